@@ -27,6 +27,7 @@ from app.ai_gateway.providers.gemini import GeminiProvider
 from app.ai_gateway.providers.openrouter import OpenRouterProvider
 from app.core.config import settings
 from app.core.exceptions import AIServiceError
+from app.core.metrics import AI_PROMPT_TOKENS
 
 logger = logging.getLogger("guidify.ai_gateway")
 
@@ -50,10 +51,26 @@ def _sanitize_user_input(text: str, max_len: int = 500) -> str:
     return sanitized[:max_len]
 
 
+def _sanitize_values(value: Any) -> Any:
+    """Apply _sanitize_user_input to every string inside a JSON-like value."""
+    if isinstance(value, str):
+        return _sanitize_user_input(value)
+    if isinstance(value, dict):
+        return {k: _sanitize_values(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_sanitize_values(v) for v in value]
+    return value
+
+
 # Cap for full resume documents passed to the AI (F-12).
 MAX_RESUME_CHARS = 12000
 
 
+def estimate_tokens(text: str) -> int:
+    """Provider-agnostic token estimate (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
 class AIGateway:
     """
     Central AI Gateway — the single point through which all AI interactions flow.
@@ -71,6 +88,7 @@ class AIGateway:
     # mission text, stronger model for full roadmap generation)"
     TASK_MODEL_MAP: Dict[str, str] = {
         "roadmap.generate": "nvidia/nemotron-3-super-120b-a12b:free",
+        "roadmap.adapt": "nvidia/nemotron-3-super-120b-a12b:free",
         "mission.generate": "nvidia/nemotron-3-super-120b-a12b:free",
         "resume.parse": "nvidia/nemotron-3-super-120b-a12b:free",
         "resume.score": "nvidia/nemotron-3-super-120b-a12b:free",
@@ -142,6 +160,9 @@ class AIGateway:
         if "_system_instruction" in context:
             system_instruction = context.pop("_system_instruction")
 
+        prompt_tokens = estimate_tokens(system_instruction) + estimate_tokens(prompt)
+        AI_PROMPT_TOKENS.labels(task_type=task_type).observe(prompt_tokens)
+
         start_time = time.time()
         last_error: Optional[Exception] = None
 
@@ -165,6 +186,7 @@ class AIGateway:
                         "model": model,
                         "attempt": attempt + 1,
                         "duration_ms": round(duration_ms, 1),
+                        "prompt_tokens_est": prompt_tokens,
                         "response_length": len(raw_response),
                     },
                 )
@@ -286,6 +308,28 @@ class AIGateway:
                 )
             return prompt
 
+        # Incremental roadmap adaptation — one phase in, one patch out
+        if task_type == "roadmap.adapt":
+            from app.ai_gateway.prompts.roadmap_adapt import ROADMAP_ADAPT_V1, TRIGGER_INSTRUCTIONS
+
+            prompt = ROADMAP_ADAPT_V1.format(
+                target_role=_sanitize_user_input(context.get("target_role", "Software Developer")),
+                trigger_instructions=TRIGGER_INSTRUCTIONS.get(context.get("trigger"), ""),
+                # The signal can carry learner-supplied text (certificate names)
+                signal=json.dumps(
+                    _sanitize_values(context.get("signal", {})), separators=(",", ":"), default=str
+                )[:2000],
+                phase_number=context.get("phase_number", 1),
+                phase=json.dumps(context.get("phase", {}), separators=(",", ":"), default=str),
+                roadmap_summary="\n".join(context.get("roadmap_summary", [])) or "None",
+            )
+            if schema_hint:
+                prompt += (
+                    "\n\nIMPORTANT: Your previous response did not match the required JSON schema. "
+                    "Please return ONLY valid JSON with no extra text."
+                )
+            return prompt
+
         # Mission generation — uses versioned prompt template
         if task_type == "mission.generate":
             from app.ai_gateway.prompts.mission_generate import MISSION_GENERATE_V1
@@ -361,6 +405,8 @@ class AIGateway:
                 profile_summary=_sanitize_user_input(context.get("profile_summary", "")),
                 target_role=_sanitize_user_input(context.get("target_role", "Software Developer")),
                 transcript=context.get("transcript", []),
+                speculative=context.get("speculative", False),
+                session_summary=context.get("session_summary", ""),
             )
             if schema_hint:
                 prompt += (
@@ -384,6 +430,8 @@ class AIGateway:
                 transcript=context.get("transcript", []),
                 delivery_metrics=context.get("delivery_metrics"),
                 camera_enabled=context.get("camera_enabled", False),
+                session_summary=context.get("session_summary", ""),
+                sections=context.get("sections"),
             )
             if schema_hint:
                 prompt += (
@@ -7,6 +7,7 @@ Per prompts.md §8: Every prompt template carries a version identifier.
 Structure:
     prompts/
         roadmap_generate.py     — roadmap.generate (Phase 2)
+        roadmap_adapt.py        — roadmap.adapt (single-phase patch)
         mission_generate.py     — mission.generate (Phase 2)
         resume_parse.py         — resume.parse (Phase 1)
         resume_score.py         — resume.score (Phase 1)
@@ -1,11 +1,14 @@
 """
-interview.feedback — AI Gateway Prompt Template v2
+interview.feedback — AI Gateway Prompt Template v3
 
 Generates the post-session feedback report: strengths, gaps,
 communication notes, readiness subscore, and suggested missions.
 
 v2 adds: delivery_metrics input, STAR-structure scoring for behavioral tracks,
 cohesive communication_notes synthesis (verbal + delivery).
+v3 adds: rolling session summary (one note per earlier answer) with only the
+most recent turns verbatim, in place of the full transcript; optional
+`sections` to re-request only the report sections that failed validation.
 
 Output schema: InterviewFeedbackResponse
 """
@@ -30,7 +33,7 @@ Your role: Evaluate the learner's interview performance and produce actionable f
 Rules:
 1. Be specific and encouraging — frame gaps as improvable skills, not failures.
 2. readiness_subscore is a guidance signal, not a guarantee. Avoid absolute language ("you will pass/fail").
-3. Reference specific moments from the transcript — do not give generic feedback.
+3. Reference specific moments from the session summary and recent exchanges — do not give generic feedback.
 4. Suggested missions should target the specific skills where the learner showed gaps.
 5. communication_notes should be one cohesive paragraph synthesizing the overall performance.
 6. Strengths and gaps should each have 2-4 items, drawn from actual responses.
@@ -45,12 +48,21 @@ Respond with ONLY valid JSON matching the schema. No explanation, no markdown fe
 USER_PROMPT_TEMPLATE = """Session track: {track}
 Learner profile: {profile_summary}
 Target role: {target_role}
-{delivery_section}
-Full transcript:
+{delivery_section}{summary_section}
+Most recent exchanges:
 {transcript}
 
 Generate the post-session feedback report."""
 
+SECTIONS_SUFFIX = """
+
+Return ONLY these keys of the report (the rest are already stored): {sections}"""
+
+SUMMARY_SECTION = """
+Session summary (one line per answered question: topic, + strength, − gap):
+{session_summary}
+"""
+
 
 def build_system_prompt() -> str:
     return SYSTEM_PROMPT
@@ -63,6 +75,8 @@ def build_user_prompt(
     transcript: List[dict],
     delivery_metrics: Optional[dict] = None,
     camera_enabled: bool = False,
+    session_summary: str = "",
+    sections: Optional[List[str]] = None,
 ) -> str:
     transcript_text = ""
     for entry in transcript:
@@ -91,10 +105,14 @@ def build_user_prompt(
         if parts:
             delivery_section = "Delivery metrics (captured client-side during the session):\n" + "\n".join(parts) + "\n"
 
-    return USER_PROMPT_TEMPLATE.format(
+    prompt = USER_PROMPT_TEMPLATE.format(
         track=track,
         profile_summary=profile_summary or "Not specified",
         target_role=target_role or "Software Developer",
         delivery_section=delivery_section,
+        summary_section=SUMMARY_SECTION.format(session_summary=session_summary) if session_summary else "",
         transcript=transcript_text,
     )
+    if sections:
+        prompt += SECTIONS_SUFFIX.format(sections=", ".join(sections))
+    return prompt
@@ -1,13 +1,18 @@
 """
-interview.question — AI Gateway Prompt Template v1
+interview.question — AI Gateway Prompt Template v2
 
 Generates the next interview question contextual to the session track
 (technical/HR), learner profile, and prior transcript.
 
+v2 adds: rolling session summary (one note per earlier answer) in place of
+the full transcript, with only the most recent turns verbatim; the response
+also assesses the latest answer so the summary can be updated without an
+extra AI call.
+
 Output schema: InterviewQuestionResponse
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -15,6 +20,10 @@ class InterviewQuestionResponse(BaseModel):
     """AI Gateway output schema for interview.question"""
     question: str
     question_type: str = "technical"  # technical | behavioral | follow_up
+    # Assessment of the candidate's most recent answer (None before the first answer)
+    answer_topic: Optional[str] = None
+    answer_strength: Optional[str] = None
+    answer_gap: Optional[str] = None
 
 
 SYSTEM_PROMPT = """You are an expert interview coach for GUIDIFY, an AI-powered career guidance platform.
@@ -28,18 +37,35 @@ Rules:
 4. HR/behavioral questions should use the STAR method framework.
 5. Never ask the same question twice in a session.
 6. Frame questions as clear, answerable prompts — not statements.
+7. Also assess the candidate's most recent answer: answer_topic (the skill or topic it covered), answer_strength and answer_gap — one short phrase each (at most 15 words), or null if there is nothing to note or no answer yet.
+
+Output schema:
+{"question": string, "question_type": "technical" | "behavioral" | "follow_up", "answer_topic": string | null, "answer_strength": string | null, "answer_gap": string | null}
 
 Respond with ONLY valid JSON matching the schema. No explanation, no markdown fences."""
 
 USER_PROMPT_TEMPLATE = """Session track: {track}
 Learner profile: {profile_summary}
 Target role: {target_role}
-
-Transcript so far:
+{summary_section}
+Most recent exchanges:
 {transcript}
 
 Generate the next interview question."""
 
+SUMMARY_SECTION = """
+Earlier in this session (one line per answered question: topic, + strength, − gap):
+{session_summary}
+"""
+
+# Appended for speculative drafts, generated while the candidate is still
+# answering the last question, so the draft must stand on its own.
+SPECULATIVE_SUFFIX = """
+
+The candidate has not answered the last question yet. Generate the question that
+will follow it: move to a NEW topic or skill area for this track, do not depend
+on or refer to the pending answer, and do not repeat any question above."""
+
 
 def build_system_prompt() -> str:
     return SYSTEM_PROMPT
@@ -50,6 +76,8 @@ def build_user_prompt(
     profile_summary: str,
     target_role: str,
     transcript: List[dict],
+    speculative: bool = False,
+    session_summary: str = "",
 ) -> str:
     transcript_text = ""
     for i, entry in enumerate(transcript):
@@ -60,9 +88,13 @@ def build_user_prompt(
     if not transcript_text.strip():
         transcript_text = "(No prior questions — this is the start of the interview.)"
 
-    return USER_PROMPT_TEMPLATE.format(
+    prompt = USER_PROMPT_TEMPLATE.format(
         track=track,
         profile_summary=profile_summary or "Not specified",
         target_role=target_role or "Software Developer",
         transcript=transcript_text,
+        summary_section=SUMMARY_SECTION.format(session_summary=session_summary) if session_summary else "",
     )
+    if speculative:
+        prompt += SPECULATIVE_SUFFIX
+    return prompt
@@ -0,0 +1,72 @@
+"""
+Roadmap Adaptation Prompt Template — prompts.md §1, rules.md §1.1/§1.2/§1.4
+
+Adapts one phase of an existing roadmap in response to an adaptation trigger
+instead of regenerating every phase. The model sees only:
+  - the affected phase (in full)
+  - the triggering signal (failures, fast completions, certificate)
+  - a one-line summary of every other phase
+
+Output: a patch for the affected phase, matching RoadmapAdaptResponse.
+Goal changes (rules.md §1.3) still use roadmap.generate.
+Version: v1
+"""
+
+ROADMAP_ADAPT_V1 = """You are a career advisor AI for GUIDIFY. Adjust ONE phase of a learner's existing roadmap.
+
+## Learner
+- Target Role: {target_role}
+
+## Trigger
+{trigger_instructions}
+
+Signal:
+{signal}
+
+## Phase to adapt (phase {phase_number})
+{phase}
+
+## Rest of the roadmap (for context only — do not change)
+{roadmap_summary}
+
+## Instructions
+1. Change only what the trigger calls for; leave every other field out of the patch.
+2. "difficulty" must be "beginner", "intermediate", or "advanced".
+3. "add_skills" / "remove_skills" swap skills within this phase only; keep 3-6 skills in total.
+4. "remedial_missions" are short mission titles the learner should do next (at most 3).
+5. Do not repeat skills already covered by other phases.
+
+## Output Format
+Return ONLY valid JSON:
+{{
+  "phase_number": {phase_number},
+  "patch": {{
+    "difficulty": "beginner|intermediate|advanced" or null,
+    "add_skills": ["..."],
+    "remove_skills": ["..."],
+    "remedial_missions": ["..."],
+    "estimated_weeks": <number> or null
+  }},
+  "rationale": "one sentence"
+}}
+"""
+
+TRIGGER_INSTRUCTIONS = {
+    "failure_pattern": (
+        "The learner failed or marked too hard several missions in a row. "
+        "Insert remedial missions for the skills they struggled with and, if needed, "
+        "lower the phase difficulty or add a prerequisite skill."
+    ),
+    "fast_completion": (
+        "The learner completed several missions in well under the estimated time. "
+        "Raise the phase difficulty and/or swap basic skills for more advanced ones; "
+        "you may shorten estimated_weeks."
+    ),
+    "certificate_upload": (
+        "The learner uploaded a certificate covering some skills. "
+        "Remove skills the certificate already covers and, if the phase becomes thin, "
+        "add the next most relevant skill for the target role."
+    ),
+}
+
+VERSION = "v1"
@@ -3,16 +3,22 @@ Adaptation Routes — rules.md §1-4
 
 Endpoints for the Adaptation Engine (Rules Engine):
     POST /adaptation/event       — Log an event and evaluate adaptation triggers
+    POST /adaptation/events/batch — Log an ordered batch of events, evaluate triggers once
     POST /adaptation/trigger     — Manually trigger adaptation check
     GET  /adaptation/status      — Get current adaptation status for learner
     GET  /adaptation/skill-gap   — Get skill gap analysis
     GET  /adaptation/events      — Get recent events for learner
+
+Mission outcomes (mission_*) are logged by the missions API when a mission's
+status changes; these endpoints refuse them so a client cannot add outcomes
+to the rules state that daily_missions does not have.
 """
 
 import logging
 from fastapi import APIRouter, Depends
 
 from app.core.auth import get_current_learner_id
+from app.core.exceptions import ValidationError
 from app.db import queries
 from app.models.schemas import (
     EventCreateRequest,
@@ -20,14 +26,27 @@ from app.models.schemas import (
     AdaptationDecision,
     AdaptationStatusResponse,
     AdaptationTriggerRequest,
+    EventBatchRequest,
+    EventBatchResponse,
+    EventBatchResult,
     SkillGapResponse,
 )
 from app.services.rules_engine import RulesEngine
+from app.services.rules_state import OUTCOME_EVENTS
 
 router = APIRouter(tags=["Adaptation"])
 logger = logging.getLogger("guidify.api.adaptation")
 
 
+def _reject_mission_outcomes(*event_types: str) -> None:
+    refused = sorted({t for t in event_types if t in OUTCOME_EVENTS})
+    if refused:
+        raise ValidationError(
+            "Mission outcomes are logged by the missions API",
+            details={"event_types": refused},
+        )
+
+
 @router.post("/adaptation/event", response_model=AdaptationDecision)
 async def log_event_and_check_adaptation(
     request: EventCreateRequest,
@@ -42,6 +61,7 @@ async def log_event_and_check_adaptation(
     1.3 Changes career goal → full regeneration
     1.4 Uploads certificate → update skill gaps
     """
+    _reject_mission_outcomes(request.event_type.value)
     engine = RulesEngine()
     
     adaptation = await engine.evaluate_and_trigger(
@@ -53,6 +73,50 @@ async def log_event_and_check_adaptation(
     return AdaptationDecision(**adaptation)
 
 
+@router.post("/adaptation/events/batch", response_model=EventBatchResponse)
+async def log_event_batch(
+    request: EventBatchRequest,
+    learner_id: str = Depends(get_current_learner_id),
+):
+    """
+    Log several events (e.g. the end of a session) in one request.
+
+    Events are inserted with one bulk write in the order given, and the
+    adaptation triggers are evaluated once over the combined window instead
+    of once per event. Each event's result says whether it was logged.
+    """
+    _reject_mission_outcomes(*(event.event_type.value for event in request.events))
+    engine = RulesEngine()
+
+    outcome = await engine.evaluate_batch(
+        learner_id=learner_id,
+        events=[
+            {
+                "event_type": event.event_type.value,
+                "payload": event.payload,
+                "related_mission_id": event.related_mission_id,
+                "related_roadmap_id": event.related_roadmap_id,
+            }
+            for event in request.events
+        ],
+    )
+
+    results = [
+        EventBatchResult(
+            index=i,
+            event_type=event.event_type.value,
+            logged=row is not None,
+            event_id=row.get("id") if row else None,
+        )
+        for i, (event, row) in enumerate(zip(request.events, outcome["rows"]))
+    ]
+    return EventBatchResponse(
+        results=results,
+        logged=sum(1 for r in results if r.logged),
+        adaptation=AdaptationDecision(**outcome["adaptation"]),
+    )
+
+
 @router.post("/adaptation/trigger", response_model=AdaptationDecision)
 async def manually_trigger_adaptation(
     request: AdaptationTriggerRequest,
@@ -62,6 +126,7 @@ async def manually_trigger_adaptation(
     Manually trigger adaptation check (e.g., from dashboard action).
     Logs the event and evaluates triggers.
     """
+    _reject_mission_outcomes(request.event_type.value)
     engine = RulesEngine()
     
     adaptation = await engine.evaluate_and_trigger(
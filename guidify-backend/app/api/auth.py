@@ -65,11 +65,11 @@ async def get_my_profile(
     """
     Returns the current learner's assembled profile — api.md §1.
     """
-    learner = await queries.get_learner(learner_id)
+    learner = await queries.get_learner(learner_id, columns=queries.LEARNER_IDENTITY)
     if not learner:
         raise ResourceNotFoundError("Learner")
 
-    profile_data = await queries.get_learner_profile(learner_id)
+    profile_data = await queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY)
 
     return ProfileMeResponse(
         learner=LearnerResponse(
@@ -100,7 +100,7 @@ async def update_target_role(
     Per rules.md §1.3: Changing target role triggers immediate full roadmap
     regeneration. Goal changes bypass the 24h debounce window.
     """
-    old_learner = await queries.get_learner(learner_id)
+    old_learner = await queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING)
     old_target_role = old_learner.get("target_role") if old_learner else None
 
     await queries.update_learner(learner_id, {
@@ -8,16 +8,26 @@ Endpoints:
     POST /interview/session                        — Start a new session
     POST /interview/session/{session_id}/answer     — Submit an answer, get next question or feedback
     GET  /interview/session/{session_id}            — Get transcript + feedback
+    GET  /interview/session/{session_id}/feedback   — Poll the background feedback report
+    GET  /interview/session/{session_id}/feedback/stream — Same, as server-sent events
 """
 
+import asyncio
+import json
 import logging
+import time
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.core.auth import get_current_learner_id
+from app.core.config import settings
 from app.core.exceptions import ResourceNotFoundError, AIServiceError
+from app.core.metrics import INTERVIEW_QUESTION_LATENCY
 from app.db import queries
+from app.services import delivery_trends, interview_feedback, interview_speculation, interview_summary
+from app.services.interview_feedback import build_profile_summary
 from app.ai_gateway.gateway import gateway
 from app.models.schemas import (
     InterviewSessionRequest,
@@ -27,6 +37,7 @@ from app.models.schemas import (
     InterviewSessionResponse,
     InterviewTranscriptEntry,
     InterviewFeedbackResponse,
+    InterviewFeedbackStatusResponse,
     DeliveryMetricsRequest,
     DeliveryMetricsResponse,
 )
@@ -37,6 +48,13 @@ router = APIRouter(tags=["Interview"])
 
 MAX_QUESTIONS_PER_SESSION = 10
 
+# Feedback SSE stream: how often to re-read the session, and when to give up
+# (the client can fall back to polling GET .../feedback).
+FEEDBACK_STREAM_POLL_SECONDS = 1.5
+FEEDBACK_STREAM_TIMEOUT_SECONDS = 180
+
+FEEDBACK_DONE = ("ready", "failed")
+
 
 @router.post("/interview/session", response_model=InterviewStartResponse)
 async def start_interview_session(
@@ -46,60 +64,75 @@ async def start_interview_session(
     """
     Start a new interview session.
 
-    1. Create DB record
-    2. Generate first question via AI Gateway (interview.question)
-    3. Return session_id + first question
-    """
-    # Create session in DB
-    session = await queries.create_interview_session(learner_id, request.track)
-    if not session:
-        raise HTTPException(status_code=500, detail="Failed to create interview session")
+    1. Build the context snapshot (profile reads + consent, in parallel)
+    2. Create the DB record with the snapshot while the first question is
+       generated via AI Gateway (interview.question)
+    3. Store the opening turn and return session_id + first question
 
+    The snapshot is stored in context_data, so later turns never refetch the
+    learner or profile.
+    """
     # Record delivery consent only when the learner explicitly opted in.
     # The text-only interview must not create a granted consent record.
-    delivery_enabled = False
-    if request.camera_enabled:
-        consent = await queries.create_consent(
+    async def _consent():
+        if not request.camera_enabled:
+            return None
+        return await queries.create_consent(
             learner_id,
             consent_type="delivery_analytics",
             granted=True,
             source="interview_camera_opt_in",
         )
-        if consent:
-            await queries.update_interview_session(session["id"], {
-                "delivery_consent_id": consent["id"],
-                "camera_enabled": True,
-            })
-            delivery_enabled = True
-
-    # Get learner profile for context
-    profile = await queries.get_learner_profile(learner_id)
-    learner = await queries.get_learner(learner_id)
-    profile_summary = _build_profile_summary(profile, learner)
-    target_role = learner.get("target_role", "Software Developer") if learner else "Software Developer"
-
-    # Generate first question via AI Gateway
-    try:
-        result = await gateway.generate(
-            task_type="interview.question",
-            context={
-                "track": request.track,
-                "profile_summary": profile_summary,
-                "target_role": target_role,
-                "transcript": [],
-            },
-        )
-        first_question = result.get("question", "Tell me about yourself and your background.")
-    except AIServiceError as e:
-        logger.warning(f"AI question generation failed, using fallback: {e}")
-        first_question = "Tell me about yourself and your background."
-
-    # Store first question in transcript
-    transcript = [{"role": "interviewer", "content": first_question, "question_type": "opening"}]
-    await queries.update_interview_session(session["id"], {
-        "transcript": transcript,
-        "question_count": 1,
-    })
+
+    context_data, consent = await asyncio.gather(
+        _context_snapshot(learner_id, request.track), _consent()
+    )
+    profile_summary = context_data["profile_summary"]
+    target_role = context_data["target_role"]
+
+    session_data = {"context_data": context_data}
+    delivery_enabled = bool(consent)
+    if consent:
+        session_data.update({
+            "delivery_consent_id": consent["id"],
+            "camera_enabled": True,
+        })
+
+    async def _first_question() -> str:
+        try:
+            result = await gateway.generate(
+                task_type="interview.question",
+                context={
+                    "track": request.track,
+                    "profile_summary": profile_summary,
+                    "target_role": target_role,
+                    "transcript": [],
+                },
+            )
+            return result.get("question", "Tell me about yourself and your background.")
+        except AIServiceError as e:
+            logger.warning(f"AI question generation failed, using fallback: {e}")
+            return "Tell me about yourself and your background."
+
+    session, first_question = await asyncio.gather(
+        queries.create_interview_session(learner_id, request.track, session_data),
+        _first_question(),
+    )
+    if not session:
+        raise HTTPException(status_code=500, detail="Failed to create interview session")
+
+    # Store first question as the opening turn
+    await queries.append_interview_turns(
+        session["id"],
+        learner_id,
+        [{"role": "interviewer", "content": first_question, "question_type": "opening"}],
+        questions=1,
+    )
+    # Draft question 2 while the candidate answers the opener
+    interview_speculation.start(
+        session["id"], 2, request.track, profile_summary, target_role,
+        [{"role": "interviewer", "content": first_question}],
+    )
 
     return InterviewStartResponse(
         session_id=session["id"],
@@ -123,18 +156,31 @@ async def submit_answer(
     2. Append candidate answer to transcript
     3. If under max questions: generate next question via AI Gateway
     4. If at max questions: generate feedback report, mark complete
+
+    Turns are appended to interview_turns (answer and next question in one
+    call); the transcript array is never rewritten. Prompts get the session's
+    rolling summary plus the last INTERVIEW_VERBATIM_TURNS entries, and the
+    summary is updated in the same append. With speculation enabled,
+    a question pre-generated while the candidate was answering is used when
+    ready, and the following one is drafted before returning.
     """
-    session = await queries.get_interview_session(session_id, learner_id)
+    started = time.perf_counter()
+    session = await queries.get_interview_session(session_id, learner_id, columns=queries.SESSION_TURN)
     if not session:
         raise ResourceNotFoundError("Interview session")
     if session.get("status") != "in_progress":
         raise HTTPException(status_code=400, detail="Session is not in progress")
 
-    transcript = session.get("transcript", [])
+    # Only the recent window is sent verbatim; earlier turns are in the summary
+    transcript = await queries.get_interview_transcript(
+        session_id, learner_id, last=max(settings.INTERVIEW_VERBATIM_TURNS - 1, 1)
+    )
+    summary = session.get("transcript_summary") or interview_summary.empty_summary()
     question_count = session.get("question_count", 0)
 
     # Append candidate answer
-    transcript.append({"role": "candidate", "content": request.answer})
+    answer_turn = {"role": "candidate", "content": request.answer}
+    transcript.append(answer_turn)
 
     # Check if we should end the session
     if question_count >= MAX_QUESTIONS_PER_SESSION:
@@ -144,7 +190,7 @@ async def submit_answer(
                 raise HTTPException(status_code=403, detail="Delivery consent not given")
             delivery_metrics = _delivery_metrics_dict(request.delivery_metrics)
         return await _end_session(
-            session, transcript, learner_id, delivery_metrics=delivery_metrics
+            session, learner_id, answer_turn, delivery_metrics=delivery_metrics
         )
 
     # Generate next question - use cached profile context from session
@@ -154,49 +200,63 @@ async def submit_answer(
     track = session.get("track", "technical")
     
     if not profile_summary or not target_role:
-        # Fallback: fetch fresh (first request or session missing context)
-        learner = await queries.get_learner(learner_id)
-        profile = await queries.get_learner_profile(learner_id)
-        profile_summary = _build_profile_summary(profile, learner)
-        target_role = learner.get("target_role", "Software Developer") if learner else "Software Developer"
-        track = session.get("track", "technical")
-        
-        # Cache for subsequent requests
-        await queries.update_interview_session(session_id, {
-            "context_data": {
-                "profile_summary": profile_summary,
-                "target_role": target_role,
-                "track": track,
-            }
-        })
-
-    try:
-        result = await gateway.generate(
-            task_type="interview.question",
-            context={
-                "track": session.get("track", "technical"),
-                "profile_summary": profile_summary,
-                "target_role": target_role,
-                "transcript": transcript,
-            },
-        )
-        next_question = result.get("question", "")
-    except AIServiceError as e:
-        logger.warning(f"AI question generation failed: {e}")
-        next_question = ""
+        # Sessions created before the snapshot was stored: rebuild it per turn
+        session_data = await _context_snapshot(learner_id, track)
+        profile_summary = session_data["profile_summary"]
+        target_role = session_data["target_role"]
+
+    next_number = question_count + 1
+    assessment = None
+    next_question = await interview_speculation.take(session_id, next_number)
+    if next_question:
+        speculation = "hit"
+    else:
+        speculation = "miss" if interview_speculation.enabled() else "off"
+        try:
+            result = await gateway.generate(
+                task_type="interview.question",
+                context={
+                    "track": session.get("track", "technical"),
+                    "profile_summary": profile_summary,
+                    "target_role": target_role,
+                    "transcript": transcript,
+                    "session_summary": interview_summary.render_summary(summary),
+                },
+            )
+            next_question = result.get("question", "")
+            assessment = result
+        except AIServiceError as e:
+            logger.warning(f"AI question generation failed: {e}")
+            next_question = ""
 
     # If no next question or at natural end, finish the session
     if not next_question:
-        return await _end_session(session, transcript, learner_id)
-
-    # Append next question and update
-    transcript.append({"role": "interviewer", "content": next_question})
-    question_count += 1
-
-    await queries.update_interview_session(session_id, {
-        "transcript": transcript,
-        "question_count": question_count,
-    })
+        return await _end_session(session, learner_id, answer_turn)
+
+    # Fold the answered question into the summary and append the answer and
+    # next question together
+    answered = next((t["content"] for t in reversed(transcript) if t.get("role") == "interviewer"), "")
+    summary = interview_summary.update_summary(summary, question_count, answered, assessment)
+    appended = await queries.append_interview_turns(
+        session_id,
+        learner_id,
+        [answer_turn, {"role": "interviewer", "content": next_question}],
+        questions=1,
+        summary=summary,
+        expected_questions=question_count,
+    )
+    if not appended:
+        # Another submit for this question (or the session's end) won the race
+        raise HTTPException(status_code=409, detail="Answer already submitted for this question")
+    INTERVIEW_QUESTION_LATENCY.labels(speculation=speculation).observe(time.perf_counter() - started)
+
+    if next_number < MAX_QUESTIONS_PER_SESSION:
+        recent = transcript + [{"role": "interviewer", "content": next_question}]
+        interview_speculation.start(
+            session_id, next_number + 1, track, profile_summary, target_role,
+            recent[-settings.INTERVIEW_VERBATIM_TURNS:],
+            session_summary=interview_summary.render_summary(summary),
+        )
 
     return InterviewAnswerResponse(
         next_question=next_question,
@@ -210,17 +270,19 @@ async def get_interview_session(
     learner_id: str = Depends(get_current_learner_id),
 ):
     """Get full interview transcript and feedback report."""
-    session = await queries.get_interview_session(session_id, learner_id)
+    session = await queries.get_interview_session(session_id, learner_id, columns=queries.SESSION_DETAIL)
     if not session:
         raise ResourceNotFoundError("Interview session")
 
-    transcript_raw = session.get("transcript", [])
+    # Assembled from interview_turns only when the transcript is requested
+    transcript_raw = await queries.get_interview_transcript(session_id, learner_id)
     transcript = [InterviewTranscriptEntry(**entry) for entry in transcript_raw]
 
     feedback = None
-    if session.get("feedback_report"):
+    report = await session.fetch("feedback_report") if session.get("feedback_status") in ("ready", "failed") else None
+    if report:
         try:
-            feedback = InterviewFeedbackResponse(**session["feedback_report"])
+            feedback = InterviewFeedbackResponse(**report)
         except Exception:
             pass
 
@@ -233,9 +295,90 @@ async def get_interview_session(
         readiness_subscore=session.get("readiness_subscore"),
         question_count=session.get("question_count", 0),
         created_at=session.get("created_at"),
+        feedback_status=session.get("feedback_status"),
+    )
+
+
+def _feedback_status(session_id: str, session: dict) -> InterviewFeedbackStatusResponse:
+    sections = session.get("feedback_report") or {}
+    status = session.get("feedback_status")
+    report = None
+    if status in FEEDBACK_DONE and sections:
+        try:
+            report = InterviewFeedbackResponse(**sections)
+        except Exception:
+            pass
+    return InterviewFeedbackStatusResponse(
+        session_id=session_id,
+        feedback_status=status,
+        sections=sections,
+        feedback_report=report,
+    )
+
+
+@router.get("/interview/session/{session_id}/feedback", response_model=InterviewFeedbackStatusResponse)
+async def get_interview_feedback(
+    session_id: str,
+    learner_id: str = Depends(get_current_learner_id),
+):
+    """Poll the feedback report; `sections` fills in as each one is validated."""
+    session = await queries.get_interview_session(session_id, learner_id, columns=queries.SESSION_FEEDBACK_STATE)
+    if not session:
+        raise ResourceNotFoundError("Interview session")
+    return _feedback_status(session_id, session)
+
+
+@router.get("/interview/session/{session_id}/feedback/stream")
+async def stream_interview_feedback(
+    session_id: str,
+    learner_id: str = Depends(get_current_learner_id),
+):
+    """
+    Server-sent events for the feedback report.
+
+    Emits `section` ({"name", "value"}) once per newly stored section and a
+    final `done` ({"feedback_status", "feedback_report"}); `timeout` if the
+    report is not finished within FEEDBACK_STREAM_TIMEOUT_SECONDS.
+    """
+    session = await queries.get_interview_session(session_id, learner_id, columns=queries.SESSION_FEEDBACK_STATE)
+    if not session:
+        raise ResourceNotFoundError("Interview session")
+
+    async def events():
+        nonlocal session
+        sent = set()
+        deadline = time.monotonic() + FEEDBACK_STREAM_TIMEOUT_SECONDS
+        while True:
+            state = _feedback_status(session_id, session or {})
+            for name, value in state.sections.items():
+                if name not in sent:
+                    sent.add(name)
+                    yield _sse("section", {"name": name, "value": value})
+            if state.feedback_status in FEEDBACK_DONE:
+                yield _sse("done", {
+                    "feedback_status": state.feedback_status,
+                    "feedback_report": state.feedback_report.model_dump() if state.feedback_report else None,
+                })
+                return
+            if time.monotonic() >= deadline:
+                yield _sse("timeout", {"feedback_status": state.feedback_status})
+                return
+            await asyncio.sleep(FEEDBACK_STREAM_POLL_SECONDS)
+            session = await queries.get_interview_session(
+                session_id, learner_id, columns=queries.SESSION_FEEDBACK_STATE
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
 @router.post("/interview/session/{session_id}/delivery-metrics", response_model=DeliveryMetricsResponse)
 async def submit_delivery_metrics(
     session_id: str,
@@ -246,7 +389,7 @@ async def submit_delivery_metrics(
     Submit client-side delivery analytics metrics for a completed session.
     Called once by the client after session ends - no media, only derived numbers.
     """
-    session = await queries.get_interview_session(session_id, learner_id)
+    session = await queries.get_interview_session(session_id, learner_id, columns=queries.SESSION_CONSENT)
     if not session:
         raise ResourceNotFoundError("Interview session")
     # Check delivery consent
@@ -268,6 +411,9 @@ async def submit_delivery_metrics(
     }
 
     await queries.update_interview_session(session_id, delivery_data)
+    await delivery_trends.record_session(
+        learner_id, session_id, delivery_data["delivery_metrics"], camera_enabled=request.camera_enabled
+    )
     logger.info(f"Delivery metrics recorded for session {session_id}")
 
     return DeliveryMetricsResponse()
@@ -275,71 +421,48 @@ async def submit_delivery_metrics(
 
 async def _end_session(
     session: dict,
-    transcript: list,
     learner_id: str,
+    answer_turn: dict,
     delivery_metrics: Optional[dict] = None,
 ) -> InterviewAnswerResponse:
-    """Generate feedback report and mark session as completed."""
-    learner = await queries.get_learner(learner_id)
-    profile = await queries.get_learner_profile(learner_id)
-    profile_summary = _build_profile_summary(profile, learner)
-    target_role = learner.get("target_role", "Software Developer") if learner else "Software Developer"
-
-    feedback_data = None
-    try:
-        context = {
-            "track": session.get("track", "technical"),
-            "profile_summary": profile_summary,
-            "target_role": target_role,
-            "transcript": transcript,
-        }
-        # Metrics submitted with the final answer can influence this feedback.
-        effective_delivery_metrics = delivery_metrics or session.get("delivery_metrics")
-        if effective_delivery_metrics:
-            context["delivery_metrics"] = effective_delivery_metrics
-            context["camera_enabled"] = True
-
-        result = await gateway.generate(
-            task_type="interview.feedback",
-            context=context,
-        )
-        feedback_data = result
-    except AIServiceError as e:
-        logger.warning(f"AI feedback generation failed: {e}")
-        feedback_data = {
-            "strengths": [],
-            "gaps": [],
-            "communication_notes": "Feedback generation is temporarily unavailable.",
-            "readiness_subscore": 50,
-            "suggested_missions": [],
-        }
-
-    # F-15 FIX: guard against the AI omitting readiness_subscore (now also
-    # defaulted in the schema) so the session never 500s at completion.
-    if isinstance(feedback_data, dict):
-        feedback_data.setdefault("readiness_subscore", 50)
-
-    # Update session as completed
-    update_data = {
-        "status": "completed",
-        "transcript": transcript,
-        "feedback_report": feedback_data,
-        "readiness_subscore": feedback_data.get("readiness_subscore", 50),
-    }
-    if delivery_metrics:
-        update_data.update({
-            "camera_enabled": True,
-            "delivery_metrics": delivery_metrics,
-        })
-    await queries.update_interview_session(session["id"], update_data)
+    """
+    Store the final answer, mark the session completed and queue its feedback report.
+
+    All three happen in one round trip (queries.complete_interview_session).
+    Returns immediately with feedback_status "pending"; the report is built by
+    app.services.interview_feedback and delivered via GET .../feedback (or its
+    SSE stream). Metrics submitted with the final answer are stored with the
+    completion so they can influence the feedback.
+    """
+    result = await queries.complete_interview_session(
+        session["id"], learner_id, [answer_turn], delivery_metrics=delivery_metrics
+    )
+    if result and result.get("completed") and not result.get("job_id"):
+        interview_feedback.generate_in_background(session["id"], learner_id)
+    if delivery_metrics and result and result.get("completed"):
+        # Metrics sent with the final answer mark the session camera_enabled
+        await delivery_trends.record_session(learner_id, session["id"], delivery_metrics)
 
     return InterviewAnswerResponse(
         next_question=None,
         status="completed",
-        feedback_report=InterviewFeedbackResponse(**feedback_data),
+        feedback_status="pending",
     )
 
 
+async def _context_snapshot(learner_id: str, track: str) -> dict:
+    """Profile context for interview prompts, stored once per session in context_data."""
+    learner, profile = await asyncio.gather(
+        queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING),
+        queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY),
+    )
+    return {
+        "profile_summary": build_profile_summary(profile, learner),
+        "target_role": learner.get("target_role", "Software Developer") if learner else "Software Developer",
+        "track": track,
+    }
+
+
 def _delivery_metrics_dict(request: DeliveryMetricsRequest) -> dict:
     """Convert a validated metrics request to the JSON stored in Supabase."""
     return {
@@ -351,21 +474,3 @@ def _delivery_metrics_dict(request: DeliveryMetricsRequest) -> dict:
         "filler_word_rate": request.filler_word_rate,
         "pause_frequency": request.pause_frequency,
     }
-
-
-def _build_profile_summary(profile: Optional[dict], learner: Optional[dict]) -> str:
-    """Build a compact profile summary string for AI context."""
-    parts = []
-    if learner:
-        if learner.get("target_role"):
-            parts.append(f"Target role: {learner['target_role']}")
-        if learner.get("segment"):
-            parts.append(f"Segment: {learner['segment']}")
-    if profile:
-        skills = profile.get("skills", [])
-        if skills:
-            parts.append(f"Skills: {', '.join(skills[:10])}")
-        strengths = profile.get("strengths", [])
-        if strengths:
-            parts.append(f"Strengths: {', '.join(strengths[:5])}")
-    return "; ".join(parts) if parts else "Not specified"
@@ -18,7 +18,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from app.core.auth import get_current_learner_id
-from app.ai_gateway.gateway import gateway
+from app.services import narration_cache
 
 logger = logging.getLogger("guidify.api.profile_psychometrics")
 
@@ -62,7 +62,8 @@ async def submit_psychometrics(
 ):
     """
     Submit instrument answers. Triggers deterministic scoring (IPIP + RIASEC)
-    and one narration call. Returns narrative summary only — never raw scores.
+    and narration (served from the narration cache when a learner with
+    similar scores was narrated before). Returns narrative summary only — never raw scores.
 
     Per api.md §7: Raw trait percentages are never included in this response.
     Per rules.md §9.1: Enforces 6-month retake cooldown.
@@ -122,19 +123,15 @@ async def submit_psychometrics(
     # Deterministic scoring — no AI involved
     ipip_scores, riasec_scores, metadata = score_all(answers_dict)
 
-    # Narration — single AI Gateway call
+    instrument_version = f"ipip-{metadata['ipip_version']}_riasec-{metadata['riasec_version']}"
+
+    # Narration — cached by score buckets; at most one AI Gateway call
     narrative_summary = None
     pacing_hint = None
     tone_hint = None
 
     try:
-        narrate_result = await gateway.generate(
-            task_type="psychometrics.narrate",
-            context={
-                "ipip_scores": ipip_scores,
-                "riasec_scores": riasec_scores,
-            },
-        )
+        narrate_result = await narration_cache.narrate(ipip_scores, riasec_scores, instrument_version)
         narrative_summary = narrate_result.get("narrative_summary")
         pacing_hint = narrate_result.get("pacing_hint")
         tone_hint = narrate_result.get("tone_hint")
@@ -152,7 +149,7 @@ async def submit_psychometrics(
         "tone_hint": tone_hint,
         "consent_id": request.consent_id,
         "administered_at": now,
-        "instrument_version": f"ipip-{metadata['ipip_version']}_riasec-{metadata['riasec_version']}",
+        "instrument_version": instrument_version,
     }
 
     try:
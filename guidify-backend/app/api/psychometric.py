@@ -3,7 +3,7 @@ Psychometric Routes — Onboarding personality assessment
 
 Endpoints:
     POST /psychometric/start          — Return 5 static baseline questions
-    POST /psychometric/generate-quiz  — Generate AI adaptive questions
+    POST /psychometric/generate-quiz  — Select adaptive questions from the curated bank
     POST /psychometric/analyze        — Final personality analysis
 """
 
@@ -15,7 +15,6 @@ from pydantic import BaseModel
 
 from app.core.auth import get_current_learner_id
 from app.services.psychometric_service import PsychometricService
-from app.db import queries
 
 logger = logging.getLogger("guidify.api.psychometric")
 
@@ -30,6 +29,8 @@ class PsychometricStartRequest(BaseModel):
 
 class PsychometricGenerateRequest(BaseModel):
     user_id: Optional[str] = None
+    # Baseline answers so far ({question_text, selected_option})
+    responses: List[Dict[str, Any]] = []
 
 
 class PsychometricAnalyzeRequest(BaseModel):
@@ -58,24 +59,11 @@ async def generate_quiz(
     learner_id: str = Depends(get_current_learner_id),
 ):
     """
-    Generate 10 AI-adaptive questions based on the learner's profile.
-    Called in background while user answers static questions.
+    Select 5 adaptive questions from the curated question bank (no AI call),
+    chosen from the learner's baseline answers in `responses`.
     """
     try:
-        profile = await queries.get_learner_profile(learner_id)
-        learner = await queries.get_learner(learner_id)
-
-        user_profile = {}
-        if learner:
-            user_profile["target_role"] = learner.get("target_role", "Software Developer")
-            user_profile["segment"] = learner.get("segment", "college")
-        if profile:
-            user_profile["skills"] = profile.get("skills", [])
-            user_profile["interests"] = profile.get("interests", [])
-            user_profile["strengths"] = profile.get("strengths", [])
-
-        result = await PsychometricService.generate_quiz_questions_async(user_profile)
-        return result
+        return await PsychometricService.generate_quiz_questions_async(request.responses)
     except Exception as e:
         logger.error(f"Quiz generation failed: {e}")
         return {"questions": []}
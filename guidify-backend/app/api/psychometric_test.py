@@ -15,6 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from app.core.auth import get_current_learner_id
 from app.core.exceptions import ResourceNotFoundError
+from app.db import queries
 from app.models.psychometric_test_schemas import (
     StartTestRequest,
     StartTestResponse,
@@ -80,6 +81,7 @@ async def _sync_radar_scores(learner_id: str, category_scores: list[CategoryScor
                 "questionnaire_data": {"category_scores": radar_scores},
             }).execute
         )
+    await queries.invalidate_dashboard(learner_id)
 
 
 @router.get("/psychometric-test/questions", response_model=StartTestResponse)
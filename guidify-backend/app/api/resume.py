@@ -46,7 +46,7 @@ async def _save_recommended_courses(learner_id: str, courses: list) -> None:
     """
     from app.db import queries
 
-    profile = await queries.get_learner_profile(learner_id)
+    profile = await queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY)
     if profile:
         questionnaire_data = profile.get("questionnaire_data") or {}
         if not isinstance(questionnaire_data, dict):
@@ -123,8 +123,8 @@ async def upload_resume(
                 detail="Could not extract meaningful text from the uploaded file. Please ensure the resume is not image-based."
             )
 
-        profile = await queries.get_learner_profile(learner_id)
-        learner = await queries.get_learner(learner_id)
+        profile = await queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY)
+        learner = await queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING)
 
         target_role = learner.get("target_role", "Software Developer") if learner else "Software Developer"
         segment = learner.get("segment", "college") if learner else "college"
@@ -218,7 +218,7 @@ async def _process_resume_async(
             "gap_analysis": score_data,
         })
 
-        profile = await queries.get_learner_profile(learner_id)
+        profile = await queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY)
         if profile and parsed_data:
             update_data = {}
             if parsed_data.get("technical_skills"):
@@ -304,7 +304,7 @@ async def match_resume_to_jd(
     and alternative job suggestions.
     """
     # Load current resume
-    resume = await queries.get_current_resume(learner_id)
+    resume = await queries.get_current_resume(learner_id, columns=queries.RESUME_PARSED)
     if not resume or not resume.get("parsed_data"):
         raise HTTPException(
             status_code=400,
@@ -312,7 +312,7 @@ async def match_resume_to_jd(
         )
 
     # Get learner context
-    learner = await queries.get_learner(learner_id)
+    learner = await queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING)
     target_role = learner.get("target_role", "Software Developer") if learner else "Software Developer"
     segment = learner.get("segment", "college") if learner else "college"
 
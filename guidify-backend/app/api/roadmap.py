@@ -2,17 +2,21 @@
 Roadmap Routes — api.md §3
 
 Endpoints:
-    GET  /roadmap/current     — Get active roadmap with phases
+    GET  /roadmap/current     — Get active roadmap with phases (?view= for part of it)
     GET  /roadmap/history     — Get superseded versions with trigger_reason
-    POST /roadmap/regenerate  — Trigger roadmap (re)generation via AI Gateway
+    POST /roadmap/phases/{phase_number}/complete — Complete the current phase
+    POST /roadmap/regenerate  — Queue roadmap (re)generation via AI Gateway
+    GET  /roadmap/jobs/{job_id} — Progress of a queued (re)generation
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from app.core.auth import get_current_learner_id
 from app.db import queries
-from app.services.roadmap_service import regenerate_roadmap
+from app.services.roadmap_service import enqueue_regeneration
 
 router = APIRouter(tags=["Roadmap"])
 logger = logging.getLogger("guidify.api.roadmap")
@@ -20,14 +24,26 @@ logger = logging.getLogger("guidify.api.roadmap")
 
 @router.get("/roadmap/current")
 async def get_current_roadmap(
+    view: Literal["full", "summary", "current_phase"] = "full",
+    phase: Optional[int] = Query(None, ge=1),
     learner_id: str = Depends(get_current_learner_id),
 ):
     """
     Get the learner's active roadmap — api.md §3.
 
-    Returns the full roadmap with all phases, progress, and current phase.
+    view=full (default) returns the full roadmap with all phases, progress,
+    and current phase. view=summary returns phase titles and status plus the
+    current phase in full; view=current_phase returns only the current phase
+    (or `phase`, when given).
     """
-    roadmap = await queries.get_active_roadmap(learner_id)
+    if view == "full":
+        roadmap = await queries.get_active_roadmap(learner_id)
+    else:
+        roadmap = await queries.get_roadmap_view(
+            learner_id,
+            view="phase" if view == "current_phase" else "summary",
+            phase_number=phase,
+        )
     if not roadmap:
         return {
             "status": "no_roadmap",
@@ -49,18 +65,43 @@ async def get_roadmap_history(
     return {"roadmaps": history}
 
 
+@router.post("/roadmap/phases/{phase_number}/complete")
+async def complete_roadmap_phase(
+    phase_number: int,
+    learner_id: str = Depends(get_current_learner_id),
+):
+    """
+    Mark the current roadmap phase completed and move to the next one.
+
+    Completing a phase that is not the current one leaves progress unchanged
+    (advanced=false), so retries are safe.
+    """
+    roadmap = await queries.get_active_roadmap(learner_id, columns=queries.ROADMAP_REF)
+    if not roadmap:
+        raise HTTPException(status_code=404, detail="No active roadmap")
+
+    result = await queries.advance_roadmap_phase(learner_id, roadmap["id"], phase_number)
+    if result is None:
+        raise HTTPException(status_code=404, detail="No active roadmap")
+
+    return {"status": "ok", "roadmap_id": roadmap["id"], **result}
+
+
 @router.post("/roadmap/regenerate")
 async def regenerate_roadmap_route(
+    response: Response,
     learner_id: str = Depends(get_current_learner_id),
 ):
     """
     Trigger roadmap generation/regeneration — api.md §3.
 
-    Delegates to the shared roadmap service (context assembly, AI call,
-    persistence, event log). Manual regeneration keeps the 24h debounce
-    (rules.md §2); goal changes bypass it via the Rules Engine (rules.md §1.3).
+    Queues a roadmap_generate job through the shared roadmap service and
+    returns 202 with its job_id; poll GET /roadmap/jobs/{job_id} for progress.
+    A repeat request while a job is queued or running returns that job.
+    Manual regeneration keeps the 24h debounce (rules.md §2); goal changes
+    bypass it via the Rules Engine (rules.md §1.3).
     """
-    result = await regenerate_roadmap(
+    result = await enqueue_regeneration(
         learner_id=learner_id,
         trigger_reason="regenerate_request",
         bypass_debounce=False,
@@ -72,6 +113,11 @@ async def regenerate_roadmap_route(
     if result["status"] == "debounced":
         raise HTTPException(status_code=409, detail=result["message"])
 
+    if result["status"] == "queued":
+        response.status_code = 202
+        return result
+
+    # No job could be queued and the regeneration ran inline
     if result["status"] == "save_failed":
         raise HTTPException(status_code=500, detail=result["message"])
 
@@ -80,9 +126,39 @@ async def regenerate_roadmap_route(
 
     return {
         "status": "ok",
+        "job_id": None,
         "roadmap_id": result.get("roadmap_id"),
         "title": result.get("title"),
         "total_phases": result.get("total_phases"),
         "estimated_weeks": result.get("estimated_weeks"),
         "message": result.get("message"),
     }
+
+
+@router.get("/roadmap/jobs/{job_id}")
+async def get_regeneration_job(
+    job_id: str,
+    learner_id: str = Depends(get_current_learner_id),
+):
+    """
+    Progress of a roadmap (re)generation or adaptation job.
+
+    progress_state moves queued → generating → validating → saved, or ends
+    in failed; result carries the outcome (roadmap_id, title, ... or message).
+    """
+    job = await queries.get_job(
+        job_id, learner_id,
+        columns="id, job_type, status, progress_state, result, attempts, created_at, completed_at",
+    )
+    if not job or job.get("job_type") not in ("roadmap_generate", "roadmap_adapt"):
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return {
+        "job_id": job["id"],
+        "status": job.get("status"),
+        "progress_state": job.get("progress_state") or "queued",
+        "result": job.get("result"),
+        "attempts": job.get("attempts", 0),
+        "created_at": job.get("created_at"),
+        "completed_at": job.get("completed_at"),
+    }
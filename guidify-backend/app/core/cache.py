@@ -1,34 +1,281 @@
-import os
-import redis
+"""
+Cache Service — shared asyncio Redis cache
+
+One connection pool per process (redis.asyncio), so cache calls never block the
+event loop. Values are serialized with orjson (stdlib json fallback) and
+zlib-compressed above CACHE_COMPRESS_MIN_BYTES; every stored value carries a
+one-byte header so compressed and plain payloads can coexist.
+
+Redis is optional: the pool is created lazily on first use, and any connection
+error puts the service into a degraded state where calls return None/False
+immediately while a background loop reconnects with exponential backoff.
+A command error on a live connection (e.g. WRONGTYPE) or an unreadable entry
+only fails that call, as a miss.
+
+Usage:
+    from app.core.cache import cache
+
+    await cache.set("dashboard:123", payload, ttl=300)
+    payload = await cache.get("dashboard:123")
+    rows = await cache.get_many(["a", "b"])      # single MGET round trip
+    await cache.set_many({"a": 1, "b": 2}, ttl=60)  # single pipelined round trip
+    locked = await cache.add("lock:x", 1, ttl=30)   # SET NX; None if Redis is down
+"""
+
+import asyncio
 import json
-from typing import Optional, Any
+import logging
+import zlib
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is pinned in requirements.txt
+    orjson = None
+
+logger = logging.getLogger("guidify.cache")
+
+# Payload headers — first byte of every stored value.
+_PLAIN = b"\x00"
+_ZLIB = b"\x01"
+
+# Reconnect backoff bounds (seconds).
+_BACKOFF_INITIAL = 0.5
+_BACKOFF_MAX = 30.0
+
+# Errors that mean Redis is unreachable. Other RedisErrors (ResponseError such
+# as WRONGTYPE, DataError) concern one command: that call fails like a miss and
+# the connection stays in use.
+_CONNECTION_ERRORS = (RedisConnectionError, RedisTimeoutError, OSError, asyncio.TimeoutError)
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_value(value: Any, compress_min_bytes: int) -> bytes:
+    """Serialize a value, compressing it when the body reaches the threshold."""
+    body = _dumps(value)
+    if compress_min_bytes and len(body) >= compress_min_bytes:
+        return _ZLIB + zlib.compress(body, 1)
+    return _PLAIN + body
+
+
+def decode_value(data: Optional[bytes]) -> Any:
+    """Inverse of encode_value. Returns None for missing or unreadable payloads."""
+    if not data:
+        return None
+    header, body = data[:1], data[1:]
+    try:
+        if header == _ZLIB:
+            body = zlib.decompress(body)
+        elif header != _PLAIN:
+            # Legacy entries written by the old sync client (bare JSON text).
+            body = data
+        return _loads(body)
+    except (ValueError, zlib.error):
+        return None
 
-REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
 
 class CacheService:
-    def __init__(self):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        compress_min_bytes: Optional[int] = None,
+        socket_timeout: Optional[float] = None,
+    ):
+        self.url = url or settings.REDIS_URL
+        self.max_connections = max_connections or settings.REDIS_MAX_CONNECTIONS
+        self.compress_min_bytes = (
+            settings.CACHE_COMPRESS_MIN_BYTES if compress_min_bytes is None else compress_min_bytes
+        )
+        self.socket_timeout = socket_timeout or settings.REDIS_SOCKET_TIMEOUT_SECONDS
+
+        self._redis: Optional[aioredis.Redis] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._available = True
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    # ── Connection management ────────────────────────────────────────────
+
+    def _client(self) -> Optional[aioredis.Redis]:
+        """Return the pooled client, creating it lazily for the running loop."""
+        if not self._available:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._loop is not loop:
+            # Connections are bound to the loop that opened them; a new loop
+            # (tests, worker restarts) gets a fresh pool.
+            pool = aioredis.ConnectionPool.from_url(
+                self.url,
+                max_connections=self.max_connections,
+                socket_connect_timeout=self.socket_timeout,
+                socket_timeout=self.socket_timeout,
+                health_check_interval=30,
+            )
+            self._redis = aioredis.Redis(connection_pool=pool)
+            self._loop = loop
+        return self._redis
+
+    def _command_failed(self, command: str, error: Exception) -> None:
+        """A single command failed on a live connection; the cache stays up."""
+        logger.warning(f"Redis {command} failed: {error}")
+
+    def _mark_down(self, error: Exception) -> None:
+        """Stop issuing commands and start the reconnect loop."""
+        if self._available:
+            logger.warning(f"Redis unavailable, serving without cache: {error}")
+        self._available = False
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self) -> None:
+        delay = _BACKOFF_INITIAL
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                if self._redis is not None:
+                    await self._redis.ping()
+                    self._available = True
+                    logger.info("Redis connection restored")
+                    return
+            except (RedisError, OSError, asyncio.TimeoutError):
+                pass
+            delay = min(delay * 2, _BACKOFF_MAX)
+
+    async def close(self) -> None:
+        """Release pooled connections (called on application shutdown)."""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except (RedisError, OSError):
+                pass
+        self._redis = None
+        self._loop = None
+        self._available = True
+
+    # ── Key/value operations ─────────────────────────────────────────────
+
+    async def get(self, key: str) -> Optional[Any]:
+        client = self._client()
+        if client is None:
+            return None
         try:
-            self.redis = redis.from_url(REDIS_URL, decode_responses=True)
-        except Exception as e:
-            print(f"Redis connection failed: {e}")
-            self.redis = None
+            return decode_value(await client.get(key))
+        except _CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            return None
+        except RedisError as e:
+            self._command_failed("GET", e)
+            return None
+
+    async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        client = self._client()
+        if client is None:
+            return False
+        try:
+            await client.set(key, encode_value(value, self.compress_min_bytes), ex=ttl)
+            return True
+        except _CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            return False
+        except RedisError as e:
+            self._command_failed("SET", e)
+            return False
 
-    def get(self, key: str) -> Optional[Any]:
-        if not self.redis:
+    async def add(self, key: str, value: Any, ttl: int = 3600) -> Optional[bool]:
+        """
+        Set `key` only if it does not exist (SET NX), e.g. as a short-lived lock.
+
+        True if stored, False if the key already exists, None when Redis is
+        unavailable and nothing could be decided.
+        """
+        client = self._client()
+        if client is None:
             return None
         try:
-            data = self.redis.get(key)
-            return json.loads(data) if data else None
-        except Exception as e:
-            print(f"Cache get error: {e}")
+            return bool(await client.set(key, encode_value(value, self.compress_min_bytes), ex=ttl, nx=True))
+        except _CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            return None
+        except RedisError as e:
+            self._command_failed("SET NX", e)
             return None
 
-    def set(self, key: str, value: Any, ttl: int = 3600):
-        if not self.redis:
-            return
+    async def delete(self, *keys: str) -> int:
+        client = self._client()
+        if client is None or not keys:
+            return 0
         try:
-            self.redis.setex(key, ttl, json.dumps(value))
-        except Exception as e:
-            print(f"Cache set error: {e}")
+            return await client.delete(*keys)
+        except _CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            return 0
+        except RedisError as e:
+            self._command_failed("DEL", e)
+            return 0
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Fetch several keys in one MGET. Missing keys are omitted from the result."""
+        keys = list(keys)
+        client = self._client()
+        if client is None or not keys:
+            return {}
+        try:
+            values = await client.mget(keys)
+        except _CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            return {}
+        except RedisError as e:
+            self._command_failed("MGET", e)
+            return {}
+        result = {}
+        for key, raw in zip(keys, values):
+            value = decode_value(raw)
+            if value is not None:
+                result[key] = value
+        return result
+
+    async def set_many(self, mapping: Mapping[str, Any], ttl: int = 3600) -> bool:
+        """Write several keys with a shared TTL in one pipelined round trip."""
+        client = self._client()
+        if client is None or not mapping:
+            return False
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(key, encode_value(value, self.compress_min_bytes), ex=ttl)
+                await pipe.execute()
+            return True
+        except _CONNECTION_ERRORS as e:
+            self._mark_down(e)
+            return False
+        except RedisError as e:
+            self._command_failed("pipelined SET", e)
+            return False
+
 
 cache = CacheService()
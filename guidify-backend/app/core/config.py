@@ -40,6 +40,70 @@ class Settings(BaseSettings):
 
     # Redis Configuration (optional)
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 1.0
+    # Cached values at or above this size (serialized bytes) are zlib-compressed.
+    CACHE_COMPRESS_MIN_BYTES: int = 1024
+    # Upper bound on dashboard staleness; writes invalidate it sooner. Kept short
+    # because the streak depends on the current date.
+    DASHBOARD_CACHE_TTL_SECONDS: int = 300
+
+    # Interview speculation — pre-generate the next question while the candidate
+    # is answering (app/services/interview_speculation.py). Off by default: each
+    # speculative draft is an extra AI call, wasted when it is not used.
+    INTERVIEW_SPECULATION_ENABLED: bool = False
+    INTERVIEW_SPECULATION_TTL_SECONDS: int = 900
+    # Transcript entries sent verbatim to interview prompts; earlier turns are
+    # represented by the session's rolling summary (app/services/interview_summary.py).
+    INTERVIEW_VERBATIM_TURNS: int = 4
+    # Delivery-metric trends (app/services/delivery_trends.py): points kept per
+    # metric and the EWMA smoothing factor.
+    DELIVERY_TRENDS_WINDOW: int = 50
+    DELIVERY_EWMA_ALPHA: float = 0.3
+
+    # Overnight mission pre-generation (app/workers/mission_pregen.py). Runs
+    # daily at MISSION_PREGEN_HOUR_UTC for learners active in the last
+    # MISSION_PREGEN_ACTIVE_DAYS days, most likely visitors first.
+    MISSION_PREGEN_HOUR_UTC: int = 2
+    MISSION_PREGEN_ACTIVE_DAYS: int = 14
+    MISSION_PREGEN_LIMIT: int = 1000
+    MISSION_PREGEN_BATCH_SIZE: int = 20
+    MISSION_PREGEN_CONCURRENCY: int = 4
+    MISSION_PREGEN_RATE_PER_MINUTE: int = 30
+    # Mission template library (app/services/mission_library.py): reuse stored
+    # missions for the same role/skill/difficulty/time budget before calling AI.
+    MISSION_LIBRARY_ENABLED: bool = True
+    MISSION_LIBRARY_MAX_VARIANTS: int = 20
+    # Cross-process lock while a learner's mission for today is being created;
+    # covers the slowest mission.generate call.
+    MISSION_GENERATION_LOCK_SECONDS: int = 120
+
+    # Rules Engine state (app/services/rules_state.py): mission outcomes kept
+    # per learner, cache lifetime, and events read when rebuilding on a miss.
+    RULES_STATE_WINDOW: int = 10
+    RULES_STATE_TTL_SECONDS: int = 7 * 24 * 3600
+    RULES_STATE_REBUILD_EVENTS: int = 200
+    # Cached learners.last_regenerated_at (migration 031) for the 24h debounce;
+    # create_roadmap overwrites it, so the TTL only bounds drift from manual edits.
+    LAST_REGENERATION_CACHE_TTL_SECONDS: int = 24 * 3600
+
+    # Write-behind event_log writer (app/db/event_writer.py): flush when
+    # EVENT_WRITER_BATCH_SIZE events are buffered or every
+    # EVENT_WRITER_FLUSH_SECONDS. When EVENT_WRITER_MAX_QUEUE events are
+    # waiting, EVENT_WRITER_OVERFLOW decides: "sync" writes the event inline
+    # (back-pressure on the request), "drop" discards it with a warning.
+    EVENT_WRITER_ENABLED: bool = True
+    EVENT_WRITER_BATCH_SIZE: int = 100
+    EVENT_WRITER_FLUSH_SECONDS: float = 1.0
+    EVENT_WRITER_MAX_QUEUE: int = 5000
+    EVENT_WRITER_OVERFLOW: str = "sync"
+
+    # psychometrics.narrate cache (app/services/narration_cache.py): scores are
+    # rounded to NARRATION_CACHE_BUCKET points and learners in the same buckets
+    # share a narration. Keys carry the instrument version and prompt hash.
+    NARRATION_CACHE_ENABLED: bool = True
+    NARRATION_CACHE_BUCKET: int = 5
+    NARRATION_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
 
     # CORS Configuration
     ALLOWED_ORIGINS: str = "http://localhost:5173,http://127.0.0.1:5173,http://localhost:3000,http://127.0.0.1:3000"
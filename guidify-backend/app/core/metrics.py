@@ -0,0 +1,64 @@
+"""
+Application Metrics — Prometheus collectors
+
+Custom collectors registered on the default prometheus_client registry, so they
+are served by the existing /metrics endpoint alongside the HTTP metrics from
+prometheus-fastapi-instrumentator.
+"""
+
+from prometheus_client import Counter, Histogram
+
+# Time from an answer arriving to the next interview question being ready,
+# labelled by whether a speculatively generated question was used:
+#   hit  — a pre-generated question was ready (or finished in flight)
+#   miss — speculation was on but the question was generated inline
+#   off  — speculation disabled
+INTERVIEW_QUESTION_LATENCY = Histogram(
+    "guidify_interview_question_latency_seconds",
+    "Latency from answer submission to next interview question",
+    ["speculation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 90),
+)
+
+# Estimated prompt size (system + user prompt, ~4 chars/token) per AI Gateway
+# task; used to check that per-turn prompts such as interview.question stay
+# bounded as a session grows.
+AI_PROMPT_TOKENS = Histogram(
+    "guidify_ai_prompt_tokens",
+    "Estimated prompt tokens per AI Gateway call",
+    ["task_type"],
+    buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000),
+)
+
+# Daily mission build time by where the mission came from:
+#   library  — a stored template matched (no AI call)
+#   ai       — library miss, generated by mission.generate
+#   fallback — generation failed, generic mission used
+# Library hit rate is the library share of the _count series.
+MISSION_GENERATION_LATENCY = Histogram(
+    "guidify_mission_generation_latency_seconds",
+    "Time to build a daily mission, by source",
+    ["source"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 90),
+)
+
+# Events passing through the write-behind event_log writer, by outcome:
+#   buffered — queued for the next flush
+#   written  — inserted by a flush
+#   failed   — a flush could not insert it (lost)
+#   sync     — written inline (critical event, or writer not running)
+#   overflow — buffer full, written inline (EVENT_WRITER_OVERFLOW=sync)
+#   dropped  — buffer full, discarded (EVENT_WRITER_OVERFLOW=drop)
+EVENT_WRITER_EVENTS = Counter(
+    "guidify_event_writer_events_total",
+    "Events handled by the buffered event_log writer",
+    ["outcome"],
+)
+
+# psychometrics.narrate lookups in the narration cache, by result (hit/miss).
+# Hit rate is hit / (hit + miss).
+NARRATION_CACHE_REQUESTS = Counter(
+    "guidify_narration_cache_requests_total",
+    "psychometrics.narrate cache lookups",
+    ["result"],
+)
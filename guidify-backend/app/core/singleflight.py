@@ -0,0 +1,43 @@
+"""
+Single-flight — collapse concurrent calls for the same key
+
+Concurrent callers asking for the same key share one execution: the first
+caller starts the work and the rest await its result (or exception). Once it
+finishes the key is released, so the next call runs again. This coordinates
+callers within one process only; pair it with a database constraint or a
+cache lock for cross-process safety.
+
+Usage:
+    from app.core.singleflight import SingleFlight
+
+    _missions = SingleFlight()
+    mission = await _missions.do(f"{learner_id}:{day}", lambda: create_mission(learner_id))
+
+The shared work runs as its own task and is shielded from caller
+cancellation: a client disconnecting mid-request does not abort the
+generation other callers are waiting for.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+
+    def _release(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def inflight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn()` for `key`, or await the run already in progress."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._release(key, t))
+        return await asyncio.shield(task)
@@ -0,0 +1,197 @@
+"""
+Event Writer — write-behind buffer for event_log
+
+Most events (rules-engine inputs, roadmap_generated/regenerated, mission
+outcomes) are an audit trail: nothing in the request needs the row to exist
+before responding. `event_writer.write` stamps the event with its id and
+created_at, buffers it and returns it at once; a background task inserts the
+buffer with one bulk write per learner when EVENT_WRITER_BATCH_SIZE events are
+waiting or every EVENT_WRITER_FLUSH_SECONDS, and once more on shutdown
+(main.py lifespan).
+
+Because id and created_at are set when the event is written, event_log
+ordering and the ids callers see do not depend on when the flush happens.
+Each buffered event keeps the DB client of the request that wrote it, so the
+insert still runs under that learner's JWT (RLS).
+
+Writes go straight to queries.create_event (and raise on failure) when:
+  - the caller passes sync=True (critical events)
+  - the writer is not running (scripts, workers, tests)
+The buffer is bounded at EVENT_WRITER_MAX_QUEUE; when it is full,
+EVENT_WRITER_OVERFLOW = "sync" writes inline (back-pressure) and "drop"
+discards the event with a warning.
+
+Buffered events are lost if the process dies before a flush.
+
+Usage:
+    from app.db.event_writer import event_writer
+
+    await event_writer.write(learner_id, "mission_completed", payload)
+    await event_writer.write(learner_id, "target_role_changed", payload, sync=True)
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import EVENT_WRITER_EVENTS
+from app.db import queries
+from app.services.supabase_client import bind_db_client, get_db_client
+
+logger = logging.getLogger("guidify.event_writer")
+
+
+class EventWriter:
+    """Bounded in-process buffer of event_log rows, flushed in bulk."""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        overflow: Optional[str] = None,
+    ):
+        self.batch_size = batch_size or settings.EVENT_WRITER_BATCH_SIZE
+        self.flush_seconds = flush_seconds or settings.EVENT_WRITER_FLUSH_SECONDS
+        self.max_queue = max_queue or settings.EVENT_WRITER_MAX_QUEUE
+        self.overflow = overflow or settings.EVENT_WRITER_OVERFLOW
+        self._buffer: List[Tuple[Any, Dict[str, Any]]] = []
+        self._inflight: List[Tuple[Any, Dict[str, Any]]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._last_created_at: Optional[datetime] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def buffered(self, learner_id: str) -> List[Dict[str, Any]]:
+        """Events for `learner_id` not flushed yet (or being flushed), oldest first."""
+        return [event for _client, event in self._inflight + self._buffer if event["learner_id"] == learner_id]
+
+    def start(self) -> None:
+        """Start the flush loop on the running event loop."""
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write everything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def _stamp(self) -> str:
+        # Strictly increasing, so events written in one burst keep their order
+        now = datetime.now(timezone.utc)
+        if self._last_created_at is not None and now <= self._last_created_at:
+            now = self._last_created_at + timedelta(microseconds=1)
+        self._last_created_at = now
+        return now.isoformat()
+
+    async def write(
+        self,
+        learner_id: str,
+        event_type: str,
+        payload: Dict[str, Any],
+        related_mission_id: Optional[str] = None,
+        related_roadmap_id: Optional[str] = None,
+        sync: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Log an event. Returns the row as it will be stored (inserted already
+        for synchronous writes), or None if it was dropped.
+        """
+        if sync or not self.running:
+            EVENT_WRITER_EVENTS.labels(outcome="sync").inc()
+            return await queries.create_event(
+                learner_id, event_type, payload,
+                related_mission_id=related_mission_id,
+                related_roadmap_id=related_roadmap_id,
+            )
+
+        event: Dict[str, Any] = {
+            "id": str(uuid.uuid4()),
+            "learner_id": learner_id,
+            "event_type": event_type,
+            "payload": payload,
+            "created_at": self._stamp(),
+        }
+        if related_mission_id:
+            event["related_mission_id"] = related_mission_id
+        if related_roadmap_id:
+            event["related_roadmap_id"] = related_roadmap_id
+
+        if len(self._buffer) >= self.max_queue:
+            if self.overflow == "drop":
+                EVENT_WRITER_EVENTS.labels(outcome="dropped").inc()
+                logger.warning(f"Event buffer full ({self.max_queue}); dropped {event_type} for {learner_id}")
+                return None
+            EVENT_WRITER_EVENTS.labels(outcome="overflow").inc()
+            rows = await queries.create_events(learner_id, [event])
+            return rows[0]
+
+        self._buffer.append((get_db_client(), event))
+        EVENT_WRITER_EVENTS.labels(outcome="buffered").inc()
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+        return event
+
+    async def flush(self) -> int:
+        """Insert everything buffered, one bulk write per learner. Returns rows written."""
+        if not self._buffer:
+            return 0
+        lock = self._flush_lock or asyncio.Lock()
+        async with lock:
+            buffered, self._buffer = self._buffer, []
+            self._inflight = buffered
+            groups: Dict[Tuple[int, str], Tuple[Any, List[Dict[str, Any]]]] = {}
+            for client, event in buffered:
+                key = (id(client), event["learner_id"])
+                groups.setdefault(key, (client, []))[1].append(event)
+
+            written = 0
+            for (_client_id, learner_id), (client, events) in groups.items():
+                try:
+                    with bind_db_client(client):
+                        rows = await queries.create_events(learner_id, events)
+                except Exception as e:
+                    logger.error(f"Failed to flush {len(events)} events for {learner_id}: {e}")
+                    rows = []
+                ok = sum(1 for row in rows if row)
+                written += ok
+                EVENT_WRITER_EVENTS.labels(outcome="written").inc(ok)
+                if ok < len(events):
+                    EVENT_WRITER_EVENTS.labels(outcome="failed").inc(len(events) - ok)
+            self._inflight = []
+            return written
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Event flush failed: {e}")
+
+
+event_writer = EventWriter()
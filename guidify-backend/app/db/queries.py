@@ -8,10 +8,13 @@ Per techspec.md §7: Every table with learner data is scoped by auth.uid().
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import logging
 
-from app.services.supabase_client import db
+from app.core.cache import cache
+from app.core.config import settings
+from app.db.rows import Row, make_row
+from app.services.supabase_client import db, get_service_client
 
 logger = logging.getLogger("guidify.db")
 
@@ -27,13 +30,42 @@ async def _run_query(query_builder):
     return await asyncio.to_thread(query_builder.execute)
 
 
+def _column_loader(table: str, **filters: Any):
+    """Loader for Row.fetch — selects extra columns of one row by its key."""
+    async def load(columns: str) -> Optional[Dict[str, Any]]:
+        query = supabase.table(table).select(columns)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        response = await _run_query(query.limit(1))
+        return response.data[0] if response.data else None
+    return load
+
+
+# --- Column projections (app/db/rows.py) ---
+# Call sites pass the narrowest projection covering the fields they read;
+# helpers default to "*" for callers that return the whole row to the client.
+
+LEARNER_TARGETING = "id, target_role, segment"
+LEARNER_IDENTITY = "id, email, full_name, segment, target_role, onboarding_completed"
+PROFILE_SUMMARY = "id, learner_id, skills, interests, strengths, weaknesses, questionnaire_data"
+ROADMAP_REF = "id"
+MISSION_REF = "id, status"
+SESSION_CONSENT = "id, delivery_consent_id"
+SESSION_DETAIL = "id, track, status, feedback_status, readiness_subscore, question_count, created_at"
+SESSION_FEEDBACK_STATE = "id, status, feedback_report, feedback_status"
+SESSION_TURN = (
+    "id, track, status, question_count, delivery_consent_id, delivery_metrics, context_data, transcript_summary"
+)
+RESUME_PARSED = "id, parsed_data"
+
+
 # --- Learners (schema.md §1) ---
 
-async def get_learner(learner_id: str) -> Optional[Dict[str, Any]]:
+async def get_learner(learner_id: str, columns: str = "*") -> Optional[Row]:
     """Fetch a learner record by ID."""
     try:
-        response = await _run_query(supabase.table("learners").select("*").eq("id", learner_id).single())
-        return response.data if response.data else None
+        response = await _run_query(supabase.table("learners").select(columns).eq("id", learner_id).single())
+        return make_row(response.data or None, "learners", columns, _column_loader("learners", id=learner_id))
     except Exception as e:
         logger.error(f"Failed to fetch learner {learner_id}: {e}")
         return None
@@ -44,6 +76,7 @@ async def upsert_learner(learner_id: str, data: Dict[str, Any]) -> Optional[Dict
     try:
         data["id"] = learner_id
         response = await _run_query(supabase.table("learners").upsert(data))
+        await invalidate_dashboard(learner_id)
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Failed to upsert learner {learner_id}: {e}")
@@ -54,6 +87,7 @@ async def update_learner(learner_id: str, data: Dict[str, Any]) -> Optional[Dict
     """Update specific fields on a learner record."""
     try:
         response = await _run_query(supabase.table("learners").update(data).eq("id", learner_id))
+        await invalidate_dashboard(learner_id)
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Failed to update learner {learner_id}: {e}")
@@ -62,18 +96,20 @@ async def update_learner(learner_id: str, data: Dict[str, Any]) -> Optional[Dict
 
 # --- Learner Profiles (schema.md §2) ---
 
-async def get_learner_profile(learner_id: str) -> Optional[Dict[str, Any]]:
+async def get_learner_profile(learner_id: str, columns: str = "*") -> Optional[Dict[str, Any]]:
     """Fetch the learner profile for a given learner."""
     try:
         response = await _run_query(
             supabase.table("learner_profiles")
-            .select("*")
+            .select(columns)
             .eq("learner_id", learner_id)
             .order("created_at", desc=True)
             .limit(1)
         )
         if response.data:
-            return response.data[0]
+            row = response.data[0]
+            loader = _column_loader("learner_profiles", id=row["id"]) if "id" in row else None
+            return make_row(row, "learner_profiles", columns, loader)
     except Exception as e:
         logger.error(f"Failed to fetch profile for learner {learner_id}: {e}")
         return None
@@ -82,7 +118,7 @@ async def get_learner_profile(learner_id: str) -> Optional[Dict[str, Any]]:
     # but learner_profiles only gets populated by /auth/onboarding and resume
     # processing — which most users never hit. Fall back to the learners columns
     # so recommender/missions/dashboard see real data instead of an empty profile.
-    learner = await get_learner(learner_id)
+    learner = await get_learner(learner_id, columns="id, skills, interests, learning_hours")
     if not learner:
         return None
     return {
@@ -101,6 +137,7 @@ async def create_learner_profile(learner_id: str, data: Dict[str, Any]) -> Optio
     try:
         data["learner_id"] = learner_id
         response = await _run_query(supabase.table("learner_profiles").insert(data))
+        await invalidate_dashboard(learner_id)
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Failed to create profile for learner {learner_id}: {e}")
@@ -111,6 +148,8 @@ async def update_learner_profile(profile_id: str, data: Dict[str, Any]) -> Optio
     """Update an existing learner profile."""
     try:
         response = await _run_query(supabase.table("learner_profiles").update(data).eq("id", profile_id))
+        if response.data:
+            await invalidate_dashboard(response.data[0].get("learner_id"))
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Failed to update profile {profile_id}: {e}")
@@ -119,18 +158,22 @@ async def update_learner_profile(profile_id: str, data: Dict[str, Any]) -> Optio
 
 # --- Roadmaps (schema.md §3) ---
 
-async def get_active_roadmap(learner_id: str) -> Optional[Dict[str, Any]]:
+async def get_active_roadmap(learner_id: str, columns: str = "*") -> Optional[Row]:
     """Fetch the active (non-superseded) roadmap for a learner."""
     try:
         response = await _run_query(
             supabase.table("roadmaps")
-            .select("*")
+            .select(columns)
             .eq("learner_id", learner_id)
             .eq("status", "active")
             .order("version", desc=True)
             .limit(1)
         )
-        return response.data[0] if response.data else None
+        if not response.data:
+            return None
+        row = response.data[0]
+        loader = _column_loader("roadmaps", id=row["id"]) if "id" in row else None
+        return make_row(row, "roadmaps", columns, loader)
     except Exception as e:
         logger.error(f"Failed to fetch active roadmap for {learner_id}: {e}")
         return None
@@ -154,6 +197,8 @@ async def create_roadmap(learner_id: str, data: Dict[str, Any]) -> Optional[Dict
                 })
             )
             if response.data:
+                await invalidate_dashboard(learner_id)
+                await remember_regeneration(learner_id, response.data)
                 return response.data
         except Exception:
             # Fallback to legacy implementation if RPC doesn't exist
@@ -180,6 +225,9 @@ async def create_roadmap(learner_id: str, data: Dict[str, Any]) -> Optional[Dict
         data["version"] = next_version
         data["status"] = "active"
         response = await _run_query(supabase.table("roadmaps").insert(data))
+        await invalidate_dashboard(learner_id)
+        if response.data:
+            await remember_regeneration(learner_id, response.data[0])
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Failed to create roadmap for {learner_id}: {e}")
@@ -201,53 +249,181 @@ async def get_roadmap_history(learner_id: str) -> List[Dict[str, Any]]:
         return []
 
 
-# --- Daily Missions (schema.md §4) ---
+ROADMAP_VIEW_FIELDS = (
+    "id", "title", "version", "total_phases", "estimated_weeks",
+    "current_phase_number", "progress_pct", "created_at",
+)
 
-async def get_todays_mission(learner_id: str) -> Optional[Dict[str, Any]]:
-    """Fetch today's mission for a learner (pending or in_progress)."""
-    from datetime import date
-    today = date.today().isoformat()
+
+def _phase_status(phase_number: int, current_phase_number: int, progress_pct: int) -> str:
+    """Mirror of roadmap_phase_status() (migration 029)."""
+    if phase_number < current_phase_number:
+        return "completed"
+    if phase_number == current_phase_number:
+        return "completed" if progress_pct >= 100 else "current"
+    return "upcoming"
+
+
+def _shape_roadmap_view(
+    roadmap: Optional[Dict[str, Any]],
+    view: str,
+    phase_number: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """Build the get_active_roadmap_view result from a full roadmap row."""
+    if not roadmap:
+        return None
+    current = roadmap.get("current_phase_number") or 1
+    progress = roadmap.get("progress_pct") or 0
+    phases = {}
+    for index, phase in enumerate(roadmap.get("phases") or [], start=1):
+        number = phase.get("phase_number") or index
+        phases[number] = {**phase, "status": _phase_status(number, current, progress)}
+
+    result = {field: roadmap.get(field) for field in ROADMAP_VIEW_FIELDS}
+    if view == "phase":
+        result["phase"] = phases.get(phase_number or current)
+        return result
+    result["phases"] = [
+        {
+            "phase_number": number,
+            "title": phase.get("title"),
+            "difficulty": phase.get("difficulty"),
+            "status": phase["status"],
+            "skill_count": len(phase.get("skills") or []),
+        }
+        for number, phase in sorted(phases.items())
+    ]
+    result["current_phase"] = phases.get(current)
+    return result
+
+
+async def get_roadmap_view(
+    learner_id: str,
+    view: str = "summary",
+    phase_number: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch part of the active roadmap (migration 029).
+
+    view="summary" returns the roadmap fields, every phase as {phase_number,
+    title, difficulty, status, skill_count} and the current phase in full;
+    view="phase" returns the roadmap fields and one phase (`phase_number`,
+    default the current one) under "phase". None without an active roadmap.
+    """
     try:
         response = await _run_query(
-            supabase.table("daily_missions")
-            .select("*")
+            supabase.rpc("get_active_roadmap_view", {
+                "p_view": view,
+                "p_phase_number": phase_number,
+                "p_learner_id": learner_id,
+            })
+        )
+        return response.data if isinstance(response.data, dict) else None
+    except Exception:
+        # Fallback to legacy implementation if RPC doesn't exist
+        pass
+    roadmap = await get_active_roadmap(
+        learner_id, columns=", ".join(ROADMAP_VIEW_FIELDS) + ", phases"
+    )
+    return _shape_roadmap_view(roadmap, view, phase_number)
+
+
+async def advance_roadmap_phase(
+    learner_id: str,
+    roadmap_id: str,
+    completed_phase: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Mark `completed_phase` done and move to the next phase.
+
+    Only the roadmap's progress columns (and the status of the affected phase
+    rows, via trigger) are written; the phases document is not. Completing a
+    phase other than the current one is a no-op. Returns {advanced,
+    current_phase_number, progress_pct}, or None if the roadmap is not found.
+    """
+    try:
+        response = await _run_query(
+            supabase.rpc("advance_roadmap_phase", {
+                "p_roadmap_id": roadmap_id,
+                "p_completed_phase": completed_phase,
+                "p_learner_id": learner_id,
+            })
+        )
+        if isinstance(response.data, dict):
+            await invalidate_dashboard(learner_id)
+            return response.data
+    except Exception:
+        # Fallback to legacy implementation if RPC doesn't exist
+        pass
+
+    try:
+        roadmap = await get_active_roadmap(
+            learner_id, columns="id, current_phase_number, total_phases, progress_pct"
+        )
+        if not roadmap or roadmap.get("id") != roadmap_id:
+            return None
+        current = roadmap.get("current_phase_number") or 1
+        total = roadmap.get("total_phases") or 0
+        progress = roadmap.get("progress_pct") or 0
+        if completed_phase != current or progress >= 100:
+            return {"advanced": False, "current_phase_number": current, "progress_pct": progress}
+        progress = min(100, 100 * completed_phase // total) if total > 0 else 100
+        current = min(current + 1, max(total, 1))
+        await _run_query(
+            supabase.table("roadmaps")
+            .update({"current_phase_number": current, "progress_pct": progress})
+            .eq("id", roadmap_id)
             .eq("learner_id", learner_id)
-            .eq("assigned_date", today)
-            .in_("status", ["pending", "in_progress"])
-            .limit(1)
         )
-        return response.data[0] if response.data else None
+        await invalidate_dashboard(learner_id)
+        return {"advanced": True, "current_phase_number": current, "progress_pct": progress}
     except Exception as e:
-        logger.error(f"Failed to fetch today's mission for {learner_id}: {e}")
-        return None
+        logger.error(f"Failed to advance roadmap {roadmap_id}: {e}")
+        raise
+
 
+# --- Daily Missions (schema.md §4) ---
+
+async def get_mission_for_date(learner_id: str, assigned_date: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the learner's mission for a day (default today), whatever its status.
 
-async def get_todays_completed_mission(learner_id: str) -> Optional[Dict[str, Any]]:
-    """Fetch today's already-completed mission (to show status, not regenerate)."""
+    daily_missions is UNIQUE(learner_id, assigned_date), so one lookup covers
+    both the active and the already-resolved case.
+    """
     from datetime import date
-    today = date.today().isoformat()
+    assigned_date = assigned_date or date.today().isoformat()
     try:
         response = await _run_query(
             supabase.table("daily_missions")
             .select("*")
             .eq("learner_id", learner_id)
-            .eq("assigned_date", today)
-            .in_("status", ["completed", "skipped", "failed"])
-            .order("created_at", desc=True)
+            .eq("assigned_date", assigned_date)
             .limit(1)
         )
         return response.data[0] if response.data else None
     except Exception as e:
-        logger.error(f"Failed to fetch completed mission for {learner_id}: {e}")
+        logger.error(f"Failed to fetch mission for {learner_id} on {assigned_date}: {e}")
         return None
 
 
-async def create_mission(learner_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Create a new daily mission."""
+async def create_mission_if_absent(learner_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Insert the day's mission unless one already exists (ON CONFLICT DO NOTHING).
+
+    Returns the inserted row, or None if another request inserted first.
+    """
     try:
         data["learner_id"] = learner_id
-        response = await _run_query(supabase.table("daily_missions").insert(data))
-        return response.data[0] if response.data else None
+        response = await _run_query(
+            supabase.table("daily_missions").upsert(
+                data, on_conflict="learner_id,assigned_date", ignore_duplicates=True
+            )
+        )
+        if response.data:
+            await invalidate_dashboard(learner_id)
+            return response.data[0]
+        return None
     except Exception as e:
         logger.error(f"Failed to create mission for {learner_id}: {e}")
         raise
@@ -273,6 +449,7 @@ async def update_mission_status(
             .eq("id", mission_id)
             .eq("learner_id", learner_id)
         )
+        await invalidate_dashboard(learner_id)
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Failed to update mission {mission_id}: {e}")
@@ -302,6 +479,7 @@ async def complete_mission(
             .eq("id", mission_id)
             .eq("learner_id", learner_id)
         )
+        await invalidate_dashboard(learner_id)
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Failed to complete mission {mission_id}: {e}")
@@ -313,7 +491,7 @@ async def get_recent_missions(learner_id: str, limit: int = 5) -> List[Dict[str,
     try:
         response = await _run_query(
             supabase.table("daily_missions")
-            .select("title, target_skill, difficulty, status, assigned_date")
+            .select("title, target_skill, difficulty, status, assigned_date, estimated_minutes, time_spent_minutes")
             .eq("learner_id", learner_id)
             .order("assigned_date", desc=True)
             .limit(limit)
@@ -324,26 +502,142 @@ async def get_recent_missions(learner_id: str, limit: int = 5) -> List[Dict[str,
         return []
 
 
-async def get_mission_by_id(mission_id: str, learner_id: str) -> Optional[Dict[str, Any]]:
+# --- Mission Templates (migration 028) ---
+
+async def pick_mission_template(template_key: str, exclude_titles: List[str]) -> Optional[Dict[str, Any]]:
+    """Least-used library mission for the key, skipping the given titles. None on a miss."""
+    try:
+        response = await _run_query(
+            supabase.rpc("pick_mission_template", {
+                "p_template_key": template_key,
+                "p_exclude_titles": exclude_titles,
+            })
+        )
+        return response.data or None
+    except Exception:
+        # Library not deployed — every lookup is a miss
+        return None
+
+
+async def add_mission_template(template_key: str, mission: Dict[str, Any], max_variants: int) -> bool:
+    """Store a validated mission in the library. Returns True if it was added."""
+    response = await _run_query(
+        supabase.rpc("add_mission_template", {
+            "p_template_key": template_key,
+            "p_mission": mission,
+            "p_max_variants": max_variants,
+        })
+    )
+    return bool(response.data)
+
+
+# --- Mission Drafts (migration 027) ---
+
+async def get_mission_pregen_candidates(assigned_date: str, limit: int, days: int = 14) -> List[Dict[str, Any]]:
+    """
+    Learners active in the last `days` days to pre-generate a mission for,
+    most likely visitor first.
+
+    Returns [{"learner_id", "priority"}]. Service-role only.
+    """
+    try:
+        response = await _run_query(
+            supabase.rpc("get_mission_pregen_candidates", {"p_date": assigned_date, "p_limit": limit, "p_days": days})
+        )
+        return response.data or []
+    except Exception as e:
+        logger.error(f"Failed to fetch mission pre-generation candidates: {e}")
+        return []
+
+
+async def save_mission_draft(
+    learner_id: str,
+    assigned_date: str,
+    mission: Dict[str, Any],
+    priority: float = 0,
+) -> None:
+    """Store a pre-generated mission until the learner's first visit that day."""
+    try:
+        await _run_query(
+            supabase.table("mission_drafts").upsert({
+                "learner_id": learner_id,
+                "assigned_date": assigned_date,
+                "mission": mission,
+                "priority": priority,
+            })
+        )
+    except Exception as e:
+        logger.error(f"Failed to save mission draft for {learner_id}: {e}")
+        raise
+
+
+async def take_mission_draft(learner_id: str, assigned_date: str) -> Optional[Dict[str, Any]]:
+    """Remove and return the learner's draft for the date, or None."""
+    try:
+        response = await _run_query(
+            supabase.table("mission_drafts")
+            .delete()
+            .eq("learner_id", learner_id)
+            .eq("assigned_date", assigned_date)
+        )
+        return response.data[0] if response.data else None
+    except Exception:
+        # Drafts table not deployed — generate on demand as before
+        return None
+
+
+async def purge_mission_drafts(before_date: str) -> None:
+    """Drop drafts for days that have passed (the learner never visited)."""
+    try:
+        await _run_query(supabase.table("mission_drafts").delete().lt("assigned_date", before_date))
+    except Exception as e:
+        logger.error(f"Failed to purge mission drafts: {e}")
+
+
+async def get_mission_by_id(mission_id: str, learner_id: str, columns: str = "*") -> Optional[Row]:
     """Fetch a specific mission by ID (scoped to learner)."""
     try:
         response = await _run_query(
             supabase.table("daily_missions")
-            .select("*")
+            .select(columns)
             .eq("id", mission_id)
             .eq("learner_id", learner_id)
             .single()
         )
-        return response.data if response.data else None
+        return make_row(response.data or None, "daily_missions", columns,
+                        _column_loader("daily_missions", id=mission_id, learner_id=learner_id))
     except Exception as e:
         logger.error(f"Failed to fetch mission {mission_id}: {e}")
         return None
 
 
 async def calculate_streak(learner_id: str) -> int:
-    """Calculate the current consecutive-day completion streak (via SQL RPC)."""
+    """
+    Current consecutive-day completion streak.
+
+    Reads the streak materialized on the learner row (migration 021) and
+    applies the day-rollover rule. Falls back to the calculate_streak_sql RPC,
+    then to walking recent completions, on databases without the columns.
+    """
+    from datetime import date
+    from app.services.streaks import effective_streak, streak_from_dates
+
     try:
-        # Use optimized SQL function if available
+        try:
+            response = await _run_query(
+                supabase.table("learners")
+                .select("current_streak, last_completion_date")
+                .eq("id", learner_id)
+                .maybe_single()
+            )
+            row = response.data if response else None
+            if not row:
+                return 0
+            return effective_streak(row.get("current_streak"), row.get("last_completion_date"), date.today())
+        except Exception:
+            # Fallback to the SQL function if the streak columns don't exist
+            pass
+
         try:
             response = await _run_query(
                 supabase.rpc("calculate_streak_sql", {"p_learner_id": learner_id})
@@ -355,7 +649,6 @@ async def calculate_streak(learner_id: str) -> int:
             pass
 
         # Legacy Python implementation
-        from datetime import date, timedelta
         response = await _run_query(
             supabase.table("daily_missions")
             .select("assigned_date, status")
@@ -366,22 +659,7 @@ async def calculate_streak(learner_id: str) -> int:
         )
         if not response.data:
             return 0
-
-        completed_dates = set(row["assigned_date"] for row in response.data)
-        today = date.today()
-        streak = 0
-
-        check_date = today
-        if today.isoformat() not in completed_dates:
-            check_date = today - timedelta(days=1)
-            if check_date.isoformat() not in completed_dates:
-                return 0
-
-        while check_date.isoformat() in completed_dates:
-            streak += 1
-            check_date -= timedelta(days=1)
-
-        return streak
+        return streak_from_dates((row["assigned_date"] for row in response.data), date.today())
     except Exception as e:
         logger.error(f"Failed to calculate streak for {learner_id}: {e}")
         return 0
@@ -416,18 +694,22 @@ async def get_resume_by_id(resume_id: str, learner_id: str) -> Optional[Dict[str
         return None
 
 
-async def get_current_resume(learner_id: str) -> Optional[Dict[str, Any]]:
+async def get_current_resume(learner_id: str, columns: str = "*") -> Optional[Row]:
     """Fetch the current (most recent active) resume for a learner."""
     try:
         response = await _run_query(
             supabase.table("resumes")
-            .select("*")
+            .select(columns)
             .eq("learner_id", learner_id)
             .eq("is_current", True)
             .order("created_at", desc=True)
             .limit(1)
         )
-        return response.data[0] if response.data else None
+        if not response.data:
+            return None
+        row = response.data[0]
+        loader = _column_loader("resumes", id=row["id"], learner_id=learner_id) if "id" in row else None
+        return make_row(row, "resumes", columns, loader)
     except Exception as e:
         logger.error(f"Failed to fetch current resume for {learner_id}: {e}")
         return None
@@ -528,6 +810,46 @@ async def create_event(
         raise
 
 
+def _event_row(learner_id: str, event: Dict[str, Any]) -> Dict[str, Any]:
+    row: Dict[str, Any] = {
+        "learner_id": learner_id,
+        "event_type": event["event_type"],
+        "payload": event.get("payload") or {},
+    }
+    for key in ("id", "related_mission_id", "related_roadmap_id", "created_at"):
+        if event.get(key):
+            row[key] = event[key]
+    return row
+
+
+async def create_events(learner_id: str, events: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Insert several event log entries in one request; returns the rows in input order.
+
+    If the bulk insert is rejected (e.g. one bad related_mission_id), each
+    event is inserted on its own so the rest are kept; failed ones are None.
+    """
+    if not events:
+        return []
+    rows = [_event_row(learner_id, event) for event in events]
+    try:
+        response = await _run_query(supabase.table("event_log").insert(rows))
+        if response.data and len(response.data) == len(rows):
+            return response.data
+    except Exception as e:
+        logger.warning(f"Bulk event insert failed for {learner_id}, inserting one by one: {e}")
+
+    async def insert_one(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            response = await _run_query(supabase.table("event_log").insert(row))
+            return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error(f"Failed to create {row['event_type']} event for {learner_id}: {e}")
+            return None
+
+    return list(await asyncio.gather(*(insert_one(row) for row in rows)))
+
+
 async def get_recent_events(learner_id: str, limit: int = 10) -> List[Dict[str, Any]]:
     """Fetch recent events for a learner, newest first."""
     try:
@@ -565,10 +887,79 @@ async def get_events_by_type(
         return []
 
 
+async def get_events_by_types(
+    learner_id: str,
+    event_types: Sequence[str],
+    limit: int = 200,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch the newest events of any of the given types for a learner, newest first.
+
+    Raises on failure so callers that cache the result (rules_state) do not
+    cache an empty history.
+    """
+    try:
+        response = await _run_query(
+            supabase.table("event_log")
+            .select("id, event_type, payload, related_mission_id, created_at")
+            .eq("learner_id", learner_id)
+            .in_("event_type", list(event_types))
+            .order("created_at", desc=True)
+            .limit(limit)
+        )
+        return response.data if response.data else []
+    except Exception as e:
+        logger.error(f"Failed to fetch events for {learner_id}: {e}")
+        raise
+
+
+def last_regeneration_cache_key(learner_id: str) -> str:
+    return f"last_regen:{learner_id}"
+
+
+async def remember_regeneration(learner_id: str, roadmap: Any) -> None:
+    """Cache a just-created roadmap's created_at for the debounce check."""
+    created_at = roadmap.get("created_at") if isinstance(roadmap, dict) else None
+    if created_at:
+        await cache.set(
+            last_regeneration_cache_key(learner_id),
+            {"at": str(created_at)},
+            ttl=settings.LAST_REGENERATION_CACHE_TTL_SECONDS,
+        )
+
+
 async def get_last_regeneration(learner_id: str) -> Optional[str]:
     """
     Get the timestamp of the last roadmap generation/regeneration for debounce check.
 
+    One Redis read (last_regen:<learner_id>, written by create_roadmap); on a
+    miss, learners.last_regenerated_at (migration 031, kept by a trigger on
+    roadmaps) is read by primary key and cached.
+    """
+    cached = await cache.get(last_regeneration_cache_key(learner_id))
+    if cached is not None:
+        return cached.get("at")
+
+    try:
+        response = await _run_query(
+            supabase.table("learners").select("last_regenerated_at").eq("id", learner_id).limit(1)
+        )
+    except Exception:
+        # Fallback to legacy implementation if the column doesn't exist
+        return await _get_last_regeneration_legacy(learner_id)
+    value = response.data[0].get("last_regenerated_at") if response.data else None
+    await cache.set(
+        last_regeneration_cache_key(learner_id),
+        {"at": value},
+        ttl=settings.LAST_REGENERATION_CACHE_TTL_SECONDS,
+    )
+    return value
+
+
+async def _get_last_regeneration_legacy(learner_id: str) -> Optional[str]:
+    """
+    Last regeneration without migration 031: newest roadmap, else newest event.
+
     F-09/F-10 FIX: reads the roadmaps table first (the row itself is the source
     of truth), falling back to event_log only for pre-existing data. Previously
     the debounce depended on the event_log INSERT succeeding — if that write
@@ -612,8 +1003,15 @@ async def create_job(
     payload: Dict[str, Any],
     resume_id: Optional[str] = None,
     roadmap_id: Optional[str] = None,
+    service_role: bool = False,
 ) -> Optional[Dict[str, Any]]:
-    """Create a new job in the job queue."""
+    """
+    Create a new job in the job queue.
+
+    Job types learners may not insert themselves (migration 030) pass
+    service_role=True to insert through the service-role client.
+    """
+    client = (get_service_client() or supabase) if service_role else supabase
     try:
         job_data: Dict[str, Any] = {
             "job_type": job_type,
@@ -625,21 +1023,109 @@ async def create_job(
         if roadmap_id:
             job_data["roadmap_id"] = roadmap_id
 
-        response = await _run_query(supabase.table("job_queue").insert(job_data))
+        response = await _run_query(client.table("job_queue").insert(job_data))
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Failed to create job for learner {learner_id}: {e}")
         raise
 
 
+async def enqueue_roadmap_job(
+    learner_id: str,
+    trigger_reason: str,
+    bypass_debounce: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    Queue a roadmap_generate job, or join the learner's existing one (migration 030).
+
+    The RPC is service-role only (the worker honors bypass_debounce from the
+    payload), so it goes through the service-role client; callers check the
+    debounce before enqueueing. Returns {"job_id", "coalesced"}, or None if
+    no job could be queued.
+    """
+    try:
+        response = await _run_query(
+            (get_service_client() or supabase).rpc("enqueue_roadmap_job", {
+                "p_trigger_reason": trigger_reason,
+                "p_bypass_debounce": bypass_debounce,
+                "p_learner_id": learner_id,
+            })
+        )
+        if isinstance(response.data, dict) and response.data.get("job_id"):
+            return response.data
+    except Exception:
+        # Fallback to legacy implementation if RPC doesn't exist or isn't callable
+        pass
+
+    # Legacy implementation (coalescing is best-effort without the RPC's lock).
+    # Learners may not insert roadmap_generate jobs themselves (migration 030),
+    # so in a request without the RPC this fails and the caller runs inline.
+    try:
+        statuses = ["pending"] if bypass_debounce else ["pending", "processing"]
+        existing = await _run_query(
+            supabase.table("job_queue").select("id")
+            .eq("learner_id", learner_id)
+            .eq("job_type", "roadmap_generate")
+            .in_("status", statuses)
+            .order("created_at")
+            .limit(1)
+        )
+        if existing.data:
+            return {"job_id": existing.data[0]["id"], "coalesced": True}
+        job = await create_job(
+            job_type="roadmap_generate",
+            learner_id=learner_id,
+            payload={
+                "learner_id": learner_id,
+                "trigger_reason": trigger_reason,
+                "bypass_debounce": bypass_debounce,
+            },
+        )
+        return {"job_id": job["id"], "coalesced": False} if job else None
+    except Exception as e:
+        logger.error(f"Failed to enqueue roadmap job for learner {learner_id}: {e}")
+        return None
+
+
+async def get_job(job_id: str, learner_id: str, columns: str = "*") -> Optional[Dict[str, Any]]:
+    """Fetch one of the learner's jobs."""
+    try:
+        response = await _run_query(
+            supabase.table("job_queue")
+            .select(columns)
+            .eq("id", job_id)
+            .eq("learner_id", learner_id)
+            .limit(1)
+        )
+        return response.data[0] if response.data else None
+    except Exception as e:
+        logger.error(f"Failed to fetch job {job_id}: {e}")
+        return None
+
+
+async def update_job_progress(
+    job_id: str,
+    progress_state: str,
+    result: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Record a job's progress (and outcome). Errors are logged, not raised."""
+    data: Dict[str, Any] = {"progress_state": progress_state}
+    if result is not None:
+        data["result"] = result
+    try:
+        await _run_query(supabase.table("job_queue").update(data).eq("id", job_id))
+    except Exception as e:
+        logger.warning(f"Failed to record progress {progress_state} for job {job_id}: {e}")
+
+
 # --- Skill Baselines (schema.md §9) ---
 
-async def get_skill_baseline(role_or_company: str) -> Optional[Dict[str, Any]]:
+async def get_skill_baseline(role_or_company: str, columns: str = "*") -> Optional[Dict[str, Any]]:
     """Fetch skill baseline for a target role or company."""
     try:
         response = await _run_query(
             supabase.table("skill_baselines")
-            .select("*")
+            .select(columns)
             .eq("role_or_company", role_or_company)
             .limit(1)
         )
@@ -686,12 +1172,16 @@ async def create_consent(
         return None
 
 
-async def create_interview_session(learner_id: str, track: str) -> Optional[Dict[str, Any]]:
-    """Create a new interview session."""
+async def create_interview_session(
+    learner_id: str,
+    track: str,
+    data: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Create a new interview session (`data` adds columns to the same insert)."""
     try:
         response = await _run_query(
             supabase.table("interview_sessions")
-            .insert({"learner_id": learner_id, "track": track})
+            .insert({**(data or {}), "learner_id": learner_id, "track": track})
         )
         return response.data[0] if response.data else None
     except Exception as e:
@@ -699,17 +1189,18 @@ async def create_interview_session(learner_id: str, track: str) -> Optional[Dict
         return None
 
 
-async def get_interview_session(session_id: str, learner_id: str) -> Optional[Dict[str, Any]]:
+async def get_interview_session(session_id: str, learner_id: str, columns: str = "*") -> Optional[Row]:
     """Fetch an interview session by ID, scoped to learner."""
     try:
         response = await _run_query(
             supabase.table("interview_sessions")
-            .select("*")
+            .select(columns)
             .eq("id", session_id)
             .eq("learner_id", learner_id)
             .single()
         )
-        return response.data if response.data else None
+        return make_row(response.data or None, "interview_sessions", columns,
+                        _column_loader("interview_sessions", id=session_id, learner_id=learner_id))
     except Exception as e:
         logger.error(f"Failed to fetch interview session {session_id}: {e}")
         return None
@@ -729,6 +1220,154 @@ async def update_interview_session(session_id: str, data: Dict[str, Any]) -> Opt
         return None
 
 
+async def append_interview_turns(
+    session_id: str,
+    learner_id: str,
+    turns: List[Dict[str, Any]],
+    questions: int = 0,
+    summary: Optional[Dict[str, Any]] = None,
+    expected_questions: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Append transcript entries to a session (atomic via RPC, migration 022).
+
+    Each entry becomes one interview_turns row with the next sequence number;
+    `questions` is added to the session's question_count and `summary`, if
+    given, replaces transcript_summary (migration 023) in the same call.
+    Returns the updated {"turn_count", "question_count"}, or None when nothing
+    was appended: the session is not in progress, or its question_count no
+    longer equals `expected_questions` (a duplicate submit got there first).
+    """
+    params = {
+        "p_session_id": session_id,
+        "p_turns": turns,
+        "p_questions": questions,
+        "p_learner_id": learner_id,
+    }
+    if summary is not None:
+        params["p_summary"] = summary
+    if expected_questions is not None:
+        params["p_expected_questions"] = expected_questions
+    try:
+        response = await _run_query(supabase.rpc("append_interview_turns", params))
+        return response.data
+    except Exception:
+        # Fallback to legacy implementation if RPC doesn't exist
+        pass
+
+    try:
+        session = await get_interview_session(
+            session_id, learner_id, columns="id, status, transcript, question_count"
+        )
+        if not session or session.get("status") != "in_progress":
+            return None
+        if expected_questions is not None and (session.get("question_count") or 0) != expected_questions:
+            return None
+        transcript = (session.get("transcript") or []) + list(turns)
+        question_count = (session.get("question_count") or 0) + questions
+        update = {"transcript": transcript, "question_count": question_count}
+        if summary is not None:
+            update["transcript_summary"] = summary
+        await update_interview_session(session_id, update)
+        return {"turn_count": len(transcript), "question_count": question_count}
+    except Exception as e:
+        logger.error(f"Failed to append interview turns for session {session_id}: {e}")
+        return None
+
+
+async def complete_interview_session(
+    session_id: str,
+    learner_id: str,
+    turns: List[Dict[str, Any]],
+    delivery_metrics: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Append the final turns, mark the session completed and queue its
+    interview_feedback job in one round trip (RPC, migration 025).
+
+    Returns {"completed": bool, "job_id": str | None}; job_id is None when the
+    job could not be queued and the caller should generate feedback itself.
+    """
+    try:
+        response = await _run_query(
+            supabase.rpc("complete_interview_session", {
+                "p_session_id": session_id,
+                "p_turns": turns,
+                "p_delivery_metrics": delivery_metrics,
+                "p_learner_id": learner_id,
+            })
+        )
+        if response.data:
+            return response.data
+    except Exception:
+        # Fallback to legacy implementation if RPC doesn't exist
+        pass
+
+    # Legacy implementation: append while the session is still in progress,
+    # then complete it only if no concurrent submit already has
+    if not await append_interview_turns(session_id, learner_id, turns):
+        return {"completed": False, "job_id": None}
+    update: Dict[str, Any] = {"status": "completed", "feedback_status": "pending"}
+    if delivery_metrics:
+        update.update({"camera_enabled": True, "delivery_metrics": delivery_metrics})
+    try:
+        response = await _run_query(
+            supabase.table("interview_sessions")
+            .update(update)
+            .eq("id", session_id)
+            .eq("learner_id", learner_id)
+            .eq("status", "in_progress")
+        )
+    except Exception as e:
+        logger.error(f"Failed to complete interview session {session_id}: {e}")
+        return {"completed": False, "job_id": None}
+    if not response.data:
+        return {"completed": False, "job_id": None}
+    try:
+        job = await create_job(
+            job_type="interview_feedback",
+            learner_id=learner_id,
+            payload={"session_id": session_id, "learner_id": learner_id},
+            service_role=True,
+        )
+    except Exception:
+        job = None
+    return {"completed": True, "job_id": job["id"] if job else None}
+
+
+async def get_interview_transcript(
+    session_id: str,
+    learner_id: str,
+    last: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Assemble a session transcript from interview_turns, in sequence order.
+
+    `last` limits the result to the most recent N turns (still oldest first).
+    """
+    try:
+        query = (
+            supabase.table("interview_turns")
+            .select("role, content, question_type")
+            .eq("session_id", session_id)
+            .eq("learner_id", learner_id)
+        )
+        if last is not None:
+            response = await _run_query(query.order("seq", desc=True).limit(last))
+            return list(reversed(response.data or []))
+        response = await _run_query(query.order("seq"))
+        return response.data or []
+    except Exception:
+        # Fallback to legacy implementation if the turns table doesn't exist
+        pass
+
+    session = await get_interview_session(session_id, learner_id, columns="id, transcript")
+    transcript = (session.get("transcript") or []) if session else []
+    if last is not None:
+        return transcript[max(len(transcript) - last, 0):]
+    return transcript
+
+
 async def get_interview_history(learner_id: str, limit: int = 10) -> List[Dict[str, Any]]:
     """Get recent interview sessions for a learner."""
     try:
@@ -745,6 +1384,40 @@ async def get_interview_history(learner_id: str, limit: int = 10) -> List[Dict[s
         return []
 
 
+async def get_delivery_stats(learner_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Rolling delivery-metric state (migration 026), see app/services/delivery_trends.py.
+
+    None when the learner has no row yet or the table doesn't exist.
+    """
+    try:
+        response = await _run_query(
+            supabase.table("learner_delivery_stats")
+            .select("state")
+            .eq("learner_id", learner_id)
+            .maybe_single()
+        )
+        return response.data.get("state") if response and response.data else None
+    except Exception:
+        return None
+
+
+async def save_delivery_stats(learner_id: str, state: Dict[str, Any]) -> None:
+    """Store the learner's delivery-metric state. Derived data, so failures are only logged."""
+    from datetime import datetime, timezone
+
+    try:
+        await _run_query(
+            supabase.table("learner_delivery_stats").upsert({
+                "learner_id": learner_id,
+                "state": state,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            })
+        )
+    except Exception as e:
+        logger.error(f"Failed to save delivery stats for {learner_id}: {e}")
+
+
 # --- Psychometric Profiles (rules.md §3, api.md §7) ---
 
 async def get_psychometric_profile(learner_id: str) -> Optional[Dict[str, Any]]:
@@ -762,18 +1435,139 @@ async def get_psychometric_profile(learner_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# --- Dashboard (api.md §6) ---
+
+def dashboard_cache_key(learner_id: str) -> str:
+    return f"dashboard:{learner_id}"
+
+
+async def invalidate_dashboard(learner_id: Optional[str]) -> None:
+    """Drop the cached dashboard after a mission, roadmap, or learner write."""
+    if learner_id:
+        await cache.delete(dashboard_cache_key(learner_id))
+
+
+def _slim_roadmap(roadmap: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Reduce a full roadmap row to the shape returned by get_dashboard_summary."""
+    if not roadmap:
+        return None
+    current_phase_number = roadmap.get("current_phase_number", 1)
+    phases = roadmap.get("phases", []) or []
+    current_phase_title = None
+    for phase in phases:
+        if phase.get("phase_number") == current_phase_number:
+            current_phase_title = phase.get("title", f"Phase {current_phase_number}")
+            break
+    return {
+        "current_phase_number": current_phase_number,
+        "total_phases": roadmap.get("total_phases", len(phases)),
+        "progress_pct": roadmap.get("progress_pct", 0),
+        "current_phase_title": current_phase_title,
+        "phases": [
+            {
+                "phase_number": phase.get("phase_number", 0),
+                "difficulty": phase.get("difficulty"),
+                "skills": phase.get("skills", [])[:3],
+            }
+            for phase in phases
+        ],
+    }
+
+
+async def _get_dashboard_summary_legacy(learner_id: str) -> Dict[str, Any]:
+    """Multi-query fallback for databases without the get_dashboard_summary RPC."""
+    async def _fetch_profile_psychometrics():
+        try:
+            # F-11 FIX: onboarding stores category_scores on `learners`; fall back
+            # to learner_profiles.questionnaire_data for legacy accounts.
+            learner = await get_learner(learner_id, columns="id, category_scores")
+            if learner and learner.get("category_scores"):
+                return learner["category_scores"], None
+            result = await get_learner_profile(learner_id, columns="id, questionnaire_data")
+            if result:
+                qd = result.get("questionnaire_data", {})
+                if isinstance(qd, dict):
+                    return qd.get("category_scores"), qd.get("recommended_courses")
+        except Exception as e:
+            logger.warning(f"Failed to fetch questionnaire_data: {e}")
+        return None, None
+
+    roadmap, streak_days, (category_scores, recommended_courses) = await asyncio.gather(
+        get_active_roadmap(learner_id, columns="id, current_phase_number, total_phases, progress_pct, phases"),
+        calculate_streak(learner_id),
+        _fetch_profile_psychometrics(),
+    )
+    return {
+        "roadmap": _slim_roadmap(roadmap),
+        "streak_days": streak_days,
+        "category_scores": category_scores,
+        "recommended_courses": recommended_courses,
+    }
+
+
+async def get_dashboard_summary(learner_id: str) -> Dict[str, Any]:
+    """
+    Fetch everything the dashboard renders in one round trip (migration 019).
+
+    Returns {"roadmap": {...} | None, "streak_days", "category_scores",
+    "recommended_courses"}, where roadmap holds only the phase numbers,
+    difficulty and top-3 skills per phase plus the current phase title.
+    """
+    try:
+        response = await _run_query(
+            supabase.rpc("get_dashboard_summary", {"p_learner_id": learner_id})
+        )
+        if isinstance(response.data, dict):
+            return response.data
+    except Exception:
+        # Fallback to legacy implementation if RPC doesn't exist
+        pass
+    return await _get_dashboard_summary_legacy(learner_id)
+
+
 # --- Activity Heatmap (api.md §6) ---
 
 async def get_daily_activity(learner_id: str) -> Dict[str, int]:
     """
-    Aggregate daily activity counts over the last ~365 days for the contribution heatmap.
+    Daily activity counts over the last ~365 days for the contribution heatmap.
+
+    Reads the learner_daily_activity rollup (migration 020), which triggers on
+    daily_missions, interview_sessions and event_log keep current. Falls back
+    to scanning the source tables if the rollup table doesn't exist.
+
+    Returns a dict of {"YYYY-MM-DD": count} for dates with activity.
+    """
+    from datetime import date, timedelta
+
+    today = date.today()
+    try:
+        response = await _run_query(
+            supabase.table("learner_daily_activity")
+            .select("activity_date, activity_count")
+            .eq("learner_id", learner_id)
+            .gte("activity_date", (today - timedelta(days=365)).isoformat())
+            .lte("activity_date", today.isoformat())
+        )
+        return {
+            str(row["activity_date"]): row["activity_count"]
+            for row in response.data or []
+            if row.get("activity_count")
+        }
+    except Exception:
+        # Fallback to legacy implementation if the rollup table doesn't exist
+        pass
+
+    return await _get_daily_activity_legacy(learner_id)
+
+
+async def _get_daily_activity_legacy(learner_id: str) -> Dict[str, int]:
+    """
+    Aggregate activity by scanning a year of source rows.
 
     Sources (each counts as one activity):
       - daily_missions (completed / in_progress / skipped on assigned_date)
       - interview_sessions (created_at)
       - event_log entries (created_at)
-
-    Returns a dict of {"YYYY-MM-DD": count} for dates with activity.
     """
     from datetime import date, datetime, timedelta
 
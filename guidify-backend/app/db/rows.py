@@ -0,0 +1,111 @@
+"""
+Projected Rows — slim query results with lazily loaded heavy columns
+
+Query helpers in app.db.queries accept a `columns` projection so each call
+site fetches only the fields it reads. Results come back as `Row`, a
+Dict[str, Any] subclass that remembers its table and projection:
+
+  - Columns in the projection behave exactly like dict entries.
+  - Heavy JSON columns (HEAVY_COLUMNS) are left out of projections and loaded
+    on first use with `await row.fetch("phases")`; the value is merged into
+    the row, so later reads are plain dict lookups.
+  - `row.get(column, default)` keeps the dict contract for columns outside
+    the projection: it returns the default and logs a warning (pointing at
+    fetch() for heavy columns), so a too-narrow projection shows up in the
+    logs without breaking callers.
+  - `row[column]` for a column outside the projection raises
+    ColumnNotLoaded (a KeyError).
+
+Rows fetched with "*" have nothing to load and never warn or raise.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional
+
+logger = logging.getLogger("guidify.db.rows")
+
+# Large JSONB columns per table — the payload that projections exist to avoid.
+HEAVY_COLUMNS: Dict[str, FrozenSet[str]] = {
+    "learners": frozenset({"personality_analysis"}),
+    "learner_profiles": frozenset({"resume_data"}),
+    "roadmaps": frozenset({"phases"}),
+    "daily_missions": frozenset({"steps", "resources"}),
+    "interview_sessions": frozenset({"transcript", "feedback_report", "context_data"}),
+    "resumes": frozenset({"parsed_data", "gap_analysis"}),
+}
+
+# Selects the given columns (a PostgREST select list) of the row's record
+Loader = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class ColumnNotLoaded(KeyError):
+    """Raised when a column outside the row's projection is indexed."""
+
+
+def parse_columns(columns: str) -> Optional[FrozenSet[str]]:
+    """Split a PostgREST select list into column names (None for "*")."""
+    names = frozenset(c.strip() for c in columns.split(",") if c.strip())
+    return None if "*" in names else names
+
+
+class Row(Dict[str, Any]):
+    """A projected row; see the module docstring."""
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        table: str,
+        columns: str = "*",
+        loader: Optional[Loader] = None,
+    ):
+        super().__init__(data)
+        self.table = table
+        self.projection = parse_columns(columns)
+        self._loader = loader
+
+    def is_loaded(self, column: str) -> bool:
+        return self.projection is None or dict.__contains__(self, column)
+
+    def _describe(self, key: str) -> str:
+        if key in HEAVY_COLUMNS.get(self.table, ()):
+            return f"{self.table}.{key} is not loaded; use `await row.fetch({key!r})`"
+        return f"{self.table}.{key} is outside the projection {sorted(self.projection or ())}"
+
+    def __getitem__(self, key: str) -> Any:
+        if not self.is_loaded(key):
+            raise ColumnNotLoaded(self._describe(key))
+        return super().__getitem__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if not self.is_loaded(key):
+            logger.warning(self._describe(key))
+        return super().get(key, default)
+
+    async def fetch(self, *columns: str) -> Any:
+        """
+        Load the given columns (in one query) if not already present.
+
+        Returns the value for a single column, or the row itself for several.
+        """
+        missing = [c for c in columns if not self.is_loaded(c)]
+        if missing:
+            if self._loader is None:
+                raise ColumnNotLoaded(f"{self.table} row has no loader for {missing}")
+            data = await self._loader(", ".join(missing)) or {}
+            for column in missing:
+                dict.__setitem__(self, column, data.get(column))
+        if len(columns) == 1:
+            return dict.get(self, columns[0])
+        return self
+
+
+def make_row(
+    data: Optional[Dict[str, Any]],
+    table: str,
+    columns: str,
+    loader: Optional[Loader] = None,
+) -> Optional[Row]:
+    """Wrap a query result in a Row (None stays None)."""
+    if data is None:
+        return None
+    return Row(data, table, columns, loader)
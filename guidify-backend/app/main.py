@@ -11,6 +11,7 @@ from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from contextlib import asynccontextmanager
 import sys
 import time
 
@@ -22,6 +23,8 @@ if sys.stderr.encoding != 'utf-8':
 
 # Import core modules
 from app.core.config import settings
+from app.core.cache import cache
+from app.db.event_writer import event_writer
 from app.core.exceptions import GUIDIFYException
 from app.core.logger import logger, log_request
 from app.middleware.error_handler import (
@@ -55,6 +58,17 @@ from app.core.auth import get_current_learner_id
 
 from prometheus_fastapi_instrumentator import Instrumentator
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the buffered event writer; flush it and release shared connections on shutdown."""
+    if settings.EVENT_WRITER_ENABLED:
+        event_writer.start()
+    yield
+    await event_writer.stop()
+    await cache.close()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
@@ -62,7 +76,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url="/api/docs" if settings.DEBUG else None,
     redoc_url="/api/redoc" if settings.DEBUG else None,
-    openapi_url="/api/openapi.json" if settings.DEBUG else None
+    openapi_url="/api/openapi.json" if settings.DEBUG else None,
+    lifespan=lifespan,
 )
 
 logger.info(
@@ -6,7 +6,7 @@ and AI Gateway output validation.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from enum import Enum
 
 from pydantic import BaseModel, Field
@@ -93,6 +93,7 @@ class RoadmapPhase(BaseModel):
     estimated_weeks: int = 4
     difficulty: str = "beginner"
     milestones: List[str] = []
+    remedial_missions: List[str] = []
 
 
 class RoadmapGenerateResponse(BaseModel):
@@ -103,6 +104,22 @@ class RoadmapGenerateResponse(BaseModel):
     phases: List[RoadmapPhase]
 
 
+class RoadmapPhasePatch(BaseModel):
+    """Changes to one roadmap phase from roadmap.adapt"""
+    difficulty: Optional[Literal["beginner", "intermediate", "advanced"]] = None
+    add_skills: List[str] = []
+    remove_skills: List[str] = []
+    remedial_missions: List[str] = []
+    estimated_weeks: Optional[int] = Field(None, ge=1)
+
+
+class RoadmapAdaptResponse(BaseModel):
+    """AI Gateway output schema for roadmap.adapt"""
+    phase_number: int
+    patch: RoadmapPhasePatch
+    rationale: str = ""
+
+
 class RoadmapCurrentResponse(BaseModel):
     """GET /roadmap/current response — api.md §3"""
     id: str
@@ -401,6 +418,27 @@ class AdaptationDecision(BaseModel):
     bypass_debounce: bool = False
     consecutive_failures: Optional[int] = None
     fast_streak: Optional[int] = None
+    job_id: Optional[str] = None
+
+
+class EventBatchRequest(BaseModel):
+    """POST /adaptation/events/batch request body — events in the order they happened"""
+    events: List[EventCreateRequest] = Field(..., min_length=1, max_length=100)
+
+
+class EventBatchResult(BaseModel):
+    """Outcome of one event in a batch"""
+    index: int
+    event_type: str
+    logged: bool
+    event_id: Optional[str] = None
+
+
+class EventBatchResponse(BaseModel):
+    """POST /adaptation/events/batch response — per-event results and one adaptation decision"""
+    results: List[EventBatchResult]
+    logged: int
+    adaptation: AdaptationDecision
 
 
 class SkillGapResponse(BaseModel):
@@ -492,6 +530,7 @@ class InterviewSessionResponse(BaseModel):
     readiness_subscore: Optional[int] = None
     question_count: int = 0
     created_at: Optional[datetime] = None
+    feedback_status: Optional[str] = None  # pending | partial | ready | failed
 
 
 class InterviewStartResponse(BaseModel):
@@ -507,6 +546,16 @@ class InterviewAnswerResponse(BaseModel):
     next_question: Optional[str] = None
     status: str = "in_progress"
     feedback_report: Optional[InterviewFeedbackResponse] = None
+    # Set when the session completes; the report is generated in the background
+    feedback_status: Optional[str] = None
+
+
+class InterviewFeedbackStatusResponse(BaseModel):
+    """GET /interview/session/{id}/feedback response"""
+    session_id: str
+    feedback_status: Optional[str] = None  # pending | partial | ready | failed
+    sections: Dict[str, Any] = {}  # validated sections stored so far
+    feedback_report: Optional[InterviewFeedbackResponse] = None  # once ready/failed
 
 
 class DeliveryMetricsResponse(BaseModel):
@@ -526,6 +575,7 @@ class DeliveryTrendSeries(BaseModel):
     """One metric's trend across sessions"""
     metric: str
     history: List[DeliveryTrendPoint] = []
+    ewma: Optional[float] = None
 
 
 class DeliveryTrendsResponse(BaseModel):
@@ -0,0 +1,176 @@
+"""
+Delivery Trends
+
+Per-learner rolling aggregates of interview delivery metrics, kept in
+learner_delivery_stats and updated when a session's metrics are stored
+(POST /interview/session/{id}/delivery-metrics or the final answer), so
+GET /dashboard/delivery-trends and the rules.md §6.1 remedial trigger read one
+row instead of rescanning interview_sessions.
+
+For each metric the state holds:
+  - history: the last DELIVERY_TRENDS_WINDOW points, oldest first
+  - ewma: exponentially weighted mean (alpha DELIVERY_EWMA_ALPHA)
+  - below: consecutive camera-enabled sessions on the wrong side of its
+    DELIVERY_THRESHOLDS entry (reset by a good value or a missing one)
+
+State shape:
+    {"sessions": 3, "last_session_id": "...",
+     "metrics": {"eye_contact_pct": {"history": [{"session_id", "value", "date"}],
+                                     "ewma": 41.2, "below": 1}},
+     "prev": {...metrics before last_session_id was applied...}}
+
+"prev" lets a second submission for the same session replace its point
+instead of counting it twice. Learners without a row (sessions from before
+the table existed) are rebuilt once from their recent history; the rebuild
+keeps "prev", because the session being recorded is usually already in that
+history and its fold then lands as a resubmission.
+
+record_session reads, folds and writes the row without a lock, so two
+different sessions recorded at the same moment for one learner can lose one
+update (last write wins). A learner only has one interview in progress, and
+two writes for the same session converge on the same state, so this is
+accepted rather than moved into SQL; deleting the row repairs it.
+"""
+
+import copy
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.db import queries
+
+logger = logging.getLogger("guidify.delivery_trends")
+
+TREND_METRICS = ("eye_contact_pct", "posture_score", "filler_word_rate", "words_per_minute")
+
+# Delivery metric thresholds for remedial triggers (rules.md §6.1)
+# If metric falls below this value in 2 consecutive sessions → remedial mission
+DELIVERY_THRESHOLDS = {
+    "eye_contact_pct": 40,        # Below 40% → practice eye contact
+    "posture_score": 0.5,         # Below 0.5 → practice posture
+    "filler_word_rate": 0.1,      # Above 10% → practice reducing fillers
+    "words_per_minute": 100,      # Below 100 WPM → practice pacing
+}
+
+# Metrics where a higher value is worse
+_HIGHER_IS_WORSE = {"filler_word_rate"}
+
+
+def empty_state() -> Dict[str, Any]:
+    return {"sessions": 0, "last_session_id": None, "metrics": {}, "prev": {}}
+
+
+def is_violation(metric: str, value: float) -> bool:
+    threshold = DELIVERY_THRESHOLDS[metric]
+    return value > threshold if metric in _HIGHER_IS_WORSE else value < threshold
+
+
+def apply_session(
+    state: Optional[Dict[str, Any]],
+    session_id: str,
+    metrics: Dict[str, Any],
+    camera_enabled: bool = True,
+    date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return `state` with one session's delivery metrics folded in."""
+    state = copy.deepcopy(state) if state else empty_state()
+    sessions = state.get("sessions", 0)
+    if session_id and session_id == state.get("last_session_id"):
+        # Resubmission for the newest session: replace its point
+        base = state.get("prev") or {}
+        sessions -= 1
+    else:
+        base = state.get("metrics") or {}
+
+    alpha = settings.DELIVERY_EWMA_ALPHA
+    window = settings.DELIVERY_TRENDS_WINDOW
+    updated: Dict[str, Any] = {}
+    for name in TREND_METRICS:
+        entry = copy.deepcopy(base.get(name)) or {"history": [], "ewma": None, "below": 0}
+        value = metrics.get(name)
+        if value is None:
+            if camera_enabled and name in DELIVERY_THRESHOLDS:
+                entry["below"] = 0
+        else:
+            value = float(value)
+            entry["history"] = (entry["history"] + [{"session_id": session_id, "value": value, "date": date}])[-window:]
+            entry["ewma"] = value if entry["ewma"] is None else round(alpha * value + (1 - alpha) * entry["ewma"], 6)
+            if camera_enabled and name in DELIVERY_THRESHOLDS:
+                entry["below"] = entry["below"] + 1 if is_violation(name, value) else 0
+        if entry["history"]:
+            updated[name] = entry
+
+    return {
+        "sessions": sessions + 1,
+        "last_session_id": session_id,
+        "metrics": updated,
+        "prev": base,
+    }
+
+
+def rebuild(sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fold interview history (newest first, as get_interview_history returns it)."""
+    state = empty_state()
+    for session in reversed(sessions):
+        if session.get("status") != "completed":
+            continue
+        dm = session.get("delivery_metrics")
+        if not dm or not isinstance(dm, dict):
+            continue
+        created_at = session.get("created_at")
+        state = apply_session(
+            state,
+            session.get("id", ""),
+            dm,
+            camera_enabled=bool(session.get("camera_enabled")),
+            date=str(created_at) if created_at else None,
+        )
+    return state
+
+
+async def get_state(learner_id: str) -> Dict[str, Any]:
+    """Current trend state, rebuilt from interview history if none is stored."""
+    state = await queries.get_delivery_stats(learner_id)
+    if state is not None:
+        return state
+    sessions = await queries.get_interview_history(learner_id, limit=settings.DELIVERY_TRENDS_WINDOW)
+    state = rebuild(sessions)
+    await queries.save_delivery_stats(learner_id, state)
+    return state
+
+
+async def record_session(
+    learner_id: str,
+    session_id: str,
+    metrics: Dict[str, Any],
+    camera_enabled: bool = True,
+) -> None:
+    """
+    Fold a session's newly stored metrics into the learner's trend state.
+
+    Not atomic: see the module docstring for the concurrent-update race.
+    """
+    try:
+        state = await get_state(learner_id)
+        state = apply_session(
+            state,
+            session_id,
+            metrics,
+            camera_enabled=camera_enabled,
+            date=datetime.now(timezone.utc).isoformat(),
+        )
+        await queries.save_delivery_stats(learner_id, state)
+    except Exception as e:
+        # The session row is the source of truth; a missed update is repaired
+        # by deleting the stats row, which rebuilds it on the next read.
+        logger.error(f"Failed to update delivery trends for {learner_id}: {e}")
+
+
+def triggered_metrics(state: Dict[str, Any], consecutive: int) -> List[str]:
+    """Metrics that have been on the wrong side of their threshold `consecutive` times running."""
+    metrics = state.get("metrics") or {}
+    return [
+        name for name in DELIVERY_THRESHOLDS
+        if (metrics.get(name) or {}).get("below", 0) >= consecutive
+    ]
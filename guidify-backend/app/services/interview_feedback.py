@@ -0,0 +1,185 @@
+"""
+Interview Feedback Reports
+
+Produces the post-session interview.feedback report outside the request that
+ends the session. The final answer marks the session completed with
+feedback_status "pending" and queues an 'interview_feedback' job for
+app/workers/job_worker.py in the same round trip
+(queries.complete_interview_session); if no job could be queued,
+generate_in_background() runs the generation as an in-process task.
+
+generate_feedback() validates each report section on its own, so a response
+with one malformed section still stores the others (feedback_status
+"partial") and only the missing sections are requested again. Sections
+already stored by an earlier attempt are kept, which makes job retries
+resume rather than start over. The client reads progress from
+GET /interview/session/{id}/feedback or its SSE stream.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from pydantic import ValidationError
+
+from app.ai_gateway.gateway import gateway
+from app.core.config import settings
+from app.core.exceptions import AIServiceError
+from app.db import queries
+from app.models.schemas import InterviewFeedbackResponse
+from app.services import interview_summary
+
+logger = logging.getLogger("guidify.interview.feedback")
+
+FEEDBACK_SECTIONS = ("strengths", "gaps", "communication_notes", "readiness_subscore", "suggested_missions")
+
+# Sections where an empty value means the model skipped it.
+_REQUIRED_NON_EMPTY = {"strengths", "gaps", "communication_notes"}
+
+FALLBACK_REPORT = {
+    "strengths": [],
+    "gaps": [],
+    "communication_notes": "Feedback generation is temporarily unavailable.",
+    "readiness_subscore": 50,
+    "suggested_missions": [],
+}
+
+SESSION_FEEDBACK = (
+    "id, track, status, context_data, transcript_summary, delivery_metrics, feedback_status"
+)
+
+# Strong references to in-process fallback tasks until they finish.
+_tasks: Set["asyncio.Task[bool]"] = set()
+
+
+def build_profile_summary(profile: Optional[dict], learner: Optional[dict]) -> str:
+    """Build a compact profile summary string for AI context."""
+    parts = []
+    if learner:
+        if learner.get("target_role"):
+            parts.append(f"Target role: {learner['target_role']}")
+        if learner.get("segment"):
+            parts.append(f"Segment: {learner['segment']}")
+    if profile:
+        skills = profile.get("skills", [])
+        if skills:
+            parts.append(f"Skills: {', '.join(skills[:10])}")
+        strengths = profile.get("strengths", [])
+        if strengths:
+            parts.append(f"Strengths: {', '.join(strengths[:5])}")
+    return "; ".join(parts) if parts else "Not specified"
+
+
+def validate_sections(raw: Any, sections: List[str]) -> Dict[str, Any]:
+    """Return the requested sections of `raw` that validate individually."""
+    if not isinstance(raw, dict):
+        return {}
+    valid = {}
+    for name in sections:
+        if name not in raw or raw[name] is None:
+            continue
+        if name in _REQUIRED_NON_EMPTY and not raw[name]:
+            continue
+        try:
+            parsed = InterviewFeedbackResponse.model_validate({name: raw[name]})
+        except ValidationError:
+            logger.info(f"Feedback section {name!r} failed validation")
+            continue
+        valid[name] = getattr(parsed, name)
+    return valid
+
+
+async def _persist(session_id: str, report: Dict[str, Any], status: str) -> None:
+    update = {"feedback_report": report, "feedback_status": status}
+    if "readiness_subscore" in report:
+        update["readiness_subscore"] = report["readiness_subscore"]
+    await queries.update_interview_session(session_id, update)
+
+
+async def _context(session: dict, learner_id: str) -> Dict[str, Any]:
+    cached = session.get("context_data") or {}
+    profile_summary = cached.get("profile_summary")
+    target_role = cached.get("target_role")
+    if not profile_summary or not target_role:
+        learner, profile = await asyncio.gather(
+            queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING),
+            queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY),
+        )
+        profile_summary = build_profile_summary(profile, learner)
+        target_role = learner.get("target_role", "Software Developer") if learner else "Software Developer"
+
+    transcript = await queries.get_interview_transcript(
+        session["id"], learner_id, last=settings.INTERVIEW_VERBATIM_TURNS
+    )
+    context = {
+        "track": session.get("track", "technical"),
+        "profile_summary": profile_summary,
+        "target_role": target_role,
+        "transcript": transcript,
+        "session_summary": interview_summary.render_summary(session.get("transcript_summary")),
+    }
+    # Metrics submitted with the final answer are stored on the session before
+    # the job is queued, so they can influence this feedback.
+    if session.get("delivery_metrics"):
+        context["delivery_metrics"] = session["delivery_metrics"]
+        context["camera_enabled"] = True
+    return context
+
+
+async def generate_feedback(session_id: str, learner_id: str, final: bool = True) -> bool:
+    """
+    Generate and store the feedback report for a completed session.
+
+    Returns False when sections are still missing and `final` is False, so a
+    queued job can be retried; on the final attempt any missing sections are
+    filled from FALLBACK_REPORT.
+    """
+    session = await queries.get_interview_session(session_id, learner_id, columns=SESSION_FEEDBACK)
+    if not session:
+        logger.warning(f"Feedback requested for unknown session {session_id}")
+        return True
+    if session.get("feedback_status") in ("ready", "failed"):
+        return True
+
+    # Only a partial report has sections worth loading
+    report = {}
+    if session.get("feedback_status") == "partial":
+        report = dict(await session.fetch("feedback_report") or {})
+    missing = [s for s in FEEDBACK_SECTIONS if s not in report]
+    context = await _context(session, learner_id)
+
+    # One full request, then one follow-up for whatever did not validate
+    for _ in range(2):
+        if not missing:
+            break
+        request_context = dict(context)
+        if len(missing) < len(FEEDBACK_SECTIONS):
+            request_context["sections"] = missing
+        try:
+            raw = await gateway.generate(task_type="interview.feedback", context=request_context)
+        except AIServiceError as e:
+            logger.warning(f"AI feedback generation failed for session {session_id}: {e}")
+            break
+        valid = validate_sections(raw, missing)
+        if valid:
+            report.update(valid)
+            missing = [s for s in missing if s not in valid]
+            await _persist(session_id, report, "partial" if missing else "ready")
+
+    if not missing:
+        return True
+    if not final:
+        return False
+
+    status = "ready" if report else "failed"
+    await _persist(session_id, {**FALLBACK_REPORT, **report}, status)
+    return True
+
+
+def generate_in_background(session_id: str, learner_id: str) -> None:
+    """Run generate_feedback as an in-process task when no job could be queued."""
+    logger.warning(f"No feedback job queued for session {session_id}, generating in-process")
+    # The task inherits this request's context, so it keeps the caller's DB client.
+    task = asyncio.create_task(generate_feedback(session_id, learner_id))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
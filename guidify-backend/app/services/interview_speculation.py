@@ -0,0 +1,113 @@
+"""
+Interview Question Speculation
+
+Pre-generates the next interview question while the candidate is still
+answering the current one, so the answer endpoint can return it without
+waiting on the AI Gateway.
+
+Drafts are answer-independent probes: the prompt (interview.question with
+`speculative=True`) asks for a question on a new topic that does not rely on
+the pending answer. A draft is keyed by session and question number, so a
+draft can only be used for the question it was generated for.
+
+  - start() is called right after a question is served. It launches a
+    background task that writes the draft to the shared cache (any worker can
+    use it) and keeps the task in-process so the same worker can also use a
+    draft that is still being generated.
+  - take() is called when the answer arrives. It returns the draft (waiting on
+    an in-flight task if this worker owns it) or None on a miss, in which case
+    the caller generates inline as before.
+
+Enabled with INTERVIEW_SPECULATION_ENABLED.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from app.ai_gateway.gateway import gateway
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.exceptions import AIServiceError
+
+logger = logging.getLogger("guidify.interview.speculation")
+
+# key → task producing the draft. Finished tasks are dropped after the TTL.
+_inflight: Dict[str, "asyncio.Task[Optional[str]]"] = {}
+
+
+def _key(session_id: str, question_number: int) -> str:
+    return f"interview:spec:{session_id}:{question_number}"
+
+
+def enabled() -> bool:
+    return settings.INTERVIEW_SPECULATION_ENABLED
+
+
+async def _draft(key: str, context: Dict) -> Optional[str]:
+    try:
+        result = await gateway.generate(task_type="interview.question", context=context)
+    except AIServiceError as e:
+        logger.info(f"Speculative question generation failed: {e}")
+        return None
+    question = (result or {}).get("question") or None
+    if question:
+        await cache.set(key, question, ttl=settings.INTERVIEW_SPECULATION_TTL_SECONDS)
+    return question
+
+
+def start(
+    session_id: str,
+    question_number: int,
+    track: str,
+    profile_summary: str,
+    target_role: str,
+    transcript: List[dict],
+    session_summary: str = "",
+) -> None:
+    """
+    Begin drafting question `question_number` for the session in the background.
+
+    `transcript` holds the recent turns and must end with the question the
+    candidate is answering now; `session_summary` covers the earlier ones.
+    """
+    if not enabled():
+        return
+    key = _key(session_id, question_number)
+    if key in _inflight:
+        return
+
+    context = {
+        "track": track,
+        "profile_summary": profile_summary,
+        "target_role": target_role,
+        "transcript": list(transcript),
+        "session_summary": session_summary,
+        "speculative": True,
+    }
+    task = asyncio.create_task(_draft(key, context))
+    _inflight[key] = task
+
+    loop = asyncio.get_running_loop()
+    task.add_done_callback(
+        lambda _t: loop.call_later(settings.INTERVIEW_SPECULATION_TTL_SECONDS, _inflight.pop, key, None)
+    )
+
+
+async def take(session_id: str, question_number: int) -> Optional[str]:
+    """Claim the draft for `question_number`, or None if there isn't one."""
+    if not enabled():
+        return None
+    key = _key(session_id, question_number)
+
+    task = _inflight.pop(key, None)
+    question = None
+    if task is not None:
+        try:
+            question = await task
+        except Exception as e:
+            logger.warning(f"Speculative question task failed: {e}")
+    if question is None:
+        question = await cache.get(key)
+    await cache.delete(key)
+    return question
@@ -0,0 +1,72 @@
+"""
+Interview Transcript Summary
+
+Keeps interview prompts bounded. Instead of the whole transcript, the
+interview.question and interview.feedback prompts receive:
+
+  - a rolling summary stored on the session (interview_sessions.
+    transcript_summary): one short note per answered question — topic, a
+    strength and a gap — each clipped to NOTE_CHARS;
+  - the last INTERVIEW_VERBATIM_TURNS transcript entries verbatim.
+
+The summary is updated incrementally after each answer from the assessment
+fields interview.question returns alongside the next question (answer_topic,
+answer_strength, answer_gap), so it costs no extra AI call. Questions served
+from a speculative draft have no assessment and are noted by topic only.
+
+Summary shape:
+    {"notes": [{"q": 1, "topic": "...", "strength": "...", "gap": "..."}]}
+"""
+
+from typing import Any, Dict, List, Optional
+
+NOTE_CHARS = 160
+TOPIC_CHARS = 80
+
+
+def _clip(text: Optional[str], limit: int) -> Optional[str]:
+    if not text:
+        return None
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+def empty_summary() -> Dict[str, Any]:
+    return {"notes": []}
+
+
+def update_summary(
+    summary: Optional[Dict[str, Any]],
+    question_number: int,
+    question: str,
+    assessment: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Return the summary with a note for the answer to `question_number`."""
+    assessment = assessment or {}
+    notes = [n for n in (summary or empty_summary()).get("notes", []) if n.get("q") != question_number]
+    note = {
+        "q": question_number,
+        "topic": _clip(assessment.get("answer_topic"), TOPIC_CHARS) or _clip(question, TOPIC_CHARS),
+    }
+    strength = _clip(assessment.get("answer_strength"), NOTE_CHARS)
+    gap = _clip(assessment.get("answer_gap"), NOTE_CHARS)
+    if strength:
+        note["strength"] = strength
+    if gap:
+        note["gap"] = gap
+    notes.append(note)
+    notes.sort(key=lambda n: n["q"])
+    return {"notes": notes}
+
+
+def render_summary(summary: Optional[Dict[str, Any]]) -> str:
+    """Compact text form of the summary for prompts ("" when empty)."""
+    lines: List[str] = []
+    for note in (summary or {}).get("notes", []):
+        line = f"Q{note['q']} ({note.get('topic') or 'general'})"
+        if note.get("strength"):
+            line += f" + {note['strength']}"
+        if note.get("gap"):
+            line += f" − {note['gap']}"
+        lines.append(line)
+    return "\n".join(lines)
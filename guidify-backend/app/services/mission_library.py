@@ -0,0 +1,87 @@
+"""
+Mission Template Library
+
+Reuses validated mission.generate results across learners (migration 028).
+Missions are keyed by (target_role, target_skill, difficulty, minutes bucket):
+learners on the same role and phase skill get near-identical missions, so a
+stored variant is as good as a fresh generation and costs no AI call.
+
+  - pick() returns the least-used variant for the key whose title the learner
+    has not had recently, or None on a miss.
+  - personalize() fits a variant to the learner's context: the requested
+    skill and difficulty and the learner's own time budget.
+  - add() stores a new validated generation (up to MISSION_LIBRARY_MAX_VARIANTS
+    per key). add_mission_template is service-role only, so only the nightly
+    pre-generation worker stores generations; request-time misses read the
+    library but never write it. Fallback missions are never stored.
+
+Seed from past generations with scripts/seed_mission_library.py.
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.db import queries
+
+logger = logging.getLogger("guidify.missions.library")
+
+# Estimated minutes are bucketed so 28- and 31-minute learners share entries
+MINUTES_BUCKET = 10
+
+# Fields copied from a generation into the library (learner-specific fields
+# such as roadmap_id and assigned_date are excluded)
+TEMPLATE_FIELDS = (
+    "title", "objective", "description", "steps", "resources",
+    "target_skill", "difficulty", "estimated_minutes",
+)
+
+
+def _norm(value: Any) -> str:
+    return re.sub(r"\s+", " ", str(value or "")).strip().lower()
+
+
+def minutes_bucket(minutes: int) -> int:
+    return max(MINUTES_BUCKET, int(round(minutes / MINUTES_BUCKET)) * MINUTES_BUCKET)
+
+
+def template_key(target_role: str, target_skill: str, difficulty: str, estimated_minutes: int) -> str:
+    return "|".join([
+        _norm(target_role),
+        _norm(target_skill),
+        _norm(difficulty),
+        str(minutes_bucket(estimated_minutes)),
+    ])
+
+
+def enabled() -> bool:
+    return settings.MISSION_LIBRARY_ENABLED
+
+
+async def pick(key: str, recent_missions: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """A stored variant for `key` the learner has not had recently, or None."""
+    if not enabled():
+        return None
+    exclude = [m["title"] for m in recent_missions if m.get("title")]
+    return await queries.pick_mission_template(key, exclude)
+
+
+def personalize(template: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    """Fit a library variant to this learner's mission context."""
+    mission = {f: template[f] for f in TEMPLATE_FIELDS if f in template}
+    mission["target_skill"] = context["target_skill"]
+    mission["difficulty"] = context["difficulty"]
+    mission["estimated_minutes"] = context["estimated_minutes"]
+    return mission
+
+
+async def add(key: str, result: Dict[str, Any]) -> None:
+    """Store a validated generation under `key`. Failures are only logged."""
+    if not enabled():
+        return
+    template = {f: result[f] for f in TEMPLATE_FIELDS if f in result}
+    try:
+        await queries.add_mission_template(key, template, settings.MISSION_LIBRARY_MAX_VARIANTS)
+    except Exception as e:
+        logger.warning(f"Failed to add mission template for {key!r}: {e}")
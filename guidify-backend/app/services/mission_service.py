@@ -0,0 +1,256 @@
+"""
+Daily Mission Service
+
+Builds and stores the learner's daily mission (mission.generate task).
+
+Missions are normally pre-generated overnight by app/workers/mission_pregen.py
+and kept in mission_drafts until the learner's first visit of the day, when
+GET /missions/today promotes the draft into daily_missions without an AI
+call. Drafts live outside daily_missions so a learner who never opens the app
+gets no mission row (and no heatmap activity) for that day. Generating on
+demand is the fallback when no usable draft exists.
+
+Either way a mission is taken from the template library
+(app/services/mission_library.py) when one fits, and mission.generate is
+called only on a library miss.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import date
+from typing import Any, Dict, Optional
+
+from app.ai_gateway.gateway import gateway
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.metrics import MISSION_GENERATION_LATENCY
+from app.core.singleflight import SingleFlight
+from app.db import queries
+from app.models.schemas import MissionGenerateResponse
+from app.services import mission_library
+
+logger = logging.getLogger("guidify.missions")
+
+MISSION_LOCK_POLL_SECONDS = 1.0
+
+# In-process creation of today's mission, keyed "<learner_id>:<date>"
+_flights = SingleFlight()
+
+
+async def build_mission(
+    learner_id: str,
+    for_date: Optional[date] = None,
+    fallback: bool = True,
+    store_in_library: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build the mission for `for_date` (default today) from the mission library,
+    or with AI Gateway on a library miss.
+
+    Assembles context from:
+        - learner profile (target_role, segment)
+        - active roadmap (current phase, skills)
+        - recent mission history (avoid repetition, gauge difficulty)
+
+    With `fallback`, a generic mission is returned if generation fails;
+    otherwise the error is raised. With `store_in_library` (service-role
+    callers only; add_mission_template is not granted to learners), a fresh
+    generation is added to the library. Fallback missions are never added.
+    """
+    for_date = for_date or date.today()
+
+    # Fetch learner, profile, roadmap, and recent missions in parallel
+    learner, profile, roadmap, recent_missions = await asyncio.gather(
+        queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING),
+        queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY),
+        queries.get_roadmap_view(learner_id, view="phase"),
+        queries.get_recent_missions(learner_id, limit=5),
+    )
+
+    # Determine current phase from roadmap
+    current_phase_title = "Foundations"
+    current_phase_number = 1
+    total_phases = 4
+    phase_skills = []
+    difficulty = "beginner"
+    roadmap_id = None
+
+    if roadmap:
+        roadmap_id = roadmap.get("id")
+        current_phase_number = roadmap.get("current_phase_number") or 1
+        total_phases = roadmap.get("total_phases") or total_phases
+
+        # Only the current phase is fetched (migration 029)
+        phase = roadmap.get("phase")
+        if phase:
+            current_phase_title = phase.get("title", f"Phase {current_phase_number}")
+            phase_skills = phase.get("skills", [])
+            difficulty = phase.get("difficulty", "beginner")
+
+    # Pick a target skill from the current phase (rotating through skills)
+    target_skill = "Problem Solving"
+    if phase_skills:
+        # Use date-based rotation to avoid repeating the same skill every day
+        day_index = for_date.toordinal() % len(phase_skills)
+        target_skill = phase_skills[day_index]
+
+    # Determine estimated minutes based on learning hours
+    learning_hours = 5
+    if profile:
+        learning_hours = profile.get("questionnaire_data", {}).get("learning_hours", 5)
+        if isinstance(learning_hours, str):
+            try:
+                learning_hours = int(learning_hours)
+            except ValueError:
+                learning_hours = 5
+    estimated_minutes = min(max(int(learning_hours * 60 / 7 * 0.7), 20), 60)
+
+    # Build context for AI Gateway
+    context = {
+        "target_role": learner.get("target_role", "Software Developer") if learner else "Software Developer",
+        "segment": learner.get("segment", "college") if learner else "college",
+        "current_phase_title": current_phase_title,
+        "current_phase_number": current_phase_number,
+        "total_phases": total_phases,
+        "phase_skills": phase_skills,
+        "target_skill": target_skill,
+        "difficulty": difficulty,
+        "estimated_minutes": estimated_minutes,
+        "mission_history": recent_missions,
+    }
+
+    # Reuse a library mission for the same role/skill/difficulty/time budget;
+    # call AI Gateway only on a miss
+    started = time.perf_counter()
+    key = mission_library.template_key(
+        context["target_role"], target_skill, difficulty, estimated_minutes
+    )
+    template = await mission_library.pick(key, recent_missions)
+    if template:
+        result = mission_library.personalize(template, context)
+        source = "library"
+    else:
+        try:
+            result = await gateway.generate(
+                task_type="mission.generate",
+                context=context,
+                response_model=MissionGenerateResponse,
+            )
+            source = "ai"
+        except Exception as e:
+            logger.error(f"Mission generation failed for learner {learner_id}: {e}")
+            if not fallback:
+                raise
+            # Fallback: return a generic mission so the learner isn't blocked
+            result = {
+                "title": f"Practice {target_skill}",
+                "objective": f"Spend {estimated_minutes} minutes studying and practicing {target_skill}",
+                "description": f"Review learning materials related to {target_skill} from your current roadmap phase.",
+                "target_skill": target_skill,
+                "difficulty": difficulty,
+                "estimated_minutes": estimated_minutes,
+                "steps": [
+                    f"Find a tutorial or documentation about {target_skill}",
+                    "Read through the key concepts",
+                    "Try one hands-on exercise",
+                    "Write a short summary of what you learned",
+                ],
+                "resources": [],
+            }
+            source = "fallback"
+    MISSION_GENERATION_LATENCY.labels(source=source).observe(time.perf_counter() - started)
+    if source == "ai" and store_in_library:
+        await mission_library.add(key, result)
+
+    return {
+        "title": result["title"],
+        "objective": result["objective"],
+        "description": result.get("description", ""),
+        "steps": result.get("steps", []),
+        "resources": result.get("resources", []),
+        "target_skill": result.get("target_skill", target_skill),
+        "difficulty": result.get("difficulty", difficulty),
+        "estimated_minutes": result.get("estimated_minutes", estimated_minutes),
+        "roadmap_id": roadmap_id,
+        "roadmap_phase_number": current_phase_number,
+        "assigned_date": for_date.isoformat(),
+        "status": "pending",
+    }
+
+
+async def save_mission(learner_id: str, mission_data: Dict[str, Any]) -> dict:
+    """Insert the day's mission, returning the existing row if one won the race."""
+    # daily_missions is UNIQUE(learner_id, assigned_date) (F-17): the insert is
+    # ON CONFLICT DO NOTHING, and a concurrent winner's row is returned instead.
+    saved = await queries.create_mission_if_absent(learner_id, mission_data)
+    if saved:
+        return saved
+    existing = await queries.get_mission_for_date(learner_id, mission_data["assigned_date"])
+    return existing or mission_data
+
+
+async def take_draft(learner_id: str, assigned_date: str) -> Optional[Dict[str, Any]]:
+    """
+    Claim the mission pre-generated for the day, or None.
+
+    A draft built against a roadmap that has since been replaced is dropped,
+    since its phase and skill no longer apply.
+    """
+    draft, roadmap = await asyncio.gather(
+        queries.take_mission_draft(learner_id, assigned_date),
+        queries.get_active_roadmap(learner_id, columns=queries.ROADMAP_REF),
+    )
+    if not draft:
+        return None
+    mission = draft.get("mission") or {}
+    current_roadmap_id = roadmap.get("id") if roadmap else None
+    if mission.get("roadmap_id") != current_roadmap_id:
+        logger.info(f"Discarding stale mission draft for learner {learner_id}")
+        return None
+    return {**mission, "assigned_date": assigned_date}
+
+
+async def get_or_create_today(learner_id: str) -> dict:
+    """
+    Today's mission, creating it if the learner has none yet.
+
+    Creation is single-flight per learner and day: concurrent requests in this
+    process await the same build, and other processes wait on a short cache
+    lock for the holder's row rather than paying for a second AI call. The
+    insert itself is conflict-safe, so a lost lock (Redis down or expired)
+    can cost a duplicate generation but never a duplicate mission.
+    """
+    existing = await queries.get_mission_for_date(learner_id)
+    if existing:
+        return existing
+    today = date.today().isoformat()
+    return await _flights.do(f"{learner_id}:{today}", lambda: _create_today(learner_id, today))
+
+
+async def _create_today(learner_id: str, today: str) -> dict:
+    lock_key = f"missions:lock:{learner_id}:{today}"
+    locked = await cache.add(lock_key, 1, ttl=settings.MISSION_GENERATION_LOCK_SECONDS)
+    if locked is False:
+        mission = await _wait_for_mission(learner_id, today, lock_key)
+        if mission:
+            return mission
+    try:
+        mission = await take_draft(learner_id, today) or await build_mission(learner_id)
+        return await save_mission(learner_id, mission)
+    finally:
+        if locked:
+            await cache.delete(lock_key)
+
+
+async def _wait_for_mission(learner_id: str, today: str, lock_key: str) -> Optional[dict]:
+    """Poll for the mission another process is creating until its lock goes away."""
+    deadline = time.monotonic() + settings.MISSION_GENERATION_LOCK_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(MISSION_LOCK_POLL_SECONDS)
+        mission = await queries.get_mission_for_date(learner_id, today)
+        if mission:
+            return mission
+        if await cache.get(lock_key) is None:
+            break
+    return None
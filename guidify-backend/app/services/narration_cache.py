@@ -0,0 +1,99 @@
+"""
+Psychometrics Narration Cache
+
+Reuses psychometrics.narrate results across learners. The narrative depends
+only on the IPIP, RIASEC and grit scores, so learners whose scores fall in
+the same NARRATION_CACHE_BUCKET-point buckets share one narration and only
+the first of them costs an AI call.
+
+  - Scores are rounded to the nearest bucket before narration, so a cached
+    narrative was written for exactly the scores in its key. The stored
+    profile keeps the unrounded scores.
+  - Keys include the instrument version (as stored in
+    psychometric_profiles.instrument_version) and a hash of the prompt
+    template, so a new item set or prompt starts a fresh cache.
+  - Entries live in the shared cache, so every worker benefits; hits and
+    misses are counted in NARRATION_CACHE_REQUESTS.
+
+Disabled with NARRATION_CACHE_ENABLED=false (every submission is narrated).
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+from app.ai_gateway.gateway import gateway
+from app.ai_gateway.prompts.psychometrics_narrate import PSYCHOMETRICS_NARRATE_V1
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.metrics import NARRATION_CACHE_REQUESTS
+
+logger = logging.getLogger("guidify.psychometrics.narration_cache")
+
+# Fields kept from a narrate result
+NARRATION_FIELDS = ("narrative_summary", "pacing_hint", "tone_hint")
+
+_PROMPT_HASH = hashlib.sha1(PSYCHOMETRICS_NARRATE_V1.encode()).hexdigest()[:8]
+
+
+def enabled() -> bool:
+    return settings.NARRATION_CACHE_ENABLED
+
+
+def quantize(score: Optional[int]) -> Optional[int]:
+    """Round a 0-100 score to the nearest bucket (halves round up)."""
+    if score is None:
+        return None
+    bucket = settings.NARRATION_CACHE_BUCKET
+    return min(100, max(0, int(score / bucket + 0.5) * bucket))
+
+
+def signature(ipip_scores: Dict[str, int], riasec_scores: Dict[str, int], grit_score: Optional[int] = None) -> str:
+    """Compact, order-independent signature of already-quantized scores."""
+    ipip = ".".join(f"{k}{ipip_scores[k]}" for k in sorted(ipip_scores))
+    riasec = ".".join(f"{k}{riasec_scores[k]}" for k in sorted(riasec_scores))
+    grit = "-" if grit_score is None else str(grit_score)
+    return f"{ipip}|{riasec}|{grit}"
+
+
+def cache_key(instrument_version: str, score_signature: str) -> str:
+    return f"narrate:{instrument_version}:{_PROMPT_HASH}:{score_signature}"
+
+
+async def _generate(ipip_scores: Dict[str, int], riasec_scores: Dict[str, int], grit_score: Optional[int]) -> Dict[str, Any]:
+    context: Dict[str, Any] = {"ipip_scores": ipip_scores, "riasec_scores": riasec_scores}
+    if grit_score is not None:
+        context["grit_score"] = grit_score
+    result = await gateway.generate(task_type="psychometrics.narrate", context=context)
+    return {f: result.get(f) for f in NARRATION_FIELDS}
+
+
+async def narrate(
+    ipip_scores: Dict[str, int],
+    riasec_scores: Dict[str, int],
+    instrument_version: str,
+    grit_score: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Narration for these scores: from the cache when a learner in the same
+    score buckets was narrated before, otherwise from AI Gateway (errors are
+    raised). Results without a narrative_summary are not cached.
+    """
+    if not enabled():
+        return await _generate(ipip_scores, riasec_scores, grit_score)
+
+    ipip = {k: quantize(v) for k, v in ipip_scores.items()}
+    riasec = {k: quantize(v) for k, v in riasec_scores.items()}
+    grit = quantize(grit_score)
+    key = cache_key(instrument_version, signature(ipip, riasec, grit))
+
+    cached = await cache.get(key)
+    if cached is not None:
+        NARRATION_CACHE_REQUESTS.labels(result="hit").inc()
+        return cached
+    NARRATION_CACHE_REQUESTS.labels(result="miss").inc()
+
+    narration = await _generate(ipip, riasec, grit)
+    if narration["narrative_summary"]:
+        await cache.set(key, narration, ttl=settings.NARRATION_CACHE_TTL_SECONDS)
+    return narration
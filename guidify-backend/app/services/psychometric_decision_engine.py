@@ -11,12 +11,22 @@ Categories:
     3. Leadership           — initiative, ownership, guiding others
     4. Analytical Reasoning — data, logic, problem decomposition
     5. Interpersonal Skills — empathy, communication, collaboration
+
+The question bank is compiled at import into a dense (question, choice) ->
+category weight table. A submission is encoded as a vector of choice codes (one per question,
+in bank order) and category scores come from array operations on that vector;
+`evaluate_batch` scores many submissions as one matrix. Results are cached
+per distinct answer vector: submissions repeat heavily even though 3^30
+answer sets are possible.
 """
 
 import uuid
 import time
 import logging
-from typing import List, Dict, Tuple
+from collections import OrderedDict
+from typing import List, Dict, Sequence, Tuple
+
+import numpy as np
 
 from app.models.psychometric_test_schemas import (
     Question,
@@ -153,10 +163,99 @@ PERSONALITY_PROFILES = {
 }
 
 
+# ── Compiled Scoring Table ───────────────────────────────────────────
+# Built once from QUESTION_BANK. A submission is a vector of answer codes,
+# one per question in bank order: the index into CHOICES, or UNSCORED for a
+# missing answer or one outside yes/maybe/no. _CONTRIBUTIONS has one row per
+# (question, code) holding the weight under the question's category column
+# and a 1 under its answered-count column, so category sums and counts are a
+# single gather-and-sum over the answer vector.
+
+CHOICES: Tuple[str, ...] = ("yes", "maybe", "no")
+CATEGORIES: Tuple[str, ...] = tuple(CATEGORY_WEIGHTS)
+UNSCORED = len(CHOICES)
+
+RESULT_CACHE_SIZE = 4096
+
+_QUESTION_INDEX: Dict[str, int] = {q["id"]: i for i, q in enumerate(QUESTION_BANK)}
+_CHOICE_INDEX: Dict[str, int] = {choice: i for i, choice in enumerate(CHOICES)}
+
+
+def _compile_contributions() -> np.ndarray:
+    """(questions * codes, 2 * categories) table: weight sums, then answered counts."""
+    table = np.zeros((len(QUESTION_BANK), UNSCORED + 1, 2 * len(CATEGORIES)), dtype=np.float64)
+    for i, q in enumerate(QUESTION_BANK):
+        cat = CATEGORIES.index(q["category"])
+        for code, choice in enumerate(CHOICES):
+            table[i, code, cat] = q["weights"][choice]
+            table[i, code, len(CATEGORIES) + cat] = 1.0
+    return table.reshape(-1, 2 * len(CATEGORIES))
+
+
+def _compile_recommendations() -> List[List[Tuple[str, str]]]:
+    """Recommendations for every (first, second) strongest-category pair, by category index."""
+    table = []
+    for first in CATEGORIES:
+        row = []
+        for second in CATEGORIES:
+            pair = tuple(sorted((first, second)))
+            if pair in CAREER_MAP:
+                row.append(CAREER_MAP[pair])
+            else:
+                primary = DEFAULT_CAREERS.get(first, ("Generalist", "Analyst"))
+                secondary = DEFAULT_CAREERS.get(second, ("Coordinator", "Associate"))
+                row.append((primary[0], secondary[0]))
+        table.append(row)
+    return table
+
+
+_CONTRIBUTIONS = _compile_contributions()
+_ROW_OFFSETS = np.arange(len(QUESTION_BANK)) * (UNSCORED + 1)
+_RECOMMENDATIONS = _compile_recommendations()
+_UNANSWERED_KEY = bytes([UNSCORED]) * len(QUESTION_BANK)
+_result_cache: "OrderedDict[Tuple[bytes, int, int], DecisionResult]" = OrderedDict()
+
+
+def _answer_key(answers: Sequence[AnswerSubmission]) -> bytes:
+    """The submission's answer vector as bytes (see encode_answers)."""
+    codes = bytearray(_UNANSWERED_KEY)
+    for a in answers:
+        index = _QUESTION_INDEX.get(a.question_id)
+        if index is not None:
+            code = _CHOICE_INDEX.get(a.answer)
+            if code is None:
+                logger.warning(f"Invalid answer '{a.answer}' for question {a.question_id}")
+                code = UNSCORED
+            codes[index] = code
+    return bytes(codes)
+
+
+def encode_answers(answers: Sequence[AnswerSubmission]) -> np.ndarray:
+    """
+    Encode a submission as a uint8 vector of answer codes in QUESTION_BANK
+    order. Unknown question ids are ignored; for a repeated question the
+    last answer wins.
+    """
+    return np.frombuffer(_answer_key(answers), dtype=np.uint8)
+
+
+def score_matrix(codes: np.ndarray) -> np.ndarray:
+    """
+    Category scores (0-100, one decimal) for a (submissions, questions)
+    matrix of answer codes. Columns follow CATEGORIES; a category with no
+    scored answers scores 0.
+    """
+    totals = _CONTRIBUTIONS[_ROW_OFFSETS + np.atleast_2d(codes)].sum(axis=1)
+    sums, counts = totals[:, :len(CATEGORIES)], totals[:, len(CATEGORIES):]
+    means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+    return np.round(means * 100, 1)
+
+
 class PsychometricDecisionEngine:
     """
     Stateless decision engine. Takes responses, produces scores and recommendations.
     All state lives in the request; no session storage needed for scoring.
+    Results are memoized per answer vector (bounded LRU, RESULT_CACHE_SIZE).
     """
 
     @staticmethod
@@ -184,34 +283,10 @@ class PsychometricDecisionEngine:
     @staticmethod
     def _compute_category_scores(answers: List[AnswerSubmission]) -> Dict[str, float]:
         """Compute raw score per category (0-100)."""
-        category_raw: Dict[str, List[float]] = {cat: [] for cat in CATEGORY_WEIGHTS}
-
-        answer_map = {a.question_id: a for a in answers}
-
-        for q in QUESTION_BANK:
-            answer = answer_map.get(q["id"])
-            if not answer:
-                continue
-
-            # Validate answer
-            if answer.answer not in ("yes", "maybe", "no"):
-                logger.warning(f"Invalid answer '{answer.answer}' for question {q['id']}")
-                continue
-
-            weight = q["weights"][answer.answer]
-            category_raw[q["category"]].append(weight)
-
-        scores = {}
-        for cat, values in category_raw.items():
-            if values:
-                scores[cat] = round(sum(values) / len(values) * 100, 1)
-            else:
-                scores[cat] = 0.0
-
-        return scores
+        return dict(zip(CATEGORIES, score_matrix(encode_answers(answers))[0].tolist()))
 
     @staticmethod
-    def _compute_confidence(answers: List[AnswerSubmission], category_scores: Dict[str, float]) -> float:
+    def _confidence(answered: int, maybe_count: int, scores: List[float]) -> float:
         """
         Confidence is higher when:
         - More questions answered (completion rate)
@@ -219,19 +294,16 @@ class PsychometricDecisionEngine:
         - Stronger differentiation across categories (clear peak)
         """
         total_questions = len(QUESTION_BANK)
-        answered = len(answers)
         completion = answered / total_questions if total_questions > 0 else 0
 
-        maybe_count = sum(1 for a in answers if a.answer == "maybe")
         decisiveness = 1 - (maybe_count / answered) if answered > 0 else 0
 
         # Differentiation: a clear peak across categories strengthens the
         # recommendation, so reward peaked profiles and flag flat ones.
         # Max achievable peak-mean spread is 80 (100 vs four 0s) -> normalized.
-        if category_scores:
-            values = list(category_scores.values())
-            mean = sum(values) / len(values)
-            peak = max(values)
+        if scores:
+            mean = sum(scores) / len(scores)
+            peak = max(scores)
             differentiation = min(1.0, max(0.0, (peak - mean) / 80.0))
         else:
             differentiation = 0
@@ -239,6 +311,11 @@ class PsychometricDecisionEngine:
         confidence = (completion * 0.4) + (decisiveness * 0.3) + (differentiation * 0.3)
         return round(min(1.0, max(0.0, confidence)), 2)
 
+    @staticmethod
+    def _compute_confidence(answers: List[AnswerSubmission], category_scores: Dict[str, float]) -> float:
+        maybe_count = sum(1 for a in answers if a.answer == "maybe")
+        return PsychometricDecisionEngine._confidence(len(answers), maybe_count, list(category_scores.values()))
+
     @staticmethod
     def _get_score_label(score: float) -> str:
         for threshold, label in SCORE_LABELS:
@@ -249,16 +326,8 @@ class PsychometricDecisionEngine:
     @staticmethod
     def _get_recommendations(category_scores: Dict[str, float]) -> Tuple[str, str]:
         """Determine top 2 career recommendations based on strongest categories."""
-        sorted_cats = sorted(category_scores.items(), key=lambda x: x[1], reverse=True)
-        top_two = tuple(sorted(cat for cat, _ in sorted_cats[:2]))
-
-        if top_two in CAREER_MAP:
-            return CAREER_MAP[top_two]
-
-        # Fallback: use individual category defaults
-        primary = DEFAULT_CAREERS.get(sorted_cats[0][0], ("Generalist", "Analyst"))
-        secondary = DEFAULT_CAREERS.get(sorted_cats[1][0], ("Coordinator", "Associate"))
-        return primary[0], secondary[0]
+        ranked = sorted(category_scores, key=category_scores.get, reverse=True)
+        return _RECOMMENDATIONS[CATEGORIES.index(ranked[0])][CATEGORIES.index(ranked[1])]
 
     @staticmethod
     def _get_personality_profile(sorted_cats: List[Tuple[str, float]]) -> str:
@@ -285,30 +354,21 @@ class PsychometricDecisionEngine:
         return areas
 
     @classmethod
-    def evaluate(cls, answers: List[AnswerSubmission]) -> DecisionResult:
-        """
-        Main decision function. Takes raw answers, produces full result.
-
-        Scoring Algorithm:
-        1. Map each answer to a weight (yes=1.0, maybe=0.5, no=0.0) per question
-        2. Average weights per category -> category score (0-100)
-        3. Weighted average across categories -> overall score
-        4. Derive recommendations from top-2 category vector
-        """
-        category_scores_raw = cls._compute_category_scores(answers)
-        confidence = cls._compute_confidence(answers, category_scores_raw)
+    def _build_result(cls, scores: List[float], ranking: List[int], answered: int, maybe_count: int) -> DecisionResult:
+        """Assemble the result from one row of category scores and its category ranking."""
+        category_scores_raw = dict(zip(CATEGORIES, scores))
+        confidence = cls._confidence(answered, maybe_count, scores)
 
         # Build category score objects
-        category_scores = []
-        for cat, weight in CATEGORY_WEIGHTS.items():
-            raw = category_scores_raw.get(cat, 0.0)
-            label = cls._get_score_label(raw)
-            category_scores.append(CategoryScore(
+        category_scores = [
+            CategoryScore(
                 category=cat,
                 score=raw,
                 confidence=confidence,
-                label=label,
-            ))
+                label=cls._get_score_label(raw),
+            )
+            for cat, raw in category_scores_raw.items()
+        ]
 
         # Overall score: weighted average
         overall_score = round(
@@ -316,11 +376,11 @@ class PsychometricDecisionEngine:
             1,
         )
 
-        # Recommendations
-        primary, secondary = cls._get_recommendations(category_scores_raw)
+        # Recommendations from the precomputed top-2 table
+        primary, secondary = _RECOMMENDATIONS[ranking[0]][ranking[1]]
 
         # Personality profile
-        sorted_cats = sorted(category_scores_raw.items(), key=lambda x: x[1], reverse=True)
+        sorted_cats = [(CATEGORIES[i], scores[i]) for i in ranking]
         personality = cls._get_personality_profile(sorted_cats)
 
         # Strengths and growth areas
@@ -328,7 +388,7 @@ class PsychometricDecisionEngine:
         growth = cls._get_growth_areas(category_scores_raw)
 
         # Summary
-        top_cat = sorted_cats[0][0] if sorted_cats else "versatile"
+        top_cat = sorted_cats[0][0]
         summary = (
             f"Your assessment reveals a {cls._get_score_label(overall_score).lower()} "
             f"affinity for {top_cat.lower()}-oriented roles. "
@@ -347,3 +407,60 @@ class PsychometricDecisionEngine:
             growth_areas=growth,
             summary=summary,
         )
+
+    @staticmethod
+    def _copy_result(result: DecisionResult) -> DecisionResult:
+        """Copy a cached result so callers can't mutate the cached one (cheaper than a deep copy)."""
+        return result.model_copy(update={
+            "category_scores": [cs.model_copy() for cs in result.category_scores],
+            "strengths": list(result.strengths),
+            "growth_areas": list(result.growth_areas),
+        })
+
+    @classmethod
+    def evaluate_batch(cls, submissions: Sequence[Sequence[AnswerSubmission]]) -> List[DecisionResult]:
+        """
+        Evaluate many submissions at once, in order.
+
+        Each submission is encoded to its answer vector; vectors already in
+        the result cache are served from it, and the rest are scored together
+        as one (submissions, questions) matrix and ranked with one argsort.
+        Every returned result is an independent copy.
+        """
+        # Confidence reads the raw answer and 'maybe' counts (unknown ids and
+        # repeats included), so they are part of the key with the vector.
+        keys = [
+            (_answer_key(answers), len(answers), sum(1 for a in answers if a.answer == "maybe"))
+            for answers in submissions
+        ]
+
+        found: Dict[Tuple[bytes, int, int], DecisionResult] = {}
+        for key in keys:
+            if key in _result_cache:
+                found[key] = _result_cache[key]
+                _result_cache.move_to_end(key)
+
+        misses = [key for key in dict.fromkeys(keys) if key not in found]
+        if misses:
+            codes = np.stack([np.frombuffer(key[0], dtype=np.uint8) for key in misses])
+            scores = score_matrix(codes)
+            rankings = np.argsort(-scores, axis=1, kind="stable")[:, :2]
+            for key, row, ranking in zip(misses, scores.tolist(), rankings.tolist()):
+                found[key] = _result_cache[key] = cls._build_result(row, ranking, key[1], key[2])
+                if len(_result_cache) > RESULT_CACHE_SIZE:
+                    _result_cache.popitem(last=False)
+
+        return [cls._copy_result(found[key]) for key in keys]
+
+    @classmethod
+    def evaluate(cls, answers: List[AnswerSubmission]) -> DecisionResult:
+        """
+        Main decision function. Takes raw answers, produces full result.
+
+        Scoring Algorithm:
+        1. Map each answer to a weight (yes=1.0, maybe=0.5, no=0.0) per question
+        2. Average weights per category -> category score (0-100)
+        3. Weighted average across categories -> overall score
+        4. Derive recommendations from top-2 category vector
+        """
+        return cls.evaluate_batch([answers])[0]
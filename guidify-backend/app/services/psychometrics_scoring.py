@@ -6,11 +6,20 @@ Pure functions — no AI Gateway involvement. Unit-testable against known scorin
 
 Per techspec.md §11.1: Instrument definitions (item bank + scoring keys) live as
 versioned config files (ipip_bigfive.json, riasec.json, grit.json), not hardcoded logic.
+
+Each config is compiled once (per loaded config) into its scale groups and
+NumPy scoring matrices. score_ipip / score_riasec / score_grit score one
+answers dict; score_batch scores a whole answers matrix (columns in
+batch_item_ids() order, NaN = unanswered) in one vectorized pass, with
+results identical to the per-dict functions (same float64 arithmetic and
+round-half-to-even rounding).
 """
 
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 _INSTRUMENTS_DIR = os.path.join(os.path.dirname(__file__), "..", "psychometrics", "instruments")
 
@@ -60,6 +69,55 @@ def get_grit_version() -> str:
     return get_grit_config()["version"]
 
 
+# instrument → (config the compiled form was built from, compiled form)
+_compiled: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+# Scale key per instrument; RIASEC items have no reverse keying
+_SCALE_KEYS = {"ipip": "scale", "riasec": "dimension", "grit": "scale"}
+_CONFIG_GETTERS = {"ipip": get_ipip_config, "riasec": get_riasec_config, "grit": get_grit_config}
+
+
+def _compile(instrument: str) -> Dict[str, Any]:
+    """
+    Scale groups and scoring matrices for an instrument, rebuilt only when a
+    different config has been loaded (e.g. a version swap).
+
+    weights[i, s] is 1 if item i belongs to scale s; reverse[i] marks
+    reverse-keyed items.
+    """
+    config = _CONFIG_GETTERS[instrument]()
+    cached = _compiled.get(instrument)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    scale_key = _SCALE_KEYS[instrument]
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for item in config["items"]:
+        groups.setdefault(item[scale_key], []).append(item)
+
+    items = config["items"]
+    scales = list(groups)
+    weights = np.zeros((len(items), len(scales)))
+    for i, item in enumerate(items):
+        weights[i, scales.index(item[scale_key])] = 1.0
+    reverse = np.array(
+        [instrument != "riasec" and bool(item.get("reverse_scored", False)) for item in items],
+        dtype=bool,
+    )
+
+    compiled = {
+        "groups": groups,
+        "item_ids": [item["id"] for item in items],
+        "scales": scales,
+        "weights": weights,
+        "reverse": reverse,
+        "scale_range": tuple(config["scale_range"]),
+        "normalize_to": tuple(config["normalize_to"]),
+    }
+    _compiled[instrument] = (config, compiled)
+    return compiled
+
+
 def _normalize_score(raw_sum: int, item_count: int, scale_min: int, scale_max: int,
                      out_min: int = 0, out_max: int = 100) -> int:
     """
@@ -91,16 +149,8 @@ def score_ipip(answers: Dict[str, int]) -> Dict[str, int]:
     scale_min, scale_max = config["scale_range"]
     out_min, out_max = config["normalize_to"]
 
-    # Group items by scale (trait)
-    trait_items: Dict[str, List[Dict[str, Any]]] = {}
-    for item in config["items"]:
-        scale = item["scale"]
-        if scale not in trait_items:
-            trait_items[scale] = []
-        trait_items[scale].append(item)
-
     scores = {}
-    for trait, items in trait_items.items():
+    for trait, items in _compile("ipip")["groups"].items():
         raw_sum = 0
         count = 0
         for item in items:
@@ -138,16 +188,8 @@ def score_riasec(answers: Dict[str, int]) -> Dict[str, int]:
     scale_min, scale_max = config["scale_range"]
     out_min, out_max = config["normalize_to"]
 
-    # Group items by dimension
-    dim_items: Dict[str, List[Dict[str, Any]]] = {}
-    for item in config["items"]:
-        dim = item["dimension"]
-        if dim not in dim_items:
-            dim_items[dim] = []
-        dim_items[dim].append(item)
-
     scores = {}
-    for dim, items in dim_items.items():
+    for dim, items in _compile("riasec")["groups"].items():
         raw_sum = 0
         count = 0
         for item in items:
@@ -224,3 +266,83 @@ def score_all(answers: Dict[str, int]) -> Tuple[Dict[str, int], Dict[str, int],
     }
 
     return ipip_scores, riasec_scores, metadata
+
+
+# ── Batch scoring ────────────────────────────────────────────────────────
+
+BATCH_INSTRUMENTS = ("ipip", "riasec", "grit")
+
+
+def batch_item_ids() -> List[str]:
+    """Column order of score_batch's answers matrix: IPIP, then RIASEC, then Grit items."""
+    return [item_id for name in BATCH_INSTRUMENTS for item_id in _compile(name)["item_ids"]]
+
+
+def answers_to_matrix(answer_sets: Iterable[Dict[str, int]]) -> np.ndarray:
+    """Stack answers dicts into a float64 matrix for score_batch (NaN = unanswered)."""
+    columns = {item_id: j for j, item_id in enumerate(batch_item_ids())}
+    answer_sets = list(answer_sets)
+    matrix = np.full((len(answer_sets), len(columns)), np.nan)
+    for i, answers in enumerate(answer_sets):
+        for item_id, value in answers.items():
+            j = columns.get(item_id)
+            if j is not None and value is not None:
+                matrix[i, j] = value
+    return matrix
+
+
+def _score_matrix(compiled: Dict[str, Any], answers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(n, scales) normalized scores and answered-item counts for one instrument's columns."""
+    scale_min, scale_max = compiled["scale_range"]
+    out_min, out_max = compiled["normalize_to"]
+    weights = compiled["weights"]
+
+    answered = ~np.isnan(answers)
+    values = np.clip(answers, scale_min, scale_max)
+    values = np.where(compiled["reverse"], scale_max + scale_min - values, values)
+    values = np.where(answered, values, 0.0)
+
+    raw_sum = values @ weights
+    count = answered.astype(np.float64) @ weights
+    min_possible = count * scale_min
+    max_possible = count * scale_max
+    span = max_possible - min_possible
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = (raw_sum - min_possible) / span * (out_max - out_min) + out_min
+    scores = np.clip(np.rint(normalized), out_min, out_max)
+    scores = np.where(span == 0, 50, scores).astype(np.int64)
+    return scores, count
+
+
+def score_batch(answers_matrix: np.ndarray) -> Dict[str, Any]:
+    """
+    Score many response sets at once (re-norming, analytics backfills, bulk imports).
+
+    Args:
+        answers_matrix: (n, len(batch_item_ids())) array of Likert values, NaN
+            where an item was not answered (see answers_to_matrix).
+
+    Returns:
+        {"ipip": {trait: int64[n]}, "riasec": {dimension: int64[n]},
+         "grit": int64[n], "grit_answered": bool[n]}
+        Row i equals score_ipip / score_riasec / score_grit of response set i;
+        grit is only meaningful where grit_answered (score_grit returns None
+        otherwise).
+    """
+    answers_matrix = np.asarray(answers_matrix, dtype=np.float64)
+    if answers_matrix.ndim != 2 or answers_matrix.shape[1] != len(batch_item_ids()):
+        raise ValueError(f"answers_matrix must have shape (n, {len(batch_item_ids())})")
+
+    result: Dict[str, Any] = {}
+    start = 0
+    for name in BATCH_INSTRUMENTS:
+        compiled = _compile(name)
+        end = start + len(compiled["item_ids"])
+        scores, count = _score_matrix(compiled, answers_matrix[:, start:end])
+        start = end
+        if name == "grit":
+            result["grit"] = scores[:, 0]
+            result["grit_answered"] = count[:, 0] > 0
+        else:
+            result[name] = {scale: scores[:, k] for k, scale in enumerate(compiled["scales"])}
+    return result
@@ -0,0 +1,282 @@
+"""
+Adaptive Question Bank
+
+Curated multiple-choice items for the onboarding personality test
+(app/psychometrics/question_bank.json). Every option carries loadings on the
+traits /psychometric/analyze reports, so the next question can be chosen
+algorithmically instead of with an AI call per question.
+
+Compiled once at load:
+  - loadings        (questions, options, traits)
+  - information     (questions, traits): variance of a question's option
+                    loadings per trait, i.e. how much an answer can move
+                    that trait estimate
+  - by_trait        trait -> questions, most informative first (coverage)
+  - text/option indexes, so answers sent back by the frontend (question_text
+    + selected_option) are mapped to loadings without a scan
+
+Selection (`select`) is greedy maximum information: each trait's remaining
+uncertainty is 1 / (PRIOR_PRECISION + information collected so far), widened
+by how inconsistent the learner's answers on that trait have been; the next
+question is the unasked one with the largest expected gain
+sum_t 0.5 * log(1 + information[q, t] * uncertainty[t]). Picking several
+questions at once assumes each pick's information before choosing the next.
+
+Baseline items are the fixed warm-up served by /psychometric/start; they are
+never selected, but their answers (or, before they arrive, their expected
+information) count towards the state.
+
+The bank grows offline: app/workers/question_bank_grow.py asks AI Gateway
+for items targeting the least-covered traits and appends the ones that pass
+validation to the JSON file, which is reviewed and deployed like code.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger("guidify.psychometric.question_bank")
+
+BANK_PATH = Path(__file__).resolve().parent.parent / "psychometrics" / "question_bank.json"
+
+# Precision of each trait estimate before any answer (unit-variance prior)
+PRIOR_PRECISION = 1.0
+
+# Fields returned to the frontend (loadings and bookkeeping stay server-side)
+PUBLIC_OPTION_FIELDS = ("text", "trait_impact")
+
+# New items need this many options and at least this much total information
+OPTIONS_PER_QUESTION = 4
+MIN_INFORMATION = 0.05
+
+
+def _norm(text: Any) -> str:
+    return re.sub(r"\s+", " ", str(text or "")).strip().lower()
+
+
+class QuestionBank:
+    """A loaded, compiled question bank."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.version: str = data["version"]
+        self.traits: List[str] = list(data["traits"])
+        self.questions: List[Dict[str, Any]] = list(data["questions"])
+
+        trait_index = {trait: t for t, trait in enumerate(self.traits)}
+        width = max(len(q["options"]) for q in self.questions)
+        loadings = np.zeros((len(self.questions), width, len(self.traits)))
+        answerable = np.zeros((len(self.questions), width), dtype=bool)
+        for i, q in enumerate(self.questions):
+            for o, option in enumerate(q["options"]):
+                answerable[i, o] = True
+                for trait, value in option.get("loadings", {}).items():
+                    loadings[i, o, trait_index[trait]] = value
+        counts = answerable.sum(axis=1)[:, None]
+        mean = loadings.sum(axis=1) / counts
+        self.loadings = loadings
+        self.information = ((loadings - mean[:, None, :]) ** 2 * answerable[:, :, None]).sum(axis=1) / counts
+
+        self.ids = [q["id"] for q in self.questions]
+        self.baseline = [i for i, q in enumerate(self.questions) if q.get("baseline")]
+        self._candidate = np.array([not q.get("baseline") for q in self.questions])
+        self._by_id = {qid: i for i, qid in enumerate(self.ids)}
+        # Exact text first (what the frontend echoes back), normalized text as fallback
+        self._by_text = {q["question_text"]: i for i, q in enumerate(self.questions)}
+        self._by_text.update({_norm(q["question_text"]): i for i, q in enumerate(self.questions)})
+        self._options = [
+            {**{o["text"]: j for j, o in enumerate(q["options"])}, **{_norm(o["text"]): j for j, o in enumerate(q["options"])}}
+            for q in self.questions
+        ]
+        self.by_trait: Dict[str, List[int]] = {
+            trait: [int(i) for i in np.argsort(-self.information[:, t], kind="stable") if self._candidate[i]]
+            for t, trait in enumerate(self.traits)
+        }
+
+    @classmethod
+    def load(cls, path: Path = BANK_PATH) -> "QuestionBank":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def public(self, index: int) -> Dict[str, Any]:
+        """The question as served to the frontend."""
+        q = self.questions[index]
+        return {
+            "id": q["id"],
+            "question_text": q["question_text"],
+            "question_type": q.get("question_type", "multiple_choice"),
+            "options": [{f: o[f] for f in PUBLIC_OPTION_FIELDS} for o in q["options"]],
+        }
+
+    def baseline_questions(self) -> List[Dict[str, Any]]:
+        return [self.public(i) for i in self.baseline]
+
+    def coverage(self) -> Dict[str, float]:
+        """Total information per trait across selectable questions."""
+        totals = self.information[self._candidate].sum(axis=0)
+        return {trait: round(float(totals[t]), 3) for t, trait in enumerate(self.traits)}
+
+    def match(self, response: Dict[str, Any]) -> Optional[tuple]:
+        """(question index, option index or None) for a frontend response, or None if not a bank item."""
+        index = self._by_id.get(response.get("question_id"))
+        if index is None:
+            text = response.get("question_text")
+            index = self._by_text.get(text)
+            if index is None:
+                index = self._by_text.get(_norm(text))
+                if index is None:
+                    return None
+        selected = response.get("selected_option")
+        if isinstance(selected, dict):
+            selected = selected.get("text")
+        options = self._options[index]
+        option = options.get(selected)
+        return index, option if option is not None else options.get(_norm(selected))
+
+    def state(self, responses: Iterable[Dict[str, Any]], assume_asked: Iterable[int] = ()):
+        """
+        (asked mask, per-trait precision, per-trait answer spread) after
+        `responses`. `assume_asked` questions not answered yet contribute
+        their expected information (and are marked asked).
+        """
+        answered: Dict[int, Optional[int]] = {}
+        for response in responses:
+            matched = self.match(response)
+            if matched is not None and matched[0] not in answered:
+                answered[matched[0]] = matched[1]
+        rows = [index for index, option in answered.items() if option is not None]
+        chosen = [answered[index] for index in rows]
+
+        asked_ids = list(answered) + [index for index in assume_asked if index not in answered]
+        asked = np.zeros(len(self.questions), dtype=bool)
+        asked[asked_ids] = True
+        precision = PRIOR_PRECISION + self.information[asked].sum(axis=0)
+
+        spread = np.zeros(len(self.traits))
+        if rows:
+            values = self.loadings[rows, chosen]
+            weights = self.information[rows]
+            total = weights.sum(axis=0)
+            safe = np.where(total > 0, total, 1.0)
+            mean = (weights * values).sum(axis=0) / safe
+            spread = (weights * (values - mean) ** 2).sum(axis=0) / safe
+        return asked, precision, spread
+
+    def select(
+        self,
+        responses: Sequence[Dict[str, Any]] = (),
+        count: int = 1,
+        assume_asked: Iterable[int] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Up to `count` unasked questions with the largest expected information
+        gain, in order. Each comes with a short `reasoning` naming the traits
+        it targets.
+        """
+        asked, precision, spread = self.state(responses, assume_asked)
+        asked |= ~self._candidate
+        remaining = len(self.questions) - int(asked.sum())
+        selected = []
+        for _ in range(min(count, remaining)):
+            gains = np.log1p(self.information * ((1.0 + spread) / precision))
+            totals = gains.sum(axis=1)
+            totals[asked] = -np.inf
+            pick = int(totals.argmax())
+
+            row = gains[pick].tolist()
+            targets = sorted((t for t in range(len(row)) if row[t] > 0), key=lambda t: -row[t])[:2]
+            question = self.public(pick)
+            question["reasoning"] = f"Targets {', '.join(self.traits[t] for t in targets)} (most uncertain traits)"
+            selected.append(question)
+
+            asked[pick] = True
+            precision = precision + self.information[pick]
+        return selected
+
+    def validate(self, question: Dict[str, Any]) -> List[str]:
+        """Problems that keep a candidate item out of the bank (empty list = acceptable)."""
+        problems = []
+        text = question.get("question_text")
+        if not isinstance(text, str) or not text.strip():
+            return ["missing question_text"]
+        if _norm(text) in self._by_text:
+            problems.append("duplicate question_text")
+        options = question.get("options")
+        if not isinstance(options, list) or len(options) != OPTIONS_PER_QUESTION:
+            return problems + [f"needs exactly {OPTIONS_PER_QUESTION} options"]
+        if len({_norm(o.get("text")) for o in options if isinstance(o, dict)}) != OPTIONS_PER_QUESTION:
+            problems.append("option texts must be distinct")
+        for o in options:
+            if not isinstance(o, dict) or not o.get("text") or not o.get("trait_impact"):
+                problems.append("every option needs text and trait_impact")
+                break
+            loadings = o.get("loadings")
+            if not isinstance(loadings, dict) or not loadings:
+                problems.append("every option needs loadings")
+                break
+            unknown = set(loadings) - set(self.traits)
+            if unknown:
+                problems.append(f"unknown traits: {sorted(unknown)}")
+                break
+            if any(not isinstance(v, (int, float)) or not -1 <= v <= 1 for v in loadings.values()):
+                problems.append("loadings must be numbers in [-1, 1]")
+                break
+        if not problems:
+            matrix = np.array([[o["loadings"].get(t, 0.0) for t in self.traits] for o in options])
+            if matrix.var(axis=0).sum() < MIN_INFORMATION:
+                problems.append("answers barely differ on any trait")
+        return problems
+
+    def extend(self, questions: List[Dict[str, Any]], source: str = "generated") -> Dict[str, Any]:
+        """
+        Bank data with `questions` appended (ids continue the qb_ sequence,
+        minor version bumped). Questions are expected to pass validate().
+        """
+        numbers = [int(qid[3:]) for qid in self.ids if re.fullmatch(r"qb_\d+", qid)]
+        next_number = max(numbers, default=0) + 1
+        added = []
+        for offset, q in enumerate(questions):
+            added.append({
+                "id": f"qb_{next_number + offset:03d}",
+                "question_text": q["question_text"].strip(),
+                "question_type": "multiple_choice",
+                "source": source,
+                "options": [
+                    {"text": o["text"], "trait_impact": o["trait_impact"], "loadings": o["loadings"]}
+                    for o in q["options"]
+                ],
+            })
+        major, _, minor = self.version.partition(".")
+        return {**self.data, "version": f"{major}.{int(minor or 0) + 1}", "questions": self.questions + added}
+
+
+def dumps(data: Dict[str, Any]) -> str:
+    """Serialize a bank in the file's layout (one option per line) for reviewable diffs."""
+    lines = ["{"]
+    for key, value in data.items():
+        if key != "questions":
+            lines.append(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},")
+    lines.append('  "questions": [')
+    for i, q in enumerate(data["questions"]):
+        lines.append("    {")
+        for key, value in q.items():
+            if key != "options":
+                lines.append(f"      {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},")
+        lines.append('      "options": [')
+        options = [f"        {json.dumps(o, ensure_ascii=False)}" for o in q["options"]]
+        lines.append(",\n".join(options))
+        lines.append("      ]")
+        lines.append("    }" + ("," if i < len(data["questions"]) - 1 else ""))
+    lines.append("  ]")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+bank = QuestionBank.load()
@@ -4,25 +4,94 @@ Roadmap Service — shared roadmap (re)generation logic.
 Extracted from app/api/roadmap.py so both the /roadmap/regenerate route and the
 Rules Engine (goal-change trigger, rules.md §1.3) perform regeneration through
 one code path — no duplicated context assembly and no import cycle.
+
+Both callers queue a 'roadmap_generate' job (migration 030) with
+enqueue_regeneration and return its id; app/workers/job_worker.py runs it
+through run_regeneration_job, which records the job's progress_state
+(queued → generating → validating → saved, or failed). Duplicate requests
+for a learner join the job already queued.
+
+Adaptation triggers other than a goal change (rules.md §1.1, §1.2, §1.4)
+patch the current phase instead: enqueue_adaptation queues a 'roadmap_adapt'
+job, and adapt_roadmap sends roadmap.adapt only that phase, the triggering
+signal and a one-line summary of the other phases, then saves the patched
+roadmap as a new version.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from app.db import queries
+from app.db.event_writer import event_writer
 from app.ai_gateway.gateway import gateway
-from app.models.schemas import RoadmapGenerateResponse
+from app.models.schemas import RoadmapAdaptResponse, RoadmapGenerateResponse
+from app.services import rules_state
 
 logger = logging.getLogger("guidify.api.roadmap")
 
 DEBOUNCE_WINDOW_HOURS = 24
 
+# job_queue.progress_state values for roadmap_generate jobs
+JOB_QUEUED = "queued"
+JOB_GENERATING = "generating"
+JOB_VALIDATING = "validating"
+JOB_SAVED = "saved"
+JOB_FAILED = "failed"
+
+# Outcomes worth another attempt by the job worker
+RETRYABLE_STATUSES = ("ai_failed", "save_failed")
+
+ADAPT_JOB_TYPE = "roadmap_adapt"
+ROADMAP_ADAPT_COLUMNS = "id, title, total_phases, estimated_weeks, current_phase_number, progress_pct"
+
+Progress = Callable[[str], Awaitable[None]]
+
+
+async def _nothing() -> None:
+    return None
+
+
+def _parse_time(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _debounced(last_regeneration: Optional[str]) -> bool:
+    """True if the last regeneration is inside the 24h window (rules.md §2)."""
+    last_time = _parse_time(last_regeneration) if last_regeneration else None
+    if not last_time:
+        return False
+    return (datetime.now(timezone.utc) - last_time) < timedelta(hours=DEBOUNCE_WINDOW_HOURS)
+
+
+def _saved_at(saved: Dict[str, Any]) -> str:
+    return str(saved.get("created_at") or datetime.now(timezone.utc).isoformat())
+
+
+def _validate_roadmap(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Check a schema-valid roadmap before it is saved.
+
+    Phases are ordered and renumbered 1..n (phase_number keys roadmap_phases,
+    migration 029) and total_phases is made to match. None if there are no
+    phases.
+    """
+    phases = sorted(result.get("phases") or [], key=lambda p: p.get("phase_number", 0))
+    if not phases:
+        return None
+    phases = [{**phase, "phase_number": number} for number, phase in enumerate(phases, start=1)]
+    return {**result, "phases": phases, "total_phases": len(phases)}
+
 
 async def regenerate_roadmap(
     learner_id: str,
     trigger_reason: str = "regenerate_request",
     bypass_debounce: bool = False,
+    progress: Optional[Progress] = None,
 ) -> Dict[str, Any]:
     """
     Generate or regenerate a learner's career roadmap.
@@ -30,30 +99,29 @@ async def regenerate_roadmap(
     Assembles context from the learner + profile (including psychometric
     narrative, rules.md §3), calls the AI Gateway, validates the result, and
     persists it. Logs a roadmap_generated / roadmap_regenerated event.
+    `progress` is awaited with JOB_GENERATING and JOB_VALIDATING as the
+    corresponding steps start.
 
     Returns a status dict: {"status": "ok"|"debounced"|"error", ...}.
     """
-    learner = await queries.get_learner(learner_id)
+    # The pre-AI reads are independent; fetch them together
+    learner, last_regeneration, profile, psychometric = await asyncio.gather(
+        queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING),
+        # Goal changes (rules.md §1.3) bypass the window entirely
+        _nothing() if bypass_debounce else queries.get_last_regeneration(learner_id),
+        queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY),
+        queries.get_psychometric_profile(learner_id),
+    )
     if not learner:
         logger.warning(f"Roadmap regeneration skipped: learner {learner_id} not found")
         return {"status": "learner_not_found", "message": "Learner not found"}
 
     # Debounce check (rules.md §2): 24h minimum between regenerations.
-    # Goal changes (rules.md §1.3) bypass the window entirely.
-    if not bypass_debounce:
-        last_regeneration = await queries.get_last_regeneration(learner_id)
-        if last_regeneration:
-            try:
-                last_time = datetime.fromisoformat(last_regeneration.replace("Z", "+00:00"))
-            except ValueError:
-                last_time = None
-            if last_time and (datetime.now(timezone.utc) - last_time) < timedelta(hours=DEBOUNCE_WINDOW_HOURS):
-                return {
-                    "status": "debounced",
-                    "message": "Roadmap regeneration is rate-limited to once per 24 hours. Try again later.",
-                }
-
-    profile = await queries.get_learner_profile(learner_id)
+    if _debounced(last_regeneration):
+        return {
+            "status": "debounced",
+            "message": "Roadmap regeneration is rate-limited to once per 24 hours. Try again later.",
+        }
 
     # Build AI Gateway context from assembled profile data
     context: Dict[str, Any] = {
@@ -68,13 +136,14 @@ async def regenerate_roadmap(
 
     # F-10 FIX: inject psychometric narrative into the roadmap prompt so the AI
     # generates pacing/tone that match the learner's profile (rules.md §3).
-    psychometric = await queries.get_psychometric_profile(learner_id)
     if psychometric:
         context["psychometric_narrative"] = psychometric.get("narrative_summary")
         context["psychometric_pacing"] = psychometric.get("pacing_hint", "mixed")
         context["psychometric_tone"] = psychometric.get("tone_hint", "encouraging")
 
     # Call AI Gateway with schema validation
+    if progress:
+        await progress(JOB_GENERATING)
     try:
         result = await gateway.generate(
             task_type="roadmap.generate",
@@ -88,6 +157,16 @@ async def regenerate_roadmap(
             "message": "AI roadmap generation failed. Please try again in a few minutes.",
         }
 
+    if progress:
+        await progress(JOB_VALIDATING)
+    result = _validate_roadmap(result)
+    if not result:
+        logger.error(f"Roadmap generated without phases for learner {learner_id}")
+        return {
+            "status": "ai_failed",
+            "message": "AI roadmap generation failed. Please try again in a few minutes.",
+        }
+
     # Persist to DB
     roadmap_data = {
         "title": result["title"],
@@ -108,7 +187,7 @@ async def regenerate_roadmap(
     # Log event so the 24h regeneration debounce (rules.md §2) actually works.
     event_type = "roadmap_regenerated" if saved.get("version", 1) > 1 else "roadmap_generated"
     try:
-        await queries.create_event(
+        await event_writer.write(
             learner_id=learner_id,
             event_type=event_type,
             payload={
@@ -121,6 +200,7 @@ async def regenerate_roadmap(
         )
     except Exception as e:
         logger.warning(f"Failed to log {event_type} event for {learner_id}: {e}")
+    await rules_state.record_regeneration(learner_id, _saved_at(saved))
 
     return {
         "status": "ok",
@@ -130,3 +210,298 @@ async def regenerate_roadmap(
         "estimated_weeks": result["estimated_weeks"],
         "message": "Roadmap generated successfully",
     }
+
+
+async def enqueue_regeneration(
+    learner_id: str,
+    trigger_reason: str = "regenerate_request",
+    bypass_debounce: bool = False,
+) -> Dict[str, Any]:
+    """
+    Queue a roadmap regeneration and return without waiting for it.
+
+    The learner and debounce checks run here so those requests are refused
+    immediately. Returns {"status": "queued", "job_id", "coalesced"} — the
+    job may be one already queued for the learner — or the refusal. When no
+    job can be queued the regeneration runs inline and its result is
+    returned instead (job_id None).
+    """
+    learner, last_regeneration = await asyncio.gather(
+        queries.get_learner(learner_id, columns="id"),
+        _nothing() if bypass_debounce else queries.get_last_regeneration(learner_id),
+    )
+    if not learner:
+        return {"status": "learner_not_found", "message": "Learner not found"}
+    if _debounced(last_regeneration):
+        return {
+            "status": "debounced",
+            "message": "Roadmap regeneration is rate-limited to once per 24 hours. Try again later.",
+        }
+
+    job = await queries.enqueue_roadmap_job(learner_id, trigger_reason, bypass_debounce)
+    if not job:
+        logger.warning(f"No roadmap job queued for learner {learner_id}, regenerating inline")
+        result = await regenerate_roadmap(learner_id, trigger_reason, bypass_debounce)
+        return {**result, "job_id": None}
+
+    return {
+        "status": "queued",
+        "job_id": job["job_id"],
+        "coalesced": bool(job.get("coalesced")),
+        "progress_state": JOB_QUEUED,
+        "message": "Roadmap regeneration queued",
+    }
+
+
+async def _run_job(
+    job: Dict[str, Any],
+    final: bool,
+    run: Callable[[Progress], Awaitable[Dict[str, Any]]],
+) -> bool:
+    """Run a claimed roadmap job, recording progress and outcome on the job row."""
+    job_id = job["id"]
+
+    async def progress(state: str) -> None:
+        await queries.update_job_progress(job_id, state)
+
+    result = await run(progress)
+    if result["status"] == "ok":
+        await queries.update_job_progress(job_id, JOB_SAVED, result)
+        return True
+    if result["status"] in RETRYABLE_STATUSES and not final:
+        await queries.update_job_progress(job_id, JOB_QUEUED, result)
+        return False
+    await queries.update_job_progress(job_id, JOB_FAILED, result)
+    return result["status"] not in RETRYABLE_STATUSES
+
+
+async def run_regeneration_job(job: Dict[str, Any], final: bool = True) -> bool:
+    """
+    Run a claimed roadmap_generate job, recording progress on the job row.
+
+    Returns False when the job should be retried (AI or save failure on a
+    non-final attempt); its progress_state then goes back to queued.
+    """
+    payload = job.get("payload") or {}
+    return await _run_job(job, final, lambda progress: regenerate_roadmap(
+        learner_id=job["learner_id"],
+        trigger_reason=payload.get("trigger_reason", "regenerate_request"),
+        bypass_debounce=bool(payload.get("bypass_debounce")),
+        progress=progress,
+    ))
+
+
+# --- Incremental adaptation (roadmap.adapt) ---
+
+def summarize_phases(phases: List[Dict[str, Any]], exclude: Optional[int] = None) -> List[str]:
+    """One line per phase — title, difficulty and first skills — for prompt context."""
+    return [
+        f"Phase {p.get('phase_number')}: {p.get('title', '')} ({p.get('difficulty', 'beginner')})"
+        f" — {', '.join((p.get('skills') or [])[:4])}"
+        for p in phases
+        if p.get("phase_number") != exclude
+    ]
+
+
+def apply_roadmap_patch(
+    phases: List[Dict[str, Any]],
+    phase_number: int,
+    patch: Dict[str, Any],
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return a copy of `phases` with a roadmap.adapt patch applied to one phase.
+
+    Skills are removed and added case-insensitively, remedial missions are
+    appended without duplicates, and difficulty / estimated_weeks replace the
+    phase's values when set. Other phases are returned unchanged. None if the
+    phase does not exist.
+    """
+    patched = []
+    found = False
+    for phase in phases:
+        if phase.get("phase_number") != phase_number:
+            patched.append(phase)
+            continue
+        found = True
+        phase = dict(phase)
+        if patch.get("difficulty"):
+            phase["difficulty"] = patch["difficulty"]
+        if patch.get("estimated_weeks"):
+            phase["estimated_weeks"] = patch["estimated_weeks"]
+
+        removed = {s.lower() for s in patch.get("remove_skills") or []}
+        skills = [s for s in phase.get("skills") or [] if s.lower() not in removed]
+        for skill in patch.get("add_skills") or []:
+            if skill.lower() not in {s.lower() for s in skills}:
+                skills.append(skill)
+        phase["skills"] = skills
+
+        remedial = list(phase.get("remedial_missions") or [])
+        for mission in patch.get("remedial_missions") or []:
+            if mission not in remedial:
+                remedial.append(mission)
+        if remedial:
+            phase["remedial_missions"] = remedial
+        patched.append(phase)
+    return patched if found else None
+
+
+async def adapt_roadmap(
+    learner_id: str,
+    trigger: str,
+    signal: Dict[str, Any],
+    progress: Optional[Progress] = None,
+) -> Dict[str, Any]:
+    """
+    Patch the current phase of the learner's roadmap for an adaptation trigger.
+
+    Sends roadmap.adapt the current phase, `signal` and a summary of the other
+    phases, applies the returned patch, and saves the result as a new roadmap
+    version (progress carried over). Logs a roadmap_regenerated event with
+    mode "adapt".
+
+    Returns a status dict: {"status": "ok"|"unchanged"|"no_roadmap"|"ai_failed"|"save_failed", ...}.
+    """
+    roadmap, learner = await asyncio.gather(
+        queries.get_active_roadmap(learner_id, columns=ROADMAP_ADAPT_COLUMNS),
+        queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING),
+    )
+    phases = (await roadmap.fetch("phases") if roadmap else None) or []
+    current = (roadmap.get("current_phase_number") if roadmap else None) or 1
+    phase = next((p for p in phases if p.get("phase_number") == current), None)
+    if not phase:
+        return {"status": "no_roadmap", "message": "No roadmap phase to adapt"}
+
+    context = {
+        "target_role": learner.get("target_role", "Software Developer") if learner else "Software Developer",
+        "trigger": trigger,
+        "signal": signal,
+        "phase_number": current,
+        "phase": phase,
+        "roadmap_summary": summarize_phases(phases, exclude=current),
+    }
+
+    if progress:
+        await progress(JOB_GENERATING)
+    try:
+        result = await gateway.generate(
+            task_type="roadmap.adapt",
+            context=context,
+            response_model=RoadmapAdaptResponse,
+        )
+    except Exception as e:
+        logger.error(f"Roadmap adaptation failed for learner {learner_id}: {e}")
+        return {
+            "status": "ai_failed",
+            "message": "AI roadmap adaptation failed. Please try again in a few minutes.",
+        }
+
+    if progress:
+        await progress(JOB_VALIDATING)
+    if result.get("phase_number") != current:
+        logger.warning(
+            f"roadmap.adapt patched phase {result.get('phase_number')} instead of {current} "
+            f"for learner {learner_id}; applying to phase {current}"
+        )
+    patch = result["patch"]
+    patched = apply_roadmap_patch(phases, current, patch)
+    if patched == phases:
+        return {"status": "unchanged", "message": "No roadmap changes were needed"}
+
+    estimated_weeks = roadmap.get("estimated_weeks") or 0
+    if patch.get("estimated_weeks"):
+        estimated_weeks += patch["estimated_weeks"] - (phase.get("estimated_weeks") or 0)
+
+    saved = await queries.create_roadmap(learner_id, {
+        "title": roadmap.get("title", "Career Roadmap"),
+        "total_phases": len(patched),
+        "estimated_weeks": max(estimated_weeks, 1),
+        "phases": patched,
+        "trigger_reason": trigger,
+        "current_phase_number": current,
+        "progress_pct": roadmap.get("progress_pct") or 0,
+    })
+    if not saved:
+        logger.error(f"Roadmap adapted but save failed for learner {learner_id}")
+        return {
+            "status": "save_failed",
+            "message": "Roadmap was adapted but could not be saved. Please try again.",
+        }
+
+    try:
+        await event_writer.write(
+            learner_id=learner_id,
+            event_type="roadmap_regenerated",
+            payload={
+                "roadmap_id": saved.get("id"),
+                "mode": "adapt",
+                "trigger_reason": trigger,
+                "phase_number": current,
+                "patch": patch,
+                "rationale": result.get("rationale", ""),
+            },
+            related_roadmap_id=saved.get("id"),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to log roadmap_regenerated event for {learner_id}: {e}")
+    await rules_state.record_regeneration(learner_id, _saved_at(saved))
+
+    return {
+        "status": "ok",
+        "roadmap_id": saved.get("id"),
+        "phase_number": current,
+        "patch": patch,
+        "rationale": result.get("rationale", ""),
+        "message": "Roadmap adapted successfully",
+    }
+
+
+async def enqueue_adaptation(learner_id: str, trigger: str, signal: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Queue a roadmap_adapt job and return without waiting for it.
+
+    Returns {"status": "queued", "job_id"}; when no job can be queued the
+    adaptation runs inline and its result is returned instead (job_id None).
+    """
+    try:
+        job = await queries.create_job(
+            job_type=ADAPT_JOB_TYPE,
+            learner_id=learner_id,
+            payload={"trigger": trigger, "signal": signal},
+            service_role=True,
+        )
+    except Exception:
+        job = None
+    if not job:
+        logger.warning(f"No roadmap adaptation job queued for learner {learner_id}, adapting inline")
+        result = await adapt_roadmap(learner_id, trigger, signal)
+        return {**result, "job_id": None}
+
+    return {
+        "status": "queued",
+        "job_id": job["id"],
+        "progress_state": JOB_QUEUED,
+        "message": "Roadmap adaptation queued",
+    }
+
+
+async def run_adaptation_job(job: Dict[str, Any], final: bool = True) -> bool:
+    """
+    Run a claimed roadmap_adapt job, recording progress on the job row.
+
+    A job is skipped when a newer roadmap version was saved after it was
+    queued (several triggers firing before the worker got to the first).
+    The learner comes from the job row, never from the payload.
+    """
+    payload = job.get("payload") or {}
+    learner_id = job["learner_id"]
+
+    async def run(progress: Progress) -> Dict[str, Any]:
+        last = await queries.get_last_regeneration(learner_id)
+        last_time = _parse_time(last) if last else None
+        queued_at = _parse_time(job["created_at"]) if job.get("created_at") else None
+        if last_time and queued_at and last_time > queued_at:
+            return {"status": "superseded", "message": "Roadmap changed since this adaptation was queued"}
+        return await adapt_roadmap(learner_id, payload.get("trigger", ""), payload.get("signal") or {}, progress)
+
+    return await _run_job(job, final, run)
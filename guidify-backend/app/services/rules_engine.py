@@ -9,15 +9,25 @@ Per rules.md §1-2:
   - Skill gap analysis: Real-time gap calculation
 Per rules.md §6.1:
   - Delivery-specific remedial mission triggers (2-consecutive-session threshold)
+
+Goal changes queue a full regeneration; failure patterns, fast completions
+and certificates queue an incremental adaptation of the current phase
+(roadmap_service.enqueue_adaptation, task roadmap.adapt).
+
+Streaks, mission history and the debounce timestamp come from the learner's
+rules state (app/services/rules_state.py), updated from each logged event, so
+evaluating a trigger runs no history queries.
 """
 
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from app.db import queries
-from app.services.roadmap_service import regenerate_roadmap
+from app.db.event_writer import event_writer
+from app.services import delivery_trends, rules_state
+from app.services.roadmap_service import enqueue_adaptation, enqueue_regeneration
 
 logger = logging.getLogger("guidify.rules_engine")
 
@@ -26,16 +36,39 @@ DEBOUNCE_WINDOW_HOURS = 24
 FAILURE_THRESHOLD = 3
 MIN_MISSION_HISTORY_FOR_ADAPTATION = 3
 
-# Delivery metric thresholds for remedial triggers (rules.md §6.1)
-# If metric falls below this value in 2 consecutive sessions → remedial mission
-DELIVERY_THRESHOLDS = {
-    "eye_contact_pct": 40,        # Below 40% → practice eye contact
-    "posture_score": 0.5,         # Below 0.5 → practice posture
-    "filler_word_rate": 0.1,      # Above 10% → practice reducing fillers
-    "words_per_minute": 100,      # Below 100 WPM → practice pacing
-}
+# Delivery metric thresholds (rules.md §6.1) are in delivery_trends.DELIVERY_THRESHOLDS.
+# If a metric is on the wrong side of its threshold in 2 consecutive sessions → remedial mission
 DELIVERY_CONSECUTIVE_SESSIONS = 2
 
+# Event types → trigger category, for evaluating a batch once per category
+TRIGGER_CATEGORIES = {
+    "target_role_changed": "goal_change",
+    "mission_completed": "mission",
+    "mission_failed": "mission",
+    "mission_too_hard": "mission",
+    "mission_skipped": "mission",
+    "certificate_uploaded": "certificate",
+    "delivery_metrics_submitted": "delivery",
+}
+TRIGGER_ORDER = ("goal_change", "mission", "certificate", "delivery")
+
+# Written to event_log before responding; other events go through the
+# write-behind buffer (app/db/event_writer.py). A goal change is the audit
+# record for the full regeneration it queues.
+SYNC_EVENTS = {"target_role_changed"}
+
+
+def _mission_signal(mission: Dict[str, Any]) -> Dict[str, Any]:
+    """The mission fields roadmap.adapt needs to see."""
+    return {
+        "title": mission.get("title"),
+        "target_skill": mission.get("target_skill"),
+        "difficulty": mission.get("difficulty"),
+        "status": mission.get("status"),
+        "estimated_minutes": mission.get("estimated_minutes"),
+        "time_spent_minutes": mission.get("time_spent_minutes"),
+    }
+
 
 class RulesEngine:
     """
@@ -64,25 +97,85 @@ class RulesEngine:
         Returns:
             Dict with adaptation decision and details
         """
-        # Log the event
-        await queries.create_event(learner_id, event_type, event_payload)
-
-        # Get learner context
-        learner = await queries.get_learner(learner_id)
-        if not learner:
-            return {"adaptation_needed": False, "reason": "Learner not found"}
+        # Log the event and fold it into the rolling rules state
+        event = await event_writer.write(
+            learner_id, event_type, event_payload, sync=event_type in SYNC_EVENTS
+        )
+        state = await rules_state.record_event(
+            learner_id, event or {"event_type": event_type, "payload": event_payload}
+        )
 
         # Check each trigger condition
-        adaptation = await self._check_triggers(learner_id, event_type, event_payload, learner)
+        adaptation = await self._check_triggers(learner_id, event_type, event_payload, state)
         
         return adaptation
 
+    async def evaluate_mission_outcome(self, learner_id: str, mission: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Log a mission's final status (missions API) and evaluate the §1.1 and
+        §1.2 triggers over the updated rules state.
+        """
+        state = await rules_state.log_mission_outcome(learner_id, mission)
+        if state is None:
+            return {"adaptation_needed": False, "reason": "No trigger matched"}
+        event_type = rules_state.STATUS_EVENTS[mission["status"]]
+        return await self._check_triggers(learner_id, event_type, {"mission_id": mission["id"]}, state)
+
+    async def evaluate_batch(
+        self,
+        learner_id: str,
+        events: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Log an ordered batch of events in one insert and evaluate triggers
+        once, over the rules state after all of them.
+
+        Each event gets a created_at a microsecond after the previous one so
+        the batch keeps its order in event_log (a bulk insert would otherwise
+        give every row the same NOW()). Triggers are checked for the latest
+        event of each category in TRIGGER_ORDER; the first decision that needs
+        an adaptation wins.
+
+        Returns:
+            {"rows": [inserted row or None, per event], "adaptation": decision}
+        """
+        now = datetime.now(timezone.utc)
+        rows = await queries.create_events(learner_id, [
+            {**event, "created_at": (now + timedelta(microseconds=i)).isoformat()}
+            for i, event in enumerate(events)
+        ])
+
+        logged = [(event, row) for event, row in zip(events, rows) if row]
+        adaptation: Dict[str, Any] = {"adaptation_needed": False, "reason": "No trigger matched"}
+        if not logged:
+            return {"rows": rows, "adaptation": adaptation}
+
+        state = await rules_state.record_events(learner_id, [row for _event, row in logged])
+        for event in self._batch_triggers([event for event, _row in logged]):
+            adaptation = await self._check_triggers(
+                learner_id, event["event_type"], event.get("payload") or {}, state
+            )
+            if adaptation.get("adaptation_needed"):
+                break
+
+        return {"rows": rows, "adaptation": adaptation}
+
+    @staticmethod
+    def _batch_triggers(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """The latest event of each trigger category, in TRIGGER_ORDER."""
+        latest: Dict[str, Dict[str, Any]] = {}
+        for event in events:
+            category = TRIGGER_CATEGORIES.get(event["event_type"])
+            if category:
+                latest[category] = event
+        return [latest[category] for category in TRIGGER_ORDER if category in latest]
+
     async def _check_triggers(
         self,
         learner_id: str,
         event_type: str,
         payload: Dict[str, Any],
-        learner: Dict[str, Any],
+        state: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
         Check all trigger conditions and return adaptation decision.
@@ -96,19 +189,19 @@ class RulesEngine:
         
         # §1.3: Goal change → ALWAYS triggers full regeneration (bypasses debounce)
         if event_type == "target_role_changed":
-            return await self._handle_goal_change(learner_id, payload)
+            return await self._handle_goal_change(learner_id, payload, state)
         
         # §1.2: Failure pattern detection (3 consecutive failures)
         if event_type in ("mission_failed", "mission_too_hard"):
-            return await self._handle_failure_pattern(learner_id, event_type, payload)
+            return await self._handle_failure_pattern(learner_id, event_type, payload, state)
         
         # §1.1: Fast completion pattern (3 consecutive fast completions)
         if event_type == "mission_completed":
-            return await self._handle_fast_completion(learner_id, payload)
+            return await self._handle_fast_completion(learner_id, payload, state)
         
         # §1.4: Certificate upload → update skill gaps
         if event_type == "certificate_uploaded":
-            return await self._handle_certificate_upload(learner_id, payload)
+            return await self._handle_certificate_upload(learner_id, payload, state)
         
         # §6.1: Delivery metrics submitted → check for remedial triggers
         if event_type == "delivery_metrics_submitted":
@@ -121,6 +214,7 @@ class RulesEngine:
         self,
         learner_id: str,
         payload: Dict[str, Any],
+        state: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
         §1.3: Changes career goal → full regeneration.
@@ -129,13 +223,12 @@ class RulesEngine:
         logger.info(f"Goal change detected for learner {learner_id}")
         
         # Get current active roadmap
-        roadmap = await queries.get_active_roadmap(learner_id)
+        roadmap = await queries.get_active_roadmap(learner_id, columns=queries.ROADMAP_REF)
         if not roadmap:
             return {"adaptation_needed": False, "reason": "No active roadmap to regenerate"}
         
         # Check minimum mission history (§2)
-        recent_missions = await queries.get_recent_missions(learner_id, limit=MIN_MISSION_HISTORY_FOR_ADAPTATION)
-        if len(recent_missions) < MIN_MISSION_HISTORY_FOR_ADAPTATION:
+        if state["missions"] < MIN_MISSION_HISTORY_FOR_ADAPTATION:
             return {
                 "adaptation_needed": False,
                 "reason": f"Need at least {MIN_MISSION_HISTORY_FOR_ADAPTATION} missions before regeneration"
@@ -144,21 +237,23 @@ class RulesEngine:
         # F-09 FIX: actually regenerate the roadmap (rules.md §1.3). Previously
         # the engine only returned an adaptation_needed decision and no caller
         # ever regenerated, so a target-role change never produced a new roadmap.
-        outcome = await regenerate_roadmap(
+        # The regeneration is queued (migration 030); the job id is returned.
+        outcome = await enqueue_regeneration(
             learner_id=learner_id,
             trigger_reason="goal_change",
             bypass_debounce=True,
         )
-        if outcome.get("status") != "ok":
+        if outcome.get("status") not in ("queued", "ok"):
             logger.error(f"Goal-change regeneration failed for {learner_id}: {outcome.get('message')}")
 
         return {
-            "adaptation_needed": outcome.get("status") == "ok",
+            "adaptation_needed": outcome.get("status") in ("queued", "ok"),
             "trigger": "goal_change",
             "regeneration_type": "full",
             "reason": f"Target role changed to {payload.get('new_target_role', 'unknown')}",
             "bypass_debounce": True,  # §1.3 always bypasses
             "regeneration_status": outcome.get("status"),
+            "job_id": outcome.get("job_id"),
             "roadmap_id": outcome.get("roadmap_id"),
         }
 
@@ -167,29 +262,34 @@ class RulesEngine:
         learner_id: str,
         event_type: str,
         payload: Dict[str, Any],
+        state: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
         §1.2: Fails assessments → insert remedial missions first.
         Only triggers full regeneration if 3+ consecutive failures.
         """
         # Check debounce (§2)
-        if await self._is_in_debounce_window(learner_id):
+        if self._in_debounce_window(state):
             return {
                 "adaptation_needed": False,
                 "reason": "In debounce window (24h minimum between regenerations)"
             }
         
-        # Count consecutive failures
-        consecutive_failures = await self._count_consecutive_failures(learner_id)
+        consecutive_failures = state["consecutive_failures"]
         
         if consecutive_failures >= FAILURE_THRESHOLD:
             logger.info(f"Failure threshold reached for learner {learner_id}: {consecutive_failures} consecutive")
+            outcome = await enqueue_adaptation(learner_id, "failure_pattern", {
+                "consecutive_failures": consecutive_failures,
+                "missions": [_mission_signal(m) for m in state["outcomes"][:consecutive_failures]],
+            })
             return {
                 "adaptation_needed": True,
                 "trigger": "failure_pattern",
                 "regeneration_type": "targeted",  # Insert remedial, not full regen
                 "reason": f"{consecutive_failures} consecutive mission failures",
                 "consecutive_failures": consecutive_failures,
+                "job_id": outcome.get("job_id"),
             }
         
         return {
@@ -201,29 +301,35 @@ class RulesEngine:
         self,
         learner_id: str,
         payload: Dict[str, Any],
+        state: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
         §1.1: Completes faster than expected → advance difficulty.
         Only triggers if 3+ consecutive missions completed in <50% estimated time.
         """
         # Check debounce (§2)
-        if await self._is_in_debounce_window(learner_id):
+        if self._in_debounce_window(state):
             return {
                 "adaptation_needed": False,
                 "reason": "In debounce window (24h minimum between regenerations)"
             }
         
-        # Check for fast completion pattern
-        fast_streak = await self._count_fast_completions(learner_id)
+        # Missions completed in <50% of the estimate (requires time_spent_minutes)
+        fast_streak = state["fast_streak"]
         
         if fast_streak >= 3:
             logger.info(f"Fast completion pattern detected for learner {learner_id}: {fast_streak} missions")
+            outcome = await enqueue_adaptation(learner_id, "fast_completion", {
+                "fast_streak": fast_streak,
+                "missions": [_mission_signal(m) for m in state["outcomes"][:fast_streak]],
+            })
             return {
                 "adaptation_needed": True,
                 "trigger": "fast_completion",
                 "regeneration_type": "difficulty_advance",
                 "reason": f"{fast_streak} missions completed significantly ahead of schedule",
                 "fast_streak": fast_streak,
+                "job_id": outcome.get("job_id"),
             }
         
         return {
@@ -235,6 +341,7 @@ class RulesEngine:
         self,
         learner_id: str,
         payload: Dict[str, Any],
+        state: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
         §1.4: Uploads certificate → update skill gaps.
@@ -244,6 +351,18 @@ class RulesEngine:
         
         # Calculate skill gap with new certificate
         skill_gap = await self.calculate_skill_gap(learner_id)
+        in_debounce = self._in_debounce_window(state)
+
+        # Patch the current phase's skills (§2 debounce still applies)
+        job_id = None
+        if not in_debounce:
+            outcome = await enqueue_adaptation(learner_id, "certificate_upload", {
+                "certificate": str(payload.get("name") or payload.get("title") or "")[:200],
+                "certificate_skills": [str(s)[:100] for s in (payload.get("skills") or [])[:10]],
+                "matched_skills": skill_gap.get("matched_skills", [])[:10],
+                "remaining_gaps": skill_gap.get("gaps", [])[:10],
+            })
+            job_id = outcome.get("job_id")
         
         return {
             "adaptation_needed": True,
@@ -251,13 +370,15 @@ class RulesEngine:
             "regeneration_type": "skill_update",  # Not full regen
             "reason": "New certificate may close skill gaps",
             "skill_gap": skill_gap,
+            "job_id": job_id,
         }
 
-    async def _is_in_debounce_window(self, learner_id: str) -> bool:
+    @staticmethod
+    def _in_debounce_window(state: Dict[str, Any]) -> bool:
         """
         §2: No more than one full roadmap regeneration per learner per 24 hours.
         """
-        last_regeneration = await queries.get_last_regeneration(learner_id)
+        last_regeneration = state.get("last_regeneration")
         if not last_regeneration:
             return False
         
@@ -266,39 +387,6 @@ class RulesEngine:
         
         return (now - last_time) < timedelta(hours=DEBOUNCE_WINDOW_HOURS)
 
-    async def _count_consecutive_failures(self, learner_id: str) -> int:
-        """Count consecutive failed/too_hard missions from most recent."""
-        recent = await queries.get_recent_missions(learner_id, limit=10)
-        count = 0
-        for mission in recent:
-            if mission.get("status") in ("failed", "too_hard"):
-                count += 1
-            else:
-                break
-        return count
-
-    async def _count_fast_completions(self, learner_id: str) -> int:
-        """
-        Count consecutive missions completed in <50% estimated time.
-        Requires time_spent_minutes to be logged.
-        """
-        recent = await queries.get_recent_missions(learner_id, limit=10)
-        count = 0
-        
-        for mission in recent:
-            if mission.get("status") != "completed":
-                break
-            
-            time_spent = mission.get("time_spent_minutes")
-            estimated = mission.get("estimated_minutes", 30)
-            
-            if time_spent and estimated > 0 and time_spent < (estimated * 0.5):
-                count += 1
-            else:
-                break
-        
-        return count
-
     async def calculate_skill_gap(
         self,
         learner_id: str,
@@ -308,8 +396,8 @@ class RulesEngine:
         Calculate real-time gap between learner's current skills and target role requirements.
         """
         # Get learner profile
-        profile = await queries.get_learner_profile(learner_id)
-        learner = await queries.get_learner(learner_id)
+        profile = await queries.get_learner_profile(learner_id, columns=queries.PROFILE_SUMMARY)
+        learner = await queries.get_learner(learner_id, columns=queries.LEARNER_TARGETING)
         
         if not profile or not learner:
             return {"current_skills": [], "required_skills": [], "gaps": []}
@@ -319,7 +407,7 @@ class RulesEngine:
             return {"current_skills": [], "required_skills": [], "gaps": []}
         
         # Get baseline for target role
-        baseline = await queries.get_skill_baseline(target_role)
+        baseline = await queries.get_skill_baseline(target_role, columns="required_skills")
         if not baseline:
             return {
                 "current_skills": profile.get("skills", []),
@@ -351,18 +439,16 @@ class RulesEngine:
         Returns debounce status, recent events, and skill gap.
         """
         # Run all independent DB calls in parallel
-        in_debounce, last_regeneration, recent_events, consecutive_failures, skill_gap = await asyncio.gather(
-            self._is_in_debounce_window(learner_id),
-            queries.get_last_regeneration(learner_id),
+        state, recent_events, skill_gap = await asyncio.gather(
+            rules_state.get_state(learner_id),
             queries.get_recent_events(learner_id, limit=10),
-            self._count_consecutive_failures(learner_id),
             self.calculate_skill_gap(learner_id),
         )
 
         return {
-            "in_debounce_window": in_debounce,
-            "last_regeneration": last_regeneration,
-            "consecutive_failures": consecutive_failures,
+            "in_debounce_window": self._in_debounce_window(state),
+            "last_regeneration": state["last_regeneration"],
+            "consecutive_failures": state["consecutive_failures"],
             "failure_threshold": FAILURE_THRESHOLD,
             "recent_events": recent_events,
             "skill_gap": skill_gap,
@@ -378,41 +464,9 @@ class RulesEngine:
         If any single metric falls below its threshold in 2 consecutive camera-enabled sessions,
         queue a targeted remedial mission for that metric.
         """
-        # Get recent camera-enabled sessions with delivery metrics
-        sessions = await queries.get_interview_history(learner_id, limit=10)
-        camera_sessions = [
-            s for s in sessions
-            if s.get("camera_enabled") and s.get("delivery_metrics") and s.get("status") == "completed"
-        ]
-
-        if len(camera_sessions) < DELIVERY_CONSECUTIVE_SESSIONS:
-            return {"adaptation_needed": False, "reason": "Not enough camera sessions for delivery trigger"}
-
-        # Check the most recent N sessions for consecutive threshold violations
-        recent = camera_sessions[:DELIVERY_CONSECUTIVE_SESSIONS]
-        triggered_metrics = []
-
-        for metric_name, threshold in DELIVERY_THRESHOLDS.items():
-            violations = 0
-            for session in recent:
-                dm = session.get("delivery_metrics", {})
-                value = dm.get(metric_name)
-                if value is None:
-                    break
-
-                # For most metrics, below threshold is bad; for filler_word_rate, above is bad
-                if metric_name == "filler_word_rate":
-                    if value > threshold:
-                        violations += 1
-                elif metric_name == "words_per_minute":
-                    if value < threshold:
-                        violations += 1
-                else:
-                    if value < threshold:
-                        violations += 1
-
-            if violations >= DELIVERY_CONSECUTIVE_SESSIONS:
-                triggered_metrics.append(metric_name)
+        # Consecutive-below counters are maintained as metrics arrive
+        state = await delivery_trends.get_state(learner_id)
+        triggered_metrics = delivery_trends.triggered_metrics(state, DELIVERY_CONSECUTIVE_SESSIONS)
 
         if triggered_metrics:
             logger.info(f"Delivery remedial triggers for {learner_id}: {triggered_metrics}")
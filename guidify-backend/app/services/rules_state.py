@@ -0,0 +1,247 @@
+"""
+Rules State
+
+Per-learner rolling state for the Rules Engine (rules.md §1-2), updated as
+events are logged and cached under "rules_state:<learner_id>", so trigger
+evaluation reads one object instead of re-querying daily_missions and the
+last regeneration for every event.
+
+State shape:
+    {"outcomes": [{"mission_id", "status", "title", "target_skill", "difficulty",
+                   "estimated_minutes", "time_spent_minutes"}],   # newest first
+     "missions": 12,                # mission outcomes seen
+     "consecutive_failures": 2,     # leading failed/too_hard outcomes
+     "fast_streak": 0,              # leading completions in <50% of the estimate
+     "last_regeneration": "2026-10-18T09:12:00+00:00",
+     "last_event_id": "..."}
+
+outcomes keeps the last RULES_STATE_WINDOW mission outcomes, the same
+10-mission lookback the engine used against daily_missions, so both streaks
+are capped at that window. A second outcome for a mission still in the
+window (e.g. failed, then completed) replaces its entry in place, as the
+daily_missions row would.
+
+Only outcomes logged by the missions API count: log_mission_outcome sets
+related_mission_id, outcome events without one are ignored, and the
+adaptation endpoints refuse mission_* events from clients.
+
+event_log is the source of truth (dataflow.md §2): on a cache miss the state
+is rebuilt from the learner's recent mission_* and roadmap events (plus any
+still in the write-behind buffer, app/db/event_writer.py), and the roadmaps
+table for the last regeneration (F-09: that event write can fail).
+Concurrent events for one learner are last-write-wins; a lost update is
+repaired by the next rebuild. scripts/replay_rules_state.py compares rebuilt
+states with the daily_missions-based computation.
+"""
+
+import copy
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.db import queries
+from app.db.event_writer import event_writer
+
+logger = logging.getLogger("guidify.rules_state")
+
+# Mission outcome events → daily_missions status
+OUTCOME_EVENTS = {
+    "mission_completed": "completed",
+    "mission_failed": "failed",
+    "mission_too_hard": "too_hard",
+    "mission_skipped": "skipped",
+}
+REGENERATION_EVENTS = ("roadmap_generated", "roadmap_regenerated")
+STATE_EVENTS = tuple(OUTCOME_EVENTS) + REGENERATION_EVENTS
+
+# Final mission statuses → event logged by the missions API
+STATUS_EVENTS = {status: event_type for event_type, status in OUTCOME_EVENTS.items()}
+
+OUTCOME_FIELDS = ("title", "target_skill", "difficulty", "estimated_minutes", "time_spent_minutes")
+
+
+def cache_key(learner_id: str) -> str:
+    return f"rules_state:{learner_id}"
+
+
+def empty_state() -> Dict[str, Any]:
+    return {
+        "outcomes": [],
+        "missions": 0,
+        "consecutive_failures": 0,
+        "fast_streak": 0,
+        "last_regeneration": None,
+        "last_event_id": None,
+    }
+
+
+def is_failure(mission: Dict[str, Any]) -> bool:
+    return mission.get("status") in ("failed", "too_hard")
+
+
+def is_fast(mission: Dict[str, Any]) -> bool:
+    """Completed in under half the estimated time (rules.md §1.1)."""
+    if mission.get("status") != "completed":
+        return False
+    time_spent = mission.get("time_spent_minutes")
+    estimated = mission.get("estimated_minutes") or 30
+    return bool(time_spent) and estimated > 0 and time_spent < estimated * 0.5
+
+
+def leading(missions: Iterable[Dict[str, Any]], predicate: Callable[[Dict[str, Any]], bool]) -> int:
+    """Length of the run of missions (newest first) matching `predicate`."""
+    count = 0
+    for mission in missions:
+        if not predicate(mission):
+            break
+        count += 1
+    return count
+
+
+def _later(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    if not a or not b:
+        return a or b
+    return max(a, b)
+
+
+def apply_event(state: Optional[Dict[str, Any]], event: Dict[str, Any]) -> Dict[str, Any]:
+    """Return `state` with one event_log row ({id, event_type, payload, related_mission_id, created_at}) folded in."""
+    state = copy.deepcopy(state) if state else empty_state()
+    event_type = event.get("event_type")
+
+    if event_type in OUTCOME_EVENTS and event.get("related_mission_id"):
+        payload = event.get("payload") or {}
+        mission_id = event["related_mission_id"]
+        outcome = {"mission_id": mission_id, "status": OUTCOME_EVENTS[event_type]}
+        outcome.update({f: payload[f] for f in OUTCOME_FIELDS if payload.get(f) is not None})
+
+        outcomes = list(state["outcomes"])
+        index = next((i for i, o in enumerate(outcomes) if o.get("mission_id") == mission_id), None)
+        if index is None:
+            state["missions"] += 1
+            outcomes.insert(0, outcome)
+        else:
+            outcomes[index] = outcome
+        state["outcomes"] = outcomes[: settings.RULES_STATE_WINDOW]
+        state["consecutive_failures"] = leading(state["outcomes"], is_failure)
+        state["fast_streak"] = leading(state["outcomes"], is_fast)
+    elif event_type in REGENERATION_EVENTS:
+        state["last_regeneration"] = _later(state["last_regeneration"], event.get("created_at"))
+
+    if event.get("id"):
+        state["last_event_id"] = event["id"]
+    return state
+
+
+def rebuild(events: List[Dict[str, Any]], last_regeneration: Optional[str] = None) -> Dict[str, Any]:
+    """Fold events (newest first, as get_events_by_types returns them)."""
+    state = empty_state()
+    for event in reversed(events):
+        state = apply_event(state, event)
+    state["last_regeneration"] = _later(state["last_regeneration"], last_regeneration)
+    return state
+
+
+def _unflushed(events: List[Dict[str, Any]], recent: List[Dict[str, Any]], learner_id: str) -> List[Dict[str, Any]]:
+    """Events still in the write-behind buffer (or just written) that `events` lacks, newest first."""
+    seen = {event.get("id") for event in events}
+    pending: Dict[Any, Dict[str, Any]] = {}
+    for i, event in enumerate(event_writer.buffered(learner_id) + list(recent)):
+        if event.get("event_type") in STATE_EVENTS and event.get("id") not in seen:
+            pending.setdefault(event.get("id") or i, event)
+    return list(reversed(list(pending.values())))
+
+
+async def _rebuild_for(learner_id: str, recent: List[Dict[str, Any]] = ()) -> Dict[str, Any]:
+    try:
+        events = await queries.get_events_by_types(
+            learner_id, STATE_EVENTS, limit=settings.RULES_STATE_REBUILD_EVENTS
+        )
+    except Exception:
+        # Not cached: an empty history must not stick for the TTL
+        state = rebuild(_unflushed([], recent, learner_id), await queries.get_last_regeneration(learner_id))
+        return state
+    events = _unflushed(events, recent, learner_id) + events
+    state = rebuild(events, await queries.get_last_regeneration(learner_id))
+    await cache.set(cache_key(learner_id), state, ttl=settings.RULES_STATE_TTL_SECONDS)
+    return state
+
+
+async def get_state(learner_id: str) -> Dict[str, Any]:
+    """Current rules state, rebuilt from event_log on a cache miss."""
+    state = await cache.get(cache_key(learner_id))
+    if state is not None:
+        return state
+    return await _rebuild_for(learner_id)
+
+
+async def _update_cached(learner_id: str, events: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Fold `events` (oldest first) into the cached state; None if nothing is cached."""
+    state = await cache.get(cache_key(learner_id))
+    if state is None:
+        return None
+    changed = False
+    for event in events:
+        if event.get("event_type") not in STATE_EVENTS:
+            continue
+        if event.get("id") and event["id"] == state.get("last_event_id"):
+            continue
+        state = apply_event(state, event)
+        changed = True
+    if changed:
+        await cache.set(cache_key(learner_id), state, ttl=settings.RULES_STATE_TTL_SECONDS)
+    return state
+
+
+async def record_events(learner_id: str, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fold just-logged events (oldest first) into the learner's state and
+    return the new state.
+
+    On a cache miss the state is rebuilt from event_log plus whatever the
+    write-behind buffer has not flushed yet.
+    """
+    state = await _update_cached(learner_id, events)
+    if state is not None:
+        return state
+    return await _rebuild_for(learner_id, events)
+
+
+async def record_event(learner_id: str, event: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold one just-logged event into the learner's state (see record_events)."""
+    return await record_events(learner_id, [event])
+
+
+async def record_regeneration(learner_id: str, created_at: str) -> None:
+    """Move last_regeneration forward after a roadmap is saved (uncached: no-op)."""
+    try:
+        await _update_cached(learner_id, [{"event_type": "roadmap_generated", "created_at": created_at}])
+    except Exception as e:
+        logger.error(f"Failed to record regeneration for {learner_id}: {e}")
+
+
+async def log_mission_outcome(learner_id: str, mission: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Log a mission reaching a final status (completed/failed/too_hard/skipped)
+    as a mission_* event, fold it into the learner's state and return the
+    new state (None for a non-final status or when logging failed).
+    """
+    event_type = STATUS_EVENTS.get(mission.get("status"))
+    if not event_type or not mission.get("id"):
+        return None
+    payload = {f: mission.get(f) for f in OUTCOME_FIELDS if mission.get(f) is not None}
+    try:
+        event = await event_writer.write(
+            learner_id=learner_id,
+            event_type=event_type,
+            payload=payload,
+            related_mission_id=mission["id"],
+        )
+        return await record_event(learner_id, event or {
+            "event_type": event_type, "payload": payload, "related_mission_id": mission["id"],
+        })
+    except Exception as e:
+        # The daily_missions row is already updated; the state catches up on rebuild
+        logger.error(f"Failed to log {event_type} for {learner_id}: {e}")
+        return None
@@ -0,0 +1,48 @@
+"""
+Completion Streaks
+
+Pure helpers for the consecutive-day mission completion streak.
+
+Migration 021 materializes the streak on `learners` (current_streak,
+longest_streak, last_completion_date) and advances it when a mission is
+completed. The stored current_streak is the length of the latest run ending on
+last_completion_date; whether that run still counts is decided at read time:
+  - Day rollover: a streak is live while its last completion is today or
+    yesterday (today's mission may still be pending). Older runs read as 0.
+"""
+
+from datetime import date, timedelta
+from typing import Iterable, Optional, Union
+
+DateLike = Union[date, str, None]
+
+
+def _as_date(value: DateLike) -> Optional[date]:
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def effective_streak(current_streak: Optional[int], last_completion_date: DateLike, today: date) -> int:
+    """Apply the day-rollover rule to a materialized streak."""
+    last = _as_date(last_completion_date)
+    if last is None or last < today - timedelta(days=1):
+        return 0
+    return current_streak or 0
+
+
+def streak_from_dates(completed_dates: Iterable[DateLike], today: date) -> int:
+    """Count the live streak from a set of completion dates (legacy fallback)."""
+    days = {_as_date(d) for d in completed_dates}
+
+    check_date = today
+    if check_date not in days:
+        check_date = today - timedelta(days=1)
+        if check_date not in days:
+            return 0
+
+    streak = 0
+    while check_date in days:
+        streak += 1
+        check_date -= timedelta(days=1)
+    return streak
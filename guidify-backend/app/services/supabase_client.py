@@ -3,21 +3,31 @@ Supabase Client Module
 
 Provides Supabase clients and core auth/profile helper functions.
 
-No service-role key is used. All access is through the publishable key:
+Data access is through the publishable key:
   - `supabase` → publishable key → auth API (sign-up/in, JWT verification)
   - `db`       → publishable key + request user JWT → RLS-enforced DB access
                   Resolves to a request-scoped client carrying the caller's
                   access token so PostgREST evaluates RLS against auth.uid().
+                  Code outside a request (the job worker) can bind its own
+                  client with `bind_db_client` to reuse app.db.queries.
+
+`get_service_client()` returns a service-role client only for the few writes
+learners must not make directly (enqueue_roadmap_job, roadmap_adapt jobs). It is None when
+SUPABASE_SERVICE_ROLE_KEY is unset; callers then take their fallback path.
 """
 
 import contextvars
-from typing import Dict, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
 from supabase import create_client, Client
 from app.core.config import settings
 
 # ── Base client (publishable key) — auth operations ────────────────────────
 supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_PUBLISHABLE_KEY)
 
+# ── Service-role client — RPCs reserved to service_role only ─────────────
+_service_client: Optional[Client] = None
+
 # ── Request-scoped DB client (publishable key + user JWT, RLS enforced) ────
 _request_jwt_var: contextvars.ContextVar = contextvars.ContextVar(
     "guidify_request_jwt", default=None
@@ -25,6 +35,9 @@ _request_jwt_var: contextvars.ContextVar = contextvars.ContextVar(
 _request_client_var: contextvars.ContextVar = contextvars.ContextVar(
     "guidify_request_client", default=None
 )
+_bound_client_var: contextvars.ContextVar = contextvars.ContextVar(
+    "guidify_bound_client", default=None
+)
 
 
 def _create_client(headers: Dict[str, str]) -> Client:
@@ -51,6 +64,9 @@ def get_db_client() -> Client:
     JWT so RLS (auth.uid()) applies. Unauthenticated requests fall back to the
     shared publishable-key client.
     """
+    bound = _bound_client_var.get()
+    if bound is not None:
+        return bound
     token = _request_jwt_var.get()
     if not token:
         return supabase
@@ -66,6 +82,26 @@ def get_db_client() -> Client:
     return client
 
 
+def get_service_client() -> Optional[Client]:
+    """Service-role client for service-role-only RPCs, or None without a key."""
+    global _service_client
+    if not settings.SUPABASE_SERVICE_ROLE_KEY:
+        return None
+    if _service_client is None:
+        _service_client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+    return _service_client
+
+
+@contextmanager
+def bind_db_client(client: Client) -> Iterator[Client]:
+    """Route `db` to `client` within this context (e.g. the worker's service-role client)."""
+    token = _bound_client_var.set(client)
+    try:
+        yield client
+    finally:
+        _bound_client_var.reset(token)
+
+
 class _RequestScopedDBClient:
     """Delegates attribute access to the current request's DB client."""
 
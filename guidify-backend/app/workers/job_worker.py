@@ -29,7 +29,11 @@ from typing import Any, Dict, Optional
 
 from app.ai_gateway.gateway import gateway
 from app.core.config import settings
+from app.db import queries
 from app.models.schemas import ResumeParseResponse, ResumeScoreResponse
+from app.services.interview_feedback import generate_feedback
+from app.services.roadmap_service import run_adaptation_job, run_regeneration_job
+from app.services.supabase_client import bind_db_client
 
 logging.basicConfig(
     level=logging.INFO,
@@ -145,12 +149,69 @@ async def process_resume_job(client, job: dict) -> bool:
         return False
 
 
+async def process_interview_feedback_job(client, job: dict) -> bool:
+    """
+    Generate the feedback report for a completed interview session.
+
+    Runs app.services.interview_feedback against the service-role client.
+    Sections stored by an earlier attempt are kept; on the last attempt any
+    still-missing sections are filled with fallback text so the session never
+    stays pending.
+
+    The learner comes from the job row, not the payload; generate_feedback
+    loads the session scoped to that learner, so a job naming someone
+    else's session finds nothing and is dropped.
+    """
+    payload = job.get("payload", {})
+    session_id = payload.get("session_id")
+    learner_id = job.get("learner_id")
+    if not all([session_id, learner_id]):
+        logger.error(f"Invalid interview feedback job payload: {payload}")
+        return False
+
+    final = job.get("attempts", 1) >= job.get("max_attempts", 3)
+    try:
+        with bind_db_client(client):
+            return await generate_feedback(session_id, learner_id, final=final)
+    except Exception as e:
+        logger.error(f"Interview feedback job failed for session {session_id}: {e}")
+        return False
+
+
+async def process_roadmap_job(client, job: dict) -> bool:
+    """
+    Generate (roadmap_generate, migration 030) or adapt (roadmap_adapt) a
+    learner's roadmap.
+
+    app.services.roadmap_service records progress_state and the outcome on
+    the job row; AI and save failures are retried until the last attempt.
+    """
+    if not job.get("learner_id"):
+        logger.error(f"Roadmap job {job.get('id')} has no learner")
+        return False
+
+    final = job.get("attempts", 1) >= job.get("max_attempts", 3)
+    with bind_db_client(client):
+        try:
+            if job.get("job_type") == "roadmap_adapt":
+                return await run_adaptation_job(job, final=final)
+            return await run_regeneration_job(job, final=final)
+        except Exception as e:
+            logger.error(f"Roadmap job {job.get('id')} failed: {e}")
+            await queries.update_job_progress(job["id"], "failed" if final else "queued")
+            return False
+
+
 async def process_job(client, job: dict) -> bool:
     """Route job to appropriate handler based on job_type."""
     job_type = job.get("job_type")
 
     if job_type == "resume_process":
         return await process_resume_job(client, job)
+    elif job_type == "interview_feedback":
+        return await process_interview_feedback_job(client, job)
+    elif job_type in ("roadmap_generate", "roadmap_adapt"):
+        return await process_roadmap_job(client, job)
     else:
         logger.warning(f"Unknown job type: {job_type}")
         return False
@@ -163,7 +224,7 @@ async def worker_loop(client, poll_interval: int = 5):
     while not shutdown:
         try:
             # Try to claim a job for each supported type
-            for job_type in ["resume_process"]:
+            for job_type in ["resume_process", "interview_feedback", "roadmap_generate", "roadmap_adapt"]:
                 try:
                     # Use the claim_next_job RPC for atomic claim
                     response = await asyncio.to_thread(
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Daily Mission Pre-generation Worker for GUIDIFY
+
+Builds tomorrow's daily missions off-peak so the learner's first
+GET /missions/today of the day is a draft promotion instead of a 30–90s AI
+call (see app/services/mission_service.py).
+
+Run once:        python -m app.workers.mission_pregen [--date YYYY-MM-DD] [--limit N]
+Run on schedule: python -m app.workers.mission_pregen --loop
+                 (daily at MISSION_PREGEN_HOUR_UTC)
+
+Each run:
+1. Fetches candidates from get_mission_pregen_candidates (migration 027):
+   learners active recently with no mission or draft for the date, most
+   likely visitors first, so a run cut short still covers the likeliest ones.
+2. Processes them in batches of MISSION_PREGEN_BATCH_SIZE, at most
+   MISSION_PREGEN_CONCURRENCY AI calls in flight and no more than
+   MISSION_PREGEN_RATE_PER_MINUTE started per minute.
+3. Stores each mission in mission_drafts. Failed generations are skipped;
+   those learners fall back to on-demand generation.
+
+Like the job worker this needs SUPABASE_SERVICE_ROLE_KEY: candidates span all
+learners and drafts are written on their behalf.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.db import queries
+from app.services import mission_service
+from app.services.supabase_client import bind_db_client
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("guidify.worker.mission_pregen")
+
+# Global flag for graceful shutdown
+shutdown = False
+
+
+def _create_service_client():
+    """Create a Supabase client authenticated with the service-role key."""
+    from supabase import create_client
+    return create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+
+
+def signal_handler(signum, frame):
+    global shutdown
+    logger.info(f"Received signal {signum}, finishing the current batch...")
+    shutdown = True
+
+
+class RateLimiter:
+    """Spaces out call starts to at most `per_minute` per minute."""
+
+    def __init__(self, per_minute: int):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def _pregenerate_one(
+    learner_id: str,
+    for_date: date,
+    priority: float,
+    limiter: RateLimiter,
+    semaphore: asyncio.Semaphore,
+) -> bool:
+    async with semaphore:
+        await limiter.acquire()
+        try:
+            mission = await mission_service.build_mission(
+                learner_id, for_date, fallback=False, store_in_library=True
+            )
+            await queries.save_mission_draft(learner_id, for_date.isoformat(), mission, priority)
+            return True
+        except Exception as e:
+            logger.warning(f"Mission pre-generation failed for learner {learner_id}: {e}")
+            return False
+
+
+async def pregenerate(
+    client,
+    for_date: date,
+    limit: Optional[int] = None,
+) -> Dict[str, int]:
+    """Pre-generate missions for `for_date`. Returns counts of generated/failed/skipped."""
+    limit = limit or settings.MISSION_PREGEN_LIMIT
+    batch_size = max(settings.MISSION_PREGEN_BATCH_SIZE, 1)
+    limiter = RateLimiter(settings.MISSION_PREGEN_RATE_PER_MINUTE)
+    semaphore = asyncio.Semaphore(max(settings.MISSION_PREGEN_CONCURRENCY, 1))
+    stats = {"generated": 0, "failed": 0, "skipped": 0}
+
+    with bind_db_client(client):
+        await queries.purge_mission_drafts(date.today().isoformat())
+        candidates: List[dict] = await queries.get_mission_pregen_candidates(
+            for_date.isoformat(), limit, days=settings.MISSION_PREGEN_ACTIVE_DAYS
+        )
+        logger.info(f"Pre-generating missions for {for_date}: {len(candidates)} candidates")
+
+        for start in range(0, len(candidates), batch_size):
+            if shutdown:
+                stats["skipped"] += len(candidates) - start
+                break
+            batch = candidates[start:start + batch_size]
+            results = await asyncio.gather(*(
+                _pregenerate_one(c["learner_id"], for_date, c.get("priority") or 0, limiter, semaphore)
+                for c in batch
+            ))
+            stats["generated"] += sum(results)
+            stats["failed"] += len(results) - sum(results)
+
+    logger.info(f"Mission pre-generation for {for_date} done: {stats}")
+    return stats
+
+
+def _seconds_until_next_run(now: datetime) -> float:
+    run_at = now.replace(hour=settings.MISSION_PREGEN_HOUR_UTC, minute=0, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    return (run_at - now).total_seconds()
+
+
+async def scheduler_loop(client) -> None:
+    """Run pregenerate() for the next day once a day at MISSION_PREGEN_HOUR_UTC."""
+    logger.info("Mission pre-generation scheduler started")
+    while not shutdown:
+        delay = _seconds_until_next_run(datetime.now(timezone.utc))
+        logger.info(f"Next mission pre-generation in {delay / 3600:.1f}h")
+        # Sleep in short steps so a shutdown signal is honoured promptly
+        while delay > 0 and not shutdown:
+            step = min(delay, 30)
+            await asyncio.sleep(step)
+            delay -= step
+        if shutdown:
+            break
+        try:
+            await pregenerate(client, date.today() + timedelta(days=1))
+        except Exception as e:
+            logger.error(f"Mission pre-generation run failed: {e}")
+    logger.info("Mission pre-generation scheduler stopped")
+
+
+async def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--date", type=date.fromisoformat, help="Mission date (default: tomorrow)")
+    parser.add_argument("--limit", type=int, help="Maximum learners (default: MISSION_PREGEN_LIMIT)")
+    parser.add_argument("--loop", action="store_true", help="Run daily at MISSION_PREGEN_HOUR_UTC")
+    args = parser.parse_args(argv)
+
+    if not settings.SUPABASE_SERVICE_ROLE_KEY:
+        logger.error(
+            "SUPABASE_SERVICE_ROLE_KEY is not set. Mission pre-generation reads "
+            "candidates across all learners and writes their drafts. Exiting — "
+            "missions will be generated on demand."
+        )
+        return
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    client = _create_service_client()
+    if args.loop:
+        await scheduler_loop(client)
+    else:
+        await pregenerate(client, args.date or date.today() + timedelta(days=1), args.limit)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Question Bank Growth Worker for GUIDIFY
+
+Grows the curated adaptive question bank (app/psychometrics/question_bank.json)
+offline, so onboarding never waits on an AI call for a question
+(see app/services/question_bank.py).
+
+Run once:   python -m app.workers.question_bank_grow [--count N] [--traits T1,T2] [--dry-run]
+
+Each run:
+1. Picks the target traits: --traits, or the two with the least total
+   information across the bank.
+2. Asks AI Gateway for --count new items aimed at those traits, with
+   per-option trait loadings, using the same custom-prompt route as the other
+   psychometric generation calls.
+3. Keeps the items that pass QuestionBank.validate() and carry information
+   on a target trait, and appends them to the bank file (ids continue the
+   qb_ sequence, minor version bumped, "source": "generated").
+
+The file change is reviewed and deployed like code; API processes load the
+bank at startup. --dry-run prints the accepted items without writing.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.ai_gateway.gateway import gateway
+from app.services import question_bank
+from app.services.question_bank import BANK_PATH, QuestionBank
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("guidify.worker.question_bank_grow")
+
+# Existing question texts shown to the model so it avoids near-duplicates
+PROMPT_EXAMPLES = 40
+
+
+def target_traits(bank: QuestionBank, count: int = 2) -> List[str]:
+    """The `count` traits with the least total information in the bank."""
+    coverage = bank.coverage()
+    return sorted(bank.traits, key=lambda trait: coverage[trait])[:count]
+
+
+def build_prompt(bank: QuestionBank, traits: List[str], count: int) -> str:
+    existing = json.dumps([q["question_text"] for q in bank.questions][-PROMPT_EXAMPLES:], indent=2)
+    return f"""Write {count} new multiple-choice questions for a career-oriented personality assessment.
+
+Each question must mainly discriminate between people on these traits: {", ".join(traits)}.
+All traits in the assessment: {", ".join(bank.traits)}.
+
+Rules:
+- Everyday, workplace or study situations; no clinical or diagnostic wording.
+- Exactly 4 options per question, none obviously "right".
+- Each option has "loadings": how choosing it moves each trait, from -1 to 1 (omit traits it does not affect).
+- Options of one question must load differently on the target traits.
+- Do not repeat or paraphrase these existing questions:
+{existing}
+
+Return a JSON object:
+{{"questions": [{{"question_text": "...", "options": [{{"text": "...", "trait_impact": "short label", "loadings": {{"Trait": 0.8}}}}]}}]}}
+
+Output JSON ONLY. No markdown."""
+
+
+async def generate_candidates(bank: QuestionBank, traits: List[str], count: int) -> List[Dict[str, Any]]:
+    response = await gateway.generate(
+        task_type="psychometrics.narrate",
+        context={
+            "ipip_scores": {},
+            "riasec_scores": {},
+            "grit_score": None,
+            "_custom_prompt": build_prompt(bank, traits, count),
+        },
+    )
+    candidates = (response or {}).get("questions") if isinstance(response, dict) else None
+    return candidates if isinstance(candidates, list) else []
+
+
+def accept(bank: QuestionBank, candidates: List[Dict[str, Any]], traits: List[str]) -> List[Dict[str, Any]]:
+    """Candidates that pass validation and inform at least one target trait."""
+    accepted = []
+    seen = set()
+    for candidate in candidates:
+        if not isinstance(candidate, dict):
+            continue
+        problems = bank.validate(candidate)
+        if not problems:
+            text = " ".join(candidate["question_text"].split()).lower()
+            if text in seen:
+                problems = ["duplicate question_text"]
+            elif not any(o["loadings"].get(trait) for o in candidate["options"] for trait in traits):
+                problems = [f"no loading on target traits {traits}"]
+            seen.add(text)
+        if problems:
+            logger.info(f"Rejected candidate {candidate.get('question_text')!r}: {'; '.join(problems)}")
+            continue
+        accepted.append(candidate)
+    return accepted
+
+
+async def grow(
+    count: int = 5,
+    traits: Optional[List[str]] = None,
+    path: Path = BANK_PATH,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Generate, validate and append items. Returns a summary of the run."""
+    bank = QuestionBank.load(path)
+    traits = traits or target_traits(bank)
+    unknown = set(traits) - set(bank.traits)
+    if unknown:
+        raise ValueError(f"Unknown traits: {sorted(unknown)} (bank traits: {bank.traits})")
+    logger.info(f"Growing question bank v{bank.version} ({len(bank)} items) for traits {traits}")
+
+    try:
+        candidates = await generate_candidates(bank, traits, count)
+    except Exception as e:
+        logger.error(f"Question generation failed: {e}")
+        candidates = []
+    accepted = accept(bank, candidates, traits)
+
+    summary = {"traits": traits, "generated": len(candidates), "accepted": len(accepted), "version": bank.version}
+    if accepted and not dry_run:
+        data = bank.extend(accepted)
+        path.write_text(question_bank.dumps(data), encoding="utf-8")
+        summary["version"] = data["version"]
+    elif accepted:
+        print(json.dumps(accepted, indent=2, ensure_ascii=False))
+
+    logger.info(f"Question bank growth done: {summary}")
+    return summary
+
+
+async def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5, help="Items to request (default: 5)")
+    parser.add_argument("--traits", help="Comma-separated target traits (default: least covered two)")
+    parser.add_argument("--dry-run", action="store_true", help="Print accepted items instead of writing the bank")
+    args = parser.parse_args(argv)
+
+    traits = [t.strip() for t in args.traits.split(",")] if args.traits else None
+    await grow(args.count, traits, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
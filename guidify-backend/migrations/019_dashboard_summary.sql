@@ -0,0 +1,100 @@
+-- Migration 019: Dashboard summary aggregate
+-- Created: 2026-10-19
+-- Purpose: Serve GET /dashboard from a single RPC instead of four round trips
+--   (active roadmap with the full phases JSON, streak RPC, learners row,
+--   learner_profiles row). Returns only the fields the dashboard renders:
+--   a slimmed roadmap (phase numbers, difficulty and top-3 skills per phase,
+--   current phase title), the streak, and the radar/course data.
+
+CREATE OR REPLACE FUNCTION get_dashboard_summary(p_learner_id UUID)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_roadmap JSONB;
+    v_category_scores JSONB;
+    v_recommended_courses JSONB;
+    v_questionnaire JSONB;
+BEGIN
+    IF v_learner_id IS NULL THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    -- Active roadmap, reduced to what the skill graph and progress bar need
+    SELECT jsonb_build_object(
+        'current_phase_number', r.current_phase_number,
+        'total_phases', r.total_phases,
+        'progress_pct', r.progress_pct,
+        'current_phase_title', (
+            SELECT COALESCE(p->>'title', 'Phase ' || r.current_phase_number)
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(r.phases) = 'array' THEN r.phases ELSE '[]'::jsonb END
+            ) AS e(p)
+            WHERE p->'phase_number' = to_jsonb(r.current_phase_number)
+            LIMIT 1
+        ),
+        'phases', COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'phase_number', p->'phase_number',
+                    'difficulty', p->'difficulty',
+                    'skills', COALESCE((
+                        SELECT jsonb_agg(s ORDER BY i)
+                        FROM jsonb_array_elements(
+                            CASE WHEN jsonb_typeof(p->'skills') = 'array' THEN p->'skills' ELSE '[]'::jsonb END
+                        ) WITH ORDINALITY AS sk(s, i)
+                        WHERE i <= 3
+                    ), '[]'::jsonb)
+                )
+                ORDER BY ord
+            )
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(r.phases) = 'array' THEN r.phases ELSE '[]'::jsonb END
+            ) WITH ORDINALITY AS e(p, ord)
+        ), '[]'::jsonb)
+    )
+    INTO v_roadmap
+    FROM roadmaps r
+    WHERE r.learner_id = v_learner_id
+      AND r.status = 'active'
+    ORDER BY r.version DESC
+    LIMIT 1;
+
+    -- Radar scores: onboarding writes learners.category_scores (F-11); legacy
+    -- accounts only have learner_profiles.questionnaire_data.
+    SELECT l.category_scores
+    INTO v_category_scores
+    FROM learners l
+    WHERE l.id = v_learner_id;
+
+    IF v_category_scores IS NULL
+       OR v_category_scores IN ('null'::jsonb, '{}'::jsonb) THEN
+        v_category_scores := NULL;
+
+        SELECT lp.questionnaire_data
+        INTO v_questionnaire
+        FROM learner_profiles lp
+        WHERE lp.learner_id = v_learner_id
+        ORDER BY lp.created_at DESC
+        LIMIT 1;
+
+        IF jsonb_typeof(v_questionnaire) = 'object' THEN
+            v_category_scores := v_questionnaire->'category_scores';
+            v_recommended_courses := v_questionnaire->'recommended_courses';
+        END IF;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'roadmap', v_roadmap,
+        'streak_days', calculate_streak_sql(v_learner_id),
+        'category_scores', v_category_scores,
+        'recommended_courses', v_recommended_courses
+    );
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION get_dashboard_summary(UUID) TO authenticated;
@@ -0,0 +1,160 @@
+-- Migration 020: Daily activity rollup for the contribution heatmap
+-- Created: 2026-10-19
+-- Purpose: GET /dashboard/activity-heatmap used to pull a year of
+--   daily_missions, interview_sessions and event_log rows per request and
+--   bucket them in Python. learner_daily_activity keeps one counter row per
+--   learner per day, maintained by row triggers on the three source tables,
+--   so the endpoint reads at most ~366 small rows.
+--
+-- Day keys match the previous Python bucketing: missions count on
+-- assigned_date, sessions and events on the UTC date of created_at.
+-- After applying, run scripts/backfill_daily_activity.py once to seed
+-- counters from existing rows.
+
+-- ============================================================
+-- ROLLUP TABLE
+-- ============================================================
+CREATE TABLE IF NOT EXISTS learner_daily_activity (
+    learner_id UUID NOT NULL REFERENCES learners(id) ON DELETE CASCADE,
+    activity_date DATE NOT NULL,
+    activity_count INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT now(),
+    PRIMARY KEY (learner_id, activity_date)
+);
+
+ALTER TABLE learner_daily_activity ENABLE ROW LEVEL SECURITY;
+
+-- Read-only for learners; rows are written by the SECURITY DEFINER triggers.
+CREATE POLICY "Learners can view their own daily activity"
+    ON learner_daily_activity FOR SELECT
+    USING (auth.uid() = learner_id);
+
+-- ============================================================
+-- COUNTER MAINTENANCE
+-- ============================================================
+CREATE OR REPLACE FUNCTION bump_learner_daily_activity(
+    p_learner_id UUID,
+    p_activity_date DATE,
+    p_delta INT
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF p_learner_id IS NULL OR p_activity_date IS NULL OR p_delta = 0 THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO learner_daily_activity (learner_id, activity_date, activity_count)
+    VALUES (p_learner_id, p_activity_date, GREATEST(p_delta, 0))
+    ON CONFLICT (learner_id, activity_date) DO UPDATE
+    SET activity_count = GREATEST(learner_daily_activity.activity_count + p_delta, 0),
+        updated_at = now();
+END;
+$$;
+
+-- Sessions and events: bucket on the UTC date of created_at.
+CREATE OR REPLACE FUNCTION track_created_at_activity()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_learner_daily_activity(
+            NEW.learner_id, (NEW.created_at AT TIME ZONE 'UTC')::date, 1);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM bump_learner_daily_activity(
+            OLD.learner_id, (OLD.created_at AT TIME ZONE 'UTC')::date, -1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- Missions: bucket on assigned_date (moves with the row if it is rescheduled).
+CREATE OR REPLACE FUNCTION track_mission_activity()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM bump_learner_daily_activity(OLD.learner_id, OLD.assigned_date, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM bump_learner_daily_activity(NEW.learner_id, NEW.assigned_date, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_event_log_daily_activity ON event_log;
+CREATE TRIGGER trigger_event_log_daily_activity
+    AFTER INSERT OR DELETE ON event_log
+    FOR EACH ROW
+    EXECUTE FUNCTION track_created_at_activity();
+
+DROP TRIGGER IF EXISTS trigger_interview_sessions_daily_activity ON interview_sessions;
+CREATE TRIGGER trigger_interview_sessions_daily_activity
+    AFTER INSERT OR DELETE ON interview_sessions
+    FOR EACH ROW
+    EXECUTE FUNCTION track_created_at_activity();
+
+DROP TRIGGER IF EXISTS trigger_daily_missions_daily_activity ON daily_missions;
+CREATE TRIGGER trigger_daily_missions_daily_activity
+    AFTER INSERT OR DELETE OR UPDATE OF assigned_date, learner_id ON daily_missions
+    FOR EACH ROW
+    EXECUTE FUNCTION track_mission_activity();
+
+-- ============================================================
+-- REBUILD / BACKFILL
+-- ============================================================
+-- Recomputes counters from the source tables. Authenticated callers can only
+-- rebuild their own rows; service-role callers may pass a learner, or NULL to
+-- rebuild every learner. Returns the number of day rows written.
+CREATE OR REPLACE FUNCTION rebuild_learner_daily_activity(p_learner_id UUID DEFAULT NULL)
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_rows INT;
+BEGIN
+    IF v_learner_id IS NULL AND auth.role() IS DISTINCT FROM 'service_role' THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    DELETE FROM learner_daily_activity
+    WHERE v_learner_id IS NULL OR learner_id = v_learner_id;
+
+    INSERT INTO learner_daily_activity (learner_id, activity_date, activity_count)
+    SELECT learner_id, activity_date, COUNT(*)::INT
+    FROM (
+        SELECT learner_id, assigned_date AS activity_date
+        FROM daily_missions
+        WHERE v_learner_id IS NULL OR learner_id = v_learner_id
+        UNION ALL
+        SELECT learner_id, (created_at AT TIME ZONE 'UTC')::date
+        FROM interview_sessions
+        WHERE v_learner_id IS NULL OR learner_id = v_learner_id
+        UNION ALL
+        SELECT learner_id, (created_at AT TIME ZONE 'UTC')::date
+        FROM event_log
+        WHERE v_learner_id IS NULL OR learner_id = v_learner_id
+    ) AS activity
+    WHERE activity_date IS NOT NULL
+    GROUP BY learner_id, activity_date;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION bump_learner_daily_activity(UUID, DATE, INT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION rebuild_learner_daily_activity(UUID) TO authenticated, service_role;
@@ -0,0 +1,173 @@
+-- Migration 021: Materialized completion streak
+-- Created: 2026-10-19
+-- Purpose: calculate_streak_sql walked daily_missions one day at a time on
+--   every dashboard load and mission completion. The streak now lives on the
+--   learner row and is advanced by a trigger in the same statement that marks
+--   a mission completed, so reads are a single-row lookup.
+--
+-- Stored values describe the latest run of consecutive completed days ending
+-- on last_completion_date. Day rollover is applied at read time: the streak
+-- counts only while last_completion_date is today or yesterday (the same rule
+-- calculate_streak_sql used), so no nightly reset is needed.
+--
+-- After applying, run scripts/repair_streaks.py once to seed existing learners.
+
+ALTER TABLE learners
+    ADD COLUMN IF NOT EXISTS current_streak INT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS longest_streak INT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS last_completion_date DATE;
+
+-- ============================================================
+-- FULL RECOMPUTE (repair)
+-- ============================================================
+-- Rebuilds the streak columns from completed missions (gaps-and-islands over
+-- distinct completion dates). Authenticated callers can only repair their own
+-- row; service-role callers may pass a learner, or NULL to repair everyone.
+-- Returns the number of learner rows updated.
+CREATE OR REPLACE FUNCTION recompute_learner_streak(p_learner_id UUID DEFAULT NULL)
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_rows INT;
+BEGIN
+    IF v_learner_id IS NULL AND auth.role() IS DISTINCT FROM 'service_role' THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    WITH days AS (
+        SELECT DISTINCT learner_id, assigned_date
+        FROM daily_missions
+        WHERE status = 'completed'
+          AND (v_learner_id IS NULL OR learner_id = v_learner_id)
+    ),
+    islands AS (
+        SELECT learner_id,
+               assigned_date,
+               assigned_date - (ROW_NUMBER() OVER (
+                   PARTITION BY learner_id ORDER BY assigned_date))::INT AS grp
+        FROM days
+    ),
+    runs AS (
+        SELECT learner_id, MAX(assigned_date) AS run_end, COUNT(*)::INT AS run_length
+        FROM islands
+        GROUP BY learner_id, grp
+    ),
+    summary AS (
+        SELECT DISTINCT ON (learner_id)
+               learner_id,
+               run_length AS current_streak,
+               run_end AS last_completion_date,
+               MAX(run_length) OVER (PARTITION BY learner_id) AS longest_streak
+        FROM runs
+        ORDER BY learner_id, run_end DESC
+    )
+    UPDATE learners l
+    SET current_streak = COALESCE(s.current_streak, 0),
+        longest_streak = COALESCE(s.longest_streak, 0),
+        last_completion_date = s.last_completion_date
+    FROM learners t
+    LEFT JOIN summary s ON s.learner_id = t.id
+    WHERE l.id = t.id
+      AND (v_learner_id IS NULL OR t.id = v_learner_id);
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$;
+
+-- ============================================================
+-- INCREMENTAL UPDATE ON COMPLETION
+-- ============================================================
+-- In-order completions (same day, next day, or after a gap) are applied in
+-- O(1). Completing an older day, or un-completing a mission, falls back to a
+-- full recompute for that learner since the latest run may have changed.
+CREATE OR REPLACE FUNCTION track_mission_streak()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_last DATE;
+    v_current INT;
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.status = 'completed' AND NEW.status <> 'completed' THEN
+        PERFORM recompute_learner_streak(NEW.learner_id);
+        RETURN NULL;
+    END IF;
+
+    IF NEW.status <> 'completed' OR (TG_OP = 'UPDATE' AND OLD.status = 'completed') THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT last_completion_date, current_streak
+    INTO v_last, v_current
+    FROM learners
+    WHERE id = NEW.learner_id
+    FOR UPDATE;
+
+    IF v_last IS NOT NULL AND NEW.assigned_date < v_last THEN
+        PERFORM recompute_learner_streak(NEW.learner_id);
+        RETURN NULL;
+    END IF;
+
+    v_current := CASE
+        WHEN v_last = NEW.assigned_date THEN v_current
+        WHEN v_last = NEW.assigned_date - 1 THEN v_current + 1
+        ELSE 1
+    END;
+
+    UPDATE learners
+    SET current_streak = v_current,
+        longest_streak = GREATEST(longest_streak, v_current),
+        last_completion_date = NEW.assigned_date
+    WHERE id = NEW.learner_id;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_daily_missions_streak ON daily_missions;
+CREATE TRIGGER trigger_daily_missions_streak
+    AFTER INSERT OR UPDATE OF status ON daily_missions
+    FOR EACH ROW
+    EXECUTE FUNCTION track_mission_streak();
+
+-- ============================================================
+-- O(1) STREAK READ
+-- ============================================================
+-- Same signature and semantics as before, so get_dashboard_summary (019) and
+-- existing callers pick up the materialized value without changes.
+CREATE OR REPLACE FUNCTION calculate_streak_sql(p_learner_id UUID)
+RETURNS INT
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_streak INT;
+    v_last DATE;
+BEGIN
+    IF v_learner_id IS NULL THEN
+        RETURN 0;
+    END IF;
+
+    SELECT current_streak, last_completion_date
+    INTO v_streak, v_last
+    FROM learners
+    WHERE id = v_learner_id;
+
+    IF v_last IS NULL OR v_last < CURRENT_DATE - 1 THEN
+        RETURN 0;
+    END IF;
+    RETURN COALESCE(v_streak, 0);
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION recompute_learner_streak(UUID) TO authenticated, service_role;
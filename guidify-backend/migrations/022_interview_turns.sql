@@ -0,0 +1,115 @@
+-- Migration 022: Append-only interview turns
+-- Created: 2026-10-19
+-- Purpose: submit_answer used to read the whole interview_sessions.transcript
+--   array, append two entries and write the full array back on every answer.
+--   Write volume grew quadratically over a session and two concurrent submits
+--   could overwrite each other's turns. Turns now go to interview_turns, one
+--   row per entry, through append_interview_turns, which allocates sequence
+--   numbers under the session row lock. The session row keeps only counters
+--   (turn_count, question_count); the transcript is assembled on read.
+--
+-- interview_sessions.transcript is kept for older rows and is backfilled into
+-- interview_turns below; new sessions leave it empty.
+
+ALTER TABLE interview_sessions
+    ADD COLUMN IF NOT EXISTS turn_count INT NOT NULL DEFAULT 0;
+
+-- ============================================================
+-- TURNS TABLE
+-- ============================================================
+CREATE TABLE IF NOT EXISTS interview_turns (
+    session_id UUID NOT NULL REFERENCES interview_sessions(id) ON DELETE CASCADE,
+    seq INT NOT NULL,
+    learner_id UUID NOT NULL REFERENCES learners(id) ON DELETE CASCADE,
+    role TEXT NOT NULL CHECK (role IN ('interviewer', 'candidate')),
+    content TEXT NOT NULL,
+    question_type TEXT,
+    created_at TIMESTAMPTZ DEFAULT now(),
+    PRIMARY KEY (session_id, seq)
+);
+
+ALTER TABLE interview_turns ENABLE ROW LEVEL SECURITY;
+
+-- Read-only for learners; rows are written by append_interview_turns.
+CREATE POLICY "Learners can view their own interview turns"
+    ON interview_turns FOR SELECT
+    USING (auth.uid() = learner_id);
+
+-- ============================================================
+-- APPEND
+-- ============================================================
+-- Appends p_turns (a JSON array of {role, content, question_type?}) to the
+-- session and bumps question_count by p_questions. The counter UPDATE takes
+-- the session row lock, so concurrent appends to one session are serialized
+-- and get consecutive, non-overlapping sequence numbers.
+-- Returns {"turn_count": n, "question_count": n}, or NULL if the session does
+-- not belong to the caller.
+CREATE OR REPLACE FUNCTION append_interview_turns(
+    p_session_id UUID,
+    p_turns JSONB,
+    p_questions INT DEFAULT 0,
+    p_learner_id UUID DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_count INT := jsonb_array_length(COALESCE(p_turns, '[]'::jsonb));
+    v_turn_count INT;
+    v_question_count INT;
+BEGIN
+    IF v_learner_id IS NULL THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    UPDATE interview_sessions
+    SET turn_count = turn_count + v_count,
+        question_count = question_count + COALESCE(p_questions, 0)
+    WHERE id = p_session_id AND learner_id = v_learner_id
+    RETURNING turn_count, question_count INTO v_turn_count, v_question_count;
+
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO interview_turns (session_id, seq, learner_id, role, content, question_type)
+    SELECT p_session_id,
+           v_turn_count - v_count + t.ord::INT,
+           v_learner_id,
+           t.turn->>'role',
+           COALESCE(t.turn->>'content', ''),
+           t.turn->>'question_type'
+    FROM jsonb_array_elements(COALESCE(p_turns, '[]'::jsonb)) WITH ORDINALITY AS t(turn, ord);
+
+    RETURN jsonb_build_object('turn_count', v_turn_count, 'question_count', v_question_count);
+END;
+$$;
+
+-- ============================================================
+-- BACKFILL
+-- ============================================================
+INSERT INTO interview_turns (session_id, seq, learner_id, role, content, question_type, created_at)
+SELECT s.id,
+       t.ord::INT,
+       s.learner_id,
+       t.turn->>'role',
+       COALESCE(t.turn->>'content', ''),
+       t.turn->>'question_type',
+       s.created_at
+FROM interview_sessions s
+CROSS JOIN LATERAL jsonb_array_elements(s.transcript) WITH ORDINALITY AS t(turn, ord)
+WHERE jsonb_typeof(s.transcript) = 'array'
+  AND t.turn->>'role' IN ('interviewer', 'candidate')
+ON CONFLICT (session_id, seq) DO NOTHING;
+
+UPDATE interview_sessions s
+SET turn_count = sub.n
+FROM (
+    SELECT session_id, MAX(seq) AS n FROM interview_turns GROUP BY session_id
+) sub
+WHERE s.id = sub.session_id AND s.turn_count < sub.n;
+
+GRANT EXECUTE ON FUNCTION append_interview_turns(UUID, JSONB, INT, UUID) TO authenticated, service_role;
@@ -0,0 +1,72 @@
+-- Migration 023: Rolling interview transcript summary
+-- Created: 2026-10-19
+-- Purpose: interview.question / interview.feedback prompts received the whole
+--   transcript on every turn, so prompt size grew with each question. The
+--   session now carries a compact summary (one short note per answered
+--   question: topic, strength, gap), updated incrementally as turns are
+--   appended; prompts use it plus only the last few turns verbatim.
+--
+-- append_interview_turns gains p_summary so the summary is written in the same
+-- statement that appends the turns (still one write per answer), and only
+-- appends to a session that is still in progress. With p_expected_questions
+-- it also requires question_count to still equal the value the caller read,
+-- so a duplicate or concurrent submit of the same answer is not appended
+-- twice. Either check failing returns NULL and writes nothing.
+
+ALTER TABLE interview_sessions
+    ADD COLUMN IF NOT EXISTS transcript_summary JSONB;
+
+DROP FUNCTION IF EXISTS append_interview_turns(UUID, JSONB, INT, UUID);
+DROP FUNCTION IF EXISTS append_interview_turns(UUID, JSONB, INT, UUID, JSONB);
+
+CREATE OR REPLACE FUNCTION append_interview_turns(
+    p_session_id UUID,
+    p_turns JSONB,
+    p_questions INT DEFAULT 0,
+    p_learner_id UUID DEFAULT NULL,
+    p_summary JSONB DEFAULT NULL,
+    p_expected_questions INT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_count INT := jsonb_array_length(COALESCE(p_turns, '[]'::jsonb));
+    v_turn_count INT;
+    v_question_count INT;
+BEGIN
+    IF v_learner_id IS NULL THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    UPDATE interview_sessions
+    SET turn_count = turn_count + v_count,
+        question_count = question_count + COALESCE(p_questions, 0),
+        transcript_summary = COALESCE(p_summary, transcript_summary)
+    WHERE id = p_session_id
+      AND learner_id = v_learner_id
+      AND status = 'in_progress'
+      AND (p_expected_questions IS NULL OR question_count = p_expected_questions)
+    RETURNING turn_count, question_count INTO v_turn_count, v_question_count;
+
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO interview_turns (session_id, seq, learner_id, role, content, question_type)
+    SELECT p_session_id,
+           v_turn_count - v_count + t.ord::INT,
+           v_learner_id,
+           t.turn->>'role',
+           COALESCE(t.turn->>'content', ''),
+           t.turn->>'question_type'
+    FROM jsonb_array_elements(COALESCE(p_turns, '[]'::jsonb)) WITH ORDINALITY AS t(turn, ord);
+
+    RETURN jsonb_build_object('turn_count', v_turn_count, 'question_count', v_question_count);
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION append_interview_turns(UUID, JSONB, INT, UUID, JSONB, INT) TO authenticated, service_role;
@@ -0,0 +1,23 @@
+-- Migration 024: Background interview feedback
+-- Created: 2026-10-19
+-- Purpose: The final interview answer used to wait for the full
+--   interview.feedback AI call. Sessions now complete immediately and the
+--   report is produced by an 'interview_feedback' job (app/workers/job_worker.py).
+--   feedback_status tracks the report separately from the session status:
+--     pending  — job queued, nothing generated yet
+--     partial  — some sections validated and stored in feedback_report
+--     ready    — report complete
+--     failed   — generation gave up; feedback_report holds the fallback text
+--   NULL for sessions still in progress.
+
+ALTER TABLE interview_sessions
+    ADD COLUMN IF NOT EXISTS feedback_status TEXT
+        CHECK (feedback_status IN ('pending', 'partial', 'ready', 'failed'));
+
+UPDATE interview_sessions
+SET feedback_status = 'ready'
+WHERE status = 'completed' AND feedback_report IS NOT NULL AND feedback_status IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_interview_sessions_feedback_pending
+    ON interview_sessions(created_at)
+    WHERE feedback_status IN ('pending', 'partial');
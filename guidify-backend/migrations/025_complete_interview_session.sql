@@ -0,0 +1,66 @@
+-- Migration 025: Single-round-trip interview completion
+-- Created: 2026-10-19
+-- Purpose: Ending an interview took three writes from the API (append the
+--   final answer, mark the session completed, queue the feedback job).
+--   complete_interview_session does all three in one transaction, which also
+--   guarantees a completed session always has its feedback job queued.
+--
+-- Returns {"completed": bool, "job_id": uuid | null}. completed is false when
+-- the session was not in progress (e.g. a concurrent submit already ended
+-- it); nothing is written in that case.
+
+CREATE OR REPLACE FUNCTION complete_interview_session(
+    p_session_id UUID,
+    p_turns JSONB,
+    p_delivery_metrics JSONB DEFAULT NULL,
+    p_learner_id UUID DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_job_id UUID;
+BEGIN
+    IF v_learner_id IS NULL THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    -- Takes the session row lock; a second completion waits and then no-ops.
+    PERFORM 1
+    FROM interview_sessions
+    WHERE id = p_session_id
+      AND learner_id = v_learner_id
+      AND status = 'in_progress'
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN jsonb_build_object('completed', FALSE, 'job_id', NULL);
+    END IF;
+
+    -- Appended before the status changes: append_interview_turns only
+    -- writes to a session that is in progress.
+    PERFORM append_interview_turns(p_session_id, p_turns, 0, v_learner_id, NULL);
+
+    UPDATE interview_sessions
+    SET status = 'completed',
+        feedback_status = 'pending',
+        camera_enabled = CASE WHEN p_delivery_metrics IS NOT NULL THEN TRUE ELSE camera_enabled END,
+        delivery_metrics = COALESCE(p_delivery_metrics, delivery_metrics)
+    WHERE id = p_session_id;
+
+    INSERT INTO job_queue (job_type, learner_id, payload)
+    VALUES (
+        'interview_feedback',
+        v_learner_id,
+        jsonb_build_object('session_id', p_session_id, 'learner_id', v_learner_id)
+    )
+    RETURNING id INTO v_job_id;
+
+    RETURN jsonb_build_object('completed', TRUE, 'job_id', v_job_id);
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION complete_interview_session(UUID, JSONB, JSONB, UUID) TO authenticated, service_role;
@@ -0,0 +1,24 @@
+-- Migration 026: Incremental delivery-metric trends
+-- Created: 2026-10-19
+-- Purpose: GET /dashboard/delivery-trends rebuilt four metric series from the
+--   last 50 interview_sessions on every request, and the rules.md §6.1
+--   remedial trigger re-read history to count consecutive sessions below
+--   threshold. learner_delivery_stats keeps one row per learner holding the
+--   last-N points, an EWMA and a consecutive-below counter per metric
+--   (shape documented in app/services/delivery_trends.py). The API updates it
+--   when a session's metrics are stored; rows missing for existing learners
+--   are rebuilt from interview_sessions on first read.
+
+CREATE TABLE IF NOT EXISTS learner_delivery_stats (
+    learner_id UUID PRIMARY KEY REFERENCES learners(id) ON DELETE CASCADE,
+    state JSONB NOT NULL DEFAULT '{}'::jsonb,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+ALTER TABLE learner_delivery_stats ENABLE ROW LEVEL SECURITY;
+
+-- Written by the API with the learner's JWT when metrics are submitted.
+CREATE POLICY "Learners can manage their own delivery stats"
+    ON learner_delivery_stats FOR ALL
+    USING (auth.uid() = learner_id)
+    WITH CHECK (auth.uid() = learner_id);
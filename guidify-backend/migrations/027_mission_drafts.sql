@@ -0,0 +1,76 @@
+-- Migration 027: Pre-generated daily missions
+-- Created: 2026-10-19
+-- Purpose: GET /missions/today generated the mission with a 30–90s AI call on
+--   the learner's first visit of the day. app/workers/mission_pregen.py now
+--   builds tomorrow's missions off-peak and stores them here; the first visit
+--   promotes the draft into daily_missions. Drafts are kept out of
+--   daily_missions so a learner who does not visit gets no mission row (and
+--   no learner_daily_activity count) for the day.
+
+CREATE TABLE IF NOT EXISTS mission_drafts (
+    learner_id UUID NOT NULL REFERENCES learners(id) ON DELETE CASCADE,
+    assigned_date DATE NOT NULL,
+    mission JSONB NOT NULL,
+    priority REAL NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT now(),
+    PRIMARY KEY (learner_id, assigned_date)
+);
+
+ALTER TABLE mission_drafts ENABLE ROW LEVEL SECURITY;
+
+-- Learners only read and consume (delete) their own drafts; the worker writes
+-- them with the service-role key.
+CREATE POLICY "Learners can view their own mission drafts"
+    ON mission_drafts FOR SELECT
+    USING (auth.uid() = learner_id);
+
+CREATE POLICY "Learners can consume their own mission drafts"
+    ON mission_drafts FOR DELETE
+    USING (auth.uid() = learner_id);
+
+GRANT SELECT, DELETE ON mission_drafts TO authenticated;
+GRANT ALL ON mission_drafts TO service_role;
+
+-- ============================================================
+-- CANDIDATES
+-- ============================================================
+-- Learners with an active roadmap and activity in the last p_days days that
+-- have neither a mission nor a draft for p_date, ordered by how likely they
+-- are to visit: each active day counts 0.8^(days before the run day), so a
+-- learner active every day scores ~4.4 and one seen once two weeks ago ~0.06.
+CREATE OR REPLACE FUNCTION get_mission_pregen_candidates(
+    p_date DATE,
+    p_limit INT DEFAULT 1000,
+    p_days INT DEFAULT 14
+)
+RETURNS TABLE (learner_id UUID, priority REAL)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT a.learner_id,
+           SUM(power(0.8, (p_date - 1) - a.activity_date))::REAL AS priority
+    FROM learner_daily_activity a
+    WHERE a.activity_date >= p_date - p_days
+      AND a.activity_date < p_date
+      AND a.activity_count > 0
+      AND EXISTS (
+          SELECT 1 FROM roadmaps r
+          WHERE r.learner_id = a.learner_id AND r.status = 'active'
+      )
+      AND NOT EXISTS (
+          SELECT 1 FROM daily_missions m
+          WHERE m.learner_id = a.learner_id AND m.assigned_date = p_date
+      )
+      AND NOT EXISTS (
+          SELECT 1 FROM mission_drafts d
+          WHERE d.learner_id = a.learner_id AND d.assigned_date = p_date
+      )
+    GROUP BY a.learner_id
+    ORDER BY priority DESC, a.learner_id
+    LIMIT p_limit;
+$$;
+
+REVOKE EXECUTE ON FUNCTION get_mission_pregen_candidates(DATE, INT, INT) FROM PUBLIC, authenticated;
+GRANT EXECUTE ON FUNCTION get_mission_pregen_candidates(DATE, INT, INT) TO service_role;
@@ -0,0 +1,100 @@
+-- Migration 028: Mission template library
+-- Created: 2026-10-19
+-- Purpose: Every daily mission was a fresh mission.generate call, although
+--   learners on the same role, phase skill and difficulty get near-identical
+--   missions. mission_templates stores validated generations under a key of
+--   (target_role, target_skill, difficulty, minutes bucket); mission building
+--   (app/services/mission_library.py) reuses a stored variant and only calls
+--   the model on a miss, adding the result to the library.
+
+CREATE TABLE IF NOT EXISTS mission_templates (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    template_key TEXT NOT NULL,
+    title TEXT NOT NULL,
+    mission JSONB NOT NULL,
+    uses INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT now(),
+    last_used_at TIMESTAMPTZ,
+    UNIQUE (template_key, title)
+);
+
+CREATE INDEX IF NOT EXISTS idx_mission_templates_key_uses
+    ON mission_templates(template_key, uses);
+
+-- Shared reference data with no learner columns; only reachable through the
+-- functions below.
+ALTER TABLE mission_templates ENABLE ROW LEVEL SECURITY;
+
+-- ============================================================
+-- PICK
+-- ============================================================
+-- Returns the least-used variant for the key whose title the learner has not
+-- seen recently, and counts the use. NULL on a miss.
+CREATE OR REPLACE FUNCTION pick_mission_template(
+    p_template_key TEXT,
+    p_exclude_titles TEXT[] DEFAULT '{}'
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_id UUID;
+    v_mission JSONB;
+BEGIN
+    SELECT id, mission INTO v_id, v_mission
+    FROM mission_templates
+    WHERE template_key = p_template_key
+      AND NOT (title = ANY (COALESCE(p_exclude_titles, '{}')))
+    ORDER BY uses, random()
+    LIMIT 1;
+
+    IF v_id IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE mission_templates
+    SET uses = uses + 1, last_used_at = now()
+    WHERE id = v_id;
+
+    RETURN v_mission;
+END;
+$$;
+
+-- ============================================================
+-- ADD
+-- ============================================================
+-- Stores a validated generation unless the key already holds p_max_variants
+-- variants or one with the same title. Returns TRUE if stored.
+CREATE OR REPLACE FUNCTION add_mission_template(
+    p_template_key TEXT,
+    p_mission JSONB,
+    p_max_variants INT DEFAULT 20
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_rows INT;
+BEGIN
+    IF (SELECT count(*) FROM mission_templates WHERE template_key = p_template_key) >= p_max_variants THEN
+        RETURN FALSE;
+    END IF;
+
+    INSERT INTO mission_templates (template_key, title, mission)
+    VALUES (p_template_key, p_mission->>'title', p_mission)
+    ON CONFLICT (template_key, title) DO NOTHING;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows > 0;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION pick_mission_template(TEXT, TEXT[]) TO authenticated, service_role;
+-- Writes go to a library shared by all learners, so only the service role
+-- (mission pre-generation worker, seed script) may add templates.
+REVOKE EXECUTE ON FUNCTION add_mission_template(TEXT, JSONB, INT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION add_mission_template(TEXT, JSONB, INT) TO service_role;
@@ -0,0 +1,270 @@
+-- Migration 029: Addressable roadmap phases
+-- Created: 2026-10-19
+-- Purpose: A roadmap's phases lived only in the roadmaps.phases JSON array, so
+--   every read returned the whole document and any change to one phase meant
+--   rewriting it. roadmap_phases keeps one row per phase (content, skills and
+--   progress status), written by a trigger when a roadmap is created:
+--
+--     get_active_roadmap_view    summary (phase titles/status + current phase)
+--                                or a single phase, instead of the document
+--     advance_roadmap_phase      progress: scalar columns on roadmaps plus the
+--                                status of the phase rows that change; the
+--                                phases JSON is not touched
+--
+--   roadmaps.phases stays the as-generated document for full reads. Phase
+--   content is never edited in place: adaptation saves a new roadmap version.
+--   Phase status: 'completed' before current_phase_number, 'current' at it
+--   ('completed' once progress_pct reaches 100), 'upcoming' after it.
+
+CREATE TABLE IF NOT EXISTS roadmap_phases (
+    roadmap_id UUID NOT NULL REFERENCES roadmaps(id) ON DELETE CASCADE,
+    phase_number INT NOT NULL,
+    learner_id UUID NOT NULL REFERENCES learners(id) ON DELETE CASCADE,
+    title TEXT,
+    difficulty TEXT,
+    skills JSONB NOT NULL DEFAULT '[]'::jsonb,
+    phase JSONB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'upcoming' CHECK (status IN ('upcoming', 'current', 'completed')),
+    updated_at TIMESTAMPTZ DEFAULT now(),
+    PRIMARY KEY (roadmap_id, phase_number)
+);
+
+CREATE INDEX IF NOT EXISTS idx_roadmap_phases_current
+    ON roadmap_phases(roadmap_id)
+    WHERE status = 'current';
+
+-- Active-roadmap lookups (every view below, missions, dashboard)
+CREATE INDEX IF NOT EXISTS idx_roadmaps_active_learner
+    ON roadmaps(learner_id, version DESC)
+    WHERE status = 'active';
+
+ALTER TABLE roadmap_phases ENABLE ROW LEVEL SECURITY;
+
+-- Read-only for learners; rows are written by the trigger and functions below.
+CREATE POLICY "Learners can view their own roadmap phases"
+    ON roadmap_phases FOR SELECT
+    USING (auth.uid() = learner_id);
+
+-- ============================================================
+-- SYNC
+-- ============================================================
+CREATE OR REPLACE FUNCTION roadmap_phase_status(
+    p_phase_number INT,
+    p_current_phase_number INT,
+    p_progress_pct INT
+)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT CASE
+        WHEN p_phase_number < p_current_phase_number THEN 'completed'
+        WHEN p_phase_number = p_current_phase_number AND p_progress_pct >= 100 THEN 'completed'
+        WHEN p_phase_number = p_current_phase_number THEN 'current'
+        ELSE 'upcoming'
+    END;
+$$;
+
+-- New roadmap → one row per phase. Roadmaps are never rewritten wholesale
+-- (regeneration inserts a new version), so only INSERT explodes the array.
+CREATE OR REPLACE FUNCTION sync_roadmap_phases()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO roadmap_phases (roadmap_id, phase_number, learner_id, title, difficulty, skills, phase, status)
+        SELECT NEW.id,
+               COALESCE((p->>'phase_number')::INT, ord::INT),
+               NEW.learner_id,
+               p->>'title',
+               p->>'difficulty',
+               CASE WHEN jsonb_typeof(p->'skills') = 'array' THEN p->'skills' ELSE '[]'::jsonb END,
+               p,
+               roadmap_phase_status(COALESCE((p->>'phase_number')::INT, ord::INT),
+                                    NEW.current_phase_number, NEW.progress_pct)
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(NEW.phases) = 'array' THEN NEW.phases ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS e(p, ord)
+        ON CONFLICT (roadmap_id, phase_number) DO NOTHING;
+    ELSE
+        -- Progress moved: restate only the rows whose status changes
+        UPDATE roadmap_phases rp
+        SET status = roadmap_phase_status(rp.phase_number, NEW.current_phase_number, NEW.progress_pct),
+            updated_at = now()
+        WHERE rp.roadmap_id = NEW.id
+          AND rp.status IS DISTINCT FROM
+              roadmap_phase_status(rp.phase_number, NEW.current_phase_number, NEW.progress_pct);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_roadmaps_sync_phases ON roadmaps;
+CREATE TRIGGER trigger_roadmaps_sync_phases
+    AFTER INSERT OR UPDATE OF current_phase_number, progress_pct ON roadmaps
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_roadmap_phases();
+
+-- Backfill active roadmaps (superseded versions are only listed, never read by phase)
+INSERT INTO roadmap_phases (roadmap_id, phase_number, learner_id, title, difficulty, skills, phase, status)
+SELECT r.id,
+       COALESCE((p->>'phase_number')::INT, ord::INT),
+       r.learner_id,
+       p->>'title',
+       p->>'difficulty',
+       CASE WHEN jsonb_typeof(p->'skills') = 'array' THEN p->'skills' ELSE '[]'::jsonb END,
+       p,
+       roadmap_phase_status(COALESCE((p->>'phase_number')::INT, ord::INT), r.current_phase_number, r.progress_pct)
+FROM roadmaps r,
+     jsonb_array_elements(
+         CASE WHEN jsonb_typeof(r.phases) = 'array' THEN r.phases ELSE '[]'::jsonb END
+     ) WITH ORDINALITY AS e(p, ord)
+WHERE r.status = 'active'
+ON CONFLICT (roadmap_id, phase_number) DO NOTHING;
+
+-- ============================================================
+-- READ
+-- ============================================================
+-- p_view:
+--   'summary' — roadmap fields, every phase as {phase_number, title,
+--               difficulty, status, skill_count}, and the current phase in full
+--   'phase'   — roadmap fields and one phase in full (p_phase_number, or the
+--               current phase when NULL)
+-- NULL when the learner has no active roadmap.
+CREATE OR REPLACE FUNCTION get_active_roadmap_view(
+    p_view TEXT DEFAULT 'summary',
+    p_phase_number INT DEFAULT NULL,
+    p_learner_id UUID DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_roadmap roadmaps%ROWTYPE;
+    v_result JSONB;
+BEGIN
+    IF v_learner_id IS NULL THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    SELECT * INTO v_roadmap
+    FROM roadmaps
+    WHERE learner_id = v_learner_id AND status = 'active'
+    ORDER BY version DESC
+    LIMIT 1;
+
+    IF v_roadmap.id IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    v_result := jsonb_build_object(
+        'id', v_roadmap.id,
+        'title', v_roadmap.title,
+        'version', v_roadmap.version,
+        'total_phases', v_roadmap.total_phases,
+        'estimated_weeks', v_roadmap.estimated_weeks,
+        'current_phase_number', v_roadmap.current_phase_number,
+        'progress_pct', v_roadmap.progress_pct,
+        'created_at', v_roadmap.created_at
+    );
+
+    IF p_view = 'phase' THEN
+        RETURN v_result || jsonb_build_object('phase', (
+            SELECT rp.phase || jsonb_build_object('status', rp.status)
+            FROM roadmap_phases rp
+            WHERE rp.roadmap_id = v_roadmap.id
+              AND rp.phase_number = COALESCE(p_phase_number, v_roadmap.current_phase_number)
+        ));
+    END IF;
+
+    RETURN v_result || jsonb_build_object(
+        'phases', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'phase_number', rp.phase_number,
+                'title', rp.title,
+                'difficulty', rp.difficulty,
+                'status', rp.status,
+                'skill_count', jsonb_array_length(rp.skills)
+            ) ORDER BY rp.phase_number)
+            FROM roadmap_phases rp
+            WHERE rp.roadmap_id = v_roadmap.id
+        ), '[]'::jsonb),
+        'current_phase', (
+            SELECT rp.phase || jsonb_build_object('status', rp.status)
+            FROM roadmap_phases rp
+            WHERE rp.roadmap_id = v_roadmap.id
+              AND rp.phase_number = v_roadmap.current_phase_number
+        )
+    );
+END;
+$$;
+
+-- ============================================================
+-- PROGRESS
+-- ============================================================
+-- Marks p_completed_phase done and moves to the next phase. Idempotent: a
+-- phase other than the current one is ignored, so a retried request cannot
+-- advance twice. Returns {advanced, current_phase_number, progress_pct}.
+CREATE OR REPLACE FUNCTION advance_roadmap_phase(
+    p_roadmap_id UUID,
+    p_completed_phase INT,
+    p_learner_id UUID DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_current INT;
+    v_total INT;
+    v_progress INT;
+BEGIN
+    IF v_learner_id IS NULL THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    SELECT current_phase_number, total_phases, progress_pct
+    INTO v_current, v_total, v_progress
+    FROM roadmaps
+    WHERE id = p_roadmap_id AND learner_id = v_learner_id AND status = 'active'
+    FOR UPDATE;
+
+    IF v_current IS NULL THEN
+        RAISE EXCEPTION 'Roadmap not found';
+    END IF;
+
+    IF p_completed_phase <> v_current OR v_progress >= 100 THEN
+        RETURN jsonb_build_object(
+            'advanced', FALSE, 'current_phase_number', v_current, 'progress_pct', v_progress
+        );
+    END IF;
+
+    v_progress := CASE WHEN v_total > 0 THEN LEAST(100, (100 * p_completed_phase) / v_total) ELSE 100 END;
+    v_current := LEAST(v_current + 1, GREATEST(v_total, 1));
+
+    -- Scalar update only; the trigger restates the affected phase rows
+    UPDATE roadmaps
+    SET current_phase_number = v_current, progress_pct = v_progress
+    WHERE id = p_roadmap_id;
+
+    RETURN jsonb_build_object(
+        'advanced', TRUE, 'current_phase_number', v_current, 'progress_pct', v_progress
+    );
+END;
+$$;
+
+-- An earlier revision of this migration shipped a learner-callable phase
+-- content patch; nothing calls it.
+DROP FUNCTION IF EXISTS update_roadmap_phase(UUID, INT, JSONB, UUID);
+
+GRANT EXECUTE ON FUNCTION get_active_roadmap_view(TEXT, INT, UUID) TO authenticated, service_role;
+GRANT EXECUTE ON FUNCTION advance_roadmap_phase(UUID, INT, UUID) TO authenticated, service_role;
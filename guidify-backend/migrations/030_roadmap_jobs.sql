@@ -0,0 +1,184 @@
+-- Migration 030: Queued roadmap regeneration
+-- Created: 2026-10-19
+-- Purpose: Roadmap (re)generation runs as a 'roadmap_generate' job in job_queue
+--   (processed by app/workers/job_worker.py) instead of inside the request.
+--   progress_state reports where the job is (queued → generating →
+--   validating → saved, or failed) and result holds the outcome for
+--   GET /roadmap/jobs/{id}.
+--
+--   enqueue_roadmap_job coalesces duplicate requests per learner:
+--     manual requests   join any queued or running job
+--     goal changes      join only a queued job (upgrading it to bypass the
+--                       debounce); a running job may already have read the
+--                       old target role, so a new job is queued behind it
+--   At most one queued roadmap job exists per learner (unique index).
+--   complete_job (migration 014) would put a failed-but-retryable job back to
+--   pending even when a goal change already queued a newer job behind it,
+--   violating that index; for roadmap jobs the retry is folded into the
+--   queued job instead (the superseded job is marked failed).
+--
+--   The worker honors bypass_debounce from the job payload, so learners can
+--   neither call enqueue_roadmap_job (service role only; the API checks the
+--   24h debounce before calling it) nor insert roadmap_generate jobs directly.
+
+ALTER TABLE job_queue ADD COLUMN IF NOT EXISTS progress_state TEXT;
+ALTER TABLE job_queue ADD COLUMN IF NOT EXISTS result JSONB;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_job_queue_roadmap_pending
+    ON job_queue(learner_id)
+    WHERE job_type = 'roadmap_generate' AND status = 'pending';
+
+-- Same contract as migration 014; a retryable roadmap_generate failure with a
+-- newer job already queued fails the old job, pointing at the newer one, and
+-- carries its bypass_debounce over so the retry is not lost.
+CREATE OR REPLACE FUNCTION complete_job(
+    p_job_id UUID,
+    p_success BOOLEAN,
+    p_error_message TEXT DEFAULT NULL
+)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_job job_queue;
+    v_successor_id UUID;
+BEGIN
+    IF p_success THEN
+        UPDATE job_queue
+        SET status = 'completed',
+            completed_at = NOW(),
+            updated_at = NOW()
+        WHERE id = p_job_id;
+        RETURN;
+    END IF;
+
+    SELECT * INTO v_job FROM job_queue WHERE id = p_job_id;
+
+    IF v_job.job_type = 'roadmap_generate' AND v_job.attempts < v_job.max_attempts THEN
+        -- Same lock as enqueue_roadmap_job, so no job is queued in between
+        PERFORM pg_advisory_xact_lock(hashtext('roadmap_generate:' || v_job.learner_id::TEXT));
+
+        SELECT id INTO v_successor_id
+        FROM job_queue
+        WHERE learner_id = v_job.learner_id
+          AND job_type = 'roadmap_generate'
+          AND status = 'pending'
+          AND id <> p_job_id
+        LIMIT 1;
+
+        IF v_successor_id IS NOT NULL THEN
+            IF COALESCE((v_job.payload->>'bypass_debounce')::BOOLEAN, FALSE) THEN
+                UPDATE job_queue
+                SET payload = payload || jsonb_build_object('bypass_debounce', TRUE),
+                    updated_at = NOW()
+                WHERE id = v_successor_id;
+            END IF;
+
+            UPDATE job_queue
+            SET status = 'failed',
+                error_message = p_error_message,
+                progress_state = 'failed',
+                result = COALESCE(result, '{}'::jsonb) || jsonb_build_object(
+                    'status', 'superseded',
+                    'superseded_by', v_successor_id,
+                    'message', 'Replaced by a newer roadmap request'
+                ),
+                completed_at = NOW(),
+                updated_at = NOW()
+            WHERE id = p_job_id;
+            RETURN;
+        END IF;
+    END IF;
+
+    UPDATE job_queue
+    SET status = CASE
+        WHEN attempts >= max_attempts THEN 'failed'
+        ELSE 'pending'
+    END,
+        error_message = p_error_message,
+        completed_at = CASE WHEN attempts >= max_attempts THEN NOW() END,
+        updated_at = NOW()
+    WHERE id = p_job_id;
+END;
+$$;
+
+-- Returns {"job_id": uuid, "coalesced": bool}
+CREATE OR REPLACE FUNCTION enqueue_roadmap_job(
+    p_trigger_reason TEXT,
+    p_bypass_debounce BOOLEAN DEFAULT FALSE,
+    p_learner_id UUID DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_learner_id UUID := COALESCE(auth.uid(), p_learner_id);
+    v_job_id UUID;
+    v_status TEXT;
+BEGIN
+    IF v_learner_id IS NULL THEN
+        RAISE EXCEPTION 'Not authenticated';
+    END IF;
+
+    -- Serialize enqueues per learner so two requests cannot both insert
+    PERFORM pg_advisory_xact_lock(hashtext('roadmap_generate:' || v_learner_id::TEXT));
+
+    SELECT id, status INTO v_job_id, v_status
+    FROM job_queue
+    WHERE learner_id = v_learner_id
+      AND job_type = 'roadmap_generate'
+      AND (
+          status = 'pending'
+          -- A running job whose worker died stops absorbing requests
+          OR (status = 'processing' AND NOT p_bypass_debounce
+              AND started_at > NOW() - INTERVAL '15 minutes')
+      )
+    ORDER BY (status = 'pending') DESC, created_at
+    LIMIT 1;
+
+    IF v_job_id IS NOT NULL THEN
+        IF p_bypass_debounce AND v_status = 'pending' THEN
+            UPDATE job_queue
+            SET payload = payload || jsonb_build_object(
+                    'trigger_reason', p_trigger_reason, 'bypass_debounce', TRUE
+                ),
+                updated_at = NOW()
+            WHERE id = v_job_id;
+        END IF;
+        RETURN jsonb_build_object('job_id', v_job_id, 'coalesced', TRUE);
+    END IF;
+
+    INSERT INTO job_queue (job_type, learner_id, payload, progress_state)
+    VALUES (
+        'roadmap_generate',
+        v_learner_id,
+        jsonb_build_object(
+            'learner_id', v_learner_id,
+            'trigger_reason', p_trigger_reason,
+            'bypass_debounce', p_bypass_debounce
+        ),
+        'queued'
+    )
+    RETURNING id INTO v_job_id;
+
+    RETURN jsonb_build_object('job_id', v_job_id, 'coalesced', FALSE);
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION enqueue_roadmap_job(TEXT, BOOLEAN, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION enqueue_roadmap_job(TEXT, BOOLEAN, UUID) TO service_role;
+
+-- Learner inserts (migration 018) stay open for other job types. Roadmap
+-- jobs are queued by the API with the service-role client, and interview
+-- feedback jobs by complete_interview_session (migration 025), so a learner
+-- cannot hand the worker an arbitrary trigger, signal or session.
+DROP POLICY IF EXISTS "Users can insert own jobs" ON job_queue;
+CREATE POLICY "Users can insert own jobs" ON job_queue
+    FOR INSERT WITH CHECK (
+        auth.uid() = learner_id
+        AND job_type NOT IN ('roadmap_generate', 'roadmap_adapt', 'interview_feedback')
+    );
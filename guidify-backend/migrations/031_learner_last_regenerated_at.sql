@@ -0,0 +1,41 @@
+-- Migration 031: Last regeneration time on the learner row
+-- Created: 2026-10-19
+-- Purpose: get_last_regeneration (the 24h debounce in roadmap_service and the
+--   Rules Engine, rules.md §2) ran two ordered scans, roadmaps then
+--   event_log. learners.last_regenerated_at now holds the newest roadmap's
+--   created_at, set by a trigger in the same statement that inserts the
+--   roadmap (create_roadmap_atomic or the legacy insert), so the debounce
+--   check is a primary-key read. The app caches it in Redis under
+--   last_regen:<learner_id> (written by queries.create_roadmap).
+
+ALTER TABLE learners ADD COLUMN IF NOT EXISTS last_regenerated_at TIMESTAMPTZ;
+
+CREATE OR REPLACE FUNCTION track_last_regeneration()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE learners
+    SET last_regenerated_at = GREATEST(COALESCE(last_regenerated_at, NEW.created_at), NEW.created_at)
+    WHERE id = NEW.learner_id;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_roadmaps_last_regeneration ON roadmaps;
+CREATE TRIGGER trigger_roadmaps_last_regeneration
+    AFTER INSERT ON roadmaps
+    FOR EACH ROW
+    EXECUTE FUNCTION track_last_regeneration();
+
+-- Backfill: newest roadmap, or the newest regeneration event for learners
+-- whose roadmap rows predate the event log fix (F-09)
+UPDATE learners l
+SET last_regenerated_at = COALESCE(
+    (SELECT MAX(r.created_at) FROM roadmaps r WHERE r.learner_id = l.id),
+    (SELECT MAX(e.created_at) FROM event_log e
+     WHERE e.learner_id = l.id AND e.event_type = 'roadmap_regenerated')
+)
+WHERE l.last_regenerated_at IS NULL;
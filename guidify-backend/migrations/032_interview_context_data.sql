@@ -0,0 +1,14 @@
+-- Migration 032: Interview context snapshot column
+-- Created: 2026-10-19
+-- Purpose: interview_sessions.context_data holds the profile context
+--   (profile_summary, target_role) captured when the session starts, so later
+--   turns and the feedback job never refetch the learner or profile. The app
+--   has written and read this column since the baseline, but no migration
+--   created it: with select("*") and a swallowed update error that went
+--   unnoticed, while the explicit projections (SESSION_TURN,
+--   SESSION_FEEDBACK) and the session insert fail without it.
+--   NULL for sessions started before this migration; readers fall back to
+--   an empty context.
+
+ALTER TABLE interview_sessions
+    ADD COLUMN IF NOT EXISTS context_data JSONB;
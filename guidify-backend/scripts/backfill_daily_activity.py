@@ -0,0 +1,82 @@
+"""
+Backfill learner_daily_activity (migration 020) from existing rows.
+
+The triggers added by migration 020 only count rows written after it was
+applied; run this once afterwards (and any time counters need repair) to
+recompute them from daily_missions, interview_sessions and event_log.
+
+Usage:
+    python scripts/backfill_daily_activity.py                     # every learner, one at a time
+    python scripts/backfill_daily_activity.py --learner-id <uuid> # single learner
+
+Environment:
+    SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY (rebuilding other learners' rows
+    bypasses RLS, so the publishable key is not enough)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from supabase import create_client  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+
+PAGE_SIZE = 500
+
+
+def _learner_ids(client):
+    offset = 0
+    while True:
+        response = (
+            client.table("learners")
+            .select("id")
+            .order("id")
+            .range(offset, offset + PAGE_SIZE - 1)
+            .execute()
+        )
+        rows = response.data or []
+        for row in rows:
+            yield row["id"]
+        if len(rows) < PAGE_SIZE:
+            return
+        offset += PAGE_SIZE
+
+
+def main(args) -> int:
+    if not settings.SUPABASE_SERVICE_ROLE_KEY:
+        print("SUPABASE_SERVICE_ROLE_KEY is not set.")
+        return 1
+    client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+
+    learner_ids = [args.learner_id] if args.learner_id else _learner_ids(client)
+    start = time.perf_counter()
+    learners = days = failures = 0
+    for learner_id in learner_ids:
+        try:
+            response = client.rpc(
+                "rebuild_learner_daily_activity", {"p_learner_id": learner_id}
+            ).execute()
+            days += int(response.data or 0)
+            learners += 1
+        except Exception as e:
+            failures += 1
+            print(f"  {learner_id}: {e}")
+        if learners and learners % 100 == 0:
+            print(f"  {learners} learners, {days} day rows")
+
+    print(
+        f"Rebuilt {learners} learners ({days} day rows, {failures} failures) "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner-id", help="Rebuild a single learner")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,120 @@
+"""
+Activity heatmap benchmark — year-long source scan vs. learner_daily_activity.
+
+Optionally seeds a learner with many event_log rows spread over the past year,
+then reports p50/p99 latency and rows transferred for:
+
+    scan     the previous implementation (missions + sessions + events for 365
+             days, bucketed in Python)
+    rollup   one select on learner_daily_activity (migration 020)
+
+Usage:
+    python scripts/bench_activity_heatmap.py --learner-id <uuid> --token <access token>
+    python scripts/bench_activity_heatmap.py --learner-id ... --token ... --seed-events 20000
+
+Seeding and cleanup use SUPABASE_SERVICE_ROLE_KEY; seeded rows are tagged
+with payload {"bench": true} and deleted afterwards unless --keep is given.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from supabase import create_client  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.db import queries  # noqa: E402
+from app.services.supabase_client import set_request_jwt  # noqa: E402
+
+SEED_BATCH = 500
+
+
+def _seed(client, learner_id: str, count: int) -> None:
+    now = datetime.now(timezone.utc)
+    for offset in range(0, count, SEED_BATCH):
+        rows = [
+            {
+                "learner_id": learner_id,
+                "event_type": "profile_updated",
+                "payload": {"bench": True},
+                "created_at": (now - timedelta(minutes=random.randint(0, 365 * 24 * 60))).isoformat(),
+            }
+            for _ in range(min(SEED_BATCH, count - offset))
+        ]
+        client.table("event_log").insert(rows).execute()
+    print(f"seeded {count} events")
+
+
+def _cleanup(client, learner_id: str) -> None:
+    client.table("event_log").delete().eq("learner_id", learner_id).eq("payload->>bench", "true").execute()
+
+
+async def _measure(label: str, iterations: int, call) -> None:
+    samples = []
+    result = await call()  # warm-up
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(
+        f"  {label:<7} p50 {p50:8.1f} ms   p99 {p99:8.1f} ms   "
+        f"days={len(result)} activities={sum(result.values())}"
+    )
+
+
+async def _source_rows(learner_id: str) -> int:
+    cut_off = (datetime.now(timezone.utc) - timedelta(days=365)).date().isoformat()
+    total = 0
+    for table, column in (
+        ("daily_missions", "assigned_date"),
+        ("interview_sessions", "created_at"),
+        ("event_log", "created_at"),
+    ):
+        response = await queries._run_query(
+            queries.supabase.table(table).select("id", count="exact", head=True)
+            .eq("learner_id", learner_id).gte(column, cut_off)
+        )
+        total += response.count or 0
+    return total
+
+
+async def main(args) -> None:
+    admin = None
+    if args.seed_events:
+        if not settings.SUPABASE_SERVICE_ROLE_KEY:
+            print("--seed-events requires SUPABASE_SERVICE_ROLE_KEY")
+            return
+        admin = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+        _seed(admin, args.learner_id, args.seed_events)
+
+    set_request_jwt(args.token)
+    try:
+        print(f"source rows in window: {await _source_rows(args.learner_id)}\n")
+        await _measure("scan", args.iterations,
+                       lambda: queries._get_daily_activity_legacy(args.learner_id))
+        await _measure("rollup", args.iterations,
+                       lambda: queries.get_daily_activity(args.learner_id))
+    finally:
+        if admin is not None and not args.keep:
+            _cleanup(admin, args.learner_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner-id", required=True)
+    parser.add_argument("--token", required=True, help="Supabase access token for the learner")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seed-events", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="Keep seeded events")
+    asyncio.run(main(parser.parse_args()))
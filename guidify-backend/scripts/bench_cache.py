@@ -0,0 +1,130 @@
+"""
+Cache throughput benchmark — legacy sync client vs. CacheService.
+
+Runs the same get/set workload from N concurrent asyncio tasks against a live
+Redis, first through the old pattern (sync `redis` client + json.dumps called
+from coroutines, blocking the loop) and then through app.core.cache
+(redis.asyncio pool, orjson, compression, MGET/pipelined batches).
+
+Usage:
+    python scripts/bench_cache.py                          # defaults
+    python scripts/bench_cache.py --ops 20000 --concurrency 200 --payload-bytes 4096
+
+Environment:
+    REDIS_URL   redis://localhost:6379/0 (a scratch database is recommended —
+                keys are written under the "bench:" prefix and deleted afterwards)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import redis  # noqa: E402
+
+from app.core.cache import CacheService  # noqa: E402
+from app.core.config import settings  # noqa: E402
+
+
+def _payload(size: int) -> dict:
+    """A dashboard-shaped payload of roughly `size` serialized bytes."""
+    skills = [f"skill-{i}" for i in range(max(1, size // 40))]
+    return {"streak_days": 7, "current_phase": "Phase 2: Data", "skills": skills}
+
+
+async def _run(label: str, ops: int, concurrency: int, op) -> float:
+    queue = asyncio.Queue()
+    for i in range(ops):
+        queue.put_nowait(i)
+
+    async def worker():
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await op(i)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    rate = ops / elapsed
+    print(f"  {label:<34} {rate:>12,.0f} ops/s  ({elapsed:.2f}s)")
+    return rate
+
+
+async def main(args) -> None:
+    value = _payload(args.payload_bytes)
+    keys = [f"bench:{i % args.keyspace}" for i in range(args.ops)]
+
+    print(f"Redis: {settings.REDIS_URL}")
+    print(f"ops={args.ops} concurrency={args.concurrency} payload≈{len(json.dumps(value))}B\n")
+
+    # ── Legacy: sync client from async code (blocks the event loop) ─────
+    legacy = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+    async def legacy_set(i):
+        legacy.setex(keys[i], 300, json.dumps(value))
+
+    async def legacy_get(i):
+        data = legacy.get(keys[i])
+        json.loads(data) if data else None
+
+    print("legacy (sync redis + json)")
+    legacy_rates = (
+        await _run("set", args.ops, args.concurrency, legacy_set),
+        await _run("get", args.ops, args.concurrency, legacy_get),
+    )
+
+    # ── CacheService: pooled asyncio client ─────────────────────────────
+    service = CacheService()
+
+    async def async_set(i):
+        await service.set(keys[i], value, ttl=300)
+
+    async def async_get(i):
+        await service.get(keys[i])
+
+    batch = args.batch_size
+
+    async def async_get_many(i):
+        await service.get_many(keys[i:i + batch])
+
+    async def async_set_many(i):
+        await service.set_many({k: value for k in keys[i:i + batch]}, ttl=300)
+
+    print("\nCacheService (redis.asyncio pool + orjson)")
+    async_rates = (
+        await _run("set", args.ops, args.concurrency, async_set),
+        await _run("get", args.ops, args.concurrency, async_get),
+    )
+    batches = args.ops // batch
+    get_many_rate = await _run(f"get_many x{batch} (keys/s)", batches, args.concurrency,
+                               lambda i: async_get_many(i * batch))
+    set_many_rate = await _run(f"set_many x{batch} (keys/s)", batches, args.concurrency,
+                               lambda i: async_set_many(i * batch))
+
+    print("\nspeed-up vs legacy")
+    print(f"  set       {async_rates[0] / legacy_rates[0]:.1f}x")
+    print(f"  get       {async_rates[1] / legacy_rates[1]:.1f}x")
+    print(f"  get_many  {get_many_rate * batch / legacy_rates[1]:.1f}x (per key)")
+    print(f"  set_many  {set_many_rate * batch / legacy_rates[0]:.1f}x (per key)")
+
+    await service.delete(*{k for k in keys})
+    await service.close()
+    legacy.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--payload-bytes", type=int, default=2048)
+    parser.add_argument("--keyspace", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
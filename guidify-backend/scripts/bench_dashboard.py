@@ -0,0 +1,90 @@
+"""
+Dashboard latency benchmark — multi-query fan-out vs. get_dashboard_summary RPC.
+
+Calls the three dashboard read paths for one learner against a live Supabase
+project and prints p50/p99 latencies:
+
+    legacy   get_active_roadmap + calculate_streak + learner/profile lookups
+             (four to five PostgREST round trips, full phases JSON)
+    rpc      one get_dashboard_summary call (migration 019)
+    cached   GET /dashboard handler with a warm Redis entry
+
+Usage:
+    python scripts/bench_dashboard.py --learner-id <uuid> --token <access token>
+    python scripts/bench_dashboard.py --learner-id ... --token ... --iterations 500 --concurrency 10
+
+The token must belong to the learner (RLS applies). Requires migration 019 for
+the rpc row, and REDIS_URL for the cached row (skipped when Redis is down).
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app.api.dashboard import _build_dashboard, get_dashboard  # noqa: E402
+from app.core.cache import cache  # noqa: E402
+from app.db import queries  # noqa: E402
+from app.services.supabase_client import set_request_jwt  # noqa: E402
+
+
+async def _measure(label: str, iterations: int, concurrency: int, call) -> None:
+    samples = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            samples.append((time.perf_counter() - start) * 1000)
+
+    await call()  # warm-up (connection setup, plan cache)
+    await asyncio.gather(*(one() for _ in range(iterations)))
+    samples.sort()
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"  {label:<8} p50 {p50:8.1f} ms   p99 {p99:8.1f} ms   (n={len(samples)})")
+
+
+async def main(args) -> None:
+    learner_id = args.learner_id
+    set_request_jwt(args.token)
+    print(f"learner={learner_id} iterations={args.iterations} concurrency={args.concurrency}\n")
+
+    async def legacy():
+        _build_dashboard(await queries._get_dashboard_summary_legacy(learner_id))
+
+    async def rpc():
+        response = await queries._run_query(
+            queries.supabase.rpc("get_dashboard_summary", {"p_learner_id": learner_id})
+        )
+        _build_dashboard(response.data)
+
+    async def cached():
+        await get_dashboard(learner_id=learner_id)
+
+    await _measure("legacy", args.iterations, args.concurrency, legacy)
+    await _measure("rpc", args.iterations, args.concurrency, rpc)
+
+    await get_dashboard(learner_id=learner_id)
+    if cache.available:
+        await _measure("cached", args.iterations, args.concurrency, cached)
+    else:
+        print("  cached   skipped (Redis unavailable)")
+
+    await queries.invalidate_dashboard(learner_id)
+    await cache.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner-id", required=True)
+    parser.add_argument("--token", required=True, help="Supabase access token for the learner")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,80 @@
+"""
+Decision engine benchmark — uncached evaluate vs. cached evaluate vs. evaluate_batch.
+
+Builds --submissions full yes/maybe/no submissions drawn from a pool of
+--distinct answer vectors (real traffic repeats heavily) and prints
+submissions per second:
+
+    uncached   evaluate with the result cache cleared before every call
+    cached     evaluate with the result cache warm from earlier calls
+    batch      evaluate_batch over every submission, from a cold cache
+
+Then checks that every batch result equals the uncached result; exits 1 on
+any difference.
+
+Usage:
+    python scripts/bench_decision_engine.py
+    python scripts/bench_decision_engine.py --submissions 50000 --distinct 500 --seed 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app.models.psychometric_test_schemas import AnswerSubmission  # noqa: E402
+from app.services import psychometric_decision_engine as engine  # noqa: E402
+
+Engine = engine.PsychometricDecisionEngine
+
+
+def _submissions(n: int, distinct: int, seed: int):
+    rng = random.Random(seed)
+    pool = [
+        [AnswerSubmission(question_id=q["id"], answer=rng.choice(engine.CHOICES)) for q in engine.QUESTION_BANK]
+        for _ in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(n)]
+
+
+def _timed(label: str, n: int, call):
+    start = time.perf_counter()
+    result = call()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<9} {n / elapsed:12,.0f} submissions/s   {elapsed * 1000:9.1f} ms")
+    return result
+
+
+def _uncached(submissions):
+    results = []
+    for answers in submissions:
+        engine._result_cache.clear()
+        results.append(Engine.evaluate(answers))
+    return results
+
+
+def main(args) -> int:
+    submissions = _submissions(args.submissions, args.distinct, args.seed)
+    print(f"submissions={args.submissions} distinct={args.distinct}\n")
+
+    uncached = _timed("uncached", args.submissions, lambda: _uncached(submissions))
+    engine._result_cache.clear()
+    _timed("cached", args.submissions, lambda: [Engine.evaluate(answers) for answers in submissions])
+    engine._result_cache.clear()
+    batch = _timed("batch", args.submissions, lambda: Engine.evaluate_batch(submissions))
+
+    mismatches = sum(1 for a, b in zip(uncached, batch) if a.model_dump() != b.model_dump())
+    print(f"\nidentical: {args.submissions - mismatches}/{args.submissions}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submissions", type=int, default=10000)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    sys.exit(main(parser.parse_args()))
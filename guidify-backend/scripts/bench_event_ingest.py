@@ -0,0 +1,79 @@
+"""
+Event ingestion benchmark — one event per request vs. POST /adaptation/events/batch.
+
+Logs --events events for one learner against a live Supabase project, --rounds
+times each way, and prints events/second and per-round latency:
+
+    single   one RulesEngine.evaluate_and_trigger per event (what N calls to
+             POST /adaptation/event cost, minus HTTP)
+    batch    one RulesEngine.evaluate_batch for all of them (one bulk insert,
+             one rules-state update, one trigger evaluation)
+
+The events are --event-type (default skill_gap_analysis_run, which matches no
+trigger) so the run measures ingestion, not adaptation jobs. They are real
+rows in the learner's event_log; use a test account.
+
+Usage:
+    python scripts/bench_event_ingest.py --learner-id <uuid> --token <access token>
+    python scripts/bench_event_ingest.py --learner-id ... --token ... --events 50 --rounds 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app.core.cache import cache  # noqa: E402
+from app.services.rules_engine import RulesEngine  # noqa: E402
+from app.services.supabase_client import set_request_jwt  # noqa: E402
+
+
+async def _measure(label: str, rounds: int, events: int, call) -> None:
+    samples = []
+    await call()  # warm-up (connection setup, rules state cached)
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - start)
+    total = sum(samples)
+    p50 = statistics.median(samples) * 1000
+    print(
+        f"  {label:<7} {rounds * events / total:8.1f} events/s   "
+        f"p50 {p50:8.1f} ms per {events} events   (rounds={rounds})"
+    )
+
+
+async def main(args) -> None:
+    set_request_jwt(args.token)
+    engine = RulesEngine()
+    events = [
+        {"event_type": args.event_type, "payload": {"source": "bench_event_ingest", "seq": i}}
+        for i in range(args.events)
+    ]
+    print(f"learner={args.learner_id} events={args.events} rounds={args.rounds}\n")
+
+    async def single():
+        for event in events:
+            await engine.evaluate_and_trigger(args.learner_id, event["event_type"], event["payload"])
+
+    async def batch():
+        await engine.evaluate_batch(args.learner_id, events)
+
+    await _measure("single", args.rounds, args.events, single)
+    await _measure("batch", args.rounds, args.events, batch)
+    await cache.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner-id", required=True)
+    parser.add_argument("--token", required=True, help="Supabase access token for the learner")
+    parser.add_argument("--events", type=int, default=20, help="Events per round (max 100 per batch request)")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--event-type", default="skill_gap_analysis_run")
+    asyncio.run(main(parser.parse_args()))
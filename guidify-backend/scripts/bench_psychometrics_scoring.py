@@ -0,0 +1,82 @@
+"""
+Psychometrics scoring benchmark — per-dict scoring vs. score_batch.
+
+Scores --sets random response sets (with skipped items and out-of-range
+values) three ways and prints response sets per second:
+
+    per-dict   score_ipip + score_riasec + score_grit per answers dict
+    batch      answers_to_matrix + score_batch (including matrix assembly)
+    matrix     score_batch alone on a prebuilt matrix (bulk imports that
+               already hold a matrix)
+
+Then checks that every batch score equals the per-dict score; exits 1 on
+any difference.
+
+Usage:
+    python scripts/bench_psychometrics_scoring.py
+    python scripts/bench_psychometrics_scoring.py --sets 50000 --seed 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app.services import psychometrics_scoring as scoring  # noqa: E402
+
+
+def _answer_sets(n: int, seed: int):
+    rng = random.Random(seed)
+    item_ids = scoring.batch_item_ids()
+    sets = []
+    for _ in range(n):
+        keep = rng.choice([0.3, 0.8, 1.0, 1.0])
+        sets.append({
+            item_id: rng.choice([0, 1, 2, 3, 4, 5, 6])
+            for item_id in item_ids if rng.random() < keep
+        })
+    return sets
+
+
+def _timed(label: str, n: int, call):
+    start = time.perf_counter()
+    result = call()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<9} {n / elapsed:12,.0f} sets/s   {elapsed * 1000:9.1f} ms")
+    return result
+
+
+def main(args) -> int:
+    answer_sets = _answer_sets(args.sets, args.seed)
+    matrix = scoring.answers_to_matrix(answer_sets)
+    scoring.score_batch(matrix[:1])  # compile configs outside the timings
+    print(f"sets={args.sets} items={matrix.shape[1]}\n")
+
+    per_dict = _timed("per-dict", args.sets, lambda: [
+        (scoring.score_ipip(a), scoring.score_riasec(a), scoring.score_grit(a)) for a in answer_sets
+    ])
+    _timed("batch", args.sets, lambda: scoring.score_batch(scoring.answers_to_matrix(answer_sets)))
+    batch = _timed("matrix", args.sets, lambda: scoring.score_batch(matrix))
+
+    mismatches = 0
+    for i, (ipip, riasec, grit) in enumerate(per_dict):
+        batch_grit = int(batch["grit"][i]) if batch["grit_answered"][i] else None
+        if (
+            {t: int(v[i]) for t, v in batch["ipip"].items()} != ipip
+            or {d: int(v[i]) for d, v in batch["riasec"].items()} != riasec
+            or batch_grit != grit
+        ):
+            mismatches += 1
+    print(f"\nidentical: {args.sets - mismatches}/{args.sets}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sets", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    sys.exit(main(parser.parse_args()))
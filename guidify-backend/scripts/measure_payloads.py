@@ -0,0 +1,104 @@
+"""
+Payload measurement — select("*") vs. per-call-site projections.
+
+For one learner, runs each query behind the listed endpoints twice, once with
+select("*") (the previous behaviour) and once with the projection the call
+site now passes, and reports the response body size per endpoint.
+
+Sizes are the compact JSON encoding of the returned rows, which is what
+PostgREST puts on the wire (before any HTTP compression).
+
+Usage:
+    python scripts/measure_payloads.py --learner-id <uuid> --token <access token>
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app.db import queries  # noqa: E402
+from app.services.supabase_client import set_request_jwt  # noqa: E402
+
+LEARNER = ("learners", queries.LEARNER_TARGETING)
+PROFILE = ("learner_profiles", queries.PROFILE_SUMMARY)
+
+# endpoint → [(table, projection now used by the call site)]
+CALL_SITES = {
+    # The roadmap is read through get_active_roadmap_view (scripts/measure_roadmap_storage.py)
+    "GET /missions/today (generate)": [LEARNER, PROFILE],
+    "POST /missions/{id}/complete": [("daily_missions", queries.MISSION_REF)],
+    "POST /interview/session": [LEARNER, PROFILE],
+    "GET /interview/session/{id}": [("interview_sessions", queries.SESSION_DETAIL)],
+    "POST /interview/session/{id}/delivery-metrics": [("interview_sessions", queries.SESSION_CONSENT)],
+    "GET /profile/me": [("learners", queries.LEARNER_IDENTITY), PROFILE],
+    "PATCH /profile/target-role": [LEARNER, ("roadmaps", queries.ROADMAP_REF)],
+    "POST /roadmap/regenerate": [LEARNER, PROFILE],
+    "POST /resume/match-jd": [("resumes", queries.RESUME_PARSED), LEARNER],
+    "GET /dashboard (legacy fallback)": [
+        ("learners", "id, category_scores"),
+        ("learner_profiles", "id, questionnaire_data"),
+        ("roadmaps", "id, current_phase_number, total_phases, progress_pct, phases"),
+    ],
+}
+
+
+def _query(table: str, columns: str, learner_id: str):
+    """The row lookup each call site performs, keyed the same way."""
+    query = queries.supabase.table(table).select(columns)
+    if table == "learners":
+        return query.eq("id", learner_id)
+    query = query.eq("learner_id", learner_id)
+    if table == "roadmaps":
+        return query.eq("status", "active").order("version", desc=True).limit(1)
+    if table == "resumes":
+        return query.eq("is_current", True).order("created_at", desc=True).limit(1)
+    if table == "daily_missions":
+        return query.order("assigned_date", desc=True).limit(1)
+    return query.order("created_at", desc=True).limit(1)
+
+
+async def _size(table: str, columns: str, learner_id: str) -> int:
+    response = await queries._run_query(_query(table, columns, learner_id))
+    return len(json.dumps(response.data, separators=(",", ":"), default=str))
+
+
+async def main(args) -> None:
+    set_request_jwt(args.token)
+    sizes = defaultdict(lambda: [0, 0])
+
+    for endpoint, sites in CALL_SITES.items():
+        for table, columns in sites:
+            before, after = await asyncio.gather(
+                _size(table, "*", args.learner_id),
+                _size(table, columns, args.learner_id),
+            )
+            sizes[endpoint][0] += before
+            sizes[endpoint][1] += after
+
+    dashboard_rpc = await queries._run_query(
+        queries.supabase.rpc("get_dashboard_summary", {"p_learner_id": args.learner_id})
+    )
+    rpc_bytes = len(json.dumps(dashboard_rpc.data, separators=(",", ":"), default=str))
+
+    print(f"{'endpoint':<48} {'select *':>10} {'projected':>10} {'saved':>7}")
+    total_before = total_after = 0
+    for endpoint, (before, after) in sizes.items():
+        total_before += before
+        total_after += after
+        saved = (1 - after / before) * 100 if before else 0
+        print(f"{endpoint:<48} {before:>9,}B {after:>9,}B {saved:>6.0f}%")
+    print(f"{'total':<48} {total_before:>9,}B {total_after:>9,}B")
+    print(f"\nGET /dashboard via get_dashboard_summary RPC: {rpc_bytes:,}B")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner-id", required=True)
+    parser.add_argument("--token", required=True, help="Supabase access token for the learner")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,84 @@
+"""
+Roadmap storage measurement — whole document vs. addressable phases (migration 029).
+
+For one learner's active roadmap, reports:
+
+    reads   response size of the full roadmap row (GET /roadmap/current) vs.
+            get_active_roadmap_view summary and single-phase reads
+    writes  per operation, the request body sent and the JSON rewritten in
+            the database: completing a phase by rewriting the roadmap document
+            vs. advance_roadmap_phase
+
+Write figures are computed from the fetched row; nothing is written.
+
+Sizes are compact JSON encodings, as PostgREST puts them on the wire.
+
+Usage:
+    python scripts/measure_roadmap_storage.py --learner-id <uuid> --token <access token>
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app.db import queries  # noqa: E402
+from app.services.supabase_client import set_request_jwt  # noqa: E402
+
+
+def _bytes(value) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+async def _view(learner_id: str, view: str):
+    response = await queries._run_query(
+        queries.supabase.rpc("get_active_roadmap_view", {
+            "p_view": view, "p_phase_number": None, "p_learner_id": learner_id,
+        })
+    )
+    return response.data
+
+
+async def main(args) -> int:
+    set_request_jwt(args.token)
+    full, summary, phase = await asyncio.gather(
+        queries.get_active_roadmap(args.learner_id),
+        _view(args.learner_id, "summary"),
+        _view(args.learner_id, "phase"),
+    )
+    if not full:
+        print("No active roadmap for this learner.")
+        return 1
+    full = dict(full)
+    phases = full.get("phases") or []
+
+    print(f"{'read':<40} {'bytes':>10}")
+    for label, body in [
+        ("full roadmap row", full),
+        ("get_active_roadmap_view summary", summary),
+        ("get_active_roadmap_view phase", phase),
+    ]:
+        print(f"{label:<40} {_bytes(body):>9,}B")
+
+    progress = {"current_phase_number": 2, "progress_pct": 50}
+    doc_rewrite = _bytes(phases)
+    print(f"\n{'write':<40} {'request':>10} {'json rewritten':>16}")
+    for label, request, rewritten in [
+        ("complete phase: rewrite document", {**progress, "phases": phases}, doc_rewrite),
+        ("complete phase: advance_roadmap_phase", {
+            "p_roadmap_id": full["id"], "p_completed_phase": 1, "p_learner_id": args.learner_id,
+        }, 0),
+    ]:
+        print(f"{label:<40} {_bytes(request):>9,}B {rewritten:>15,}B")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner-id", required=True)
+    parser.add_argument("--token", required=True, help="Supabase access token for the learner")
+    sys.exit(asyncio.run(main(parser.parse_args())))
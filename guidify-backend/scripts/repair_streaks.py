@@ -0,0 +1,50 @@
+"""
+Repair materialized completion streaks (migration 021).
+
+Recomputes learners.current_streak / longest_streak / last_completion_date
+from completed daily_missions. Run once after applying migration 021, and
+periodically (e.g. a nightly cron) to correct any drift from manual edits.
+
+Usage:
+    python scripts/repair_streaks.py                      # every learner, one set-based statement
+    python scripts/repair_streaks.py --learner-id <uuid>  # single learner
+
+Environment:
+    SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
+"""
+
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from supabase import create_client  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+
+
+def main(args) -> int:
+    if not settings.SUPABASE_SERVICE_ROLE_KEY:
+        print("SUPABASE_SERVICE_ROLE_KEY is not set.")
+        return 1
+    client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+
+    start = time.perf_counter()
+    try:
+        response = client.rpc(
+            "recompute_learner_streak", {"p_learner_id": args.learner_id}
+        ).execute()
+    except Exception as e:
+        print(f"Streak repair failed: {e}")
+        return 1
+    print(f"Repaired {int(response.data or 0)} learners in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner-id", help="Repair a single learner")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,144 @@
+"""
+Replay rules state from event_log and check it against the legacy computation.
+
+For each learner, rebuilds the Rules Engine state from event_log
+(app/services/rules_state.py) and compares it with what the engine used to
+compute per event from daily_missions:
+
+    consecutive_failures  leading failed/too_hard missions (last 10)
+    fast_streak           leading missions completed in <50% of the estimate
+    last_regeneration     queries.get_last_regeneration
+    in_debounce_window    24h window on last_regeneration
+    outcomes              every outcome in the rebuilt window matches the
+                          status of its daily_missions row (catches outcome
+                          events the missions API did not log)
+
+Only finished missions (completed/failed/too_hard/skipped) are compared: the
+engine evaluated mission events after the mission's own row was updated, so a
+pending or in-progress row never preceded it. Missions finished before
+outcome events were logged have no events; such learners are reported as
+"short history" and skipped unless --strict. With --check-cache the cached
+state (if any) is also compared with the rebuilt one.
+
+Exits 1 if any learner mismatches.
+
+Usage:
+    python scripts/replay_rules_state.py                       # up to --limit learners
+    python scripts/replay_rules_state.py --learner-id <uuid> --check-cache
+
+Environment:
+    SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY (and REDIS_URL for --check-cache)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from supabase import create_client  # noqa: E402
+
+from app.core.cache import cache  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.db import queries  # noqa: E402
+from app.services import rules_state  # noqa: E402
+from app.services.rules_engine import RulesEngine  # noqa: E402
+from app.services.supabase_client import bind_db_client  # noqa: E402
+
+FINISHED = set(rules_state.OUTCOME_EVENTS.values())
+COMPARED = ("consecutive_failures", "fast_streak", "last_regeneration", "in_debounce_window")
+
+
+def legacy_state(missions, last_regeneration):
+    """The engine's per-event computation over daily_missions (newest first)."""
+    finished = [m for m in missions if m.get("status") in FINISHED][: settings.RULES_STATE_WINDOW]
+    return {
+        "consecutive_failures": rules_state.leading(finished, rules_state.is_failure),
+        "fast_streak": rules_state.leading(finished, rules_state.is_fast),
+        "last_regeneration": last_regeneration,
+        "in_debounce_window": RulesEngine._in_debounce_window({"last_regeneration": last_regeneration}),
+        "finished": len(finished),
+    }
+
+
+def compare(rebuilt, legacy):
+    view = {**rebuilt, "in_debounce_window": RulesEngine._in_debounce_window(rebuilt)}
+    return {k: (view[k], legacy[k]) for k in COMPARED if view[k] != legacy[k]}
+
+
+def unmatched_outcomes(rebuilt, missions):
+    """Rebuilt outcomes whose mission is not among `missions` with that status."""
+    statuses = {m.get("id"): m.get("status") for m in missions}
+    return [
+        (o.get("mission_id"), o.get("status"), statuses.get(o.get("mission_id")))
+        for o in rebuilt["outcomes"]
+        if statuses.get(o.get("mission_id")) != o.get("status")
+    ]
+
+
+async def replay(learner_id, args):
+    window = settings.RULES_STATE_WINDOW
+    events, missions, last_regeneration = await asyncio.gather(
+        queries.get_events_by_types(learner_id, rules_state.STATE_EVENTS, limit=settings.RULES_STATE_REBUILD_EVENTS),
+        queries.get_recent_missions(learner_id, limit=window * 2),
+        queries.get_last_regeneration(learner_id),
+    )
+    rebuilt = rules_state.rebuild(events, last_regeneration)
+    legacy = legacy_state(missions, last_regeneration)
+
+    if rebuilt["missions"] < legacy["finished"]:
+        return "short history", {}
+
+    diffs = compare(rebuilt, legacy)
+    unmatched = unmatched_outcomes(rebuilt, missions)
+    if unmatched:
+        diffs["outcomes"] = unmatched
+    if args.check_cache:
+        cached = await cache.get(rules_state.cache_key(learner_id))
+        if cached is not None:
+            diffs.update({
+                f"cache.{k}": (cached.get(k), rebuilt[k])
+                for k in ("consecutive_failures", "fast_streak", "missions")
+                if cached.get(k) != rebuilt[k]
+            })
+    return ("mismatch" if diffs else "ok"), diffs
+
+
+async def main(args) -> int:
+    if not settings.SUPABASE_SERVICE_ROLE_KEY:
+        print("SUPABASE_SERVICE_ROLE_KEY is not set.")
+        return 1
+    client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+
+    with bind_db_client(client):
+        if args.learner_id:
+            learner_ids = [args.learner_id]
+        else:
+            response = client.table("learners").select("id").limit(args.limit).execute()
+            learner_ids = [row["id"] for row in response.data or []]
+
+        counts = {"ok": 0, "mismatch": 0, "short history": 0}
+        for learner_id in learner_ids:
+            result, diffs = await replay(learner_id, args)
+            if result == "short history" and args.strict:
+                result = "mismatch"
+            counts[result] += 1
+            if result != "ok":
+                print(f"{learner_id}: {result} {diffs or ''}".rstrip())
+
+    print(
+        f"{len(learner_ids)} learners: {counts['ok']} ok, "
+        f"{counts['mismatch']} mismatched, {counts['short history']} short history"
+    )
+    return 1 if counts["mismatch"] else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learner-id", help="Replay a single learner")
+    parser.add_argument("--limit", type=int, default=500, help="Learners to replay (default 500)")
+    parser.add_argument("--strict", action="store_true", help="Count short histories as mismatches")
+    parser.add_argument("--check-cache", action="store_true", help="Also compare the cached state")
+    sys.exit(asyncio.run(main(parser.parse_args())))
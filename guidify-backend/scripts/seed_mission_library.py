@@ -0,0 +1,102 @@
+"""
+Seed the mission template library (migration 028) from past generations.
+
+Reads existing daily_missions, skips the generic fallback missions written when
+mission.generate failed, and adds each remaining mission under its library key
+(learner target_role, target_skill, difficulty, minutes bucket) through
+add_mission_template, which caps variants per key and ignores duplicate titles.
+Safe to re-run.
+
+Usage:
+    python scripts/seed_mission_library.py              # all missions
+    python scripts/seed_mission_library.py --dry-run    # report keys only
+
+Environment:
+    SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from supabase import create_client  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.services import mission_library  # noqa: E402
+
+PAGE_SIZE = 1000
+
+
+def _is_fallback(mission: dict) -> bool:
+    """Generic missions from mission_service when generation failed."""
+    skill = mission.get("target_skill") or ""
+    return mission.get("title") == f"Practice {skill}" and str(mission.get("objective", "")).startswith("Spend ")
+
+
+def _pages(client, table: str, columns: str):
+    offset = 0
+    while True:
+        rows = (
+            client.table(table).select(columns)
+            .order("id")
+            .range(offset, offset + PAGE_SIZE - 1)
+            .execute()
+        ).data or []
+        yield from rows
+        if len(rows) < PAGE_SIZE:
+            return
+        offset += PAGE_SIZE
+
+
+def main(args) -> int:
+    if not settings.SUPABASE_SERVICE_ROLE_KEY:
+        print("SUPABASE_SERVICE_ROLE_KEY is not set.")
+        return 1
+    client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+
+    start = time.perf_counter()
+    roles = {
+        row["id"]: row.get("target_role") or "Software Developer"
+        for row in _pages(client, "learners", "id, target_role")
+    }
+    columns = "id, learner_id, " + ", ".join(mission_library.TEMPLATE_FIELDS)
+    keys = Counter()
+    added = skipped = 0
+    for mission in _pages(client, "daily_missions", columns):
+        if _is_fallback(mission) or not mission.get("title"):
+            skipped += 1
+            continue
+        key = mission_library.template_key(
+            roles.get(mission["learner_id"], "Software Developer"),
+            mission.get("target_skill") or "",
+            mission.get("difficulty") or "beginner",
+            mission.get("estimated_minutes") or 30,
+        )
+        keys[key] += 1
+        if args.dry_run:
+            continue
+        template = {f: mission[f] for f in mission_library.TEMPLATE_FIELDS if mission.get(f) is not None}
+        response = client.rpc("add_mission_template", {
+            "p_template_key": key,
+            "p_mission": template,
+            "p_max_variants": settings.MISSION_LIBRARY_MAX_VARIANTS,
+        }).execute()
+        added += bool(response.data)
+
+    print(f"{sum(keys.values())} missions across {len(keys)} keys ({skipped} fallback/empty skipped)")
+    for key, count in keys.most_common(10):
+        print(f"  {count:5d}  {key}")
+    if not args.dry_run:
+        print(f"Added {added} templates in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Count keys without writing")
+    sys.exit(main(parser.parse_args()))
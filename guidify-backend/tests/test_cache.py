@@ -0,0 +1,78 @@
+"""
+Tests for the async cache service (app.core.cache).
+
+Covers the value codec (round trip, compression threshold, legacy JSON and
+corrupt entries) and degraded behaviour when Redis is unreachable: calls must
+return immediately without raising, and the service must enter its reconnect
+state. A failing command on a live connection is a miss, not an outage.
+"""
+
+import zlib
+
+import pytest
+from redis.exceptions import ResponseError
+
+from app.core import cache as cache_module
+from app.core.cache import CacheService, decode_value, encode_value
+
+
+def test_codec_round_trip_small_value_is_not_compressed():
+    value = {"streak_days": 3, "skills": ["Python", "SQL"], "score": 72.5}
+    encoded = encode_value(value, compress_min_bytes=1024)
+    assert encoded[:1] == b"\x00"
+    assert decode_value(encoded) == value
+
+
+def test_codec_compresses_above_threshold():
+    value = {"phases": [{"title": f"Phase {i}", "skills": ["Python"] * 20} for i in range(20)]}
+    encoded = encode_value(value, compress_min_bytes=256)
+    assert encoded[:1] == b"\x01"
+    assert len(encoded) < len(encode_value(value, compress_min_bytes=0))
+    assert decode_value(encoded) == value
+
+
+def test_codec_reads_legacy_plain_json_entries():
+    assert decode_value(b'{"a": 1}') == {"a": 1}
+    assert decode_value(None) is None
+    assert decode_value(b"\x00not-json") is None
+
+
+def test_codec_treats_corrupt_compressed_entries_as_misses():
+    assert decode_value(b"\x01not-zlib") is None
+    assert decode_value(b"\x01" + zlib.compress(b"not-json")) is None
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_degrades_without_raising(monkeypatch):
+    # Keep the reconnect loop from retrying during the test.
+    monkeypatch.setattr(cache_module, "_BACKOFF_INITIAL", 60.0)
+    service = CacheService(url="redis://127.0.0.1:1/0", socket_timeout=0.2)
+
+    assert await service.get("missing") is None
+    assert service.available is False
+
+    # Subsequent calls short-circuit while the reconnect loop is pending.
+    assert await service.set("k", {"v": 1}) is False
+    assert await service.get_many(["a", "b"]) == {}
+    assert await service.set_many({"a": 1}) is False
+    assert await service.delete("a") == 0
+
+    await service.close()
+    assert service.available is True
+
+
+@pytest.mark.asyncio
+async def test_command_errors_do_not_mark_the_cache_down():
+    class WrongTypeRedis:
+        async def get(self, key):
+            raise ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+
+        async def set(self, *args, **kwargs):
+            return True
+
+    service = CacheService(url="redis://127.0.0.1:1/0")
+    service._client = lambda: WrongTypeRedis()
+
+    assert await service.get("a-hash") is None
+    assert service.available is True
+    assert await service.set("k", {"v": 1}) is True
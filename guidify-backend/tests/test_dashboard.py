@@ -0,0 +1,194 @@
+"""
+Tests for GET /api/v1/dashboard — api.md §6.
+
+Covers the cached single-summary path:
+    - legacy fan-out fallback (no get_dashboard_summary RPC) produces the same
+      response the handler built before the aggregate existed
+    - a second request is served from the per-learner cache entry
+    - invalidate_dashboard drops that entry
+
+and GET /dashboard/activity-heatmap reading the learner_daily_activity rollup.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api import dashboard
+from app.core.auth import get_current_learner_id
+from app.db import queries
+
+ROADMAP = {
+    "current_phase_number": 2,
+    "total_phases": 3,
+    "progress_pct": 0,
+    "phases": [
+        {"phase_number": 1, "title": "Phase 1: Foundations", "difficulty": "beginner",
+         "skills": ["Python", "Statistics", "Git", "SQL"], "description": "..."},
+        {"phase_number": 2, "title": "Phase 2: Machine Learning", "difficulty": "intermediate",
+         "skills": ["scikit-learn"], "description": "..."},
+        {"phase_number": 3, "title": "Phase 3: Job Readiness", "difficulty": "advanced",
+         "skills": ["Portfolio"], "description": "..."},
+    ],
+}
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=3600):
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for k in keys if self.store.pop(k, None) is not None)
+
+
+class FakeQuery:
+    """Chainable stand-in for a PostgREST query builder."""
+
+    def __init__(self, data, log):
+        self.data = data
+        self.log = log
+
+    def __getattr__(self, name):
+        def chain(*args, **kwargs):
+            self.log.append((name, args))
+            return self
+        return chain
+
+    def execute(self):
+        return type("Response", (), {"data": self.data})()
+
+
+class _NoRPC:
+    def rpc(self, *args, **kwargs):
+        raise RuntimeError("function get_dashboard_summary does not exist")
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    fake = FakeCache()
+    monkeypatch.setattr(dashboard, "cache", fake)
+    monkeypatch.setattr(queries, "cache", fake)
+    return fake
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_learner_id] = lambda: "test_user"
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def legacy_db(monkeypatch):
+    calls = {"roadmap": 0}
+
+    async def get_active_roadmap(learner_id, columns="*"):
+        calls["roadmap"] += 1
+        return dict(ROADMAP)
+
+    async def calculate_streak(learner_id):
+        return 4
+
+    async def get_learner(learner_id, columns="*"):
+        return {"id": learner_id, "category_scores": {"Technical": 80}}
+
+    async def get_learner_profile(learner_id, columns="*"):
+        raise AssertionError("profile lookup not needed when learners has scores")
+
+    monkeypatch.setattr(queries, "supabase", _NoRPC())
+    monkeypatch.setattr(queries, "get_active_roadmap", get_active_roadmap)
+    monkeypatch.setattr(queries, "calculate_streak", calculate_streak)
+    monkeypatch.setattr(queries, "get_learner", get_learner)
+    monkeypatch.setattr(queries, "get_learner_profile", get_learner_profile)
+    return calls
+
+
+def test_legacy_fallback_builds_dashboard(client, fake_cache, legacy_db):
+    response = client.get("/api/v1/dashboard")
+    assert response.status_code == 200
+    body = response.json()
+
+    assert body["streak_days"] == 4
+    assert body["current_phase"] == "Phase 2: Machine Learning"
+    assert body["roadmap_progress_pct"] == 33  # estimated from phase position
+    assert body["placement_readiness"] == 33
+    assert body["category_scores"] == {"Technical": 80}
+    assert body["recommended_courses"] == []
+    assert [s["skill"] for s in body["skill_graph"]] == [
+        "Python", "Statistics", "Git", "scikit-learn", "Portfolio",
+    ]
+    assert body["skill_graph"][0] == {"skill": "Python", "level": 3, "target_level": 3}
+    assert body["skill_graph"][3] == {"skill": "scikit-learn", "level": 1, "target_level": 3}
+    assert body["skill_graph"][4] == {"skill": "Portfolio", "level": 0, "target_level": 4}
+
+
+def test_second_request_served_from_cache(client, fake_cache, legacy_db):
+    first = client.get("/api/v1/dashboard").json()
+    second = client.get("/api/v1/dashboard").json()
+
+    assert first == second
+    assert legacy_db["roadmap"] == 1
+    assert queries.dashboard_cache_key("test_user") in fake_cache.store
+
+
+@pytest.mark.asyncio
+async def test_invalidate_dashboard_drops_entry(fake_cache):
+    key = queries.dashboard_cache_key("test_user")
+    fake_cache.store[key] = {"streak_days": 1}
+
+    await queries.invalidate_dashboard("test_user")
+    assert key not in fake_cache.store
+
+    # Writes without a resolvable learner are a no-op.
+    await queries.invalidate_dashboard(None)
+
+
+def test_activity_heatmap_reads_rollup(client, monkeypatch):
+    log = []
+    rows = [
+        {"activity_date": "2026-10-01", "activity_count": 3},
+        {"activity_date": "2026-10-02", "activity_count": 0},
+        {"activity_date": "2026-10-05", "activity_count": 2},
+    ]
+
+    class RollupDB:
+        def table(self, name):
+            log.append(("table", (name,)))
+            return FakeQuery(rows, log)
+
+    async def legacy(learner_id):
+        raise AssertionError("source tables should not be scanned")
+
+    monkeypatch.setattr(queries, "supabase", RollupDB())
+    monkeypatch.setattr(queries, "_get_daily_activity_legacy", legacy)
+
+    body = client.get("/api/v1/dashboard/activity-heatmap").json()
+    assert body == {
+        "activity": {"2026-10-01": 3, "2026-10-05": 2},
+        "total_activities": 5,
+        "active_days": 2,
+    }
+    assert ("table", ("learner_daily_activity",)) in log
+    assert ("eq", ("learner_id", "test_user")) in log
+
+
+def test_activity_heatmap_falls_back_without_rollup(client, monkeypatch):
+    class MissingTableDB:
+        def table(self, name):
+            raise RuntimeError('relation "learner_daily_activity" does not exist')
+
+    async def legacy(learner_id):
+        return {"2026-10-01": 1}
+
+    monkeypatch.setattr(queries, "supabase", MissingTableDB())
+    monkeypatch.setattr(queries, "_get_daily_activity_legacy", legacy)
+
+    body = client.get("/api/v1/dashboard/activity-heatmap").json()
+    assert body["activity"] == {"2026-10-01": 1}
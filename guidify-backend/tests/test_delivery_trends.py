@@ -0,0 +1,149 @@
+"""
+Tests for the incremental delivery-trend state (app/services/delivery_trends.py).
+
+Covers:
+    - folding sessions one at a time matches a rebuild from interview history
+    - resubmitting metrics for the newest session replaces its point
+    - recording a session right after the first-use rebuild keeps history
+    - consecutive-below counters drive the rules.md §6.1 remedial trigger
+    - GET /dashboard/delivery-trends reads the stored state, not the history
+"""
+
+import pytest
+
+from app.api import dashboard
+from app.services import delivery_trends
+from app.services.rules_engine import RulesEngine
+
+
+def _session(n, eye, wpm=130, filler=0.05, camera=True, status="completed"):
+    return {
+        "id": f"s{n}",
+        "status": status,
+        "camera_enabled": camera,
+        "created_at": f"2026-10-{n:02d}T10:00:00+00:00",
+        "delivery_metrics": {
+            "eye_contact_pct": eye,
+            "posture_score": 0.8,
+            "filler_word_rate": filler,
+            "words_per_minute": wpm,
+        },
+    }
+
+
+HISTORY = [_session(n, eye) for n, eye in [(1, 60), (2, 35), (3, 70), (4, 30), (5, 20)]]
+
+
+def test_incremental_updates_match_rebuild():
+    state = None
+    for s in HISTORY:
+        state = delivery_trends.apply_session(
+            state, s["id"], s["delivery_metrics"], camera_enabled=True, date=s["created_at"]
+        )
+    rebuilt = delivery_trends.rebuild(list(reversed(HISTORY)))
+
+    assert state["metrics"] == rebuilt["metrics"]
+    eye = state["metrics"]["eye_contact_pct"]
+    assert [p["value"] for p in eye["history"]] == [60, 35, 70, 30, 20]
+    assert eye["below"] == 2
+    assert 20 < eye["ewma"] < 60
+
+
+def test_resubmission_replaces_newest_point():
+    state = delivery_trends.rebuild(list(reversed(HISTORY[:4])))
+    once = delivery_trends.apply_session(state, "s5", {"eye_contact_pct": 20})
+    again = delivery_trends.apply_session(once, "s5", {"eye_contact_pct": 55})
+
+    eye = again["metrics"]["eye_contact_pct"]
+    assert again["sessions"] == 5
+    assert [p["value"] for p in eye["history"]][-2:] == [30, 55]
+    assert eye["below"] == 0
+
+
+@pytest.mark.asyncio
+async def test_first_record_after_rebuild_keeps_history(monkeypatch):
+    # The session being recorded is already stored, so the rebuild includes it
+    history = [_session(n, eye) for n, eye in [(1, 30), (2, 25), (3, 20)]]
+    stored = {}
+
+    async def get_stats(learner_id):
+        return stored.get(learner_id)
+
+    async def save_stats(learner_id, state):
+        stored[learner_id] = state
+
+    async def get_history(learner_id, limit=10):
+        return list(reversed(history))
+
+    monkeypatch.setattr(delivery_trends.queries, "get_delivery_stats", get_stats)
+    monkeypatch.setattr(delivery_trends.queries, "save_delivery_stats", save_stats)
+    monkeypatch.setattr(delivery_trends.queries, "get_interview_history", get_history)
+
+    await delivery_trends.record_session("learner-1", "s3", history[2]["delivery_metrics"])
+
+    state = stored["learner-1"]
+    eye = state["metrics"]["eye_contact_pct"]
+    assert state["sessions"] == 3
+    assert [p["value"] for p in eye["history"]] == [30, 25, 20]
+    assert eye["below"] == 3
+    assert delivery_trends.triggered_metrics(state, 2) == ["eye_contact_pct"]
+
+
+def test_window_and_non_camera_sessions(monkeypatch):
+    monkeypatch.setattr(delivery_trends.settings, "DELIVERY_TRENDS_WINDOW", 3)
+    state = delivery_trends.rebuild(list(reversed(HISTORY[:4] + [_session(5, 20, camera=False)])))
+
+    eye = state["metrics"]["eye_contact_pct"]
+    assert [p["session_id"] for p in eye["history"]] == ["s3", "s4", "s5"]
+    # A session without the camera is charted but does not count toward the trigger
+    assert eye["below"] == 1
+
+
+@pytest.mark.asyncio
+async def test_delivery_trigger_reads_counters(monkeypatch):
+    stored = {"learner-1": delivery_trends.rebuild(list(reversed(HISTORY)))}
+
+    async def get_stats(learner_id):
+        return stored.get(learner_id)
+
+    async def no_history(*_args, **_kwargs):
+        raise AssertionError("history should not be scanned")
+
+    monkeypatch.setattr(delivery_trends.queries, "get_delivery_stats", get_stats)
+    monkeypatch.setattr(delivery_trends.queries, "get_interview_history", no_history)
+
+    result = await RulesEngine()._check_delivery_triggers("learner-1", {})
+
+    assert result["adaptation_needed"] is True
+    assert result["triggered_metrics"] == ["eye_contact_pct"]
+
+
+@pytest.mark.asyncio
+async def test_trends_endpoint_rebuilds_once_then_reads_state(monkeypatch):
+    stored = {}
+    history_reads = []
+
+    async def get_stats(learner_id):
+        return stored.get(learner_id)
+
+    async def save_stats(learner_id, state):
+        stored[learner_id] = state
+
+    async def get_history(learner_id, limit=10):
+        history_reads.append(limit)
+        return list(reversed(HISTORY))
+
+    monkeypatch.setattr(delivery_trends.queries, "get_delivery_stats", get_stats)
+    monkeypatch.setattr(delivery_trends.queries, "save_delivery_stats", save_stats)
+    monkeypatch.setattr(delivery_trends.queries, "get_interview_history", get_history)
+
+    first = await dashboard.get_delivery_trends(learner_id="learner-1")
+    await delivery_trends.record_session("learner-1", "s6", {"eye_contact_pct": 45})
+    second = await dashboard.get_delivery_trends(learner_id="learner-1")
+
+    assert len(history_reads) == 1
+    eye = {t.metric: t for t in second.trends}["eye_contact_pct"]
+    # Newest first
+    assert [p.value for p in eye.history] == [45, 20, 30, 70, 35, 60]
+    assert eye.ewma is not None
+    assert len(first.trends) == 4
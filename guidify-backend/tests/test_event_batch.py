@@ -0,0 +1,161 @@
+"""
+Tests for batched event ingestion (POST /adaptation/events/batch):
+one bulk insert in order, per-event results, the per-row fallback, a
+single trigger evaluation over the combined window, and refusing mission
+outcomes (those are logged by the missions API).
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.auth import get_current_learner_id
+from app.db import queries
+from app.services import rules_engine, rules_state
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=3600):
+        self.store[key] = value
+        return True
+
+
+class FakeInsert:
+    def __init__(self, db, rows):
+        self.db = db
+        self.rows = rows
+
+    def execute(self):
+        self.db.inserts.append(self.rows)
+        rows = self.rows if isinstance(self.rows, list) else [self.rows]
+        if len(rows) > 1 and self.db.reject_bulk:
+            raise RuntimeError("insert or update on table event_log violates foreign key constraint")
+        if any(row.get("related_mission_id") == "missing" for row in rows):
+            raise RuntimeError("violates foreign key constraint")
+        data = [{"id": f"event-{len(self.db.events) + i}", **row} for i, row in enumerate(rows)]
+        self.db.events.extend(data)
+        return type("Response", (), {"data": data})()
+
+
+class FakeTable:
+    def __init__(self, db):
+        self.db = db
+
+    def insert(self, rows):
+        return FakeInsert(self.db, rows)
+
+
+class FakeDB:
+    def __init__(self):
+        self.inserts = []
+        self.events = []
+        self.reject_bulk = False
+
+    def table(self, name):
+        assert name == "event_log"
+        return FakeTable(self)
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_learner_id] = lambda: "test_user"
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = FakeDB()
+    queued = []
+
+    async def get_events_by_types(learner_id, event_types, limit=200):
+        return sorted(fake.events, key=lambda e: e["created_at"], reverse=True)
+
+    async def get_last_regeneration(learner_id):
+        return None
+
+    async def enqueue_adaptation(learner_id, trigger, signal):
+        queued.append((trigger, signal))
+        return {"status": "queued", "job_id": "job-1"}
+
+    monkeypatch.setattr(queries, "supabase", fake)
+    monkeypatch.setattr(rules_state, "cache", FakeCache())
+    monkeypatch.setattr(rules_state.queries, "get_events_by_types", get_events_by_types)
+    monkeypatch.setattr(rules_state.queries, "get_last_regeneration", get_last_regeneration)
+    async def calculate_skill_gap(self, learner_id):
+        return {}
+
+    monkeypatch.setattr(rules_engine, "enqueue_adaptation", enqueue_adaptation)
+    monkeypatch.setattr(rules_engine.RulesEngine, "calculate_skill_gap", calculate_skill_gap)
+    fake.queued = queued
+    return fake
+
+
+def _certificate(i, **extra):
+    return {"event_type": "certificate_uploaded", "payload": {"name": f"C{i}"}, **extra}
+
+
+def test_batch_is_one_ordered_insert(client, db):
+    events = [_certificate(i) for i in range(3)] + [{"event_type": "profile_updated"}]
+
+    response = client.post("/api/v1/adaptation/events/batch", json={"events": events})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(db.inserts) == 1
+    rows = db.inserts[0]
+    assert [r["event_type"] for r in rows] == ["certificate_uploaded"] * 3 + ["profile_updated"]
+    assert [r["created_at"] for r in rows] == sorted(r["created_at"] for r in rows)
+    assert len({r["created_at"] for r in rows}) == 4
+    assert body["logged"] == 4
+    assert [r["event_id"] for r in body["results"]] == [f"event-{i}" for i in range(4)]
+
+
+def test_triggers_evaluated_once_over_the_batch(client, db):
+    events = [_certificate(i) for i in range(4)]
+
+    body = client.post("/api/v1/adaptation/events/batch", json={"events": events}).json()
+
+    assert len(db.queued) == 1
+    trigger, signal = db.queued[0]
+    assert trigger == "certificate_upload"
+    assert signal["certificate"] == "C3"
+    assert body["adaptation"]["trigger"] == "certificate_upload"
+
+
+def test_rejected_bulk_insert_falls_back_per_event(client, db):
+    db.reject_bulk = True
+    events = [_certificate(0), _certificate(1, related_mission_id="missing"), _certificate(2)]
+
+    body = client.post("/api/v1/adaptation/events/batch", json={"events": events}).json()
+
+    assert [r["logged"] for r in body["results"]] == [True, False, True]
+    assert body["logged"] == 2
+    assert len(db.queued) == 1
+
+
+def test_mission_outcomes_are_refused(client, db):
+    failed = {"event_type": "mission_failed", "payload": {}, "related_mission_id": "m1"}
+
+    response = client.post("/api/v1/adaptation/events/batch", json={"events": [_certificate(0), failed]})
+    assert response.status_code == 422
+    response = client.post("/api/v1/adaptation/event", json=failed)
+    assert response.status_code == 422
+
+    assert db.inserts == []
+    assert db.queued == []
+
+
+def test_batch_size_is_bounded(client, db):
+    response = client.post("/api/v1/adaptation/events/batch", json={"events": []})
+    assert response.status_code == 422
+
+    response = client.post("/api/v1/adaptation/events/batch", json={"events": [_certificate(i) for i in range(101)]})
+    assert response.status_code == 422
+    assert db.inserts == []
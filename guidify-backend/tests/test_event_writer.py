@@ -0,0 +1,148 @@
+"""
+Tests for the write-behind event_log writer (app/db/event_writer.py):
+size- and time-based flushes, flush on stop, the bounded queue's overflow
+policies, synchronous writes, and rules-state rebuilds seeing buffered events.
+"""
+
+import asyncio
+
+import pytest
+
+from app.db import event_writer as event_writer_module
+from app.db.event_writer import EventWriter
+from app.services import rules_state
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=3600):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def db(monkeypatch):
+    log = {"bulk": [], "sync": []}
+
+    async def create_events(learner_id, events):
+        log["bulk"].append((learner_id, list(events)))
+        return list(events)
+
+    async def create_event(learner_id, event_type, payload, **kwargs):
+        log["sync"].append((learner_id, event_type))
+        return {"id": "sync-1", "event_type": event_type, "payload": payload}
+
+    monkeypatch.setattr(event_writer_module.queries, "create_events", create_events)
+    monkeypatch.setattr(event_writer_module.queries, "create_event", create_event)
+    return log
+
+
+@pytest.mark.asyncio
+async def test_buffers_and_flushes_on_batch_size(db):
+    writer = EventWriter(batch_size=3, flush_seconds=60, max_queue=10)
+    writer.start()
+    try:
+        events = [await writer.write("learner-1", "mission_completed", {"n": i}) for i in range(3)]
+        assert all(e["id"] for e in events)
+        assert [e["created_at"] for e in events] == sorted({e["created_at"] for e in events})
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert len(db["bulk"]) == 1
+        assert [e["payload"]["n"] for e in db["bulk"][0][1]] == [0, 1, 2]
+        assert writer.pending == 0
+    finally:
+        await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_flushes_on_interval_and_groups_by_learner(db):
+    writer = EventWriter(batch_size=100, flush_seconds=0.01, max_queue=10)
+    writer.start()
+    try:
+        await writer.write("learner-1", "mission_failed", {})
+        await writer.write("learner-2", "mission_failed", {})
+        await writer.write("learner-1", "mission_skipped", {})
+        await asyncio.sleep(0.05)
+        assert sorted((learner, len(events)) for learner, events in db["bulk"]) == [("learner-1", 2), ("learner-2", 1)]
+    finally:
+        await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_remaining_events(db):
+    writer = EventWriter(batch_size=100, flush_seconds=60, max_queue=10)
+    writer.start()
+    await writer.write("learner-1", "roadmap_generated", {})
+
+    await writer.stop()
+
+    assert len(db["bulk"]) == 1
+    assert not writer.running
+
+
+@pytest.mark.asyncio
+async def test_full_queue_writes_inline_or_drops(db):
+    writer = EventWriter(batch_size=100, flush_seconds=60, max_queue=1, overflow="sync")
+    writer.start()
+    try:
+        await writer.write("learner-1", "mission_failed", {})
+        await writer.write("learner-1", "mission_failed", {"overflow": True})
+        assert len(db["bulk"]) == 1
+        assert db["bulk"][0][1][0]["payload"] == {"overflow": True}
+        assert writer.pending == 1
+
+        writer.overflow = "drop"
+        assert await writer.write("learner-1", "mission_failed", {}) is None
+        assert writer.pending == 1
+    finally:
+        await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_sync_and_stopped_writes_are_immediate(db):
+    writer = EventWriter(batch_size=100, flush_seconds=60, max_queue=10)
+    assert (await writer.write("learner-1", "mission_failed", {}))["id"] == "sync-1"
+
+    writer.start()
+    try:
+        await writer.write("learner-1", "target_role_changed", {}, sync=True)
+        assert [event_type for _learner, event_type in db["sync"]] == ["mission_failed", "target_role_changed"]
+        assert writer.pending == 0
+    finally:
+        await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_rules_state_rebuild_includes_buffered_events(monkeypatch, db):
+    writer = EventWriter(batch_size=100, flush_seconds=60, max_queue=10)
+
+    async def get_events_by_types(learner_id, event_types, limit=200):
+        return [{"id": "old", "event_type": "mission_failed", "payload": {}, "related_mission_id": "m1",
+                 "created_at": "2026-10-01T00:00:00+00:00"}]
+
+    async def get_last_regeneration(learner_id):
+        return None
+
+    monkeypatch.setattr(rules_state, "event_writer", writer)
+    monkeypatch.setattr(rules_state, "cache", FakeCache())
+    monkeypatch.setattr(rules_state.queries, "get_events_by_types", get_events_by_types)
+    monkeypatch.setattr(rules_state.queries, "get_last_regeneration", get_last_regeneration)
+
+    writer.start()
+    try:
+        first = await writer.write("learner-1", "mission_too_hard", {}, related_mission_id="m2")
+        second = await writer.write("learner-1", "mission_failed", {}, related_mission_id="m3")
+
+        state = await rules_state.record_event("learner-1", second)
+
+        assert state["consecutive_failures"] == 3
+        assert state["missions"] == 3
+        assert state["last_event_id"] == second["id"] != first["id"]
+    finally:
+        await writer.stop()
@@ -6,6 +6,7 @@ import pytest
 
 from app.api import interview
 from app.models.schemas import InterviewAnswerRequest, InterviewSessionRequest
+from app.services import interview_feedback
 
 
 @pytest.mark.asyncio
@@ -13,8 +14,10 @@ from app.models.schemas import InterviewAnswerRequest, InterviewSessionRequest
 async def test_session_records_only_explicit_camera_consent(monkeypatch, camera_enabled):
     consent_calls = []
     updates = []
+    inserts = []
 
-    async def create_session(learner_id, track):
+    async def create_session(learner_id, track, data=None):
+        inserts.append(data or {})
         return {"id": "session-1", "learner_id": learner_id, "track": track}
 
     async def create_consent(*args, **kwargs):
@@ -25,13 +28,17 @@ async def test_session_records_only_explicit_camera_consent(monkeypatch, camera_
         updates.append((session_id, data))
         return data
 
-    async def no_profile(_learner_id):
+    async def no_profile(_learner_id, columns="*"):
         return None
 
     async def generate(**_kwargs):
         return {"question": "First question?"}
 
+    async def append_turns(*_args, **_kwargs):
+        return {"turn_count": 1, "question_count": 1}
+
     monkeypatch.setattr(interview.queries, "create_interview_session", create_session)
+    monkeypatch.setattr(interview.queries, "append_interview_turns", append_turns)
     monkeypatch.setattr(interview.queries, "create_consent", create_consent)
     monkeypatch.setattr(interview.queries, "update_interview_session", update_session)
     monkeypatch.setattr(interview.queries, "get_learner_profile", no_profile)
@@ -45,13 +52,16 @@ async def test_session_records_only_explicit_camera_consent(monkeypatch, camera_
 
     assert response.camera_enabled is camera_enabled
     assert len(consent_calls) == int(camera_enabled)
-    consent_updates = [data for _, data in updates if "delivery_consent_id" in data]
-    assert len(consent_updates) == int(camera_enabled)
+    # Consent and the context snapshot are stored by the session insert itself
+    assert ("delivery_consent_id" in inserts[0]) is camera_enabled
+    assert inserts[0]["context_data"]["target_role"] == "Software Developer"
+    assert updates == []
 
 
 @pytest.mark.asyncio
 async def test_final_answer_metrics_feed_feedback_and_persist(monkeypatch):
     updates = []
+    jobs = []
     gateway_contexts = []
     session = {
         "id": "session-1",
@@ -59,34 +69,64 @@ async def test_final_answer_metrics_feed_feedback_and_persist(monkeypatch):
         "track": "technical",
         "question_count": interview.MAX_QUESTIONS_PER_SESSION,
         "delivery_consent_id": "consent-1",
-        "transcript": [{"role": "interviewer", "content": "Final question?"}],
     }
+    turns = [{"role": "interviewer", "content": "Final question?"}]
+
+    async def get_session(_session_id, _learner_id, columns="*"):
+        return dict(session)
 
-    async def get_session(_session_id, _learner_id):
-        return session
+    async def get_transcript(_session_id, _learner_id, last=None):
+        return list(turns)
 
-    async def no_profile(_learner_id):
+    async def append_turns(_session_id, _learner_id, new_turns, questions=0, summary=None, expected_questions=None):
+        turns.extend(new_turns)
+        return {"turn_count": len(turns), "question_count": session["question_count"]}
+
+    async def no_profile(_learner_id, columns="*"):
         return None
 
     async def update_session(session_id, data):
         updates.append((session_id, data))
+        session.update(data)
         return data
 
+    async def complete_session(session_id, learner_id, final_turns, delivery_metrics=None):
+        # Stands in for the complete_interview_session RPC (one round trip)
+        turns.extend(final_turns)
+        await update_session(session_id, {
+            "status": "completed",
+            "feedback_status": "pending",
+            "camera_enabled": True,
+            "delivery_metrics": delivery_metrics,
+        })
+        jobs.append(("interview_feedback", {"session_id": session_id, "learner_id": learner_id}))
+        return {"completed": True, "job_id": "job-1"}
+
     async def generate(**kwargs):
         gateway_contexts.append(kwargs["context"])
         return {
             "strengths": ["Clear structure"],
-            "gaps": [],
+            "gaps": ["Quantify results"],
             "communication_notes": "Good delivery.",
             "readiness_subscore": 82,
             "suggested_missions": [],
         }
 
     monkeypatch.setattr(interview.queries, "get_interview_session", get_session)
+    monkeypatch.setattr(interview.queries, "get_interview_transcript", get_transcript)
+    monkeypatch.setattr(interview.queries, "append_interview_turns", append_turns)
     monkeypatch.setattr(interview.queries, "get_learner_profile", no_profile)
     monkeypatch.setattr(interview.queries, "get_learner", no_profile)
     monkeypatch.setattr(interview.queries, "update_interview_session", update_session)
-    monkeypatch.setattr(interview, "gateway", SimpleNamespace(generate=generate))
+    monkeypatch.setattr(interview.queries, "complete_interview_session", complete_session)
+    monkeypatch.setattr(interview_feedback, "gateway", SimpleNamespace(generate=generate))
+
+    trend_updates = []
+
+    async def record_trend(learner_id, session_id, metrics, camera_enabled=True):
+        trend_updates.append((session_id, metrics["eye_contact_pct"], camera_enabled))
+
+    monkeypatch.setattr(interview.delivery_trends, "record_session", record_trend)
 
     request = InterviewAnswerRequest(
         answer="My final answer",
@@ -103,10 +143,23 @@ async def test_final_answer_metrics_feed_feedback_and_persist(monkeypatch):
     )
     response = await interview.submit_answer("session-1", request, "learner-1")
 
+    # The request returns before any feedback is generated
     assert response.status == "completed"
-    assert gateway_contexts[0]["delivery_metrics"]["eye_contact_pct"] == 76
-    assert gateway_contexts[0]["camera_enabled"] is True
+    assert response.feedback_status == "pending"
+    assert response.feedback_report is None
+    assert gateway_contexts == []
+    assert jobs == [("interview_feedback", {"session_id": "session-1", "learner_id": "learner-1"})]
     persisted = updates[-1][1]
     assert persisted["status"] == "completed"
     assert persisted["camera_enabled"] is True
     assert persisted["delivery_metrics"]["words_per_minute"] == 135
+    assert "transcript" not in persisted
+    assert trend_updates == [("session-1", 76, True)]
+
+    # The queued job sees the final answer and the stored metrics
+    assert await interview_feedback.generate_feedback("session-1", "learner-1") is True
+    assert gateway_contexts[0]["transcript"][-1]["content"] == "My final answer"
+    assert gateway_contexts[0]["delivery_metrics"]["eye_contact_pct"] == 76
+    assert gateway_contexts[0]["camera_enabled"] is True
+    assert session["feedback_status"] == "ready"
+    assert session["readiness_subscore"] == 82
@@ -0,0 +1,137 @@
+"""
+Tests for background interview feedback (app.services.interview_feedback).
+
+Covers per-section validation and persistence, re-requesting only the
+sections that failed, retry-vs-fallback on the final job attempt, the
+worker handler's learner scoping, and the polling endpoint.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import interview
+from app.db.rows import make_row, parse_columns
+from app.services import interview_feedback
+from app.workers import job_worker
+
+
+@pytest.fixture
+def store(monkeypatch):
+    session = {
+        "id": "session-1",
+        "status": "completed",
+        "track": "hr",
+        "feedback_status": "pending",
+        "context_data": {"profile_summary": "Skills: SQL", "target_role": "Analyst"},
+    }
+    writes = []
+
+    async def get_session(_session_id, _learner_id, columns="*"):
+        async def load(select):
+            return {c: session.get(c) for c in parse_columns(select)}
+
+        wanted = parse_columns(columns) or set(session)
+        return make_row({c: session.get(c) for c in wanted}, "interview_sessions", columns, load)
+
+    async def get_transcript(_session_id, _learner_id, last=None):
+        return [{"role": "interviewer", "content": "Tell me about a conflict."}]
+
+    async def update_session(_session_id, data):
+        writes.append(dict(data))
+        session.update(data)
+        return data
+
+    monkeypatch.setattr(interview_feedback.queries, "get_interview_session", get_session)
+    monkeypatch.setattr(interview_feedback.queries, "get_interview_transcript", get_transcript)
+    monkeypatch.setattr(interview_feedback.queries, "update_interview_session", update_session)
+    return SimpleNamespace(session=session, writes=writes)
+
+
+def _gateway(monkeypatch, responses):
+    calls = []
+
+    async def generate(task_type, context):
+        calls.append(context)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(interview_feedback, "gateway", SimpleNamespace(generate=generate))
+    return calls
+
+
+def test_validate_sections_keeps_valid_sections_only():
+    raw = {
+        "strengths": ["Calm under pressure"],
+        "gaps": [],
+        "communication_notes": "Clear.",
+        "readiness_subscore": 140,
+        "suggested_missions": [{"title": "STAR drill", "target_skill": "Storytelling"}],
+    }
+    valid = interview_feedback.validate_sections(raw, list(interview_feedback.FEEDBACK_SECTIONS))
+    assert set(valid) == {"strengths", "communication_notes", "suggested_missions"}
+
+
+@pytest.mark.asyncio
+async def test_partial_sections_persist_then_only_missing_are_requested(store, monkeypatch):
+    from app.core.exceptions import AIServiceError
+
+    calls = _gateway(monkeypatch, [
+        {"strengths": ["Calm"], "gaps": "not a list", "communication_notes": "Clear.", "readiness_subscore": 70},
+        AIServiceError(message="timeout"),
+    ])
+
+    assert await interview_feedback.generate_feedback("session-1", "learner-1", final=False) is False
+    assert store.writes[0]["feedback_status"] == "partial"
+    assert set(store.writes[0]["feedback_report"]) == {"strengths", "communication_notes", "readiness_subscore"}
+    assert calls[1]["sections"] == ["gaps", "suggested_missions"]
+
+    # A retried job resumes from the stored sections and finishes them
+    calls = _gateway(monkeypatch, [{"gaps": ["Use measurable results"], "suggested_missions": []}])
+    assert await interview_feedback.generate_feedback("session-1", "learner-1", final=False) is True
+    assert calls[0]["sections"] == ["gaps", "suggested_missions"]
+    assert store.session["feedback_status"] == "ready"
+    assert store.session["feedback_report"]["strengths"] == ["Calm"]
+
+
+@pytest.mark.asyncio
+async def test_final_attempt_falls_back_instead_of_staying_pending(store, monkeypatch):
+    from app.core.exceptions import AIServiceError
+
+    _gateway(monkeypatch, [AIServiceError(message="down")])
+
+    assert await interview_feedback.generate_feedback("session-1", "learner-1", final=True) is True
+    assert store.session["feedback_status"] == "failed"
+    assert store.session["feedback_report"]["readiness_subscore"] == 50
+
+
+@pytest.mark.asyncio
+async def test_feedback_endpoint_reports_partial_sections(store):
+    store.session.update({"feedback_status": "partial", "feedback_report": {"strengths": ["Calm"]}})
+
+    response = await interview.get_interview_feedback("session-1", "learner-1")
+
+    assert response.feedback_status == "partial"
+    assert response.sections == {"strengths": ["Calm"]}
+    assert response.feedback_report is None
+
+
+@pytest.mark.asyncio
+async def test_worker_uses_the_job_learner_not_the_payload(monkeypatch):
+    calls = []
+
+    async def generate(session_id, learner_id, final=False):
+        calls.append((session_id, learner_id))
+        return True
+
+    monkeypatch.setattr(job_worker, "generate_feedback", generate)
+
+    job = {
+        "id": "job-1",
+        "learner_id": "learner-1",
+        "payload": {"session_id": "session-2", "learner_id": "learner-2"},
+    }
+    assert await job_worker.process_interview_feedback_job(object(), job) is True
+    assert calls == [("session-2", "learner-1")]
@@ -0,0 +1,109 @@
+"""
+Tests for speculative next-question generation (app.services.interview_speculation).
+
+Covers the disabled default, claiming an in-flight draft, and that the answer
+endpoint uses a ready draft instead of generating inline.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import interview
+from app.core.config import settings
+from app.models.schemas import InterviewAnswerRequest
+from app.services import interview_speculation
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+        return True
+
+
+@pytest.fixture
+def speculation(monkeypatch):
+    calls = []
+
+    async def generate(task_type, context):
+        calls.append(context)
+        await asyncio.sleep(0)
+        return {"question": f"Draft after {len(context['transcript'])} turns?"}
+
+    monkeypatch.setattr(settings, "INTERVIEW_SPECULATION_ENABLED", True)
+    monkeypatch.setattr(interview_speculation, "cache", FakeCache())
+    monkeypatch.setattr(interview_speculation, "gateway", SimpleNamespace(generate=generate))
+    monkeypatch.setattr(interview_speculation, "_inflight", {})
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_disabled_by_default_makes_no_ai_calls(monkeypatch):
+    async def generate(**_kwargs):
+        raise AssertionError("speculation should be off")
+
+    monkeypatch.setattr(interview_speculation, "gateway", SimpleNamespace(generate=generate))
+    assert settings.INTERVIEW_SPECULATION_ENABLED is False
+    interview_speculation.start("s1", 2, "technical", "", "", [])
+    assert await interview_speculation.take("s1", 2) is None
+
+
+@pytest.mark.asyncio
+async def test_take_returns_inflight_draft_once(speculation):
+    interview_speculation.start("s1", 2, "technical", "Skills: Python", "Backend Developer",
+                                [{"role": "interviewer", "content": "Opening?"}])
+
+    assert await interview_speculation.take("s1", 2) == "Draft after 1 turns?"
+    assert await interview_speculation.take("s1", 2) is None
+    assert speculation[0]["speculative"] is True
+    # A draft is only valid for the question number it was made for
+    assert await interview_speculation.take("s1", 3) is None
+
+
+@pytest.mark.asyncio
+async def test_answer_uses_ready_draft_and_drafts_the_next(speculation, monkeypatch):
+    appends = []
+    session = {
+        "id": "s1",
+        "status": "in_progress",
+        "track": "technical",
+        "question_count": 1,
+        "context_data": {"profile_summary": "Skills: Python", "target_role": "Backend Developer"},
+    }
+
+    async def get_session(_session_id, _learner_id, columns="*"):
+        return session
+
+    async def get_transcript(_session_id, _learner_id, last=None):
+        return [{"role": "interviewer", "content": "Opening?"}]
+
+    async def append_turns(_session_id, _learner_id, turns, questions=0, summary=None, expected_questions=None):
+        appends.append(turns)
+        return {"turn_count": 3, "question_count": 2}
+
+    async def inline_generate(**_kwargs):
+        raise AssertionError("a ready draft should be used")
+
+    monkeypatch.setattr(interview.queries, "get_interview_session", get_session)
+    monkeypatch.setattr(interview.queries, "get_interview_transcript", get_transcript)
+    monkeypatch.setattr(interview.queries, "append_interview_turns", append_turns)
+    monkeypatch.setattr(interview, "gateway", SimpleNamespace(generate=inline_generate))
+
+    interview_speculation.start("s1", 2, "technical", "Skills: Python", "Backend Developer",
+                                [{"role": "interviewer", "content": "Opening?"}])
+    response = await interview.submit_answer("s1", InterviewAnswerRequest(answer="An answer"), "learner-1")
+
+    assert response.next_question == "Draft after 1 turns?"
+    assert appends[0][-1] == {"role": "interviewer", "content": "Draft after 1 turns?"}
+    assert await interview_speculation.take("s1", 3) == "Draft after 3 turns?"
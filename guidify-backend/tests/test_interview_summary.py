@@ -0,0 +1,66 @@
+"""
+Tests for the rolling interview transcript summary (app.services.interview_summary).
+
+Covers incremental note updates and that interview.question prompts stay
+bounded over a full session instead of growing with every answer.
+"""
+
+from app.ai_gateway.gateway import estimate_tokens
+from app.ai_gateway.prompts.interview_question import build_user_prompt
+from app.api.interview import MAX_QUESTIONS_PER_SESSION
+from app.core.config import settings
+from app.services.interview_summary import empty_summary, render_summary, update_summary
+
+LONG_ANSWER = "I designed and shipped a caching layer for our API, measured p99 latency, " * 25
+
+
+def test_update_summary_is_incremental_and_clipped():
+    summary = update_summary(empty_summary(), 1, "Explain REST vs GraphQL?", {
+        "answer_topic": "API design",
+        "answer_strength": "Clear comparison with examples",
+        "answer_gap": "x" * 500,
+    })
+    summary = update_summary(summary, 2, "How would you cache a hot endpoint?")
+
+    notes = summary["notes"]
+    assert [n["q"] for n in notes] == [1, 2]
+    assert notes[0]["topic"] == "API design"
+    assert len(notes[0]["gap"]) <= 160
+    # Speculative draft: no assessment, topic falls back to the question
+    assert notes[1] == {"q": 2, "topic": "How would you cache a hot endpoint?"}
+    assert render_summary(summary).splitlines()[0].startswith("Q1 (API design) + Clear comparison")
+
+    # Re-folding the same question replaces its note rather than duplicating it
+    assert len(update_summary(summary, 2, "How would you cache a hot endpoint?")["notes"]) == 2
+
+
+def test_question_prompt_stays_bounded_over_a_session():
+    full_transcript, summary, sizes = [], empty_summary(), []
+    window = settings.INTERVIEW_VERBATIM_TURNS
+
+    for number in range(1, MAX_QUESTIONS_PER_SESSION + 1):
+        question = f"Question {number}: tell me about a system you scaled?"
+        full_transcript += [
+            {"role": "interviewer", "content": question},
+            {"role": "candidate", "content": LONG_ANSWER},
+        ]
+        prompt = build_user_prompt(
+            track="technical",
+            profile_summary="Skills: Python",
+            target_role="Backend Developer",
+            transcript=full_transcript[-window:],
+            session_summary=render_summary(summary),
+        )
+        sizes.append(estimate_tokens(prompt))
+        summary = update_summary(summary, number, question, {
+            "answer_topic": "scaling",
+            "answer_strength": "Quantified the latency improvement",
+            "answer_gap": "Did not discuss cache invalidation",
+        })
+
+    unbounded = estimate_tokens(build_user_prompt("technical", "Skills: Python", "Backend Developer", full_transcript))
+    per_answer = estimate_tokens(LONG_ANSWER)
+
+    # Growth across the whole session is a few short notes, not whole answers
+    assert sizes[-1] - sizes[window // 2] < per_answer
+    assert sizes[-1] < unbounded / 3
@@ -0,0 +1,258 @@
+"""
+Tests for append-only interview transcripts (migration 022).
+
+submit_answer appends the answer and next question as turns instead of
+rewriting interview_sessions.transcript, and GET assembles the transcript from
+interview_turns. Appends only land on an in-progress session whose question
+count the caller read, so duplicate submits are refused.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import interview
+from app.db import queries
+from app.models.schemas import InterviewAnswerRequest
+
+
+@pytest.mark.asyncio
+async def test_mid_session_answer_appends_two_turns_in_one_call(monkeypatch):
+    appends = []
+    summaries = []
+    updates = []
+    session = {
+        "id": "session-1",
+        "status": "in_progress",
+        "track": "technical",
+        "question_count": 1,
+        "context_data": {"profile_summary": "Skills: Python", "target_role": "Backend Developer"},
+    }
+
+    async def get_session(_session_id, _learner_id, columns="*"):
+        return session
+
+    async def get_transcript(_session_id, _learner_id, last=None):
+        return [{"role": "interviewer", "content": "Opening?", "question_type": "opening"}]
+
+    async def append_turns(session_id, learner_id, turns, questions=0, summary=None, expected_questions=None):
+        appends.append((turns, questions))
+        summaries.append(summary)
+        return {"turn_count": 3, "question_count": 2}
+
+    async def update_session(session_id, data):
+        updates.append(data)
+        return data
+
+    async def generate(**_kwargs):
+        return {"question": "Next?", "answer_topic": "Introductions", "answer_gap": "No concrete example"}
+
+    monkeypatch.setattr(interview.queries, "get_interview_session", get_session)
+    monkeypatch.setattr(interview.queries, "get_interview_transcript", get_transcript)
+    monkeypatch.setattr(interview.queries, "append_interview_turns", append_turns)
+    monkeypatch.setattr(interview.queries, "update_interview_session", update_session)
+    monkeypatch.setattr(interview, "gateway", SimpleNamespace(generate=generate))
+
+    response = await interview.submit_answer("session-1", InterviewAnswerRequest(answer="An answer"), "learner-1")
+
+    assert response.next_question == "Next?"
+    assert appends == [(
+        [{"role": "candidate", "content": "An answer"}, {"role": "interviewer", "content": "Next?"}],
+        1,
+    )]
+    assert updates == []
+    # The summary is written with the same append, not a separate update
+    assert summaries == [{"notes": [{"q": 1, "topic": "Introductions", "gap": "No concrete example"}]}]
+
+
+@pytest.mark.asyncio
+async def test_get_session_assembles_transcript_from_turns(monkeypatch):
+    async def get_session(_session_id, _learner_id, columns="*"):
+        assert "transcript" not in columns
+        return {"id": "session-1", "track": "hr", "status": "in_progress", "question_count": 1}
+
+    async def get_transcript(_session_id, _learner_id, last=None):
+        return [
+            {"role": "interviewer", "content": "Opening?", "question_type": "opening"},
+            {"role": "candidate", "content": "Hello", "question_type": None},
+        ]
+
+    monkeypatch.setattr(interview.queries, "get_interview_session", get_session)
+    monkeypatch.setattr(interview.queries, "get_interview_transcript", get_transcript)
+
+    response = await interview.get_interview_session("session-1", "learner-1")
+
+    assert [entry.content for entry in response.transcript] == ["Opening?", "Hello"]
+
+
+@pytest.mark.asyncio
+async def test_append_falls_back_to_transcript_column_without_rpc(monkeypatch):
+    updates = []
+
+    class DB:
+        def rpc(self, *args, **kwargs):
+            raise RuntimeError("function append_interview_turns does not exist")
+
+    async def get_session(_session_id, _learner_id, columns="*"):
+        return {"id": "session-1", "status": "in_progress",
+                "transcript": [{"role": "interviewer", "content": "Q1"}], "question_count": 1}
+
+    async def update_session(session_id, data):
+        updates.append(data)
+        return data
+
+    monkeypatch.setattr(queries, "supabase", DB())
+    monkeypatch.setattr(queries, "get_interview_session", get_session)
+    monkeypatch.setattr(queries, "update_interview_session", update_session)
+
+    result = await queries.append_interview_turns(
+        "session-1", "learner-1", [{"role": "candidate", "content": "A1"}, {"role": "interviewer", "content": "Q2"}],
+        questions=1,
+        expected_questions=1,
+    )
+
+    assert result == {"turn_count": 3, "question_count": 2}
+    assert [t["content"] for t in updates[0]["transcript"]] == ["Q1", "A1", "Q2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, expected", [("completed", None), ("in_progress", 0)])
+async def test_append_fallback_refuses_ended_or_stale_sessions(monkeypatch, status, expected):
+    updates = []
+
+    class DB:
+        def rpc(self, *args, **kwargs):
+            raise RuntimeError("function append_interview_turns does not exist")
+
+    async def get_session(_session_id, _learner_id, columns="*"):
+        return {"id": "session-1", "status": status, "transcript": [], "question_count": 1}
+
+    async def update_session(session_id, data):
+        updates.append(data)
+        return data
+
+    monkeypatch.setattr(queries, "supabase", DB())
+    monkeypatch.setattr(queries, "get_interview_session", get_session)
+    monkeypatch.setattr(queries, "update_interview_session", update_session)
+
+    result = await queries.append_interview_turns(
+        "session-1", "learner-1", [{"role": "candidate", "content": "A1"}], questions=1, expected_questions=expected,
+    )
+
+    assert result is None
+    assert updates == []
+
+
+@pytest.mark.asyncio
+async def test_duplicate_submit_is_refused(monkeypatch):
+    from fastapi import HTTPException
+
+    calls = []
+    session = {
+        "id": "session-1",
+        "status": "in_progress",
+        "track": "technical",
+        "question_count": 1,
+        "context_data": {"profile_summary": "Skills: Python", "target_role": "Backend Developer"},
+    }
+
+    async def get_session(_session_id, _learner_id, columns="*"):
+        return session
+
+    async def get_transcript(_session_id, _learner_id, last=None):
+        return [{"role": "interviewer", "content": "Opening?"}]
+
+    async def append_turns(session_id, learner_id, turns, questions=0, summary=None, expected_questions=None):
+        calls.append(expected_questions)
+        return None
+
+    async def generate(**_kwargs):
+        return {"question": "Next?"}
+
+    monkeypatch.setattr(interview.queries, "get_interview_session", get_session)
+    monkeypatch.setattr(interview.queries, "get_interview_transcript", get_transcript)
+    monkeypatch.setattr(interview.queries, "append_interview_turns", append_turns)
+    monkeypatch.setattr(interview, "gateway", SimpleNamespace(generate=generate))
+
+    with pytest.raises(HTTPException) as exc:
+        await interview.submit_answer("session-1", InterviewAnswerRequest(answer="An answer"), "learner-1")
+
+    assert exc.value.status_code == 409
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_answer_is_a_single_write_even_without_context_snapshot(monkeypatch):
+    writes = []
+    session = {"id": "session-1", "status": "in_progress", "track": "hr", "question_count": 2}
+
+    async def get_session(_session_id, _learner_id, columns="*"):
+        return session
+
+    async def get_transcript(_session_id, _learner_id, last=None):
+        return [{"role": "interviewer", "content": "Q2?"}]
+
+    async def no_row(_learner_id, columns="*"):
+        return None
+
+    async def append_turns(*args, **kwargs):
+        writes.append("append")
+        return {"turn_count": 6, "question_count": 3}
+
+    async def update_session(session_id, data):
+        writes.append("update")
+        return data
+
+    async def generate(**_kwargs):
+        return {"question": "Q3?"}
+
+    monkeypatch.setattr(interview.queries, "get_interview_session", get_session)
+    monkeypatch.setattr(interview.queries, "get_interview_transcript", get_transcript)
+    monkeypatch.setattr(interview.queries, "get_learner", no_row)
+    monkeypatch.setattr(interview.queries, "get_learner_profile", no_row)
+    monkeypatch.setattr(interview.queries, "append_interview_turns", append_turns)
+    monkeypatch.setattr(interview.queries, "update_interview_session", update_session)
+    monkeypatch.setattr(interview, "gateway", SimpleNamespace(generate=generate))
+
+    await interview.submit_answer("session-1", InterviewAnswerRequest(answer="A2"), "learner-1")
+
+    assert writes == ["append"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rows, completed", [([], False), ([{"id": "session-1"}], True)])
+async def test_legacy_completion_reports_whether_it_completed(monkeypatch, rows, completed):
+    filters = []
+    jobs = []
+
+    class Update:
+        def eq(self, column, value):
+            filters.append((column, value))
+            return self
+
+        def execute(self):
+            return SimpleNamespace(data=rows)
+
+    class DB:
+        def rpc(self, *args, **kwargs):
+            raise RuntimeError("function complete_interview_session does not exist")
+
+        def table(self, name):
+            return SimpleNamespace(update=lambda data: Update())
+
+    async def append_turns(*args, **kwargs):
+        return {"turn_count": 4, "question_count": 2}
+
+    async def create_job(**kwargs):
+        jobs.append(kwargs["job_type"])
+        return {"id": "job-1"}
+
+    monkeypatch.setattr(queries, "supabase", DB())
+    monkeypatch.setattr(queries, "append_interview_turns", append_turns)
+    monkeypatch.setattr(queries, "create_job", create_job)
+
+    result = await queries.complete_interview_session("session-1", "learner-1", [{"role": "candidate", "content": "A"}])
+
+    assert result == {"completed": completed, "job_id": "job-1" if completed else None}
+    assert ("status", "in_progress") in filters
+    assert jobs == (["interview_feedback"] if completed else [])
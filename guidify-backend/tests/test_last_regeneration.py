@@ -0,0 +1,114 @@
+"""
+Tests for the cached last-regeneration lookup behind the 24h debounce
+(migration 031): Redis first, then learners.last_regenerated_at, then the
+legacy roadmaps/event_log scan; create_roadmap refreshes the cached value.
+"""
+
+import pytest
+
+from app.db import queries
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=3600):
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for k in keys if self.store.pop(k, None) is not None)
+
+
+class FakeQuery:
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+
+    def __getattr__(self, name):
+        def chain(*args, **kwargs):
+            if name == "select":
+                self.db.selects.append((self.table, args[0]))
+            return self
+        return chain
+
+    def execute(self):
+        if self.table == "learners" and self.db.no_column:
+            raise RuntimeError("column learners.last_regenerated_at does not exist")
+        data = self.db.rows.get(self.table, [])
+        return type("Response", (), {"data": data})()
+
+
+class FakeDB:
+    def __init__(self):
+        self.selects = []
+        self.rows = {}
+        self.no_column = False
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params):
+        return self
+
+    def execute(self):
+        return type("Response", (), {"data": {"id": "roadmap-2", "created_at": "2026-10-19T08:00:00+00:00"}})()
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = FakeDB()
+    cache = FakeCache()
+    monkeypatch.setattr(queries, "supabase", fake)
+    monkeypatch.setattr(queries, "cache", cache)
+    fake.cache = cache
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_cached_value_needs_no_query(db):
+    db.cache.store["last_regen:learner-1"] = {"at": "2026-10-18T09:00:00+00:00"}
+
+    assert await queries.get_last_regeneration("learner-1") == "2026-10-18T09:00:00+00:00"
+    assert db.selects == []
+
+
+@pytest.mark.asyncio
+async def test_miss_reads_learner_column_once_and_caches(db):
+    db.rows["learners"] = [{"last_regenerated_at": "2026-10-17T10:00:00+00:00"}]
+
+    assert await queries.get_last_regeneration("learner-1") == "2026-10-17T10:00:00+00:00"
+    assert await queries.get_last_regeneration("learner-1") == "2026-10-17T10:00:00+00:00"
+    assert db.selects == [("learners", "last_regenerated_at")]
+
+
+@pytest.mark.asyncio
+async def test_never_regenerated_is_cached_too(db):
+    db.rows["learners"] = [{"last_regenerated_at": None}]
+
+    assert await queries.get_last_regeneration("learner-1") is None
+    assert await queries.get_last_regeneration("learner-1") is None
+    assert len(db.selects) == 1
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_legacy_scan_without_migration(db):
+    db.no_column = True
+    db.rows["roadmaps"] = [{"created_at": "2026-10-16T10:00:00+00:00"}]
+
+    assert await queries.get_last_regeneration("learner-1") == "2026-10-16T10:00:00+00:00"
+    assert ("roadmaps", "created_at") in db.selects
+    assert db.cache.store == {}
+
+
+@pytest.mark.asyncio
+async def test_create_roadmap_refreshes_cached_value(db):
+    db.cache.store["last_regen:learner-1"] = {"at": "2026-10-01T00:00:00+00:00"}
+
+    await queries.create_roadmap("learner-1", {"title": "Roadmap", "phases": []})
+
+    assert await queries.get_last_regeneration("learner-1") == "2026-10-19T08:00:00+00:00"
@@ -0,0 +1,191 @@
+"""
+Tests for race-free creation of today's mission (GET /missions/today):
+single-flight within a process, the cross-process cache lock, and the
+conflict-safe insert.
+"""
+
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import missions
+from app.core.singleflight import SingleFlight
+from app.services import mission_service
+
+MISSION = {
+    "title": "Write a CLI",
+    "objective": "Build a small argparse tool",
+    "target_skill": "Python",
+    "difficulty": "beginner",
+    "estimated_minutes": 30,
+    "steps": [],
+    "resources": [],
+}
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def add(self, key, value, ttl=3600):
+        if key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for k in keys if self.store.pop(k, None) is not None)
+
+
+class FakeMissions:
+    """daily_missions with its UNIQUE(learner_id, assigned_date) constraint."""
+
+    def __init__(self):
+        self.rows = {}
+        self.lookups = 0
+        self.inserts = 0
+
+    async def get_for_date(self, learner_id, assigned_date=None):
+        self.lookups += 1
+        return self.rows.get((learner_id, assigned_date or date.today().isoformat()))
+
+    async def insert_if_absent(self, learner_id, data):
+        self.inserts += 1
+        key = (learner_id, data["assigned_date"])
+        if key in self.rows:
+            return None
+        self.rows[key] = {"id": f"mission-{len(self.rows) + 1}", "learner_id": learner_id, **data}
+        return self.rows[key]
+
+
+@pytest.fixture
+def env(monkeypatch):
+    table = FakeMissions()
+    cache = FakeCache()
+    ai_calls = []
+
+    async def none(*_args, **_kwargs):
+        return None
+
+    async def recent(_learner_id, limit=5):
+        return []
+
+    async def generate(**kwargs):
+        ai_calls.append(kwargs["context"])
+        await asyncio.sleep(0.01)
+        return dict(MISSION)
+
+    for name, fn in {
+        "get_learner": none,
+        "get_learner_profile": none,
+        "get_active_roadmap": none,
+        "get_roadmap_view": none,
+        "get_recent_missions": recent,
+        "take_mission_draft": none,
+        "pick_mission_template": none,
+        "add_mission_template": none,
+        "get_mission_for_date": table.get_for_date,
+        "create_mission_if_absent": table.insert_if_absent,
+    }.items():
+        monkeypatch.setattr(mission_service.queries, name, fn)
+    monkeypatch.setattr(mission_service, "cache", cache)
+    monkeypatch.setattr(mission_service, "gateway", SimpleNamespace(generate=generate))
+    monkeypatch.setattr(mission_service, "MISSION_LOCK_POLL_SECONDS", 0)
+    return SimpleNamespace(table=table, cache=cache, ai_calls=ai_calls)
+
+
+@pytest.mark.asyncio
+async def test_singleflight_shares_result_and_releases_key():
+    flights = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0)
+        return len(runs)
+
+    results = await asyncio.gather(*(flights.do("k", work) for _ in range(5)))
+    assert results == [1] * 5
+    assert not flights.inflight("k")
+    assert await flights.do("k", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_singleflight_propagates_errors_to_all_waiters():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(*(flights.do("k", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_visits_generate_once(env):
+    results = await asyncio.gather(*(
+        missions.get_todays_mission(learner_id="learner-1") for _ in range(5)
+    ))
+
+    assert len(env.ai_calls) == 1
+    assert env.table.inserts == 1
+    assert {r["id"] for r in results} == {"mission-1"}
+    # One existence query per request; the lock is released afterwards
+    assert env.table.lookups == 5
+    assert env.cache.store == {}
+
+
+@pytest.mark.asyncio
+async def test_existing_mission_of_any_status_is_returned_with_one_query(env):
+    today = date.today().isoformat()
+    env.table.rows[("learner-1", today)] = {"id": "done", "status": "skipped", "assigned_date": today}
+
+    mission = await missions.get_todays_mission(learner_id="learner-1")
+
+    assert mission["id"] == "done"
+    assert env.table.lookups == 1
+    assert env.ai_calls == []
+
+
+@pytest.mark.asyncio
+async def test_waits_for_mission_created_by_another_process(monkeypatch, env):
+    today = date.today().isoformat()
+    lock_key = f"missions:lock:learner-1:{today}"
+    env.cache.store[lock_key] = 1
+    real_lookup = env.table.get_for_date
+
+    async def lookup(learner_id, assigned_date=None):
+        row = await real_lookup(learner_id, assigned_date)
+        if row is None and env.table.lookups >= 3:
+            # The lock holder finishes its insert
+            env.table.rows[(learner_id, today)] = {"id": "other-worker", "assigned_date": today}
+        return row
+
+    monkeypatch.setattr(mission_service.queries, "get_mission_for_date", lookup)
+
+    mission = await missions.get_todays_mission(learner_id="learner-1")
+
+    assert mission["id"] == "other-worker"
+    assert env.ai_calls == []
+
+
+@pytest.mark.asyncio
+async def test_insert_conflict_returns_the_winning_row(monkeypatch, env):
+    today = date.today().isoformat()
+    winner = {"id": "winner", "assigned_date": today}
+
+    async def lose_race(learner_id, data):
+        env.table.rows[(learner_id, today)] = winner
+        return None
+
+    monkeypatch.setattr(mission_service.queries, "create_mission_if_absent", lose_race)
+
+    mission = await mission_service.save_mission("learner-1", {**MISSION, "assigned_date": today})
+
+    assert mission is winner
@@ -0,0 +1,149 @@
+"""
+Tests for the mission template library (app/services/mission_library.py):
+key normalization, hits served without an AI call, and misses populating the
+library from validated generations only, and only for service-role callers.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.db import queries
+from app.services import mission_library, mission_service
+
+ROADMAP = {
+    "id": "roadmap-1",
+    "current_phase_number": 1,
+    "total_phases": 1,
+    "phases": [{"phase_number": 1, "title": "Foundations", "skills": ["Python"], "difficulty": "beginner"}],
+}
+
+MISSION = {
+    "title": "Write a CLI",
+    "objective": "Build a small argparse tool",
+    "target_skill": "Python",
+    "difficulty": "beginner",
+    "estimated_minutes": 45,
+    "steps": ["Plan", "Build"],
+    "resources": [],
+}
+
+
+class FakeLibrary:
+    """In-memory stand-in for the pick/add_mission_template RPCs."""
+
+    def __init__(self):
+        self.templates = {}
+
+    async def pick(self, key, exclude_titles):
+        for template in sorted(self.templates.get(key, []), key=lambda t: t["uses"]):
+            if template["mission"]["title"] not in exclude_titles:
+                template["uses"] += 1
+                return dict(template["mission"])
+        return None
+
+    async def add(self, key, mission, max_variants):
+        variants = self.templates.setdefault(key, [])
+        if len(variants) >= max_variants or any(v["mission"]["title"] == mission["title"] for v in variants):
+            return False
+        variants.append({"mission": dict(mission), "uses": 0})
+        return True
+
+
+@pytest.fixture
+def library(monkeypatch):
+    async def none(*_args, **_kwargs):
+        return None
+
+    async def get_roadmap(_learner_id, columns="*"):
+        return ROADMAP
+
+    async def get_roadmap_view(_learner_id, view="summary", phase_number=None):
+        return queries._shape_roadmap_view(ROADMAP, view, phase_number)
+
+    async def recent(_learner_id, limit=5):
+        return []
+
+    monkeypatch.setattr(mission_service.queries, "get_learner", none)
+    monkeypatch.setattr(mission_service.queries, "get_learner_profile", none)
+    monkeypatch.setattr(mission_service.queries, "get_active_roadmap", get_roadmap)
+    monkeypatch.setattr(mission_service.queries, "get_roadmap_view", get_roadmap_view)
+    monkeypatch.setattr(mission_service.queries, "get_recent_missions", recent)
+
+    fake = FakeLibrary()
+    monkeypatch.setattr(mission_service.queries, "pick_mission_template", fake.pick)
+    monkeypatch.setattr(mission_service.queries, "add_mission_template", fake.add)
+    return fake
+
+
+def _gateway(monkeypatch, result=None, error=None):
+    calls = []
+
+    async def generate(**kwargs):
+        calls.append(kwargs["context"])
+        if error:
+            raise error
+        return dict(result or MISSION)
+
+    monkeypatch.setattr(mission_service, "gateway", SimpleNamespace(generate=generate))
+    return calls
+
+
+def test_template_key_normalizes_and_buckets_minutes():
+    a = mission_library.template_key("Data  Analyst", "SQL ", "Beginner", 28)
+    b = mission_library.template_key("data analyst", "sql", "beginner", 31)
+    assert a == b == "data analyst|sql|beginner|30"
+    assert mission_library.template_key("x", "y", "z", 3).endswith("|10")
+
+
+@pytest.mark.asyncio
+async def test_miss_generates_and_second_learner_hits(monkeypatch, library):
+    calls = _gateway(monkeypatch)
+
+    first = await mission_service.build_mission("learner-1", store_in_library=True)
+    second = await mission_service.build_mission("learner-2")
+
+    assert len(calls) == 1
+    assert first["title"] == second["title"] == "Write a CLI"
+    # The hit is personalized to the learner's own context
+    assert second["roadmap_id"] == "roadmap-1"
+    assert second["estimated_minutes"] == calls[0]["estimated_minutes"]
+
+
+@pytest.mark.asyncio
+async def test_recently_seen_variant_is_a_miss(monkeypatch, library):
+    calls = _gateway(monkeypatch)
+    await mission_service.build_mission("learner-1", store_in_library=True)
+
+    async def recent(_learner_id, limit=5):
+        return [{"title": "Write a CLI"}]
+
+    monkeypatch.setattr(mission_service.queries, "get_recent_missions", recent)
+    _gateway(monkeypatch, result={**MISSION, "title": "Parse a CSV"})
+    mission = await mission_service.build_mission("learner-1", store_in_library=True)
+
+    assert mission["title"] == "Parse a CSV"
+    assert len(calls) == 1
+    assert sum(len(v) for v in library.templates.values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_fallback_missions_are_not_stored(monkeypatch, library):
+    _gateway(monkeypatch, error=RuntimeError("provider down"))
+
+    mission = await mission_service.build_mission("learner-1", store_in_library=True)
+
+    assert mission["title"] == "Practice Python"
+    assert library.templates == {}
+
+
+@pytest.mark.asyncio
+async def test_request_time_misses_do_not_write_the_library(monkeypatch, library):
+    calls = _gateway(monkeypatch)
+
+    await mission_service.build_mission("learner-1")
+    await mission_service.build_mission("learner-2")
+
+    # add_mission_template is service-role only; learners read the library
+    assert len(calls) == 2
+    assert library.templates == {}
@@ -0,0 +1,195 @@
+"""
+Tests for overnight mission pre-generation (app/workers/mission_pregen.py) and
+draft promotion in GET /missions/today.
+"""
+
+import asyncio
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import missions
+from app.db import queries
+from app.services import mission_service
+from app.workers import mission_pregen
+
+ROADMAP = {
+    "id": "roadmap-1",
+    "current_phase_number": 1,
+    "total_phases": 2,
+    "phases": [{"phase_number": 1, "title": "Foundations", "skills": ["Python"], "difficulty": "beginner"}],
+}
+
+MISSION = {
+    "title": "Write a CLI",
+    "objective": "Build a small argparse tool",
+    "description": "",
+    "target_skill": "Python",
+    "difficulty": "beginner",
+    "estimated_minutes": 30,
+    "steps": ["Plan", "Build"],
+    "resources": [],
+}
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def add(self, key, value, ttl=3600):
+        if key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(1 for k in keys if self.store.pop(k, None) is not None)
+
+
+def _fake_reads(monkeypatch, roadmap=ROADMAP):
+    async def none(*_args, **_kwargs):
+        return None
+
+    async def get_roadmap(_learner_id, columns="*"):
+        return roadmap
+
+    async def get_roadmap_view(_learner_id, view="summary", phase_number=None):
+        return queries._shape_roadmap_view(roadmap, view, phase_number)
+
+    async def recent(_learner_id, limit=5):
+        return []
+
+    monkeypatch.setattr(mission_service.queries, "get_learner", none)
+    monkeypatch.setattr(mission_service.queries, "get_learner_profile", none)
+    monkeypatch.setattr(mission_service.queries, "get_active_roadmap", get_roadmap)
+    monkeypatch.setattr(mission_service.queries, "get_roadmap_view", get_roadmap_view)
+    monkeypatch.setattr(mission_service.queries, "get_recent_missions", recent)
+    monkeypatch.setattr(mission_service.queries, "get_mission_for_date", none)
+    monkeypatch.setattr(mission_service, "cache", FakeCache())
+    # Mission library misses (tests/test_mission_library.py covers hits)
+    monkeypatch.setattr(mission_service.queries, "pick_mission_template", none)
+    monkeypatch.setattr(mission_service.queries, "add_mission_template", none)
+
+
+def _fake_missions_table(monkeypatch, drafts):
+    created = []
+
+    async def take_draft(learner_id, assigned_date):
+        return drafts.pop((learner_id, assigned_date), None)
+
+    async def create_mission(learner_id, data):
+        created.append(data)
+        return {"id": "mission-1", **data}
+
+    monkeypatch.setattr(mission_service.queries, "take_mission_draft", take_draft)
+    monkeypatch.setattr(mission_service.queries, "create_mission_if_absent", create_mission)
+    return created
+
+
+@pytest.mark.asyncio
+async def test_first_visit_promotes_draft_without_ai(monkeypatch):
+    _fake_reads(monkeypatch)
+    today = date.today().isoformat()
+    drafts = {("learner-1", today): {"mission": {**MISSION, "roadmap_id": "roadmap-1", "assigned_date": today}}}
+    created = _fake_missions_table(monkeypatch, drafts)
+
+    async def no_ai(**_kwargs):
+        raise AssertionError("mission should come from the draft")
+
+    monkeypatch.setattr(mission_service, "gateway", SimpleNamespace(generate=no_ai))
+
+    mission = await missions.get_todays_mission(learner_id="learner-1")
+
+    assert mission["title"] == "Write a CLI"
+    assert created[0]["assigned_date"] == today
+    assert drafts == {}
+
+
+@pytest.mark.asyncio
+async def test_stale_draft_falls_back_to_on_demand(monkeypatch):
+    _fake_reads(monkeypatch)
+    today = date.today().isoformat()
+    drafts = {("learner-1", today): {"mission": {**MISSION, "roadmap_id": "old-roadmap"}}}
+    created = _fake_missions_table(monkeypatch, drafts)
+    calls = []
+
+    async def generate(**kwargs):
+        calls.append(kwargs["context"])
+        return {**MISSION, "title": "Fresh mission"}
+
+    monkeypatch.setattr(mission_service, "gateway", SimpleNamespace(generate=generate))
+
+    mission = await missions.get_todays_mission(learner_id="learner-1")
+
+    assert mission["title"] == "Fresh mission"
+    assert len(calls) == 1
+    assert created[0]["roadmap_id"] == "roadmap-1"
+
+
+@pytest.mark.asyncio
+async def test_pregenerate_batches_by_priority_and_bounds_concurrency(monkeypatch):
+    _fake_reads(monkeypatch)
+    monkeypatch.setattr(mission_pregen.settings, "MISSION_PREGEN_BATCH_SIZE", 2)
+    monkeypatch.setattr(mission_pregen.settings, "MISSION_PREGEN_CONCURRENCY", 2)
+    monkeypatch.setattr(mission_pregen.settings, "MISSION_PREGEN_RATE_PER_MINUTE", 0)
+    tomorrow = date.today() + timedelta(days=1)
+    candidates = [{"learner_id": f"learner-{i}", "priority": 5 - i} for i in range(5)]
+    saved = []
+    in_flight = 0
+    peak = 0
+    calls = 0
+
+    async def get_candidates(assigned_date, limit, days=14):
+        assert assigned_date == tomorrow.isoformat()
+        return candidates[:limit]
+
+    async def purge(_before):
+        return None
+
+    async def save_draft(learner_id, assigned_date, mission, priority=0):
+        saved.append((learner_id, assigned_date, mission["assigned_date"], priority))
+
+    async def generate(**kwargs):
+        nonlocal in_flight, peak, calls
+        calls += 1
+        call = calls
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if call == 2:
+            raise RuntimeError("provider error")
+        return dict(MISSION)
+
+    monkeypatch.setattr(mission_pregen.queries, "get_mission_pregen_candidates", get_candidates)
+    monkeypatch.setattr(mission_pregen.queries, "purge_mission_drafts", purge)
+    monkeypatch.setattr(mission_pregen.queries, "save_mission_draft", save_draft)
+    monkeypatch.setattr(mission_service, "gateway", SimpleNamespace(generate=generate))
+
+    stats = await mission_pregen.pregenerate(client=object(), for_date=tomorrow)
+
+    assert stats == {"generated": 4, "failed": 1, "skipped": 0}
+    assert peak <= 2
+    # Most likely visitors are handled first; failures store no fallback draft
+    assert saved[0][0] == "learner-0"
+    assert all(s[1] == s[2] == tomorrow.isoformat() for s in saved)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_calls(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(mission_pregen.asyncio, "sleep", fake_sleep)
+    limiter = mission_pregen.RateLimiter(per_minute=60)
+    for _ in range(3):
+        await limiter.acquire()
+
+    assert len(sleeps) == 2
+    assert all(0.9 < s <= 2.0 for s in sleeps)
@@ -0,0 +1,106 @@
+"""
+Tests for the psychometrics.narrate cache (app/services/narration_cache.py):
+bucketed score signatures, instrument-versioned keys, hit/miss counting, and
+failed or empty narrations not being cached.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services import narration_cache
+
+
+IPIP = {"openness": 72, "conscientiousness": 48, "extraversion": 31, "agreeableness": 66, "neuroticism": 20}
+RIASEC = {"realistic": 10, "investigative": 88, "artistic": 54, "social": 40, "enterprising": 23, "conventional": 61}
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=3600):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    calls = []
+    replies = []
+
+    async def generate(task_type, context):
+        calls.append(context)
+        if replies:
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+        return {"narrative_summary": "You like ideas.", "pacing_hint": "mixed", "tone_hint": "warm", "extra": 1}
+
+    monkeypatch.setattr(narration_cache.gateway, "generate", generate)
+    monkeypatch.setattr(narration_cache, "cache", FakeCache())
+    return SimpleNamespace(calls=calls, replies=replies)
+
+
+def _count(result):
+    return REGISTRY.get_sample_value("guidify_narration_cache_requests_total", {"result": result}) or 0.0
+
+
+def test_quantize_rounds_to_nearest_bucket():
+    assert [narration_cache.quantize(v) for v in (0, 2, 3, 72, 97, 98, 100)] == [0, 0, 5, 70, 95, 100, 100]
+    assert narration_cache.quantize(None) is None
+
+
+@pytest.mark.asyncio
+async def test_similar_profiles_share_one_narration(gateway):
+    hits, misses = _count("hit"), _count("miss")
+    similar = {**IPIP, "openness": 71, "neuroticism": 22}
+
+    first = await narration_cache.narrate(IPIP, RIASEC, "ipip-1.0_riasec-1.0")
+    second = await narration_cache.narrate(similar, RIASEC, "ipip-1.0_riasec-1.0")
+
+    assert first == second == {"narrative_summary": "You like ideas.", "pacing_hint": "mixed", "tone_hint": "warm"}
+    assert len(gateway.calls) == 1
+    assert gateway.calls[0]["ipip_scores"]["openness"] == 70
+    assert gateway.calls[0]["riasec_scores"]["investigative"] == 90
+    assert "grit_score" not in gateway.calls[0]
+    assert (_count("hit") - hits, _count("miss") - misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_instrument_version_and_buckets_separate_entries(gateway):
+    await narration_cache.narrate(IPIP, RIASEC, "ipip-1.0_riasec-1.0")
+    await narration_cache.narrate(IPIP, RIASEC, "ipip-1.1_riasec-1.0")
+    await narration_cache.narrate({**IPIP, "openness": 80}, RIASEC, "ipip-1.0_riasec-1.0")
+    await narration_cache.narrate(IPIP, RIASEC, "ipip-1.0_riasec-1.0", grit_score=64)
+
+    assert len(gateway.calls) == 4
+    assert gateway.calls[3]["grit_score"] == 65
+
+
+@pytest.mark.asyncio
+async def test_failed_or_empty_narrations_are_not_cached(gateway):
+    gateway.replies.extend([RuntimeError("gateway down"), {"narrative_summary": None}])
+
+    with pytest.raises(RuntimeError):
+        await narration_cache.narrate(IPIP, RIASEC, "ipip-1.0_riasec-1.0")
+    assert (await narration_cache.narrate(IPIP, RIASEC, "ipip-1.0_riasec-1.0"))["narrative_summary"] is None
+    assert (await narration_cache.narrate(IPIP, RIASEC, "ipip-1.0_riasec-1.0"))["narrative_summary"] == "You like ideas."
+
+    assert len(gateway.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_narrates_raw_scores(monkeypatch, gateway):
+    monkeypatch.setattr(narration_cache.settings, "NARRATION_CACHE_ENABLED", False)
+
+    await narration_cache.narrate(IPIP, RIASEC, "ipip-1.0_riasec-1.0")
+    await narration_cache.narrate(IPIP, RIASEC, "ipip-1.0_riasec-1.0")
+
+    assert len(gateway.calls) == 2
+    assert gateway.calls[0]["ipip_scores"] == IPIP
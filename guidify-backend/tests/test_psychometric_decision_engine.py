@@ -3,14 +3,18 @@ Unit tests for the yes/maybe/no psychometric decision engine
 (app.services.psychometric_decision_engine).
 
 Covers: deterministic scoring, canonicalized career mapping, confidence
-differentiation, and the engine's tolerance of partial/duplicate answers
-(validation lives in the API layer, not the engine).
+differentiation, the engine's tolerance of partial/duplicate answers
+(validation lives in the API layer, not the engine), batch evaluation and
+the per-answer-vector result cache.
 """
 
 from app.models.psychometric_test_schemas import AnswerSubmission
 from app.services.psychometric_decision_engine import (
     QUESTION_BANK,
+    UNSCORED,
     PsychometricDecisionEngine,
+    _result_cache,
+    encode_answers,
 )
 
 
@@ -85,3 +89,46 @@ def test_missing_answers_tolerated_by_engine():
     partial = _all("yes")[:-1]
     result = PsychometricDecisionEngine.evaluate(partial)
     assert 0 <= result.overall_score <= 100
+
+
+def test_batch_matches_single_evaluation():
+    """evaluate_batch returns the same results, in order, as evaluating one by one."""
+    mixed = _all("yes")[:12] + _all("no")[12:20] + _all("maybe")[20:]
+    partial = _all("yes")[:5]
+    submissions = [_all("yes"), mixed, partial, _all("no"), mixed]
+
+    batch = PsychometricDecisionEngine.evaluate_batch(submissions)
+
+    _result_cache.clear()
+    assert [r.model_dump() for r in batch] == [
+        PsychometricDecisionEngine.evaluate(s).model_dump() for s in submissions
+    ]
+
+
+def test_repeated_answers_are_served_from_cache():
+    """A repeated answer vector is not re-scored, and callers get independent copies."""
+    _result_cache.clear()
+    first = PsychometricDecisionEngine.evaluate(_all("maybe"))
+    first.strengths.append("mutated")
+    second = PsychometricDecisionEngine.evaluate(_all("maybe"))
+
+    assert len(_result_cache) == 1
+    assert "mutated" not in second.strengths
+    assert second.overall_score == 50.0
+
+
+def test_encoding_last_answer_wins_and_skips_invalid():
+    """Repeated questions keep the last answer; unknown ids and invalid values are not scored."""
+    answers = _all("no")
+    answers.append(AnswerSubmission(question_id="ta_01", answer="yes"))
+    answers.append(AnswerSubmission(question_id="ta_02", answer="sometimes"))
+    answers.append(AnswerSubmission(question_id="zz_99", answer="yes"))
+
+    codes = encode_answers(answers)
+    assert codes[0] == 0
+    assert codes[1] == UNSCORED
+    assert codes[2] == 2
+
+    scores = PsychometricDecisionEngine._compute_category_scores(answers)
+    # ta_01..ta_06 minus invalid ta_02: yes(1.0) + no(0.0, 0.3, 0.1, 0.0) over 5
+    assert scores["Technical Aptitude"] == 28.0
@@ -266,3 +266,46 @@ def test_score_all_is_deterministic():
                                     "social", "enterprising", "conventional"}
     assert first[2]["ipip_version"] == scoring.get_ipip_version()
     assert first[2]["riasec_version"] == scoring.get_riasec_version()
+
+
+# ── Batch scoring ────────────────────────────────────────────────────────
+
+def _random_answer_sets(n: int, seed: int = 7):
+    """Answer dicts with skipped items, out-of-range values and empty instruments."""
+    import random
+    rng = random.Random(seed)
+    item_ids = scoring.batch_item_ids()
+    sets = []
+    for _ in range(n):
+        keep = rng.choice([0.0, 0.3, 0.8, 1.0])
+        sets.append({
+            item_id: rng.choice([0, 1, 2, 3, 4, 5, 6])
+            for item_id in item_ids if rng.random() < keep
+        })
+    return sets
+
+
+def test_score_batch_matches_per_dict_scoring():
+    answer_sets = _random_answer_sets(500)
+    batch = scoring.score_batch(scoring.answers_to_matrix(answer_sets))
+
+    for i, answers in enumerate(answer_sets):
+        assert {t: int(v[i]) for t, v in batch["ipip"].items()} == scoring.score_ipip(answers)
+        assert {d: int(v[i]) for d, v in batch["riasec"].items()} == scoring.score_riasec(answers)
+        grit = int(batch["grit"][i]) if batch["grit_answered"][i] else None
+        assert grit == scoring.score_grit(answers)
+
+
+def test_score_batch_follows_instrument_version_swap(tmp_path, monkeypatch):
+    test_config = {
+        "instrument": "Grit-S", "version": "9.9-test", "scoring_method": "likert_sum_normalized",
+        "scale_range": [1, 5], "normalize_to": [0, 100],
+        "items": [{"id": "grit_101", "text": "t", "scale": "grit", "reverse_scored": True}],
+    }
+    (tmp_path / "grit.json").write_text(json.dumps(test_config), encoding="utf-8")
+    monkeypatch.setattr(scoring, "_INSTRUMENTS_DIR", str(tmp_path))
+    monkeypatch.setattr(scoring, "_grit_config", None)
+
+    assert scoring.batch_item_ids()[-1] == "grit_101"
+    batch = scoring.score_batch(scoring.answers_to_matrix([{"grit_101": 1}]))
+    assert batch["grit"].tolist() == [100]
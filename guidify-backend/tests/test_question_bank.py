@@ -0,0 +1,194 @@
+"""
+Tests for the curated adaptive question bank (app/services/question_bank.py):
+the shipped bank file, maximum-information selection, answer matching,
+validation of new items, the service methods that no longer call AI, and
+the offline growth worker (app/workers/question_bank_grow.py).
+"""
+
+import json
+
+import pytest
+
+from app.services import psychometric_service, question_bank
+from app.services.psychometric_service import PsychometricService
+from app.services.question_bank import QuestionBank
+from app.workers import question_bank_grow
+
+
+def _option(text, **loadings):
+    return {"text": text, "trait_impact": text.title(), "loadings": loadings}
+
+
+def _question(qid, trait, baseline=False):
+    entry = {
+        "id": qid,
+        "question_text": f"Question {qid}?",
+        "question_type": "multiple_choice",
+        "options": [
+            _option(f"{qid} high", **{trait: 1.0}),
+            _option(f"{qid} mid", **{trait: 0.5}),
+            _option(f"{qid} low", **{trait: -0.5}),
+            _option(f"{qid} none", **{trait: 0.0}),
+        ],
+    }
+    if baseline:
+        entry["baseline"] = True
+    return entry
+
+
+def _bank():
+    return QuestionBank({
+        "bank": "test",
+        "version": "1.0",
+        "traits": ["A", "B"],
+        "questions": [
+            _question("base_01", "A", baseline=True),
+            _question("qb_001", "A"),
+            _question("qb_002", "A"),
+            _question("qb_003", "A"),
+            _question("qb_004", "B"),
+            _question("qb_005", "B"),
+            _question("qb_006", "B"),
+        ],
+    })
+
+
+def _answer(bank, qid, choice):
+    q = bank.questions[bank.ids.index(qid)]
+    return {"question_text": q["question_text"], "selected_option": q["options"][choice]}
+
+
+def test_shipped_bank_is_valid():
+    bank = question_bank.bank
+    assert len(set(bank.ids)) == len(bank)
+    assert len(bank.baseline) == 5
+    assert all(len(q["options"]) == question_bank.OPTIONS_PER_QUESTION for q in bank.questions)
+    assert all(bank.information[i].sum() >= question_bank.MIN_INFORMATION for i in range(len(bank)))
+    assert all(bank.by_trait[trait] for trait in bank.traits)
+    assert question_bank.dumps(bank.data) == question_bank.BANK_PATH.read_text(encoding="utf-8")
+
+
+def test_selects_the_least_measured_trait():
+    bank = _bank()
+    responses = [_answer(bank, "qb_001", 0), _answer(bank, "qb_002", 0)]
+
+    [picked] = bank.select(responses)
+
+    assert picked["id"] in ("qb_004", "qb_005", "qb_006")
+    assert picked["reasoning"] == "Targets B (most uncertain traits)"
+    assert set(picked["options"][0]) == {"text", "trait_impact"}
+
+
+def test_inconsistent_answers_keep_a_trait_open():
+    bank = _bank()
+    consistent_a = [_answer(bank, "qb_001", 0), _answer(bank, "qb_002", 0)]
+    conflicting_b = [_answer(bank, "qb_004", 0), _answer(bank, "qb_005", 2)]
+    assert bank.select(consistent_a + [_answer(bank, "qb_004", 0), _answer(bank, "qb_005", 0)])[0]["id"] == "qb_003"
+
+    [picked] = bank.select(consistent_a + conflicting_b)
+
+    assert picked["id"] == "qb_006"
+
+
+def test_batch_selection_is_distinct_and_skips_baseline():
+    bank = _bank()
+
+    picked = [q["id"] for q in bank.select(count=10, assume_asked=bank.baseline)]
+
+    assert sorted(picked) == ["qb_001", "qb_002", "qb_003", "qb_004", "qb_005", "qb_006"]
+    # The baseline already covers A, so B comes first
+    assert picked[0] in ("qb_004", "qb_005", "qb_006")
+
+
+def test_matches_answers_by_text_loosely():
+    bank = _bank()
+    response = {"question_text": "  question QB_004? ", "selected_option": {"text": "QB_004 HIGH"}}
+
+    assert bank.match(response) == (bank.ids.index("qb_004"), 0)
+    assert bank.match({"question_text": "Something the AI asked once"}) is None
+
+
+def test_validate_and_extend():
+    bank = _bank()
+    good = {
+        "question_text": "A brand new question?",
+        "options": [_option("w", B=1.0), _option("x", B=0.2), _option("y", A=0.5), _option("z", B=-0.8)],
+    }
+    assert bank.validate(good) == []
+    assert "duplicate question_text" in bank.validate({**good, "question_text": "question qb_001?"})
+    assert bank.validate({**good, "options": good["options"][:3]}) == ["needs exactly 4 options"]
+    flat = {**good, "options": [_option(t, B=0.1) for t in "wxyz"]}
+    assert bank.validate(flat) == ["answers barely differ on any trait"]
+    assert bank.validate({**good, "options": [_option("w", C=1.0)] + good["options"][1:]}) == ["unknown traits: ['C']"]
+
+    data = bank.extend([good])
+    assert data["version"] == "1.1"
+    assert data["questions"][-1]["id"] == "qb_007"
+    assert data["questions"][-1]["source"] == "generated"
+
+
+@pytest.mark.asyncio
+async def test_service_questions_need_no_ai(monkeypatch):
+    async def generate(*args, **kwargs):
+        raise AssertionError("AI Gateway must not be called")
+
+    monkeypatch.setattr(psychometric_service.gateway, "generate", generate)
+    bank = question_bank.bank
+
+    baseline = await PsychometricService.generate_baseline_questions()
+    responses = [{"question_text": q["question_text"], "selected_option": q["options"][0]} for q in baseline]
+    quiz = await PsychometricService.generate_quiz_questions(responses)
+    adaptive = await PsychometricService.generate_adaptive_question(responses)
+
+    assert [q["question_text"] for q in baseline] == [bank.questions[i]["question_text"] for i in bank.baseline]
+    assert len(quiz["questions"]) == 5
+    assert {q["id"] for q in quiz["questions"]}.isdisjoint(q["id"] for q in baseline)
+    assert adaptive["id"] not in {q["id"] for q in baseline}
+    assert adaptive["reasoning"]
+
+
+@pytest.mark.asyncio
+async def test_quiz_depends_on_baseline_answers():
+    baseline = await PsychometricService.generate_baseline_questions()
+
+    def answered(*choices):
+        return [
+            {"question_text": q["question_text"], "selected_option": q["options"][c]}
+            for q, c in zip(baseline, choices)
+        ]
+
+    consistent = await PsychometricService.generate_quiz_questions(answered(0, 0, 0, 0, 0))
+    mixed = await PsychometricService.generate_quiz_questions(answered(1, 1, 0, 1, 1))
+    unanswered = await PsychometricService.generate_quiz_questions()
+
+    picks = [[q["id"] for q in quiz["questions"]] for quiz in (consistent, mixed, unanswered)]
+    assert all(len(p) == 5 for p in picks)
+    assert set(picks[0]) != set(picks[1])
+    assert picks[2] == [q["id"] for q in question_bank.bank.select(count=5, assume_asked=question_bank.bank.baseline)]
+
+
+@pytest.mark.asyncio
+async def test_grow_appends_only_valid_targeted_items(monkeypatch, tmp_path):
+    path = tmp_path / "question_bank.json"
+    path.write_text(question_bank.dumps(_bank().data), encoding="utf-8")
+    good = {
+        "question_text": "How do you spend a free afternoon?",
+        "options": [_option("w", B=1.0), _option("x", B=0.2), _option("y", A=0.5), _option("z", B=-0.8)],
+    }
+    off_target = {
+        "question_text": "Only about A?",
+        "options": [_option("w", A=1.0), _option("x", A=0.2), _option("y", A=0.5), _option("z", A=-0.8)],
+    }
+
+    async def generate(task_type, context):
+        assert "B" in context["_custom_prompt"]
+        return {"questions": [good, off_target, dict(good), "not a question"]}
+
+    monkeypatch.setattr(question_bank_grow.gateway, "generate", generate)
+
+    summary = await question_bank_grow.grow(count=4, traits=["B"], path=path)
+
+    assert summary == {"traits": ["B"], "generated": 4, "accepted": 1, "version": "1.1"}
+    grown = QuestionBank(json.loads(path.read_text(encoding="utf-8")))
+    assert grown.ids[-1] == "qb_007"
+    assert grown.questions[-1]["question_text"] == good["question_text"]
@@ -0,0 +1,267 @@
+"""
+Tests for incremental roadmap adaptation (roadmap.adapt).
+
+Covers:
+    - apply_roadmap_patch on one phase, leaving the others untouched
+    - adapt_roadmap sending only the current phase plus a summary, and saving
+      the patched roadmap as a new version with progress carried over
+    - the roadmap.adapt prompt
+    - Rules Engine failure / fast-completion triggers queueing an adaptation
+    - adaptation jobs superseded by a newer roadmap version
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.ai_gateway.gateway import AIGateway
+from app.db.rows import make_row, parse_columns
+from app.services import roadmap_service, rules_engine, rules_state
+
+PHASES = [
+    {"phase_number": 1, "title": "Foundations", "difficulty": "beginner",
+     "skills": ["Python", "Statistics"], "estimated_weeks": 6, "description": "..."},
+    {"phase_number": 2, "title": "Machine Learning", "difficulty": "intermediate",
+     "skills": ["scikit-learn", "Pandas", "SQL"], "estimated_weeks": 8, "description": "..."},
+    {"phase_number": 3, "title": "Job Readiness", "difficulty": "advanced",
+     "skills": ["Portfolio"], "estimated_weeks": 4, "description": "..."},
+]
+
+ROADMAP = {
+    "id": "rm_1",
+    "title": "Roadmap to Data Scientist",
+    "total_phases": 3,
+    "estimated_weeks": 18,
+    "current_phase_number": 2,
+    "progress_pct": 33,
+    "phases": PHASES,
+}
+
+PATCH = {
+    "phase_number": 2,
+    "patch": {
+        "difficulty": "beginner",
+        "add_skills": ["NumPy"],
+        "remove_skills": ["sql"],
+        "remedial_missions": ["Rebuild a linear regression by hand"],
+        "estimated_weeks": 10,
+    },
+    "rationale": "Three failed ML missions in a row.",
+}
+
+
+def test_apply_patch_changes_only_the_target_phase():
+    patched = roadmap_service.apply_roadmap_patch(PHASES, 2, PATCH["patch"])
+
+    assert patched[0] is PHASES[0] and patched[2] is PHASES[2]
+    phase = patched[1]
+    assert phase["skills"] == ["scikit-learn", "Pandas", "NumPy"]
+    assert phase["difficulty"] == "beginner"
+    assert phase["estimated_weeks"] == 10
+    assert phase["remedial_missions"] == ["Rebuild a linear regression by hand"]
+    # The input is not mutated
+    assert PHASES[1]["skills"] == ["scikit-learn", "Pandas", "SQL"]
+
+
+def test_apply_patch_missing_phase_returns_none():
+    assert roadmap_service.apply_roadmap_patch(PHASES, 9, {"difficulty": "advanced"}) is None
+
+
+@pytest.fixture
+def store(monkeypatch):
+    state = SimpleNamespace(roadmaps=[], events=[], contexts=[], result=PATCH)
+
+    async def get_active_roadmap(learner_id, columns="*"):
+        async def load(select):
+            return {c: ROADMAP.get(c) for c in parse_columns(select)}
+
+        wanted = parse_columns(columns) or set(ROADMAP)
+        return make_row({c: ROADMAP[c] for c in wanted if c in ROADMAP}, "roadmaps", columns, load)
+
+    async def get_learner(learner_id, columns="*"):
+        return {"id": learner_id, "target_role": "Data Scientist"}
+
+    async def create_roadmap(learner_id, data):
+        state.roadmaps.append(data)
+        return {**data, "id": "rm_2", "version": 2}
+
+    async def create_event(learner_id, event_type, payload, related_mission_id=None, related_roadmap_id=None):
+        state.events.append((event_type, payload))
+
+    async def generate(task_type, context, response_model=None):
+        assert task_type == "roadmap.adapt"
+        state.contexts.append(context)
+        return state.result
+
+    monkeypatch.setattr(roadmap_service.queries, "get_active_roadmap", get_active_roadmap)
+    monkeypatch.setattr(roadmap_service.queries, "get_learner", get_learner)
+    monkeypatch.setattr(roadmap_service.queries, "create_roadmap", create_roadmap)
+    monkeypatch.setattr(roadmap_service.queries, "create_event", create_event)
+    monkeypatch.setattr(roadmap_service, "gateway", SimpleNamespace(generate=generate))
+    return state
+
+
+@pytest.mark.asyncio
+async def test_adapt_sends_only_current_phase_and_saves_new_version(store):
+    result = await roadmap_service.adapt_roadmap(
+        "learner-1", "failure_pattern", {"consecutive_failures": 3}
+    )
+
+    assert result["status"] == "ok"
+    context = store.contexts[0]
+    assert context["phase"] == PHASES[1]
+    assert context["roadmap_summary"] == [
+        "Phase 1: Foundations (beginner) — Python, Statistics",
+        "Phase 3: Job Readiness (advanced) — Portfolio",
+    ]
+
+    saved = store.roadmaps[0]
+    assert saved["trigger_reason"] == "failure_pattern"
+    assert saved["current_phase_number"] == 2
+    assert saved["progress_pct"] == 33
+    assert saved["estimated_weeks"] == 20
+    assert saved["phases"][0] == PHASES[0]
+    assert saved["phases"][1]["difficulty"] == "beginner"
+
+    event_type, payload = store.events[0]
+    assert event_type == "roadmap_regenerated"
+    assert payload["mode"] == "adapt"
+
+
+@pytest.mark.asyncio
+async def test_empty_patch_saves_nothing(store):
+    store.result = {"phase_number": 2, "patch": {}, "rationale": ""}
+
+    result = await roadmap_service.adapt_roadmap("learner-1", "fast_completion", {})
+
+    assert result["status"] == "unchanged"
+    assert store.roadmaps == []
+
+
+def test_adapt_prompt_holds_one_phase():
+    gateway = AIGateway(provider=SimpleNamespace())
+    prompt = gateway._build_prompt("roadmap.adapt", {
+        "target_role": "Data Scientist",
+        "trigger": "certificate_upload",
+        "signal": {"certificate": 'AWS "Practitioner"'},
+        "phase_number": 2,
+        "phase": PHASES[1],
+        "roadmap_summary": roadmap_service.summarize_phases(PHASES, exclude=2),
+    })
+
+    assert "scikit-learn" in prompt
+    assert "Phase 1: Foundations (beginner)" in prompt
+    # Other phases appear only as summary lines
+    assert '"title":"Foundations"' not in prompt
+    assert "AWS Practitioner" in prompt
+    assert "certificate covering some skills" in prompt
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    queued = []
+
+    async def enqueue_adaptation(learner_id, trigger, signal):
+        queued.append((trigger, signal))
+        return {"status": "queued", "job_id": "job-1"}
+
+    async def create_event(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(rules_engine.queries, "create_event", create_event)
+    monkeypatch.setattr(rules_engine, "enqueue_adaptation", enqueue_adaptation)
+    return queued
+
+
+def _with_outcomes(monkeypatch, outcomes):
+    state = rules_state.empty_state()
+    for i, outcome in reversed(list(enumerate(outcomes))):
+        state = rules_state.apply_event(state, {
+            "event_type": rules_state.STATUS_EVENTS[outcome.pop("status")], "payload": outcome,
+            "related_mission_id": f"m{i}",
+        })
+
+    async def record_event(learner_id, event):
+        return state
+
+    monkeypatch.setattr(rules_engine.rules_state, "record_event", record_event)
+
+
+@pytest.mark.asyncio
+async def test_failure_pattern_queues_adaptation(monkeypatch, engine):
+    _with_outcomes(monkeypatch, [{"title": f"M{i}", "target_skill": "SQL", "status": "failed"} for i in range(3)])
+
+    decision = await rules_engine.RulesEngine().evaluate_and_trigger("learner-1", "mission_failed", {})
+
+    assert decision["job_id"] == "job-1"
+    trigger, signal = engine[0]
+    assert trigger == "failure_pattern"
+    assert signal["consecutive_failures"] == 3
+    assert [m["title"] for m in signal["missions"]] == ["M0", "M1", "M2"]
+
+
+@pytest.mark.asyncio
+async def test_fast_completion_queues_adaptation(monkeypatch, engine):
+    _with_outcomes(monkeypatch, [
+        {"title": f"M{i}", "status": "completed", "estimated_minutes": 40, "time_spent_minutes": 10}
+        for i in range(3)
+    ])
+
+    decision = await rules_engine.RulesEngine().evaluate_and_trigger("learner-1", "mission_completed", {})
+
+    assert decision["fast_streak"] == 3
+    assert engine[0][0] == "fast_completion"
+
+
+def test_adaptation_job_skipped_after_newer_version(monkeypatch):
+    progress = []
+
+    async def last_regeneration(learner_id):
+        return "2026-10-19T12:00:00+00:00"
+
+    async def update_job_progress(job_id, state, result=None):
+        progress.append((state, result and result["status"]))
+
+    async def adapt(*args, **kwargs):
+        raise AssertionError("superseded job must not call roadmap.adapt")
+
+    monkeypatch.setattr(roadmap_service.queries, "get_last_regeneration", last_regeneration)
+    monkeypatch.setattr(roadmap_service.queries, "update_job_progress", update_job_progress)
+    monkeypatch.setattr(roadmap_service, "adapt_roadmap", adapt)
+
+    done = asyncio.run(roadmap_service.run_adaptation_job({
+        "id": "job-1",
+        "learner_id": "learner-1",
+        "created_at": "2026-10-19T11:00:00+00:00",
+        "payload": {"trigger": "failure_pattern", "signal": {}},
+    }))
+
+    assert done is True
+    assert progress == [("failed", "superseded")]
+
+
+def test_adaptation_job_ignores_learner_in_payload(monkeypatch):
+    adapted = []
+
+    async def last_regeneration(learner_id):
+        return None
+
+    async def update_job_progress(job_id, state, result=None):
+        pass
+
+    async def adapt(learner_id, trigger, signal, progress=None):
+        adapted.append(learner_id)
+        return {"status": "ok"}
+
+    monkeypatch.setattr(roadmap_service.queries, "get_last_regeneration", last_regeneration)
+    monkeypatch.setattr(roadmap_service.queries, "update_job_progress", update_job_progress)
+    monkeypatch.setattr(roadmap_service, "adapt_roadmap", adapt)
+
+    asyncio.run(roadmap_service.run_adaptation_job({
+        "id": "job-1",
+        "learner_id": "learner-1",
+        "payload": {"learner_id": "learner-2", "trigger": "failure_pattern", "signal": {}},
+    }))
+
+    assert adapted == ["learner-1"]
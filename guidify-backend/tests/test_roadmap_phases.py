@@ -0,0 +1,159 @@
+"""
+Tests for partial roadmap reads and phase progress (migration 029).
+
+Covers the legacy fallbacks (no RPCs) that mirror the SQL functions:
+    - GET /roadmap/current?view=summary|current_phase shapes
+    - phase status derivation
+    - POST /roadmap/phases/{n}/complete advancing once, ignoring retries,
+      and writing only the progress columns
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.auth import get_current_learner_id
+from app.db import queries
+
+ROADMAP = {
+    "id": "roadmap-1",
+    "title": "Roadmap to Data Scientist",
+    "version": 2,
+    "total_phases": 3,
+    "estimated_weeks": 24,
+    "current_phase_number": 2,
+    "progress_pct": 33,
+    "created_at": "2026-10-01T00:00:00Z",
+    "phases": [
+        {"phase_number": 1, "title": "Foundations", "difficulty": "beginner",
+         "skills": ["Python", "Statistics"], "description": "..."},
+        {"phase_number": 2, "title": "Machine Learning", "difficulty": "intermediate",
+         "skills": ["scikit-learn", "Pandas", "SQL"], "description": "..."},
+        {"phase_number": 3, "title": "Job Readiness", "difficulty": "advanced",
+         "skills": ["Portfolio"], "description": "..."},
+    ],
+}
+
+
+class FakeCache:
+    async def delete(self, *keys):
+        return 0
+
+
+class FakeQuery:
+    """Chainable stand-in for a PostgREST query builder."""
+
+    def __init__(self, table, log):
+        self.table = table
+        self.log = log
+
+    def __getattr__(self, name):
+        def chain(*args, **kwargs):
+            self.log.append((self.table, name, args))
+            return self
+        return chain
+
+    def execute(self):
+        return type("Response", (), {"data": []})()
+
+
+class FakeDB:
+    def __init__(self):
+        self.log = []
+
+    def rpc(self, name, *args, **kwargs):
+        raise RuntimeError(f"function {name} does not exist")
+
+    def table(self, name):
+        return FakeQuery(name, self.log)
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_learner_id] = lambda: "test_user"
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def db(monkeypatch):
+    state = {"roadmap": dict(ROADMAP)}
+    fake = FakeDB()
+
+    async def get_active_roadmap(learner_id, columns="*"):
+        return dict(state["roadmap"])
+
+    monkeypatch.setattr(queries, "supabase", fake)
+    monkeypatch.setattr(queries, "cache", FakeCache())
+    monkeypatch.setattr(queries, "get_active_roadmap", get_active_roadmap)
+    fake.state = state
+    return fake
+
+
+def test_phase_status():
+    assert queries._phase_status(1, 2, 33) == "completed"
+    assert queries._phase_status(2, 2, 33) == "current"
+    assert queries._phase_status(3, 2, 33) == "upcoming"
+    assert queries._phase_status(3, 3, 100) == "completed"
+
+
+def test_summary_view(client, db):
+    body = client.get("/api/v1/roadmap/current?view=summary").json()
+
+    assert body["id"] == "roadmap-1"
+    assert body["phases"] == [
+        {"phase_number": 1, "title": "Foundations", "difficulty": "beginner",
+         "status": "completed", "skill_count": 2},
+        {"phase_number": 2, "title": "Machine Learning", "difficulty": "intermediate",
+         "status": "current", "skill_count": 3},
+        {"phase_number": 3, "title": "Job Readiness", "difficulty": "advanced",
+         "status": "upcoming", "skill_count": 1},
+    ]
+    assert body["current_phase"]["skills"] == ["scikit-learn", "Pandas", "SQL"]
+    assert body["current_phase"]["status"] == "current"
+
+
+def test_current_phase_view(client, db):
+    body = client.get("/api/v1/roadmap/current?view=current_phase").json()
+    assert "phases" not in body
+    assert body["phase"]["title"] == "Machine Learning"
+
+    body = client.get("/api/v1/roadmap/current?view=current_phase&phase=3").json()
+    assert body["phase"]["title"] == "Job Readiness"
+    assert body["phase"]["status"] == "upcoming"
+
+
+def test_full_view_is_default(client, db):
+    body = client.get("/api/v1/roadmap/current").json()
+    assert body["phases"] == ROADMAP["phases"]
+
+
+def test_complete_current_phase_advances(client, db):
+    response = client.post("/api/v1/roadmap/phases/2/complete")
+    assert response.status_code == 200
+    body = response.json()
+
+    assert body["advanced"] is True
+    assert body["current_phase_number"] == 3
+    assert body["progress_pct"] == 66
+    updates = [args for table, name, args in db.log if name == "update"]
+    assert updates == [({"current_phase_number": 3, "progress_pct": 66},)]
+
+
+def test_complete_other_phase_is_noop(client, db):
+    body = client.post("/api/v1/roadmap/phases/1/complete").json()
+
+    assert body["advanced"] is False
+    assert body["current_phase_number"] == 2
+    assert not any(name == "update" for _table, name, _args in db.log)
+
+
+def test_complete_last_phase_finishes_roadmap(client, db):
+    db.state["roadmap"].update(current_phase_number=3, progress_pct=66)
+
+    body = client.post("/api/v1/roadmap/phases/3/complete").json()
+
+    assert body == {
+        "status": "ok", "roadmap_id": "roadmap-1",
+        "advanced": True, "current_phase_number": 3, "progress_pct": 100,
+    }
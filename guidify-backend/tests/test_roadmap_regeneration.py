@@ -1,22 +1,33 @@
 """
-Tests for POST /api/v1/roadmap/regenerate — api.md §3.
+Tests for POST /api/v1/roadmap/regenerate and GET /roadmap/jobs/{id} — api.md §3.
 
-Covers the full regeneration flow with a mocked AI Gateway and mocked DB layer:
+Covers the queued regeneration flow with a mocked AI Gateway and mocked DB layer:
+    - the request returns a job id; the job (run as the worker would) saves
+      the roadmap and records queued → generating → validating → saved
     - first-time generation (version 1, "roadmap_generated" event)
     - regeneration (version increments, old superseded, "roadmap_regenerated" event)
+    - duplicate requests join the queued job
     - 24h debounce (rules.md §2): 409 inside the window, allowed after
-    - AI Gateway failure → 502, nothing persisted
-    - DB save failure → 500
+    - AI Gateway failure → retried, then job failed, nothing persisted
+    - goal change while a job runs, then a retryable failure → the retry is
+      folded into the queued goal-change job (one pending job per learner)
+    - DB save failure → job failed
     - missing learner → 404
+    - no job queue → regenerated inline (200 / 502)
+    - the enqueue RPC runs with the service-role client
+    - pre-AI reads run concurrently
 """
 
+import asyncio
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.core.auth import get_current_learner_id
+from app.db import queries
 from app.services import roadmap_service
 
 SAMPLE_ROADMAP = {
@@ -91,22 +102,34 @@ class FakeStore:
         }
         self.roadmaps = []
         self.events = []
+        self.jobs = {}
+        self.progress = []
         self.last_regeneration = None
         self.psychometric = None
         self.save_failure = False
         self.learner_present = True
+        self.queue_available = True
+        self.reads_in_flight = 0
+        self.max_reads_in_flight = 0
 
-    async def get_learner(self, learner_id):
-        return dict(self.learner) if self.learner_present else None
+    async def _read(self, value):
+        self.reads_in_flight += 1
+        self.max_reads_in_flight = max(self.max_reads_in_flight, self.reads_in_flight)
+        await asyncio.sleep(0)
+        self.reads_in_flight -= 1
+        return value
 
-    async def get_learner_profile(self, learner_id):
-        return dict(self.profile)
+    async def get_learner(self, learner_id, columns="*"):
+        return await self._read(dict(self.learner) if self.learner_present else None)
+
+    async def get_learner_profile(self, learner_id, columns="*"):
+        return await self._read(dict(self.profile))
 
     async def get_psychometric_profile(self, learner_id):
-        return self.psychometric
+        return await self._read(self.psychometric)
 
     async def get_last_regeneration(self, learner_id):
-        return self.last_regeneration
+        return await self._read(self.last_regeneration)
 
     async def create_roadmap(self, learner_id, data):
         if self.save_failure:
@@ -138,6 +161,81 @@ class FakeStore:
             self.last_regeneration = event["created_at"]
         return event
 
+    async def enqueue_roadmap_job(self, learner_id, trigger_reason, bypass_debounce=False):
+        """Mirror of enqueue_roadmap_job (migration 030)."""
+        if not self.queue_available:
+            return None
+        joinable = ("pending",) if bypass_debounce else ("pending", "processing")
+        for job in sorted(self.jobs.values(), key=lambda j: j["status"] != "pending"):
+            if job["status"] in joinable:
+                if bypass_debounce:
+                    job["payload"].update(trigger_reason=trigger_reason, bypass_debounce=True)
+                return {"job_id": job["id"], "coalesced": True}
+        job_id = f"job_{len(self.jobs) + 1}"
+        self.jobs[job_id] = {
+            "id": job_id,
+            "job_type": "roadmap_generate",
+            "learner_id": learner_id,
+            "status": "pending",
+            "progress_state": "queued",
+            "result": None,
+            "attempts": 0,
+            "payload": {
+                "learner_id": learner_id,
+                "trigger_reason": trigger_reason,
+                "bypass_debounce": bypass_debounce,
+            },
+        }
+        return {"job_id": job_id, "coalesced": False}
+
+    async def get_job(self, job_id, learner_id, columns="*"):
+        job = self.jobs.get(job_id)
+        return dict(job) if job and job["learner_id"] == learner_id else None
+
+    async def update_job_progress(self, job_id, progress_state, result=None):
+        self.progress.append(progress_state)
+        self.jobs[job_id]["progress_state"] = progress_state
+        if result is not None:
+            self.jobs[job_id]["result"] = result
+
+    def claim(self, job_id):
+        job = self.jobs[job_id]
+        job["status"] = "processing"
+        job["attempts"] += 1
+        return dict(job, payload=dict(job["payload"]))
+
+    def complete_job(self, job_id, success, final=True):
+        """Mirror of complete_job (migration 030), final standing in for attempts >= max_attempts."""
+        job = self.jobs[job_id]
+        if success:
+            job["status"] = "completed"
+            return
+        successor = next(
+            (j for j in self.jobs.values() if j["status"] == "pending" and j["id"] != job_id), None
+        )
+        if not final and successor:
+            if job["payload"].get("bypass_debounce"):
+                successor["payload"]["bypass_debounce"] = True
+            job["status"] = "failed"
+            job["progress_state"] = "failed"
+            job["result"] = {
+                **(job["result"] or {}),
+                "status": "superseded",
+                "superseded_by": successor["id"],
+                "message": "Replaced by a newer roadmap request",
+            }
+            return
+        job["status"] = "failed" if final else "pending"
+        # uq_job_queue_roadmap_pending
+        assert sum(j["status"] == "pending" for j in self.jobs.values()) <= 1
+
+    def run_jobs(self, final=True):
+        """Process pending jobs the way app/workers/job_worker.py does."""
+        for job_id in [j["id"] for j in self.jobs.values() if j["status"] == "pending"]:
+            job = self.claim(job_id)
+            success = asyncio.run(roadmap_service.run_regeneration_job(job, final=final))
+            self.complete_job(job_id, success, final=final)
+
 
 @pytest.fixture()
 def client(monkeypatch):
@@ -154,27 +252,35 @@ def store():
     return FakeStore()
 
 
+def _install(monkeypatch, store, gateway):
+    monkeypatch.setattr(roadmap_service, "gateway", gateway)
+    for name in (
+        "get_learner", "get_learner_profile", "get_last_regeneration",
+        "get_psychometric_profile", "create_roadmap", "create_event",
+        "enqueue_roadmap_job", "get_job", "update_job_progress",
+    ):
+        monkeypatch.setattr(roadmap_service.queries, name, getattr(store, name))
+
+
 @pytest.fixture()
 def installed(monkeypatch, store):
     """Install FakeGateway + FakeStore into the roadmap service module."""
-    monkeypatch.setattr(roadmap_service, "gateway", FakeGateway(result=SAMPLE_ROADMAP))
-    monkeypatch.setattr(roadmap_service.queries, "get_learner", store.get_learner)
-    monkeypatch.setattr(roadmap_service.queries, "get_learner_profile", store.get_learner_profile)
-    monkeypatch.setattr(roadmap_service.queries, "get_last_regeneration", store.get_last_regeneration)
-    monkeypatch.setattr(roadmap_service.queries, "get_psychometric_profile", store.get_psychometric_profile)
-    monkeypatch.setattr(roadmap_service.queries, "create_roadmap", store.create_roadmap)
-    monkeypatch.setattr(roadmap_service.queries, "create_event", store.create_event)
+    _install(monkeypatch, store, FakeGateway(result=SAMPLE_ROADMAP))
     return store
 
 
-def test_regenerate_creates_first_roadmap(client, installed):
+def test_regenerate_queues_job_and_job_saves_roadmap(client, installed):
     response = client.post("/api/v1/roadmap/regenerate")
-    assert response.status_code == 200
+    assert response.status_code == 202
     data = response.json()
-    assert data["status"] == "ok"
-    assert data["title"] == SAMPLE_ROADMAP["title"]
-    assert data["total_phases"] == 3
+    assert data["status"] == "queued"
+    assert data["progress_state"] == "queued"
+    job_id = data["job_id"]
+    assert installed.roadmaps == []
+
+    installed.run_jobs()
 
+    assert installed.progress == ["generating", "validating", "saved"]
     assert len(installed.roadmaps) == 1
     saved = installed.roadmaps[0]
     assert saved["version"] == 1
@@ -185,6 +291,30 @@ def test_regenerate_creates_first_roadmap(client, installed):
     event_types = [e["event_type"] for e in installed.events]
     assert event_types == ["roadmap_generated"]
 
+    job = client.get(f"/api/v1/roadmap/jobs/{job_id}").json()
+    assert job["progress_state"] == "saved"
+    assert job["result"]["status"] == "ok"
+    assert job["result"]["title"] == SAMPLE_ROADMAP["title"]
+    assert job["result"]["roadmap_id"] == "rm_1"
+
+
+def test_duplicate_requests_join_queued_job(client, installed):
+    first = client.post("/api/v1/roadmap/regenerate").json()
+    second = client.post("/api/v1/roadmap/regenerate").json()
+
+    assert second["job_id"] == first["job_id"]
+    assert second["coalesced"] is True
+    assert len(installed.jobs) == 1
+
+    installed.run_jobs()
+    assert roadmap_service.gateway.calls == 1
+    assert len(installed.roadmaps) == 1
+
+
+def test_job_status_unknown_job_returns_404(client, installed):
+    response = client.get("/api/v1/roadmap/jobs/missing")
+    assert response.status_code == 404
+
 
 def test_regenerate_injects_psychometric_context(client, installed):
     """F-10: psychometric narrative must reach the roadmap prompt context."""
@@ -195,7 +325,8 @@ def test_regenerate_injects_psychometric_context(client, installed):
     }
 
     response = client.post("/api/v1/roadmap/regenerate")
-    assert response.status_code == 200
+    assert response.status_code == 202
+    installed.run_jobs()
 
     service_gateway = roadmap_service.gateway
     context = service_gateway.last_context
@@ -204,6 +335,11 @@ def test_regenerate_injects_psychometric_context(client, installed):
     assert context.get("psychometric_tone") == "direct"
 
 
+def test_pre_ai_reads_run_concurrently(installed):
+    asyncio.run(roadmap_service.regenerate_roadmap("test_user"))
+    assert installed.max_reads_in_flight == 4
+
+
 def test_regenerate_increments_version_and_supersedes(client, installed):
     installed.roadmaps.append({
         "id": "rm_1",
@@ -219,7 +355,8 @@ def test_regenerate_increments_version_and_supersedes(client, installed):
     assert installed.roadmaps[0]["version"] == 1
 
     response = client.post("/api/v1/roadmap/regenerate")
-    assert response.status_code == 200
+    assert response.status_code == 202
+    installed.run_jobs()
 
     assert len(installed.roadmaps) == 2
     assert installed.roadmaps[0]["status"] == "superseded"
@@ -236,6 +373,7 @@ def test_regenerate_debounced_within_24h(client, installed):
     response = client.post("/api/v1/roadmap/regenerate")
     assert response.status_code == 409
     assert "24 hours" in response.json()["error"]["message"]
+    assert installed.jobs == {}
     assert installed.roadmaps == []
     assert installed.events == []
 
@@ -245,32 +383,64 @@ def test_regenerate_allowed_after_24h(client, installed):
         datetime.now(timezone.utc) - timedelta(hours=25)
     ).isoformat()
     response = client.post("/api/v1/roadmap/regenerate")
-    assert response.status_code == 200
+    assert response.status_code == 202
+    installed.run_jobs()
     assert len(installed.roadmaps) == 1
 
 
-def test_regenerate_ai_failure_returns_502(client, monkeypatch, store):
+def test_regenerate_ai_failure_retries_then_fails(client, monkeypatch, store):
     from app.core.exceptions import AIServiceError
-    gateway = FakeGateway(error=AIServiceError(message="model timeout"))
-    monkeypatch.setattr(roadmap_service, "gateway", gateway)
-    monkeypatch.setattr(roadmap_service.queries, "get_learner", store.get_learner)
-    monkeypatch.setattr(roadmap_service.queries, "get_learner_profile", store.get_learner_profile)
-    monkeypatch.setattr(roadmap_service.queries, "get_last_regeneration", store.get_last_regeneration)
-    monkeypatch.setattr(roadmap_service.queries, "get_psychometric_profile", store.get_psychometric_profile)
-    monkeypatch.setattr(roadmap_service.queries, "create_roadmap", store.create_roadmap)
-    monkeypatch.setattr(roadmap_service.queries, "create_event", store.create_event)
+    _install(monkeypatch, store, FakeGateway(error=AIServiceError(message="model timeout")))
 
-    response = client.post("/api/v1/roadmap/regenerate")
-    assert response.status_code == 502
-    assert "failed" in response.json()["error"]["message"]
+    job_id = client.post("/api/v1/roadmap/regenerate").json()["job_id"]
+
+    store.run_jobs(final=False)
+    assert store.jobs[job_id]["status"] == "pending"
+    assert store.jobs[job_id]["progress_state"] == "queued"
+
+    store.run_jobs(final=True)
+    job = client.get(f"/api/v1/roadmap/jobs/{job_id}").json()
+    assert job["progress_state"] == "failed"
+    assert job["result"]["status"] == "ai_failed"
+    assert "failed" in job["result"]["message"]
     assert store.roadmaps == []
     assert store.events == []
 
 
-def test_regenerate_save_failure_returns_500(client, installed):
+def test_goal_change_during_job_then_retryable_failure(client, monkeypatch, store):
+    from app.core.exceptions import AIServiceError
+    _install(monkeypatch, store, FakeGateway(error=AIServiceError(message="model timeout")))
+
+    first_id = client.post("/api/v1/roadmap/regenerate").json()["job_id"]
+    running = store.claim(first_id)
+    # A goal change while the first job runs queues a new job behind it
+    goal_change = asyncio.run(roadmap_service.enqueue_regeneration(
+        "test_user", trigger_reason="goal_change", bypass_debounce=True,
+    ))
+    assert goal_change["coalesced"] is False
+
+    success = asyncio.run(roadmap_service.run_regeneration_job(running, final=False))
+    store.complete_job(first_id, success, final=False)
+
+    first = client.get(f"/api/v1/roadmap/jobs/{first_id}").json()
+    assert first["progress_state"] == "failed"
+    assert first["result"]["superseded_by"] == goal_change["job_id"]
+    assert [j["id"] for j in store.jobs.values() if j["status"] == "pending"] == [goal_change["job_id"]]
+
+    monkeypatch.setattr(roadmap_service, "gateway", FakeGateway(result=SAMPLE_ROADMAP))
+    store.run_jobs()
+
+    assert store.jobs[goal_change["job_id"]]["progress_state"] == "saved"
+    assert [r["trigger_reason"] for r in store.roadmaps] == ["goal_change"]
+
+
+def test_regenerate_save_failure_fails_job(client, installed):
     installed.save_failure = True
-    response = client.post("/api/v1/roadmap/regenerate")
-    assert response.status_code == 500
+    job_id = client.post("/api/v1/roadmap/regenerate").json()["job_id"]
+    installed.run_jobs()
+
+    assert installed.jobs[job_id]["progress_state"] == "failed"
+    assert installed.jobs[job_id]["result"]["status"] == "save_failed"
     assert installed.roadmaps == []
     assert installed.events == []
 
@@ -279,5 +449,60 @@ def test_regenerate_missing_learner_returns_404(client, installed):
     installed.learner_present = False
     response = client.post("/api/v1/roadmap/regenerate")
     assert response.status_code == 404
+    assert installed.jobs == {}
     assert installed.roadmaps == []
     assert installed.events == []
+
+
+def test_regenerate_inline_without_job_queue(client, installed):
+    installed.queue_available = False
+    response = client.post("/api/v1/roadmap/regenerate")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ok"
+    assert data["job_id"] is None
+    assert data["title"] == SAMPLE_ROADMAP["title"]
+    assert len(installed.roadmaps) == 1
+
+
+def test_regenerate_inline_ai_failure_returns_502(client, monkeypatch, store):
+    from app.core.exceptions import AIServiceError
+    _install(monkeypatch, store, FakeGateway(error=AIServiceError(message="model timeout")))
+    store.queue_available = False
+
+    response = client.post("/api/v1/roadmap/regenerate")
+    assert response.status_code == 502
+    assert "failed" in response.json()["error"]["message"]
+    assert store.roadmaps == []
+
+
+def test_validation_renumbers_phases():
+    result = roadmap_service._validate_roadmap({
+        "title": "R",
+        "total_phases": 5,
+        "estimated_weeks": 8,
+        "phases": [{"phase_number": 4, "title": "B"}, {"phase_number": 2, "title": "A"}],
+    })
+    assert [(p["phase_number"], p["title"]) for p in result["phases"]] == [(1, "A"), (2, "B")]
+    assert result["total_phases"] == 2
+    assert roadmap_service._validate_roadmap({"phases": []}) is None
+
+
+def test_enqueue_rpc_runs_with_the_service_role(monkeypatch):
+    """enqueue_roadmap_job is service-role only (migration 030)."""
+    calls = []
+
+    def rpc(name, params):
+        calls.append((name, params))
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data={"job_id": "job_1", "coalesced": False}))
+
+    monkeypatch.setattr(queries, "get_service_client", lambda: SimpleNamespace(rpc=rpc))
+
+    job = asyncio.run(queries.enqueue_roadmap_job("test_user", "goal_change", bypass_debounce=True))
+
+    assert job == {"job_id": "job_1", "coalesced": False}
+    assert calls == [("enqueue_roadmap_job", {
+        "p_trigger_reason": "goal_change",
+        "p_bypass_debounce": True,
+        "p_learner_id": "test_user",
+    })]
@@ -0,0 +1,73 @@
+"""
+Tests for projected rows (app.db.rows).
+
+Covers the projection guard on Row indexing, the dict `.get` contract for
+columns outside the projection, lazy loading of heavy columns through
+`Row.fetch`, and that unprojected ("*") rows behave like plain dicts.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.db import rows
+from app.db.rows import ColumnNotLoaded, Row, make_row, parse_columns
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    logged = []
+    monkeypatch.setattr(rows, "logger", SimpleNamespace(warning=logged.append))
+    return logged
+
+
+def test_parse_columns():
+    assert parse_columns("*") is None
+    assert parse_columns("id, target_role,segment") == {"id", "target_role", "segment"}
+
+
+def test_projected_row_rejects_indexing_unselected_columns():
+    row = Row({"id": "r1", "total_phases": 4}, "roadmaps", "id, total_phases")
+    assert row["total_phases"] == 4
+    assert row.get("id") == "r1"
+    with pytest.raises(ColumnNotLoaded, match="fetch"):
+        row["phases"]
+    with pytest.raises(ColumnNotLoaded, match="outside the projection"):
+        row["title"]
+    with pytest.raises(KeyError):
+        row["progress_pct"]
+
+
+def test_get_outside_projection_returns_default_and_warns(warnings):
+    row = Row({"id": "r1"}, "roadmaps", "id")
+
+    assert row.get("phases") is None
+    assert row.get("progress_pct", 0) == 0
+
+    assert len(warnings) == 2
+    assert warnings[0].startswith("roadmaps.phases is not loaded")
+    assert "outside the projection" in warnings[1]
+
+
+@pytest.mark.asyncio
+async def test_fetch_loads_heavy_column_once():
+    calls = []
+
+    async def loader(columns):
+        calls.append(columns)
+        return {"phases": [{"phase_number": 1}]}
+
+    row = make_row({"id": "r1", "total_phases": 4}, "roadmaps", "id, total_phases", loader)
+
+    assert await row.fetch("phases") == [{"phase_number": 1}]
+    assert row["phases"] == [{"phase_number": 1}]
+    assert await row.fetch("phases", "total_phases") is row
+    assert calls == ["phases"]
+
+
+def test_star_rows_never_raise(warnings):
+    row = make_row({"id": "r1"}, "roadmaps", "*")
+    assert row.get("phases") is None
+    assert warnings == []
+    assert row.is_loaded("anything")
+    assert make_row(None, "roadmaps", "*") is None
@@ -0,0 +1,170 @@
+"""
+Tests for the per-learner rules state (app/services/rules_state.py):
+incremental updates, rebuilds from event_log, equivalence with the
+streaks the Rules Engine used to compute from daily_missions, and that only
+outcomes tied to a mission are counted.
+"""
+
+import random
+
+import pytest
+
+from app.services import rules_engine, rules_state
+
+STATUSES = ["completed", "failed", "too_hard", "skipped"]
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=3600):
+        self.store[key] = value
+        return True
+
+
+def _legacy(missions):
+    """Streaks over the newest 10 finished daily_missions rows, as the engine computed them."""
+    recent = missions[:10]
+    return (
+        rules_state.leading(recent, rules_state.is_failure),
+        rules_state.leading(recent, rules_state.is_fast),
+    )
+
+
+def _simulate(seed, steps=60):
+    """Random mission outcomes, sometimes re-finishing the newest mission."""
+    rng = random.Random(seed)
+    missions, events = [], []
+    for i in range(steps):
+        if missions and rng.random() < 0.2:
+            mission = missions[0]
+        else:
+            mission = {"id": f"m{i}", "title": f"Mission {i}", "estimated_minutes": rng.choice([None, 20, 40])}
+            missions.insert(0, mission)
+        mission["status"] = rng.choice(STATUSES)
+        mission["time_spent_minutes"] = rng.choice([None, 5, 15, 30])
+        payload = {f: mission[f] for f in rules_state.OUTCOME_FIELDS if mission.get(f) is not None}
+        events.insert(0, {
+            "id": f"e{i}",
+            "event_type": rules_state.STATUS_EVENTS[mission["status"]],
+            "payload": payload,
+            "related_mission_id": mission["id"],
+            "created_at": f"2026-10-19T00:{i:02d}:00+00:00",
+        })
+        yield missions, events
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_matches_rebuild_and_legacy(seed):
+    state = rules_state.empty_state()
+    for missions, events in _simulate(seed):
+        state = rules_state.apply_event(state, events[0])
+        assert (state["consecutive_failures"], state["fast_streak"]) == _legacy(missions)
+        assert state["missions"] == len(missions)
+
+    rebuilt = rules_state.rebuild(events)
+    assert rebuilt == state
+    assert len(state["outcomes"]) == 10
+
+
+def test_apply_does_not_mutate_the_input():
+    state = rules_state.empty_state()
+    rules_state.apply_event(state, {"event_type": "mission_failed", "payload": {}})
+    assert state == rules_state.empty_state()
+
+
+def test_outcomes_without_a_mission_are_ignored():
+    state = rules_state.apply_event(None, {"event_type": "mission_failed", "payload": {}, "related_mission_id": "m1"})
+    for _ in range(2):
+        state = rules_state.apply_event(state, {"event_type": "mission_failed", "payload": {}})
+
+    assert state["consecutive_failures"] == 1
+    assert state["missions"] == 1
+
+
+def test_repeat_outcome_replaces_its_entry_in_the_window():
+    state = None
+    for mission_id, event_type in [("m1", "mission_failed"), ("m2", "mission_failed"), ("m1", "mission_failed")]:
+        state = rules_state.apply_event(state, {"event_type": event_type, "payload": {}, "related_mission_id": mission_id})
+
+    assert [o["mission_id"] for o in state["outcomes"]] == ["m2", "m1"]
+    assert state["consecutive_failures"] == 2
+    assert state["missions"] == 2
+
+
+def test_rebuild_keeps_the_latest_regeneration():
+    events = [{"event_type": "roadmap_generated", "created_at": "2026-10-18T09:00:00+00:00"}]
+
+    assert rules_state.rebuild(events)["last_regeneration"] == "2026-10-18T09:00:00+00:00"
+    assert rules_state.rebuild(events, "2026-10-19T09:00:00+00:00")["last_regeneration"] == "2026-10-19T09:00:00+00:00"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    cache = FakeCache()
+    reads = []
+    log = [
+        {"id": f"e{i}", "event_type": "mission_failed", "payload": {"title": f"M{i}"},
+         "related_mission_id": f"m{i}", "created_at": f"2026-10-19T00:0{i}:00+00:00"}
+        for i in range(2, 0, -1)
+    ]
+
+    async def get_events_by_types(learner_id, event_types, limit=200):
+        reads.append(limit)
+        return list(log)
+
+    async def get_last_regeneration(learner_id):
+        return None
+
+    async def create_event(learner_id, event_type, payload, related_mission_id=None, **kwargs):
+        event = {"id": f"e{len(log) + 1}", "event_type": event_type, "payload": payload,
+                 "related_mission_id": related_mission_id,
+                 "created_at": f"2026-10-19T00:0{len(log) + 1}:00+00:00"}
+        log.insert(0, event)
+        return event
+
+    async def no_history(*args, **kwargs):
+        raise AssertionError("trigger evaluation must not query mission history")
+
+    async def enqueue_adaptation(learner_id, trigger, signal):
+        return {"status": "queued", "job_id": "job-1"}
+
+    monkeypatch.setattr(rules_state, "cache", cache)
+    monkeypatch.setattr(rules_state.queries, "get_events_by_types", get_events_by_types)
+    monkeypatch.setattr(rules_state.queries, "get_last_regeneration", get_last_regeneration)
+    monkeypatch.setattr(rules_state.queries, "create_event", create_event)
+    monkeypatch.setattr(rules_state.queries, "get_recent_missions", no_history)
+    monkeypatch.setattr(rules_engine, "enqueue_adaptation", enqueue_adaptation)
+    return cache, reads
+
+
+@pytest.mark.asyncio
+async def test_engine_rebuilds_once_then_updates_incrementally(store):
+    cache, reads = store
+    engine = rules_engine.RulesEngine()
+
+    decision = await engine.evaluate_mission_outcome("learner-1", {"id": "m3", "status": "failed", "title": "M3"})
+    assert decision["consecutive_failures"] == 3
+    assert [m["title"] for m in cache.store["rules_state:learner-1"]["outcomes"]] == ["M3", "M2", "M1"]
+
+    await engine.evaluate_mission_outcome("learner-1", {"id": "m4", "status": "completed", "title": "M4"})
+    state = cache.store["rules_state:learner-1"]
+    assert state["consecutive_failures"] == 0
+    assert state["missions"] == 4
+    assert len(reads) == 1
+
+
+@pytest.mark.asyncio
+async def test_regeneration_opens_the_debounce_window(store):
+    cache, _reads = store
+    await rules_state.get_state("learner-1")
+
+    await rules_state.record_regeneration("learner-1", "2999-01-01T00:00:00+00:00")
+    decision = await rules_engine.RulesEngine().evaluate_mission_outcome("learner-1", {"id": "m3", "status": "failed"})
+
+    assert decision["adaptation_needed"] is False
+    assert "debounce" in decision["reason"]
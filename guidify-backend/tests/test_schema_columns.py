@@ -0,0 +1,105 @@
+"""
+Schema drift tests: columns the code selects or writes must exist in the
+migrations.
+
+PostgREST rejects an explicit select list or an insert that names a column
+the table does not have, and the query helpers turn that into a logged error
+and a None result. These tests read the CREATE TABLE / ALTER TABLE ... ADD
+COLUMN statements in migrations/ and check the column projections and the
+interview session insert against them.
+"""
+
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.api import interview
+from app.db import queries
+from app.db.rows import parse_columns
+from app.models.schemas import InterviewSessionRequest
+from app.services import interview_feedback, roadmap_service
+
+MIGRATIONS = Path(__file__).resolve().parent.parent / "migrations"
+
+_CREATE = re.compile(r"CREATE TABLE IF NOT EXISTS (?:public\.)?(\w+)\s*\((.*?)\n\);", re.S | re.I)
+_ALTER = re.compile(r"ALTER TABLE (?:IF EXISTS )?(?:ONLY )?(?:public\.)?(\w+)\s+(.*?);", re.S | re.I)
+_ADD = re.compile(r"ADD COLUMN (?:IF NOT EXISTS )?(\w+)", re.I)
+_CONSTRAINTS = {"primary", "unique", "constraint", "foreign", "check", "exclude"}
+
+
+def _migration_columns():
+    tables = {}
+    for path in sorted(MIGRATIONS.glob("*.sql")):
+        sql = re.sub(r"--[^\n]*", "", path.read_text(encoding="utf-8"))
+        for table, body in _CREATE.findall(sql):
+            columns = tables.setdefault(table.lower(), set())
+            for line in body.splitlines():
+                name = line.strip().split(" ", 1)[0].strip('",').lower()
+                if name and name not in _CONSTRAINTS and re.fullmatch(r"\w+", name):
+                    columns.add(name)
+        for table, body in _ALTER.findall(sql):
+            tables.setdefault(table.lower(), set()).update(c.lower() for c in _ADD.findall(body))
+    return tables
+
+
+SCHEMA = _migration_columns()
+
+PROJECTIONS = {
+    "LEARNER_TARGETING": ("learners", queries.LEARNER_TARGETING),
+    "LEARNER_IDENTITY": ("learners", queries.LEARNER_IDENTITY),
+    "PROFILE_SUMMARY": ("learner_profiles", queries.PROFILE_SUMMARY),
+    "ROADMAP_REF": ("roadmaps", queries.ROADMAP_REF),
+    "ROADMAP_VIEW_FIELDS": ("roadmaps", ", ".join(queries.ROADMAP_VIEW_FIELDS)),
+    "ROADMAP_ADAPT_COLUMNS": ("roadmaps", roadmap_service.ROADMAP_ADAPT_COLUMNS),
+    "MISSION_REF": ("daily_missions", queries.MISSION_REF),
+    "SESSION_CONSENT": ("interview_sessions", queries.SESSION_CONSENT),
+    "SESSION_DETAIL": ("interview_sessions", queries.SESSION_DETAIL),
+    "SESSION_FEEDBACK_STATE": ("interview_sessions", queries.SESSION_FEEDBACK_STATE),
+    "SESSION_TURN": ("interview_sessions", queries.SESSION_TURN),
+    "SESSION_FEEDBACK": ("interview_sessions", interview_feedback.SESSION_FEEDBACK),
+    "RESUME_PARSED": ("resumes", queries.RESUME_PARSED),
+}
+
+
+@pytest.mark.parametrize("table, columns", PROJECTIONS.values(), ids=PROJECTIONS.keys())
+def test_projections_select_existing_columns(table, columns):
+    assert parse_columns(columns) - SCHEMA[table] == set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("camera_enabled", [False, True])
+async def test_interview_session_insert_writes_existing_columns(monkeypatch, camera_enabled):
+    inserts = []
+
+    async def create_session(learner_id, track, data=None):
+        inserts.append({**(data or {}), "learner_id": learner_id, "track": track})
+        return {"id": "session-1", "learner_id": learner_id, "track": track}
+
+    async def create_consent(*args, **kwargs):
+        return {"id": "consent-1"}
+
+    async def no_row(_learner_id, columns="*"):
+        return None
+
+    async def generate(**_kwargs):
+        return {"question": "First question?"}
+
+    async def append_turns(*_args, **_kwargs):
+        return {"turn_count": 1, "question_count": 1}
+
+    monkeypatch.setattr(interview.queries, "create_interview_session", create_session)
+    monkeypatch.setattr(interview.queries, "append_interview_turns", append_turns)
+    monkeypatch.setattr(interview.queries, "create_consent", create_consent)
+    monkeypatch.setattr(interview.queries, "get_learner_profile", no_row)
+    monkeypatch.setattr(interview.queries, "get_learner", no_row)
+    monkeypatch.setattr(interview, "gateway", SimpleNamespace(generate=generate))
+
+    await interview.start_interview_session(
+        InterviewSessionRequest(track="technical", camera_enabled=camera_enabled),
+        learner_id="learner-1",
+    )
+
+    assert "context_data" in inserts[0]
+    assert set(inserts[0]) - SCHEMA["interview_sessions"] == set()
@@ -1,4 +1,4 @@
-﻿import React, { useState, useEffect, useRef, useCallback } from 'react';
+﻿import React, { useState, useEffect, useCallback } from 'react';
 import { useAuth } from '../../contexts/AuthContext';
 import apiClient from '../../api/apiClient';
 import { supabase } from '../../utils/supabaseClient';
@@ -120,29 +120,6 @@ const AdaptivePersonalityTest = () => {
     const [analyzing, setAnalyzing] = useState(false);
     const [aiThinking, setAiThinking] = useState(false);
     const [aiQuestionsQueue, setAiQuestionsQueue] = useState([]);
-    const [hasFetchedAI, setHasFetchedAI] = useState(false);
-    const aiFetchStarted = useRef(false);
-
-    // Start AI fetch IMMEDIATELY on mount — don't wait for static questions
-    useEffect(() => {
-        if (!user || aiFetchStarted.current) return;
-        aiFetchStarted.current = true;
-
-        const fetchAIQuestions = async () => {
-            try {
-                console.log("Starting AI question fetch immediately...");
-                const res = await apiClient.post('/api/v1/psychometric/generate-quiz', { user_id: user.id });
-                if (res.questions && res.questions.length > 0) {
-                    console.log("AI Questions ready:", res.questions.length);
-                    setAiQuestionsQueue(res.questions);
-                }
-            } catch (error) {
-                console.error("AI fetch failed:", error);
-            }
-        };
-
-        fetchAIQuestions();
-    }, [user]);
 
     // Load static baseline questions
     useEffect(() => {
@@ -177,27 +154,41 @@ const AdaptivePersonalityTest = () => {
 
         // Last question logic
         if (currentQuestionIndex === questions.length - 1) {
-            // AI questions ready → inject and continue
-            if (aiQuestionsQueue.length > 0) {
-                setQuestions(prev => [...prev, ...aiQuestionsQueue]);
-                setAiQuestionsQueue([]);
-                setCurrentQuestionIndex(prev => prev + 1);
-            }
-            // Already past static (user answered AI questions) → finish
-            else if (questions.length > 5) {
+            // Already past static (user answered adaptive questions) → finish
+            if (questions.length > 5) {
                 setAnalyzing(true);
                 finishTest(updatedResponses);
             }
-            // AI not ready yet → show waiting state
+            // Baseline done → select adaptive questions from these answers
             else {
                 setAiThinking(true);
+                fetchQuizQuestions(updatedResponses);
             }
         } else {
             setCurrentQuestionIndex(prev => prev + 1);
         }
-    }, [questions, currentQuestionIndex, responses, aiQuestionsQueue]);
+    }, [questions, currentQuestionIndex, responses]);
+
+    // The bank picks questions for the traits the baseline answers left most uncertain
+    const fetchQuizQuestions = async (baselineResponses) => {
+        try {
+            const res = await apiClient.post('/api/v1/psychometric/generate-quiz', {
+                user_id: user.id,
+                responses: baselineResponses,
+            });
+            if (res.questions && res.questions.length > 0) {
+                setAiQuestionsQueue(res.questions);
+                return;
+            }
+        } catch (error) {
+            console.error("Quiz question fetch failed:", error);
+        }
+        setAiThinking(false);
+        setAnalyzing(true);
+        finishTest(baselineResponses);
+    };
 
-    // Handle late arrival of AI questions while user is waiting
+    // Inject adaptive questions once they arrive
     useEffect(() => {
         if (aiThinking && aiQuestionsQueue.length > 0) {
             setAiThinking(false);
@@ -340,7 +331,7 @@ const AdaptivePersonalityTest = () => {
                                         Personalizing your assessment...
                                     </p>
                                     <p className="text-gray-500 text-xs mb-3">
-                                        AI is generating questions tailored to your responses
+                                        Choosing questions tailored to your responses
                                     </p>
                                     <AIStreamBar>
                                         <AIStreamFill
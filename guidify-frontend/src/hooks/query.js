@@ -181,11 +181,35 @@ export const useUploadResume = () => {
   });
 };
 
+const ROADMAP_JOB_POLL_INTERVAL_MS = 2000;
+const ROADMAP_JOB_POLL_ATTEMPTS = 90;
+
+// Regeneration is queued server-side; wait for the job to save or fail.
+// A job superseded by a newer request (e.g. a goal change) points at it.
+const regenerateRoadmap = async () => {
+  const queued = await roadmapAPI.regenerate();
+  if (!queued?.job_id) return queued;
+  let jobId = queued.job_id;
+  for (let attempt = 0; attempt < ROADMAP_JOB_POLL_ATTEMPTS; attempt++) {
+    await new Promise(resolve => setTimeout(resolve, ROADMAP_JOB_POLL_INTERVAL_MS));
+    const job = await roadmapAPI.getJob(jobId);
+    if (job.progress_state === 'saved') return job.result;
+    if (job.result?.superseded_by) {
+      jobId = job.result.superseded_by;
+      continue;
+    }
+    if (job.progress_state === 'failed') {
+      throw new Error(job.result?.message || 'Roadmap generation failed. Please try again.');
+    }
+  }
+  throw new Error('Roadmap generation is taking longer than expected. Check back in a few minutes.');
+};
+
 export const useRegenerateRoadmap = () => {
   const queryClient = useQueryClient();
   
   return useMutation({
-    mutationFn: roadmapAPI.regenerate,
+    mutationFn: regenerateRoadmap,
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: queryKeys.roadmap.current });
     },
@@ -165,6 +165,7 @@ export const roadmapAPI = {
   getCurrent: () => api.get('/api/v1/roadmap/current'),
   getHistory: () => api.get('/api/v1/roadmap/history'),
   regenerate: () => api.post('/api/v1/roadmap/regenerate', null, { skipRetry: true }),
+  getJob: (jobId) => api.get(`/api/v1/roadmap/jobs/${jobId}`),
 };
 
 /** Missions — api.md §4 */
@@ -185,6 +186,7 @@ export const interviewAPI = {
     { answer, delivery_metrics: deliveryMetrics },
   ),
   getSession: (sessionId) => api.get(`/api/v1/interview/session/${sessionId}`),
+  getFeedback: (sessionId) => api.get(`/api/v1/interview/session/${sessionId}/feedback`),
   submitDeliveryMetrics: (sessionId, metrics) => api.post(`/api/v1/interview/session/${sessionId}/delivery-metrics`, metrics),
 };
 
@@ -199,6 +201,7 @@ export const dashboardAPI = {
 export const adaptationAPI = {
   getStatus: () => api.get('/api/v1/adaptation/status'),
   getSkillGap: () => api.get('/api/v1/adaptation/skill-gap'),
+  logEvents: (events) => api.post('/api/v1/adaptation/events/batch', { events }),
 };
 
 /** Psychometric Test — yes/maybe/no assessment */
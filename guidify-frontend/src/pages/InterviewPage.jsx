@@ -23,6 +23,10 @@ import {
   Camera, CameraOff, Video
 } from 'lucide-react';
 
+// Feedback is generated in the background after the last answer (~3 min max).
+const FEEDBACK_POLL_INTERVAL_MS = 2000;
+const FEEDBACK_POLL_ATTEMPTS = 90;
+
 const TRACKS = [
   { id: 'technical', label: 'Technical', icon: Brain, desc: 'Data structures, system design, coding' },
   { id: 'hr', label: 'HR / Behavioral', icon: Users, desc: 'STAR method, culture fit, leadership' },
@@ -103,11 +107,13 @@ function FeedbackReport({ feedback, onRestart }) {
           <CheckCircle2 className="w-8 h-8 text-[#3cff14]" />
         </div>
         <h3 className="text-xl font-display font-bold text-white mb-1">Interview Complete</h3>
-        <div className="mt-4">
-          <span className="text-4xl font-display font-bold text-[#3cff14]">{feedback.readiness_subscore}</span>
-          <span className="text-sm text-[#A4ACBC] ml-1">/ 100</span>
-          <p className="text-xs text-[#A4ACBC] mt-1">Readiness Score</p>
-        </div>
+        {feedback.readiness_subscore != null && (
+          <div className="mt-4">
+            <span className="text-4xl font-display font-bold text-[#3cff14]">{feedback.readiness_subscore}</span>
+            <span className="text-sm text-[#A4ACBC] ml-1">/ 100</span>
+            <p className="text-xs text-[#A4ACBC] mt-1">Readiness Score</p>
+          </div>
+        )}
       </div>
 
       {feedback.communication_notes && (
@@ -185,13 +191,17 @@ export default function InterviewPage() {
   const chatEndRef = useRef(null);
   const videoRef = useRef(null);
   const transcriptTextsRef = useRef([]);
+  const feedbackPollRef = useRef(null);
 
   const scrollToBottom = () => chatEndRef.current?.scrollIntoView({ behavior: 'smooth' });
   useEffect(scrollToBottom, [messages]);
 
   // Cleanup on unmount
   useEffect(() => {
-    return () => stopDeliveryAnalytics();
+    return () => {
+      stopDeliveryAnalytics();
+      stopFeedbackPoll();
+    };
   }, []);
 
   const handleTrackSelected = (selectedTrack) => {
@@ -262,6 +272,8 @@ export default function InterviewPage() {
         setMessages(prev => [...prev, { role: 'system', content: 'Interview complete. Generating feedback...' }]);
         setFeedback(res.feedback_report);
         setPhase('feedback');
+        // The report is generated in the background; sections appear as they are ready.
+        if (!res.feedback_report) pollFeedback(sessionId);
       } else if (res.next_question) {
         setMessages(prev => [...prev, { role: 'interviewer', content: res.next_question }]);
       }
@@ -273,6 +285,37 @@ export default function InterviewPage() {
     }
   };
 
+  // Only the latest poll may update state; it stops on unmount or when the session changes.
+  const stopFeedbackPoll = () => {
+    if (feedbackPollRef.current) {
+      feedbackPollRef.current.cancelled = true;
+      clearTimeout(feedbackPollRef.current.timer);
+      feedbackPollRef.current = null;
+    }
+  };
+
+  const pollFeedback = async (id) => {
+    stopFeedbackPoll();
+    const poll = { cancelled: false, timer: null };
+    feedbackPollRef.current = poll;
+    for (let attempt = 0; attempt < FEEDBACK_POLL_ATTEMPTS; attempt++) {
+      try {
+        const res = await interviewAPI.getFeedback(id);
+        if (poll.cancelled) return;
+        if (res.feedback_report || Object.keys(res.sections || {}).length > 0) {
+          setFeedback(res.feedback_report || res.sections);
+        }
+        if (res.feedback_status === 'ready' || res.feedback_status === 'failed') return;
+      } catch (e) {
+        console.error('Failed to fetch interview feedback:', e);
+      }
+      if (poll.cancelled) return;
+      await new Promise(resolve => { poll.timer = setTimeout(resolve, FEEDBACK_POLL_INTERVAL_MS); });
+      if (poll.cancelled) return;
+    }
+    if (feedbackPollRef.current === poll) feedbackPollRef.current = null;
+  };
+
   const handleKeyDown = (e) => {
     if (e.key === 'Enter' && !e.shiftKey) {
       e.preventDefault();
@@ -282,6 +325,7 @@ export default function InterviewPage() {
 
   const handleRestart = () => {
     stopDeliveryAnalytics();
+    stopFeedbackPoll();
     setPhase('select');
     setTrack(null);
     setSessionId(null);